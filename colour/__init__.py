@@ -35,97 +35,12 @@ Sub-packages
 from __future__ import absolute_import
 
 import sys
+from importlib import import_module
 
 from .utilities.deprecation import (FutureAccessChange, FutureAccessRemove,
                                     ModuleAPI, Removed, Renamed)
 from .utilities.documentation import is_documentation_building
 
-from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
-                         CHROMATIC_ADAPTATION_TRANSFORMS,
-                         CMCCAT2000_VIEWING_CONDITIONS, chromatic_adaptation)
-from .algebra import (
-    CubicSplineInterpolator, Extrapolator, KernelInterpolator,
-    LinearInterpolator, NullInterpolator, PchipInterpolator,
-    SpragueInterpolator, kernel_cardinal_spline, kernel_lanczos, kernel_linear,
-    kernel_nearest_neighbour, kernel_sinc, lagrange_coefficients)
-from .colorimetry import (
-    ASTME30815_PRACTISE_SHAPE, BANDPASS_CORRECTION_METHODS,
-    CIE_standard_illuminant_A_function, CMFS, DEFAULT_SPECTRAL_SHAPE,
-    D_illuminant_relative_spd, HUNTERLAB_ILLUMINANTS, ILLUMINANTS,
-    ILLUMINANTS_RELATIVE_SPDS, LEFS, LIGHTNESS_METHODS, LIGHT_SOURCES,
-    LIGHT_SOURCES_RELATIVE_SPDS, LMS_CMFS, LUMINANCE_METHODS,
-    MultiSpectralPowerDistribution, PHOTOPIC_LEFS, RGB_CMFS, SCOTOPIC_LEFS,
-    SPECTRAL_TO_XYZ_METHODS, STANDARD_OBSERVERS_CMFS,
-    SpectralPowerDistribution, SpectralShape, WHITENESS_METHODS,
-    YELLOWNESS_METHODS, bandpass_correction, blackbody_spd,
-    colorimetric_purity, complementary_wavelength, constant_spd,
-    dominant_wavelength, excitation_purity, lightness, luminance,
-    luminous_efficacy, luminous_efficiency, luminous_flux,
-    mesopic_luminous_efficiency_function, ones_spd, spectral_to_XYZ,
-    wavelength_to_XYZ, whiteness, yellowness, zeros_spd)
-from .appearance import (
-    ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
-    CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
-    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification,
-    LLAB_Specification, LLAB_VIEWING_CONDITIONS, Nayatani95_Specification,
-    RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
-    XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
-    XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
-from .characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
-                               COLOURCHECKERS, COLOURCHECKERS_SPDS,
-                               DISPLAYS_RGB_PRIMARIES, first_order_colour_fit)
-from .io import (IES_TM2714_Spd, read_image, read_spds_from_csv_file,
-                 read_spds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_spds_to_csv_file)
-from .models import (
-    CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
-    CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
-    CAM16UCS_to_JMh_CAM16, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range,
-    EOTFS, EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB,
-    HSV_to_RGB, Hunter_Lab_to_XYZ, ICTCP_to_RGB, IPT_hue_angle, IPT_to_XYZ,
-    JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD, JMh_CAM16_to_CAM16UCS,
-    JMh_CIECAM02_to_CAM02LCD, JMh_CIECAM02_to_CAM02SCD,
-    JMh_CIECAM02_to_CAM02UCS, LCHab_to_Lab, LCHuv_to_Luv, LOG_DECODING_CURVES,
-    LOG_ENCODING_CURVES, Lab_to_LCHab, Lab_to_XYZ, Luv_to_LCHuv, Luv_to_XYZ,
-    Luv_to_uv, Luv_uv_to_xy, OETFS, OETFS_REVERSE, OOTFS, OOTFS_REVERSE,
-    POINTER_GAMUT_BOUNDARIES, POINTER_GAMUT_DATA, POINTER_GAMUT_ILLUMINANT,
-    Prismatic_to_RGB, RGB_COLOURSPACES, RGB_Colourspace, RGB_luminance,
-    RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP,
-    RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr,
-    RGB_to_YcCbcCrc, UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, XYZ_to_Hunter_Lab,
-    XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab,
-    XYZ_to_Luv, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab,
-    XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY, YCBCR_WEIGHTS,
-    YCbCr_to_RGB, YcCbcCrc_to_RGB, chromatically_adapted_primaries, eotf,
-    eotf_reverse, full_to_legal, function_gamma, function_linear,
-    hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, legal_to_full, log_decoding_curve,
-    log_encoding_curve, normalised_primary_matrix, oetf, oetf_reverse, ootf,
-    ootf_reverse, primaries_whitepoint, sRGB_to_XYZ,
-    spectral_to_aces_relative_exposure_values, xyY_to_XYZ, xyY_to_xy,
-    xy_to_XYZ, xy_to_xyY)
-from .corresponding import (BRENEMAN_EXPERIMENTS,
-                            BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES,
-                            CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS,
-                            corresponding_chromaticities_prediction)
-from .phenomena import (rayleigh_scattering, rayleigh_scattering_spd,
-                        scattering_cross_section)
-from .notation import (MUNSELL_COLOURS, MUNSELL_VALUE_METHODS,
-                       munsell_colour_to_xyY, munsell_value,
-                       xyY_to_munsell_colour)
-from .quality import (colour_quality_scale, colour_rendering_index)
-from .recovery import (REFLECTANCE_RECOVERY_METHODS, XYZ_to_spectral)
-from .temperature import (CCT_TO_UV_METHODS, CCT_TO_XY_METHODS, CCT_to_uv,
-                          CCT_to_xy, UV_TO_CCT_METHODS, XY_TO_CCT_METHODS,
-                          uv_to_CCT, xy_to_CCT)
-from .volume import (
-    ILLUMINANTS_OPTIMAL_COLOUR_STIMULI, RGB_colourspace_limits,
-    RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-    RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
-
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -133,112 +48,153 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
+_SUB_PACKAGES_ATTRIBUTES = (
+    ('adaptation', [
+        'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
+        'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation'
+    ]),
+    ('algebra', [
+        'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
+        'LinearInterpolator', 'NullInterpolator', 'PchipInterpolator',
+        'SpragueInterpolator', 'kernel_cardinal_spline', 'kernel_lanczos',
+        'kernel_linear', 'kernel_nearest_neighbour', 'kernel_sinc',
+        'lagrange_coefficients', 'TABLE_INTERPOLATION_METHODS',
+        'table_interpolation'
+    ]),
+    ('colorimetry', [
+        'ASTME30815_PRACTISE_SHAPE', 'BANDPASS_CORRECTION_METHODS',
+        'CIE_standard_illuminant_A_function', 'CMFS',
+        'DEFAULT_SPECTRAL_SHAPE', 'D_illuminant_relative_spd',
+        'HUNTERLAB_ILLUMINANTS', 'ILLUMINANTS', 'ILLUMINANTS_RELATIVE_SPDS',
+        'LEFS', 'LIGHTNESS_METHODS', 'LIGHT_SOURCES',
+        'LIGHT_SOURCES_RELATIVE_SPDS', 'LMS_CMFS', 'LUMINANCE_METHODS',
+        'MULTI_SPECTRAL_TO_XYZ_METHODS', 'MultiSpectralPowerDistribution',
+        'PHOTOPIC_LEFS', 'RGB_CMFS', 'SCOTOPIC_LEFS',
+        'SPECTRAL_TO_XYZ_METHODS', 'STANDARD_OBSERVERS_CMFS',
+        'SpectralPowerDistribution', 'SpectralResampler', 'SpectralShape',
+        'WHITENESS_METHODS', 'YELLOWNESS_METHODS', 'bandpass_correction',
+        'blackbody_spd', 'colorimetric_purity', 'complementary_wavelength',
+        'constant_spd', 'dominant_wavelength', 'excitation_purity',
+        'lightness', 'luminance', 'luminous_efficacy', 'luminous_efficiency',
+        'luminous_flux', 'mesopic_luminous_efficiency_function',
+        'multi_spectral_to_XYZ', 'ones_spd', 'spectral_to_XYZ',
+        'wavelength_to_XYZ', 'whiteness', 'yellowness', 'zeros_spd'
+    ]),
+    ('appearance', [
+        'ATD95_Specification', 'CAM16_Specification',
+        'CAM16_VIEWING_CONDITIONS', 'CAM16_to_XYZ', 'CIECAM02_Specification',
+        'CIECAM02_VIEWING_CONDITIONS', 'CIECAM02_to_XYZ',
+        'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification', 'LLAB_Specification',
+        'LLAB_VIEWING_CONDITIONS', 'Nayatani95_Specification',
+        'RLAB_D_FACTOR', 'RLAB_Specification', 'RLAB_VIEWING_CONDITIONS',
+        'XYZ_to_ATD95', 'XYZ_to_CAM16', 'XYZ_to_CIECAM02', 'XYZ_to_Hunt',
+        'XYZ_to_LLAB', 'XYZ_to_Nayatani95', 'XYZ_to_RLAB'
+    ]),
+    ('difference', [
+        'DELTA_E_METHODS', 'delta_E'
+    ]),
+    ('characterisation', [
+        'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
+        'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES',
+        'first_order_colour_fit'
+    ]),
+    ('io', [
+        'IES_TM2714_Spd', 'LUT1D', 'LUT3x1D', 'LUT3D', 'LUT_READ_METHODS',
+        'LUT_WRITE_METHODS', 'bake_LUT', 'read_LUT', 'read_image',
+        'read_image_blocks', 'read_spds_from_csv_file',
+        'read_spds_from_xrite_file', 'read_spectral_data_from_csv_file',
+        'write_LUT', 'write_image', 'write_image_blocks',
+        'write_spds_to_csv_file'
+    ]),
+    ('models', [
+        'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
+        'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
+        'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
+        'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'ColourspaceConversion',
+        'EOTFS', 'EOTFS_REVERSE',
+        'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
+        'Hunter_Lab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ',
+        'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD',
+        'JMh_CAM16_to_CAM16UCS', 'JMh_CIECAM02_to_CAM02LCD',
+        'JMh_CIECAM02_to_CAM02SCD', 'JMh_CIECAM02_to_CAM02UCS',
+        'LCHab_to_Lab', 'LCHuv_to_Luv', 'LOG_DECODING_CURVES',
+        'LOG_ENCODING_CURVES', 'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv',
+        'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS', 'OETFS_REVERSE',
+        'OOTFS', 'OOTFS_REVERSE', 'POINTER_GAMUT_BOUNDARIES',
+        'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
+        'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
+        'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
+        'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
+        'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc', 'UCS_to_XYZ',
+        'UCS_to_uv', 'UCS_uv_to_xy', 'XYZ_to_Hunter_Lab',
+        'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_K_ab_HunterLab1966',
+        'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW',
+        'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy',
+        'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB',
+        'chromatically_adapted_primaries', 'eotf', 'eotf_reverse',
+        'full_to_legal', 'function_gamma', 'function_linear',
+        'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
+        'log_decoding_curve', 'log_encoding_curve',
+        'normalised_primary_matrix', 'oetf', 'oetf_reverse', 'ootf',
+        'ootf_reverse', 'primaries_whitepoint', 'sRGB_to_XYZ',
+        'spectral_to_aces_relative_exposure_values', 'xyY_to_XYZ',
+        'xyY_to_xy', 'xy_to_XYZ', 'xy_to_xyY'
+    ]),
+    ('corresponding', [
+        'BRENEMAN_EXPERIMENTS',
+        'BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES',
+        'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
+        'corresponding_chromaticities_prediction'
+    ]),
+    ('phenomena', [
+        'rayleigh_scattering', 'rayleigh_scattering_spd',
+        'scattering_cross_section'
+    ]),
+    ('notation', [
+        'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
+        'munsell_value', 'xyY_to_munsell_colour'
+    ]),
+    ('quality', [
+        'colour_quality_scale', 'colour_rendering_index',
+        'multi_colour_quality_scale', 'multi_colour_rendering_index'
+    ]),
+    ('recovery', [
+        'REFLECTANCE_RECOVERY_METHODS', 'XYZ_to_spectral'
+    ]),
+    ('temperature', [
+        'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
+        'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
+    ]),
+    ('volume', [
+        'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
+        'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
+        'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+        'RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_volume_Mesh',
+        'RGB_colourspaces_intersection_volume_Mesh',
+        'RGB_colourspace_volume_coverage_MonteCarlo',
+        'is_within_macadam_limits', 'is_within_mesh_volume',
+        'is_within_pointer_gamut', 'is_within_visible_spectrum'
+    ]),
+    ('biochemistry', []),
+    ('constants', []),
+    ('continuous', []),
+)  # yapf: disable
+"""
+Sub-packages of *Colour* and their public attributes exposed in its namespace,
+a sub-package is only imported on first access of one of its attributes.
+
+_SUB_PACKAGES_ATTRIBUTES : tuple
+"""
+
 __all__ = []
-__all__ += [
-    'CHROMATIC_ADAPTATION_METHODS', 'CHROMATIC_ADAPTATION_TRANSFORMS',
-    'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation'
-]
-__all__ += [
-    'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
-    'LinearInterpolator', 'NullInterpolator', 'PchipInterpolator',
-    'SpragueInterpolator', 'kernel_cardinal_spline', 'kernel_lanczos',
-    'kernel_linear', 'kernel_nearest_neighbour', 'kernel_sinc',
-    'lagrange_coefficients'
-]
-__all__ += [
-    'ASTME30815_PRACTISE_SHAPE', 'BANDPASS_CORRECTION_METHODS',
-    'CIE_standard_illuminant_A_function', 'CMFS', 'DEFAULT_SPECTRAL_SHAPE',
-    'D_illuminant_relative_spd', 'HUNTERLAB_ILLUMINANTS', 'ILLUMINANTS',
-    'ILLUMINANTS_RELATIVE_SPDS', 'LEFS', 'LIGHTNESS_METHODS', 'LIGHT_SOURCES',
-    'LIGHT_SOURCES_RELATIVE_SPDS', 'LMS_CMFS', 'LUMINANCE_METHODS',
-    'MultiSpectralPowerDistribution', 'PHOTOPIC_LEFS', 'RGB_CMFS',
-    'SCOTOPIC_LEFS', 'SPECTRAL_TO_XYZ_METHODS', 'STANDARD_OBSERVERS_CMFS',
-    'SpectralPowerDistribution', 'SpectralShape', 'WHITENESS_METHODS',
-    'YELLOWNESS_METHODS', 'bandpass_correction', 'blackbody_spd',
-    'colorimetric_purity', 'complementary_wavelength', 'constant_spd',
-    'dominant_wavelength', 'excitation_purity', 'lightness', 'luminance',
-    'luminous_efficacy', 'luminous_efficiency', 'luminous_flux',
-    'mesopic_luminous_efficiency_function', 'ones_spd', 'spectral_to_XYZ',
-    'wavelength_to_XYZ', 'whiteness', 'yellowness', 'zeros_spd'
-]
-__all__ += [
-    'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_to_XYZ', 'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
-    'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
-    'Nayatani95_Specification', 'RLAB_D_FACTOR', 'RLAB_Specification',
-    'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
-    'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
-    'XYZ_to_RLAB'
-]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
-__all__ += [
-    'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
-    'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES', 'first_order_colour_fit'
-]
-__all__ += [
-    'IES_TM2714_Spd', 'read_image', 'read_spds_from_csv_file',
-    'read_spds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_spds_to_csv_file'
-]
-__all__ += [
-    'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
-    'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
-    'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
-    'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'EOTFS', 'EOTFS_REVERSE',
-    'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
-    'Hunter_Lab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ',
-    'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
-    'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
-    'JMh_CIECAM02_to_CAM02UCS', 'LCHab_to_Lab', 'LCHuv_to_Luv',
-    'LOG_DECODING_CURVES', 'LOG_ENCODING_CURVES', 'Lab_to_LCHab', 'Lab_to_XYZ',
-    'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS',
-    'OETFS_REVERSE', 'OOTFS', 'OOTFS_REVERSE', 'POINTER_GAMUT_BOUNDARIES',
-    'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
-    'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
-    'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
-    'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
-    'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc', 'UCS_to_XYZ', 'UCS_to_uv',
-    'UCS_uv_to_xy', 'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT',
-    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_RGB',
-    'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT',
-    'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB',
-    'YcCbcCrc_to_RGB', 'chromatically_adapted_primaries', 'eotf',
-    'eotf_reverse', 'full_to_legal', 'function_gamma', 'function_linear',
-    'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
-    'log_decoding_curve', 'log_encoding_curve', 'normalised_primary_matrix',
-    'oetf', 'oetf_reverse', 'ootf', 'ootf_reverse', 'primaries_whitepoint',
-    'sRGB_to_XYZ', 'spectral_to_aces_relative_exposure_values', 'xyY_to_XYZ',
-    'xyY_to_xy', 'xy_to_XYZ', 'xy_to_xyY'
-]
-__all__ += [
-    'BRENEMAN_EXPERIMENTS', 'BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES',
-    'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
-    'corresponding_chromaticities_prediction'
-]
-__all__ += [
-    'rayleigh_scattering', 'rayleigh_scattering_spd',
-    'scattering_cross_section'
-]
-__all__ += [
-    'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
-    'munsell_value', 'xyY_to_munsell_colour'
-]
-__all__ += ['colour_quality_scale', 'colour_rendering_index']
-__all__ += ['REFLECTANCE_RECOVERY_METHODS', 'XYZ_to_spectral']
-__all__ += [
-    'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
-    'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
-]
-__all__ += [
-    'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
-    'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
-    'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
-    'is_within_mesh_volume', 'is_within_pointer_gamut',
-    'is_within_visible_spectrum'
-]
+_LAZY_ATTRIBUTES = {}
+for _sub_package, _attributes in _SUB_PACKAGES_ATTRIBUTES:
+    _module = 'colour.{0}'.format(_sub_package)
+    _LAZY_ATTRIBUTES[_sub_package] = _module
+    _LAZY_ATTRIBUTES.update(dict.fromkeys(_attributes, _module))
+    __all__ += _attributes
+del _sub_package, _attributes, _module
+
 __application_name__ = 'Colour'
 
 __major_version__ = '0'
@@ -1592,6 +1548,13 @@ if not is_documentation_building():
     del is_documentation_building
     del _setup_api_changes
 
-    sys.modules['colour'] = colour(sys.modules['colour'], API_CHANGES)
+    sys.modules['colour'] = colour(sys.modules['colour'], API_CHANGES,
+                                   _LAZY_ATTRIBUTES)
 
+    del import_module
     del sys
+else:
+    for _attribute in __all__:
+        globals()[_attribute] = getattr(
+            import_module(_LAZY_ATTRIBUTES[_attribute]), _attribute)
+    del _attribute
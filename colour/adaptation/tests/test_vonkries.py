@@ -10,7 +10,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.adaptation import (chromatic_adaptation_matrix_VonKries,
+from colour.adaptation import (CHROMATIC_ADAPTATION_MATRICES_CACHE,
+                               CHROMATIC_ADAPTATION_TRANSFORMS,
+                               chromatic_adaptation_matrix_VonKries,
                                chromatic_adaptation_VonKries)
 from colour.utilities import ignore_numpy_errors
 
@@ -133,6 +135,55 @@ chromatic_adaptation_matrix_VonKries` definition n-dimensional arrays support.
         np.testing.assert_almost_equal(
             chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr), M, decimal=7)
 
+    def test_cache_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition matrices caching.
+        """
+
+        CHROMATIC_ADAPTATION_MATRICES_CACHE.clear()
+
+        XYZ_w = np.array([0.96429568, 1.00000000, 0.82510460])
+        XYZ_wr = np.array([0.95045593, 1.00000000, 1.08905775])
+
+        M = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Bradford')
+        self.assertEqual(CHROMATIC_ADAPTATION_MATRICES_CACHE.misses, 1)
+
+        M[...] = 0
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'Bradford'),
+            np.array([
+                [0.95547342, -0.02309846, 0.06325924],
+                [-0.02836971, 1.00999540, 0.02104144],
+                [0.01231401, -0.02050765, 1.33036593],
+            ]),
+            decimal=7)
+        chromatic_adaptation_matrix_VonKries(XYZ_w + 1e-12, XYZ_wr,
+                                             'Bradford')
+        self.assertEqual(CHROMATIC_ADAPTATION_MATRICES_CACHE.hits, 2)
+
+        chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, 'CAT02')
+        self.assertEqual(CHROMATIC_ADAPTATION_MATRICES_CACHE.misses, 2)
+        self.assertAlmostEqual(CHROMATIC_ADAPTATION_MATRICES_CACHE.hit_rate,
+                               0.5)
+
+        # N-dimensional whitepoints are not cached.
+        chromatic_adaptation_matrix_VonKries(
+            np.tile(XYZ_w, (6, 1)), np.tile(XYZ_wr, (6, 1)), 'CAT02')
+        self.assertEqual(len(CHROMATIC_ADAPTATION_MATRICES_CACHE), 2)
+
+        # Replacing a transform invalidates its cached matrices.
+        transform = CHROMATIC_ADAPTATION_TRANSFORMS['Bradford']
+        try:
+            CHROMATIC_ADAPTATION_TRANSFORMS['Bradford'] = np.identity(3)
+            np.testing.assert_almost_equal(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr,
+                                                     'Bradford'),
+                np.diag(XYZ_wr / XYZ_w),
+                decimal=7)
+        finally:
+            CHROMATIC_ADAPTATION_TRANSFORMS['Bradford'] = transform
+
     @ignore_numpy_errors
     def test_nan_chromatic_adaptation_matrix_VonKries(self):
         """
@@ -5,6 +5,7 @@ Von Kries Chromatic Adaptation Model
 
 Defines *Von Kries* chromatic adaptation model objects:
 
+-   :attr:`colour.adaptation.CHROMATIC_ADAPTATION_MATRICES_CACHE`
 -   :func:`colour.adaptation.chromatic_adaptation_matrix_VonKries`
 -   :func:`colour.adaptation.chromatic_adaptation_VonKries`
 
@@ -26,7 +27,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
-from colour.utilities import dot_matrix, dot_vector, row_as_diagonal
+from colour.utilities import (LRUCache, dot_matrix, dot_vector,
+                              row_as_diagonal)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,9 +38,76 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
+    'CHROMATIC_ADAPTATION_MATRICES_CACHE',
     'chromatic_adaptation_matrix_VonKries', 'chromatic_adaptation_VonKries'
 ]
 
+CHROMATIC_ADAPTATION_MATRICES_CACHE = LRUCache(maxsize=256)
+"""
+Bounded least recently used cache of the *Von Kries* chromatic adaptation
+matrices of single whitepoints pairs, keyed by the whitepoints rounded to
+:attr:`colour.adaptation.vonkries.CHROMATIC_ADAPTATION_MATRICES_DECIMALS`
+decimals and the chromatic adaptation transform name. Its
+:attr:`colour.utilities.LRUCache.hits`,
+:attr:`colour.utilities.LRUCache.misses` and
+:attr:`colour.utilities.LRUCache.hit_rate` attributes report the cache
+efficiency.
+
+CHROMATIC_ADAPTATION_MATRICES_CACHE : LRUCache
+"""
+
+CHROMATIC_ADAPTATION_MATRICES_DECIMALS = 10
+"""
+Decimals count the whitepoints are rounded to when keying the
+:attr:`colour.adaptation.CHROMATIC_ADAPTATION_MATRICES_CACHE` cache.
+
+CHROMATIC_ADAPTATION_MATRICES_DECIMALS : integer
+"""
+
+_CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES = {}
+
+
+def _chromatic_adaptation_transform(transform):
+    """
+    Returns given chromatic adaptation transform matrix and its inverse, the
+    inverses are computed once per transform and stored in the
+    :attr:`colour.adaptation.vonkries._CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES`
+    attribute.
+
+    Parameters
+    ----------
+    transform : unicode
+        Chromatic adaptation transform.
+
+    Returns
+    -------
+    tuple
+        Chromatic adaptation transform matrix and its inverse.
+
+    Raises
+    ------
+    KeyError
+        If chromatic adaptation method is not defined.
+    """
+
+    M = CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+
+    if M is None:
+        raise KeyError(
+            '"{0}" chromatic adaptation transform is not defined! Supported '
+            'methods: "{1}".'.format(transform,
+                                     CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
+
+    # The stored matrix is compared by identity so that a transform replaced
+    # in :attr:`colour.CHROMATIC_ADAPTATION_TRANSFORMS` gets its inverse
+    # recomputed.
+    M_M_i = _CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES.get(transform)
+    if M_M_i is None or M_M_i[0] is not M:
+        M_M_i = _CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES[transform] = (
+            M, np.linalg.inv(M))
+
+    return M_M_i
+
 
 def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     """
@@ -67,6 +136,17 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     KeyError
         If chromatic adaptation method is not defined.
 
+    Notes
+    -----
+    -   The chromatic adaptation transforms inverses are computed once per
+        transform.
+    -   The chromatic adaptation matrices of single whitepoints pairs are
+        cached in the
+        :attr:`colour.adaptation.CHROMATIC_ADAPTATION_MATRICES_CACHE` bounded
+        least recently used cache, keyed by the whitepoints rounded to
+        :attr:`colour.adaptation.vonkries.\
+CHROMATIC_ADAPTATION_MATRICES_DECIMALS` decimals and the transform name.
+
     References
     ----------
     -   :cite:`Fairchild2013t`
@@ -93,13 +173,23 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
            [ 0.0798671..., -0.1349315...,  3.1928829...]])
     """
 
-    M = CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+    M, M_i = _chromatic_adaptation_transform(transform)
 
-    if M is None:
-        raise KeyError(
-            '"{0}" chromatic adaptation transform is not defined! Supported '
-            'methods: "{1}".'.format(transform,
-                                     CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
+    XYZ_w = np.asarray(XYZ_w)
+    XYZ_wr = np.asarray(XYZ_wr)
+
+    single = XYZ_w.ndim == 1 and XYZ_wr.ndim == 1
+    if single:
+        key = (tuple(XYZ_w.round(CHROMATIC_ADAPTATION_MATRICES_DECIMALS)
+                     .tolist()),
+               tuple(XYZ_wr.round(CHROMATIC_ADAPTATION_MATRICES_DECIMALS)
+                     .tolist()), transform)
+        try:
+            M_c, cat = CHROMATIC_ADAPTATION_MATRICES_CACHE[key]
+            if M_c is M:
+                return np.copy(cat)
+        except KeyError:
+            pass
 
     rgb_w = np.einsum('...i,...ij->...j', XYZ_w, np.transpose(M))
     rgb_wr = np.einsum('...i,...ij->...j', XYZ_wr, np.transpose(M))
@@ -108,9 +198,12 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
 
     D = row_as_diagonal(D)
 
-    cat = dot_matrix(np.linalg.inv(M), D)
+    cat = dot_matrix(M_i, D)
     cat = dot_matrix(cat, M)
 
+    if single:
+        CHROMATIC_ADAPTATION_MATRICES_CACHE[key] = (M, np.copy(cat))
+
     return cat
 
 
@@ -17,12 +17,25 @@ Defines classes for interpolating variables.
 -   :class:`colour.NullInterpolator`: 1-D function null interpolation.
 -   :func:`colour.lagrange_coefficients`: Computation of
     *Lagrange Coefficients*.
+-   :func:`colour.algebra.table_interpolation_trilinear`: Trilinear
+    interpolation of a 3D table.
+-   :func:`colour.algebra.table_interpolation_tetrahedral`: Tetrahedral
+    interpolation of a 3D table.
+-   :attr:`colour.TABLE_INTERPOLATION_METHODS`: Supported 3D table
+    interpolation methods.
+-   :func:`colour.table_interpolation`: 3D table interpolation according to
+    given method.
 
 References
 ----------
+-   :cite:`Bourkeb` : Bourke, P. (n.d.). Trilinear Interpolation. Retrieved
+    January 13, 2018, from http://paulbourke.net/miscellaneous/interpolation/
 -   :cite:`Burger2009b` : Burger, W., & Burge, M. J. (2009). Principles of
     Digital Image Processing. London: Springer London.
     doi:10.1007/978-1-84800-195-4
+-   :cite:`Kirk2006` : Kirk, R. (2006). Truelight Software Library 2.0.
+    Retrieved from https://www.filmlight.ltd.uk/pdf/whitepapers/\
+FL-TL-TN-0057-SoftwareLib.pdf
 -   :cite:`CIETC1-382005f` : CIE TC 1-38. (2005). 9.2.4 Method of
     interpolation for uniformly spaced independent variable. In CIE 167:2005
     Recommended Practice for Tabulating Spectral Data for Use in Colour
@@ -48,12 +61,14 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import scipy.interpolate
+import scipy.sparse
 from collections import OrderedDict, Mapping
 from six.moves import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_numeric, interval, is_integer, is_numeric,
-                              closest_indexes, warning)
+from colour.utilities import (CaseInsensitiveMapping, as_numeric, interval,
+                              is_integer, is_numeric, closest_indexes,
+                              warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -64,9 +79,12 @@ __status__ = 'Production'
 
 __all__ = [
     'kernel_nearest_neighbour', 'kernel_linear', 'kernel_sinc',
-    'kernel_lanczos', 'kernel_cardinal_spline', 'KernelInterpolator',
+    'kernel_lanczos', 'kernel_cardinal_spline',
+    'KERNEL_INTERPOLATOR_CHUNK_SIZE', 'KernelInterpolator',
     'LinearInterpolator', 'SpragueInterpolator', 'CubicSplineInterpolator',
-    'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients'
+    'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients',
+    'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
+    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
 ]
 
 
@@ -242,6 +260,15 @@ def kernel_cardinal_spline(x, a=0.5, b=0.0):
     return 1 / 6 * y
 
 
+KERNEL_INTERPOLATOR_CHUNK_SIZE = 65536
+"""
+Default points count of the chunks :class:`colour.KernelInterpolator` class
+instances are evaluated by.
+
+KERNEL_INTERPOLATOR_CHUNK_SIZE : integer
+"""
+
+
 class KernelInterpolator(object):
     """
     Kernel based interpolation of a 1-D function.
@@ -273,6 +300,9 @@ class KernelInterpolator(object):
          :func:`np.pad` definition.
     dtype : type
         Data type used for internal conversions.
+    chunk_size : integer, optional
+        Points count of the chunks the interpolator is evaluated by, bounding
+        the memory footprint.
 
     Attributes
     ----------
@@ -282,10 +312,23 @@ class KernelInterpolator(object):
     kernel
     kernel_args
     padding_args
+    chunk_size
 
     Methods
     -------
     __call__
+    weights
+
+    Notes
+    -----
+    -   The kernel contributions are accumulated in-place, one window offset
+        at a time, thus the evaluation memory footprint is proportional to the
+        chunks points count and not to its product with the window width.
+    -   The interpolated values being a linear combination of the :math:`y`
+        variable values, the :meth:`KernelInterpolator.weights` method
+        returns the sparse matrix of that linear combination for given points:
+        evaluating the same points repeatedly against different :math:`y`
+        variable values is then a sparse matrix product.
 
     References
     ----------
@@ -324,6 +367,15 @@ class KernelInterpolator(object):
     ...     kernel_args={'a': 16})
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 5.396179...,  5.652109...])
+
+    Using precomputed weights:
+
+    >>> f = KernelInterpolator(x, y)
+    >>> W = f.weights([0.25, 0.75])
+    >>> W.dot(y)  # doctest: +ELLIPSIS
+    array([ 6.1806208...,  8.0823848...])
+    >>> W.dot(y * 2)  # doctest: +ELLIPSIS
+    array([ 12.3612416...,  16.1647697...])
     """
 
     def __init__(self,
@@ -333,7 +385,8 @@ class KernelInterpolator(object):
                  kernel=kernel_lanczos,
                  kernel_args=None,
                  padding_args=None,
-                 dtype=DEFAULT_FLOAT_DTYPE):
+                 dtype=DEFAULT_FLOAT_DTYPE,
+                 chunk_size=KERNEL_INTERPOLATOR_CHUNK_SIZE):
         self._x_p = None
         self._y_p = None
 
@@ -353,6 +406,9 @@ class KernelInterpolator(object):
         self._kernel_args = {}
         self.kernel_args = kernel_args
 
+        self._chunk_size = None
+        self.chunk_size = chunk_size
+
         self._validate_dimensions()
 
     @property
@@ -575,6 +631,38 @@ class KernelInterpolator(object):
             if self._y is not None:
                 self.y = self._y
 
+    @property
+    def chunk_size(self):
+        """
+        Getter and setter property for the points count of the chunks the
+        interpolator is evaluated by.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the chunks points count with.
+
+        Returns
+        -------
+        int
+            Chunks points count.
+        """
+
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value):
+        """
+        Setter for the **self.chunk_size** property.
+        """
+
+        if value is not None:
+            assert is_integer(value), '"chunk_size" must be an integer!'
+
+            assert value >= 1, '"chunk_size" must be equal or superior to 1!'
+
+            self._chunk_size = int(value)
+
     def __call__(self, x):
         """
         Evaluates the interpolator at given point(s).
@@ -596,6 +684,108 @@ class KernelInterpolator(object):
 
         return xi
 
+    def weights(self, x):
+        """
+        Returns the sparse matrix of the linear combination of the :math:`y`
+        variable values interpolating given points.
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Sparse matrix of shape (N, M) where N is the points count and M
+            the :math:`y` variable values count.
+
+        Raises
+        ------
+        ValueError
+            If the padding of the :math:`y` variable values is not linear.
+
+        Examples
+        --------
+        >>> y = np.array([5.9200, 9.3700, 10.8135, 4.5100,
+        ...               69.5900, 27.8007, 86.0500])
+        >>> x = np.arange(len(y))
+        >>> f = KernelInterpolator(x, y)
+        >>> W = f.weights(np.linspace(0, 6, 25))
+        >>> W.shape
+        (25, 7)
+        >>> np.allclose(W.dot(y), f(np.linspace(0, 6, 25)))
+        True
+        """
+
+        x = np.ravel(np.atleast_1d(x).astype(self._dtype))
+
+        self._validate_dimensions()
+        self._validate_interpolation_range(x)
+
+        # Linear map from the :math:`y` variable values to the padded ones,
+        # the columns of the identity matrix being padded independently.
+        padding_args = dict(self._padding_args)
+        pad_width = padding_args.pop('pad_width')
+        size = self._y.size
+        P = scipy.sparse.csr_matrix(
+            np.pad(
+                np.identity(size), (pad_width, (0, 0)), **padding_args))
+
+        # Non-linear paddings, e.g. "maximum" or "median" modes, do not verify
+        # superposition on an arbitrary vector.
+        y_r = np.random.RandomState(0).random_sample(size)
+        if not np.allclose(
+                np.pad(y_r, pad_width, **padding_args), P.dot(y_r)):
+            raise ValueError(
+                '"{0}" padding is not linear, the interpolator weights are '
+                'undefined!'.format(self._padding_args))
+
+        rows, columns, values = [], [], []
+        for x_c, i, windows, kernel in self._kernel_contributions(x):
+            rows.append(np.arange(i, i + x_c.size))
+            columns.append(windows)
+            values.append(kernel)
+
+        W_p = scipy.sparse.coo_matrix(
+            (np.concatenate(values), (np.concatenate(rows),
+                                      np.concatenate(columns))),
+            shape=(x.size, P.shape[0])).tocsr()
+
+        return W_p.dot(P)
+
+    def _kernel_contributions(self, x):
+        """
+        Yields the kernel contributions to the interpolation of given points,
+        one window offset of one chunk at a time.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the interpolant at.
+
+        Returns
+        -------
+        generator
+            Generator yielding the chunk points, the chunk first point index,
+            the padded :math:`y` variable values indexes and the kernel
+            values.
+        """
+
+        x_interval = interval(self._x)[0]
+        clip_l = np.min(self._x_p) / x_interval
+        clip_h = np.max(self._x_p) / x_interval
+
+        for i in range(0, x.size, self._chunk_size):
+            x_c = x[i:i + self._chunk_size] / x_interval
+            x_f = np.floor(x_c)
+            for offset in range(-self._window + 1, self._window + 1):
+                windows = np.around(np.clip(x_f + offset, clip_l, clip_h) -
+                                    clip_l).astype(np.int_)
+
+                yield x_c, i, windows, self._kernel(
+                    x_c - windows - clip_l, **self._kernel_args)
+
     def _evaluate(self, x):
         """
         Performs the interpolator evaluation at given points.
@@ -614,21 +804,14 @@ class KernelInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        x_interval = interval(self._x)[0]
-        x_f = np.floor(x / x_interval)
+        shape = x.shape
+        x = np.ravel(x)
 
-        windows = (x_f[:, np.newaxis] + np.arange(-self._window + 1,
-                                                  self._window + 1))
-        clip_l = min(self._x_p) / x_interval
-        clip_h = max(self._x_p) / x_interval
-        windows = np.clip(windows, clip_l, clip_h) - clip_l
-        windows = np.around(windows).astype(np.int_)
+        xi = np.zeros(x.shape, dtype=self._dtype)
+        for x_c, i, windows, kernel in self._kernel_contributions(x):
+            xi[i:i + x_c.size] += self._y_p[windows] * kernel
 
-        return np.sum(
-            self._y_p[windows] *
-            self._kernel(x[:, np.newaxis] / x_interval - windows -
-                         min(self._x_p) / x_interval, **self._kernel_args),
-            axis=-1)
+        return np.reshape(xi, shape)
 
     def _validate_dimensions(self):
         """
@@ -679,6 +862,7 @@ class LinearInterpolator(object):
     Methods
     -------
     __call__
+    weights
 
     Notes
     -----
@@ -800,6 +984,50 @@ class LinearInterpolator(object):
 
         return xi
 
+    def weights(self, x):
+        """
+        Returns the sparse matrix of the linear combination of the :math:`y`
+        variable values interpolating given points.
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Sparse matrix of shape (N, M) where N is the points count and M
+            the :math:`y` variable values count.
+
+        Examples
+        --------
+        >>> y = np.array([5.9200, 9.3700, 10.8135, 4.5100,
+        ...               69.5900, 27.8007, 86.0500])
+        >>> x = np.arange(len(y))
+        >>> f = LinearInterpolator(x, y)
+        >>> W = f.weights([0.25, 0.75])
+        >>> W.shape
+        (2, 7)
+        >>> W.dot(y)
+        array([ 6.7825,  8.5075])
+        """
+
+        x = np.ravel(np.atleast_1d(x).astype(self._dtype))
+
+        self._validate_dimensions()
+        self._validate_interpolation_range(x)
+
+        i = np.clip(np.searchsorted(self._x, x) - 1, 0, self._x.size - 2)
+        t = (x - self._x[i]) / (self._x[i + 1] - self._x[i])
+
+        rows = np.arange(x.size)
+
+        return scipy.sparse.coo_matrix(
+            (np.concatenate((1 - t, t)),
+             (np.concatenate((rows, rows)), np.concatenate((i, i + 1)))),
+            shape=(x.size, self._x.size)).tocsr()
+
     def _evaluate(self, x):
         """
         Performs the interpolating polynomial evaluation at given points.
@@ -873,6 +1101,7 @@ class SpragueInterpolator(object):
     Methods
     -------
     __call__
+    weights
 
     Notes
     -----
@@ -1041,6 +1270,78 @@ class SpragueInterpolator(object):
 
         return self._evaluate(x)
 
+    def weights(self, x):
+        """
+        Returns the sparse matrix of the linear combination of the :math:`y`
+        variable values interpolating given points.
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Sparse matrix of shape (N, M) where N is the points count and M
+            the :math:`y` variable values count.
+
+        Examples
+        --------
+        >>> y = np.array([5.9200, 9.3700, 10.8135, 4.5100,
+        ...               69.5900, 27.8007, 86.0500])
+        >>> x = np.arange(len(y))
+        >>> f = SpragueInterpolator(x, y)
+        >>> W = f.weights([0.25, 0.75])
+        >>> W.shape
+        (2, 7)
+        >>> W.dot(y)  # doctest: +ELLIPSIS
+        array([ 6.7295161...,  7.8140625...])
+        """
+
+        x = np.ravel(np.atleast_1d(x).astype(self._dtype))
+
+        self._validate_dimensions()
+        self._validate_interpolation_range(x)
+
+        i = np.searchsorted(self._xp, x) - 1
+        X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
+
+        # Coefficients of the interpolating polynomial terms, i.e. "a0p" to
+        # "a5p", for the padded :math:`y` variable values "r[i - 2]" to
+        # "r[i + 3]".
+        A = np.array([
+            [0, 0, 24, 0, 0, 0],
+            [2, -16, 0, 16, -2, 0],
+            [-1, 16, -30, 16, -1, 0],
+            [-9, 39, -70, 66, -33, 7],
+            [13, -64, 126, -124, 61, -12],
+            [-5, 25, -50, 50, -25, 5],
+        ]) / 24
+
+        values = np.dot(X[..., np.newaxis] ** np.arange(6), A)
+        rows = np.repeat(np.arange(x.size), 6)
+        # The first point yields a null-weighted "-1" index, wrapped around
+        # as in :meth:`SpragueInterpolator._evaluate` method.
+        columns = (i[..., np.newaxis] + np.arange(-2, 4)).ravel()
+        columns %= self._yp.size
+
+        W_p = scipy.sparse.coo_matrix(
+            (values.ravel(), (rows, columns)),
+            shape=(x.size, self._yp.size)).tocsr()
+
+        # Linear map from the :math:`y` variable values to the padded ones.
+        size = self._y.size
+        C = self.SPRAGUE_C_COEFFICIENTS / 209
+        P = np.zeros((size + 4, size))
+        P[0, :6] = C[0]
+        P[1, :6] = C[1]
+        P[2:-2] = np.identity(size)
+        P[-2, -6:] = C[2]
+        P[-1, -6:] = C[3]
+
+        return W_p.dot(scipy.sparse.csr_matrix(P))
+
     def _evaluate(self, x):
         """
         Performs the interpolating polynomial evaluation at given point.
@@ -1113,6 +1414,10 @@ class CubicSplineInterpolator(scipy.interpolate.interp1d):
     """
     Interpolates a 1-D function using cubic spline interpolation.
 
+    Methods
+    -------
+    weights
+
     Notes
     -----
     This class is a wrapper around *scipy.interpolate.interp1d* class.
@@ -1122,6 +1427,55 @@ class CubicSplineInterpolator(scipy.interpolate.interp1d):
         super(CubicSplineInterpolator, self).__init__(
             kind='cubic', *args, **kwargs)
 
+    def weights(self, x):
+        """
+        Returns the sparse matrix of the linear combination of the :math:`y`
+        variable values interpolating given points.
+
+        Parameters
+        ----------
+        x : numeric or array_like
+            Point(s) to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Sparse matrix of shape (N, M) where N is the points count and M
+            the :math:`y` variable values count.
+
+        Notes
+        -----
+        -   The spline coefficients are linear in the :math:`y` variable
+            values, the matrix is computed by interpolating the identity
+            matrix columns.
+
+        Examples
+        --------
+        >>> y = np.array([5.9200, 9.3700, 10.8135, 4.5100,
+        ...               69.5900, 27.8007, 86.0500])
+        >>> x = np.arange(len(y))
+        >>> f = CubicSplineInterpolator(x, y)
+        >>> W = f.weights([0.25, 0.75])
+        >>> W.shape
+        (2, 7)
+        >>> np.allclose(W.dot(y), f([0.25, 0.75]))
+        True
+        """
+
+        x = np.ravel(x)
+
+        interpolator = scipy.interpolate.interp1d(
+            self.x,
+            np.identity(self.x.size),
+            kind='cubic',
+            axis=0,
+            copy=False,
+            bounds_error=self.bounds_error,
+            fill_value=self.fill_value,
+            assume_sorted=True)
+
+        return scipy.sparse.csr_matrix(interpolator(x))
+
 
 class PchipInterpolator(scipy.interpolate.PchipInterpolator):
     """
@@ -1504,3 +1858,254 @@ def lagrange_coefficients(r, n=4):
         L_n.append(reduce(lambda x, y: x * y, basis))  # noqa
 
     return np.array(L_n)
+
+
+def _table_interpolation_cell(V_xyz, table):
+    """
+    Returns the cells of given 3D table enclosing given normalised values, i.e.
+    the table channels flattened, the flat indexes of the cells origins, the
+    flat index strides of the table axes and the values fractional positions
+    within the cells.
+
+    Parameters
+    ----------
+    V_xyz : ndarray, (N, 3)
+        Values normalised to domain [0, 1].
+    table : array_like, (I, J, K, C)
+        3D table.
+
+    Returns
+    -------
+    tuple
+        Table flattened channels, cells origins flat indexes, table axes flat
+        index strides and values fractional positions along each axis.
+    """
+
+    table = np.asarray(table, dtype=DEFAULT_FLOAT_DTYPE)
+
+    assert table.ndim == 4, '"table" must be a 4-dimensional array!'
+
+    size = table.shape[:3]
+
+    assert min(size) >= 2, (
+        '"table" must have at least 2 samples along each axis!')
+
+    # Gathering from contiguous single channel tables is substantially faster
+    # than gathering rows of the multi-channel table.
+    channels = [
+        np.ravel(table[..., i]) for i in range(table.shape[-1])
+    ]
+    strides = (size[1] * size[2], size[2], 1)
+
+    i_xyz = 0
+    f_xyz = []
+    for i, V in enumerate(np.transpose(V_xyz)):
+        # Values outside the table domain are clamped to its boundary. Casting
+        # *nan* to integer is undefined, clipping the indexes keeps them valid
+        # and the fractional positions propagate the *nan*.
+        f = np.clip(V, 0, 1)
+        f *= size[i] - 1
+        i_V = np.clip(f.astype(np.int_), 0, size[i] - 2)
+        f -= i_V
+
+        i_xyz = i_xyz + i_V * strides[i]
+        f_xyz.append(f)
+
+    return channels, i_xyz, strides, f_xyz
+
+
+def table_interpolation_trilinear(V_xyz, table):
+    """
+    Performs trilinear interpolation of given :math:`V_{xyz}` values using
+    given interpolation table.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1].
+    table : array_like, (I, J, K, C)
+        4-Dimensional (I, J, K, C) interpolation table, the first three axes
+        are the table samples along the :math:`x`, :math:`y` and :math:`z`
+        axes.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+
+    Notes
+    -----
+    -   :math:`V_{xyz}` values outside domain [0, 1] are clamped.
+    -   The interpolation gathers the 8 vertexes of the cells enclosing all
+        the :math:`V_{xyz}` values at once, the memory footprint is thus
+        proportional to the values count.
+
+    References
+    ----------
+    -   :cite:`Bourkeb`
+
+    Examples
+    --------
+    >>> samples = np.linspace(0, 1, 3)
+    >>> table = np.stack(np.meshgrid(samples, samples, samples,
+    ...                              indexing='ij'), axis=-1) ** 2
+    >>> V_xyz = np.array([[0.25, 0.50, 0.75], [1.00, 0.10, 0.00]])
+    >>> table_interpolation_trilinear(V_xyz, table)
+    array([[ 0.125,  0.25 ,  0.625],
+           [ 1.   ,  0.05 ,  0.   ]])
+    """
+
+    V_xyz = np.asarray(V_xyz, dtype=DEFAULT_FLOAT_DTYPE)
+    shape = V_xyz.shape
+    V_xyz = np.reshape(V_xyz, (-1, 3))
+
+    channels, i, (s_x, s_y, s_z), (f_x, f_y, f_z) = _table_interpolation_cell(
+        V_xyz, table)
+    c_x, c_y, c_z = 1 - f_x, 1 - f_y, 1 - f_z
+
+    V_xyzo = np.zeros((len(channels), V_xyz.shape[0]))
+    for w_xy, o_xy in ((c_x * c_y, 0), (c_x * f_y, s_y), (f_x * c_y, s_x),
+                       (f_x * f_y, s_x + s_y)):
+        for w_z, o_z in ((c_z, 0), (f_z, s_z)):
+            w = w_xy * w_z
+            i_c = i + (o_xy + o_z)
+            for j, channel in enumerate(channels):
+                V_xyzo[j] += w * channel.take(i_c)
+
+    return np.reshape(np.transpose(V_xyzo), shape[:-1] + (len(channels), ))
+
+
+def table_interpolation_tetrahedral(V_xyz, table):
+    """
+    Performs tetrahedral interpolation of given :math:`V_{xyz}` values using
+    given interpolation table.
+
+    Each table cell is split into 6 tetrahedra sharing its main diagonal, the
+    tetrahedron enclosing a value is selected by the ordering of its
+    fractional position components and only its 4 vertexes are gathered.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1].
+    table : array_like, (I, J, K, C)
+        4-Dimensional (I, J, K, C) interpolation table, the first three axes
+        are the table samples along the :math:`x`, :math:`y` and :math:`z`
+        axes.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+
+    Notes
+    -----
+    -   :math:`V_{xyz}` values outside domain [0, 1] are clamped.
+    -   The interpolation gathers the 4 vertexes of the tetrahedra enclosing
+        all the :math:`V_{xyz}` values at once, the memory footprint is thus
+        proportional to the values count.
+    -   Values on the table main diagonal, i.e. neutral values, are
+        interpolated along the diagonal only.
+
+    References
+    ----------
+    -   :cite:`Kirk2006`
+
+    Examples
+    --------
+    >>> samples = np.linspace(0, 1, 3)
+    >>> table = np.stack(np.meshgrid(samples, samples, samples,
+    ...                              indexing='ij'), axis=-1) ** 2
+    >>> V_xyz = np.array([[0.25, 0.50, 0.75], [1.00, 0.10, 0.00]])
+    >>> table_interpolation_tetrahedral(V_xyz, table)
+    array([[ 0.125,  0.25 ,  0.625],
+           [ 1.   ,  0.05 ,  0.   ]])
+    """
+
+    V_xyz = np.asarray(V_xyz, dtype=DEFAULT_FLOAT_DTYPE)
+    shape = V_xyz.shape
+    V_xyz = np.reshape(V_xyz, (-1, 3))
+
+    channels, i, (s_x, s_y, s_z), (f_x, f_y, f_z) = _table_interpolation_cell(
+        V_xyz, table)
+
+    f_max = np.maximum(np.maximum(f_x, f_y), f_z)
+    f_min = np.minimum(np.minimum(f_x, f_y), f_z)
+    f_mid = f_x + f_y + f_z - f_max - f_min
+
+    # The tetrahedron second vertex is reached by stepping along the axis of
+    # the largest fractional position component and its third vertex is the
+    # cell opposite vertex minus a step along the axis of the smallest one,
+    # with ties, the ambiguous vertexes have null weights.
+    with np.errstate(invalid='ignore'):
+        s_max = np.where(f_x >= f_y, np.where(f_x >= f_z, s_x, s_z),
+                         np.where(f_y >= f_z, s_y, s_z))
+        s_min = np.where(f_x <= f_y, np.where(f_x <= f_z, s_x, s_z),
+                         np.where(f_y <= f_z, s_y, s_z))
+    s = s_x + s_y + s_z
+
+    V_xyzo = np.zeros((len(channels), V_xyz.shape[0]))
+    for w, i_c in ((1 - f_max, i), (f_max - f_mid, i + s_max),
+                   (f_mid - f_min, i + s - s_min), (f_min, i + s)):
+        for j, channel in enumerate(channels):
+            V_xyzo[j] += w * channel.take(i_c)
+
+    return np.reshape(np.transpose(V_xyzo), shape[:-1] + (len(channels), ))
+
+
+TABLE_INTERPOLATION_METHODS = CaseInsensitiveMapping({
+    'Trilinear': table_interpolation_trilinear,
+    'Tetrahedral': table_interpolation_tetrahedral,
+})
+TABLE_INTERPOLATION_METHODS.__doc__ = """
+Supported 3D table interpolation methods.
+
+References
+----------
+-   :cite:`Bourkeb`
+-   :cite:`Kirk2006`
+
+TABLE_INTERPOLATION_METHODS : CaseInsensitiveMapping
+    **{'Trilinear', 'Tetrahedral'}**
+"""
+
+
+def table_interpolation(V_xyz, table, method='Trilinear'):
+    """
+    Performs interpolation of given :math:`V_{xyz}` values using given
+    interpolation table and method.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1].
+    table : array_like, (I, J, K, C)
+        4-Dimensional (I, J, K, C) interpolation table.
+    method : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation method.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+
+    References
+    ----------
+    -   :cite:`Bourkeb`
+    -   :cite:`Kirk2006`
+
+    Examples
+    --------
+    >>> samples = np.linspace(0, 1, 3)
+    >>> table = np.stack(np.meshgrid(samples, samples, samples,
+    ...                              indexing='ij'), axis=-1) ** 2
+    >>> V_xyz = np.array([0.10, 0.30, 0.90])
+    >>> table_interpolation(V_xyz, table)  # doctest: +ELLIPSIS
+    array([ 0.05...,  0.15...,  0.85...])
+    >>> table_interpolation(V_xyz, table, method='Tetrahedral')
+    ... # doctest: +ELLIPSIS
+    array([ 0.05...,  0.15...,  0.85...])
+    """
+
+    return TABLE_INTERPOLATION_METHODS[method](V_xyz, table)
@@ -19,7 +19,8 @@ from colour.algebra import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
     kernel_cardinal_spline, KernelInterpolator, LinearInterpolator,
     SpragueInterpolator, CubicSplineInterpolator, PchipInterpolator,
-    NullInterpolator, lagrange_coefficients)
+    NullInterpolator, lagrange_coefficients, table_interpolation_trilinear,
+    table_interpolation_tetrahedral, table_interpolation)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -38,7 +39,9 @@ __all__ = [
     'TestKernelLanczos', 'TestKernelCardinalSpline', 'TestKernelInterpolator',
     'TestLinearInterpolator', 'TestSpragueInterpolator',
     'TestCubicSplineInterpolator', 'TestPchipInterpolator',
-    'TestNullInterpolator', 'TestLagrangeCoefficients'
+    'TestNullInterpolator', 'TestLagrangeCoefficients', 'TABLE_A',
+    'TABLE_V_XYZ_A', 'TestTableInterpolationTrilinear',
+    'TestTableInterpolationTetrahedral', 'TestTableInterpolation'
 ]
 
 POINTS_DATA_A = (9.3700, 12.3200, 12.4600, 9.5100, 5.9200, 4.3300, 4.2900,
@@ -308,7 +311,7 @@ class TestKernelInterpolator(unittest.TestCase):
         """
 
         required_attributes = ('x', 'y', 'window', 'kernel', 'kernel_args',
-                               'padding_args')
+                               'padding_args', 'chunk_size')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(KernelInterpolator))
@@ -318,7 +321,7 @@ class TestKernelInterpolator(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ()
+        required_methods = ('weights', )
 
         for method in required_methods:
             self.assertIn(method, dir(KernelInterpolator))
@@ -412,6 +415,79 @@ class TestKernelInterpolator(unittest.TestCase):
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+        # Chunked evaluation.
+        x_i = np.linspace(1, 9, 1001)
+        for chunk_size in (1, 7, 1000, 1001):
+            np.testing.assert_almost_equal(
+                KernelInterpolator(x_1, y, chunk_size=chunk_size)(x_i),
+                KernelInterpolator(x_1, y)(x_i),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            KernelInterpolator(x_1, y)(np.reshape(x_i[:1000], (10, 10, 10))),
+            np.reshape(KernelInterpolator(x_1, y)(x_i[:1000]), (10, 10, 10)),
+            decimal=7)
+
+    def test_weights(self):
+        """
+        Tests :func:`colour.algebra.interpolation.KernelInterpolator.weights`
+        method.
+        """
+
+        x = np.arange(11, 26, 1)
+        y = np.sin(x / len(x) * np.pi * 6) / (x / len(x)) + 0.1
+        x_i = np.linspace(11, 25, 101)
+
+        for padding_mode in ('reflect', 'symmetric', 'edge', 'wrap',
+                             'constant', 'linear_ramp', 'mean'):
+            interpolator = KernelInterpolator(
+                x,
+                y,
+                padding_args={
+                    'pad_width': (3, 3),
+                    'mode': padding_mode
+                },
+                chunk_size=16)
+
+            W = interpolator.weights(x_i)
+            self.assertTupleEqual(W.shape, (101, 15))
+            np.testing.assert_almost_equal(
+                W.dot(y), interpolator(x_i), decimal=7)
+
+            y_2 = np.cos(x)
+            interpolator.y = y_2
+            np.testing.assert_almost_equal(
+                W.dot(y_2), interpolator(x_i), decimal=7)
+
+            np.testing.assert_almost_equal(
+                W.dot(np.transpose([y, y_2])),
+                np.transpose([W.dot(y), W.dot(y_2)]),
+                decimal=7)
+
+        self.assertRaises(
+            ValueError,
+            KernelInterpolator(
+                x,
+                y,
+                padding_args={
+                    'pad_width': (3, 3),
+                    'mode': 'constant',
+                    'constant_values': 1
+                }).weights,
+            x_i)
+
+        for padding_mode in ('maximum', 'minimum', 'median'):
+            self.assertRaises(
+                ValueError,
+                KernelInterpolator(
+                    x,
+                    y,
+                    padding_args={
+                        'pad_width': (3, 3),
+                        'mode': padding_mode
+                    }).weights,
+                x_i)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -448,7 +524,7 @@ class TestLinearInterpolator(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ()
+        required_methods = ('weights', )
 
         for method in required_methods:
             self.assertIn(method, dir(LinearInterpolator))
@@ -475,6 +551,27 @@ class TestLinearInterpolator(unittest.TestCase):
                 np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)),
             LINEAR_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+    def test_weights(self):
+        """
+        Tests :func:`colour.algebra.interpolation.LinearInterpolator.weights`
+        method.
+        """
+
+        x = np.arange(len(POINTS_DATA_A))
+        linear_interpolator = LinearInterpolator(x, POINTS_DATA_A)
+
+        x_i = np.arange(0, len(POINTS_DATA_A) - 1 + 0.1, 0.1)
+        W = linear_interpolator.weights(x_i)
+        self.assertTupleEqual(W.shape, (x_i.size, len(POINTS_DATA_A)))
+        np.testing.assert_almost_equal(
+            W.dot(POINTS_DATA_A),
+            LINEAR_INTERPOLATED_POINTS_DATA_A_10_SAMPLES,
+            decimal=7)
+        np.testing.assert_almost_equal(
+            W.sum(axis=1), np.ones((x_i.size, 1)), decimal=7)
+
+        self.assertRaises(ValueError, linear_interpolator.weights, -1)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -514,7 +611,7 @@ class TestSpragueInterpolator(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ()
+        required_methods = ('weights', )
 
         for method in required_methods:
             self.assertIn(method, dir(SpragueInterpolator))
@@ -541,6 +638,26 @@ class TestSpragueInterpolator(unittest.TestCase):
                 np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)),
             SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+    def test_weights(self):
+        """
+        Tests :func:`colour.algebra.interpolation.SpragueInterpolator.weights`
+        method.
+        """
+
+        x = np.arange(len(POINTS_DATA_A))
+        sprague_interpolator = SpragueInterpolator(x, POINTS_DATA_A)
+
+        x_i = np.arange(0, len(POINTS_DATA_A) - 1 + 0.1, 0.1)
+        W = sprague_interpolator.weights(x_i)
+        self.assertTupleEqual(W.shape, (x_i.size, len(POINTS_DATA_A)))
+        np.testing.assert_almost_equal(
+            W.dot(POINTS_DATA_A),
+            SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES,
+            decimal=7)
+
+        self.assertRaises(ValueError, sprague_interpolator.weights,
+                          len(POINTS_DATA_A))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -582,6 +699,24 @@ CubicSplineInterpolator.__call__` method.
                 POINTS_DATA_A)(np.linspace(0, 1, len(POINTS_DATA_A) * 2)),
             CUBIC_SPLINE_INTERPOLATED_POINTS_DATA_A_X2_SAMPLES)
 
+    def test_weights(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+CubicSplineInterpolator.weights` method.
+        """
+
+        cubic_spline_interpolator = CubicSplineInterpolator(
+            np.linspace(0, 1, len(POINTS_DATA_A)), POINTS_DATA_A)
+
+        W = cubic_spline_interpolator.weights(
+            np.linspace(0, 1, len(POINTS_DATA_A) * 2))
+        self.assertTupleEqual(W.shape,
+                              (len(POINTS_DATA_A) * 2, len(POINTS_DATA_A)))
+        np.testing.assert_almost_equal(
+            W.dot(POINTS_DATA_A),
+            CUBIC_SPLINE_INTERPOLATED_POINTS_DATA_A_X2_SAMPLES,
+            decimal=7)
+
 
 class TestPchipInterpolator(unittest.TestCase):
     """
@@ -699,5 +834,181 @@ class TestLagrangeCoefficients(unittest.TestCase):
         np.testing.assert_almost_equal(lc, LAGRANGE_COEFFICIENTS_B, decimal=7)
 
 
+def _table(function, size=5):
+    """
+    Returns a 3D table of given function sampled along each axis.
+    """
+
+    samples = np.linspace(0, 1, size)
+
+    return function(*np.meshgrid(samples, samples, samples, indexing='ij'))
+
+
+TABLE_A = _table(lambda x, y, z: np.stack([x ** 2, y * z, np.sqrt(x + z)],
+                                          axis=-1))
+
+TABLE_V_XYZ_A = np.array([
+    [0.10, 0.20, 0.30],
+    [0.45, 0.65, 0.85],
+    [0.90, 0.05, 0.55],
+    [1.20, -0.10, 0.50],
+])
+
+
+class TestTableInterpolationTrilinear(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition unit tests methods.
+    """
+
+    def test_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(TABLE_V_XYZ_A, TABLE_A),
+            np.array([
+                [0.02500000, 0.06000000, 0.62040902],
+                [0.21250000, 0.55250000, 1.13801739],
+                [0.82500000, 0.02750000, 1.20237308],
+                [1.00000000, 0.00000000, 1.22474487],
+            ]),
+            decimal=7)
+
+        # Multi-linear functions are reproduced exactly.
+        table = _table(lambda x, y, z: np.stack([x * y * z, x - y, 1 + z],
+                                                axis=-1))
+        V_xyz = np.random.RandomState(4).random_sample((64, 3))
+        x, y, z = np.transpose(V_xyz)
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(V_xyz, table),
+            np.transpose([x * y * z, x - y, 1 + z]),
+            decimal=7)
+
+    def test_n_dimensional_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition n-dimensional arrays support.
+        """
+
+        V_xyz = TABLE_V_XYZ_A[1]
+        V_xyzo = table_interpolation_trilinear(V_xyz, TABLE_A)
+
+        V_xyz = np.tile(V_xyz, (6, 1))
+        V_xyzo = np.tile(V_xyzo, (6, 1))
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(V_xyz, TABLE_A), V_xyzo, decimal=7)
+
+        V_xyz = np.reshape(V_xyz, (2, 3, 3))
+        V_xyzo = np.reshape(V_xyzo, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(V_xyz, TABLE_A), V_xyzo, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        table_interpolation_trilinear(cases, TABLE_A)
+
+
+class TestTableInterpolationTetrahedral(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition unit tests methods.
+    """
+
+    def test_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(TABLE_V_XYZ_A, TABLE_A),
+            np.array([
+                [0.02500000, 0.06250000, 0.61462644],
+                [0.21250000, 0.56250000, 1.13711154],
+                [0.82500000, 0.03750000, 1.20168668],
+                [1.00000000, 0.00000000, 1.22474487],
+            ]),
+            decimal=7)
+
+        # Affine functions are reproduced exactly, including on the cells
+        # faces and diagonals where the tetrahedra selection is ambiguous.
+        table = _table(lambda x, y, z: np.stack(
+            [x + 2 * y - z, 0.5 * x, 1 - z], axis=-1))
+        V_xyz = np.vstack([
+            np.random.RandomState(4).random_sample((64, 3)),
+            np.array([[0.3, 0.3, 0.3], [0.3, 0.3, 0.1], [0.3, 0.1, 0.1],
+                      [0.25, 0.5, 0.75]]),
+        ])
+        x, y, z = np.transpose(V_xyz)
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, table),
+            np.transpose([x + 2 * y - z, 0.5 * x, 1 - z]),
+            decimal=7)
+
+    def test_n_dimensional_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition n-dimensional arrays support.
+        """
+
+        V_xyz = TABLE_V_XYZ_A[1]
+        V_xyzo = table_interpolation_tetrahedral(V_xyz, TABLE_A)
+
+        V_xyz = np.tile(V_xyz, (6, 1))
+        V_xyzo = np.tile(V_xyzo, (6, 1))
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, TABLE_A), V_xyzo, decimal=7)
+
+        V_xyz = np.reshape(V_xyz, (2, 3, 3))
+        V_xyzo = np.reshape(V_xyzo, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, TABLE_A), V_xyzo, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        table_interpolation_tetrahedral(cases, TABLE_A)
+
+
+class TestTableInterpolation(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.table_interpolation`
+    definition unit tests methods.
+    """
+
+    def test_table_interpolation(self):
+        """
+        Tests :func:`colour.algebra.interpolation.table_interpolation`
+        definition.
+        """
+
+        np.testing.assert_equal(
+            table_interpolation(TABLE_V_XYZ_A, TABLE_A),
+            table_interpolation_trilinear(TABLE_V_XYZ_A, TABLE_A))
+
+        np.testing.assert_equal(
+            table_interpolation(TABLE_V_XYZ_A, TABLE_A, 'tetrahedral'),
+            table_interpolation_tetrahedral(TABLE_V_XYZ_A, TABLE_A))
+
+        self.assertRaises(AssertionError, table_interpolation, TABLE_V_XYZ_A,
+                          TABLE_A[0])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,7 +8,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import random_triplet_generator, halton_triplet_generator
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +17,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_TRIPLETS', 'TestRandomTripletGenerator']
+__all__ = [
+    'RANDOM_TRIPLETS', 'HALTON_TRIPLETS', 'TestRandomTripletGenerator',
+    'TestHaltonTripletGenerator'
+]
 
 RANDOM_TRIPLETS = np.array([
     [0.96702984, 0.54723225, 0.97268436],
@@ -32,6 +35,13 @@ RANDOM_TRIPLETS = np.array([
     [0.16797218, 0.73338017, 0.40844386],
 ])
 
+HALTON_TRIPLETS = np.array([
+    [0.77225112, 0.66962147, 0.42142814],
+    [0.27225112, 0.00295481, 0.82142814],
+    [0.52225112, 0.33628814, 0.22142814],
+    [0.02225112, 0.78073259, 0.62142814],
+])
+
 
 class TestRandomTripletGenerator(unittest.TestCase):
     """
@@ -63,5 +73,45 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
             decimal=7)
 
 
+class TestHaltonTripletGenerator(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.halton_triplet_generator` definition
+    unit tests methods.
+    """
+
+    def test_halton_triplet_generator(self):
+        """
+        Tests :func:`colour.algebra.random.halton_triplet_generator`
+        definition.
+        """
+
+        prng = np.random.RandomState(4)
+        np.testing.assert_almost_equal(
+            HALTON_TRIPLETS,
+            np.array(list(halton_triplet_generator(4, random_state=prng))),
+            decimal=7)
+
+        limits = np.array([[0, 100], [-150, 150], [-50, 50]])
+        triplets = np.array(
+            list(
+                halton_triplet_generator(
+                    1000, limits, random_state=np.random.RandomState(1))))
+        self.assertTrue(np.all(triplets >= limits[..., 0]))
+        self.assertTrue(np.all(triplets < limits[..., 1]))
+
+        # Each axis is stratified: every interval of a regular partition
+        # with a power of the axis base intervals count holds one triplet.
+        triplets = np.array(
+            list(
+                halton_triplet_generator(
+                    243, random_state=np.random.RandomState(2))))
+        np.testing.assert_equal(
+            np.bincount(np.floor(triplets[:128, 0] * 128).astype(np.int_)),
+            np.ones(128))
+        np.testing.assert_equal(
+            np.bincount(np.floor(triplets[:, 1] * 243).astype(np.int_)),
+            np.ones(243))
+
+
 if __name__ == '__main__':
     unittest.main()
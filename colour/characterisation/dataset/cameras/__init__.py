@@ -11,9 +11,9 @@ References
 from __future__ import absolute_import
 
 from .dslr import DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
-CAMERAS_RGB_SPECTRAL_SENSITIVITIES = CaseInsensitiveMapping(
+CAMERAS_RGB_SPECTRAL_SENSITIVITIES = LazyCaseInsensitiveMapping(
     DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES)
 CAMERAS_RGB_SPECTRAL_SENSITIVITIES.__doc__ = """
 Cameras *RGB* spectral sensitivities.
@@ -22,7 +22,7 @@ References
 ----------
 -   :cite:`Darrodi2015a`
 
-CAMERAS_RGB_SPECTRAL_SENSITIVITIES : CaseInsensitiveMapping
+CAMERAS_RGB_SPECTRAL_SENSITIVITIES : LazyCaseInsensitiveMapping
     **{Nikon 5100 (NPL), Sigma SDMerill (NPL)}**
 """
 
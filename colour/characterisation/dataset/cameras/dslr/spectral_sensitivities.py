@@ -33,8 +33,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.characterisation import RGB_SpectralSensitivities
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -496,13 +498,15 @@ DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES_DATA = {
     }
 }  # yapf: disable
 
-DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES = CaseInsensitiveMapping({
+DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES = LazyCaseInsensitiveMapping({
     'Nikon 5100 (NPL)':
-        RGB_SpectralSensitivities(
+        partial(
+            RGB_SpectralSensitivities,
             DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES_DATA['Nikon 5100 (NPL)'],
             name='Nikon 5100 (NPL)'),
     'Sigma SDMerill (NPL)':
-        RGB_SpectralSensitivities(
+        partial(
+            RGB_SpectralSensitivities,
             DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES_DATA[
                 'Sigma SDMerill (NPL)'],
             name='Sigma SDMerill (NPL)')
@@ -514,6 +518,6 @@ References
 ----------
 -   :cite:`Darrodi2015a`
 
-DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES : CaseInsensitiveMapping
+DSLR_CAMERAS_RGB_SPECTRAL_SENSITIVITIES : LazyCaseInsensitiveMapping
     **{Nikon 5100 (NPL), Sigma SDMerill (NPL)}**
 """
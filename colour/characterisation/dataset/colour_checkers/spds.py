@@ -41,8 +41,11 @@ MacbethColorChecker.xls
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import (CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -2083,12 +2086,13 @@ COLORCHECKER_N_OHTA_SPDS_DATA = {
     }
 }
 
-COLORCHECKER_N_OHTA_SPDS = dict((key, SpectralPowerDistribution(
-    value, name=key)) for key, value in COLORCHECKER_N_OHTA_SPDS_DATA.items())
+COLORCHECKER_N_OHTA_SPDS = LazyCaseInsensitiveMapping(
+    dict((key, partial(SpectralPowerDistribution, value, name=key))
+         for key, value in COLORCHECKER_N_OHTA_SPDS_DATA.items()))
 """
 Measured by *Ohta (1997)*.
 
-COLORCHECKER_N_OHTA_SPDS : dict
+COLORCHECKER_N_OHTA_SPDS : LazyCaseInsensitiveMapping
 """
 
 BABELCOLOR_AVERAGE_SPDS_DATA = {
@@ -3006,12 +3010,13 @@ BABELCOLOR_AVERAGE_SPDS_DATA = {
     }
 }
 
-BABELCOLOR_AVERAGE_SPDS = dict((key, SpectralPowerDistribution(
-    value, name=key)) for key, value in BABELCOLOR_AVERAGE_SPDS_DATA.items())
+BABELCOLOR_AVERAGE_SPDS = LazyCaseInsensitiveMapping(
+    dict((key, partial(SpectralPowerDistribution, value, name=key))
+         for key, value in BABELCOLOR_AVERAGE_SPDS_DATA.items()))
 """
 Average data derived from measurements of 30 *ColourChecker* charts.
 
-BABELCOLOR_AVERAGE_SPDS : dict
+BABELCOLOR_AVERAGE_SPDS : LazyCaseInsensitiveMapping
 """
 
 COLOURCHECKERS_SPDS = CaseInsensitiveMapping({
@@ -35,8 +35,10 @@ context=article
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.characterisation import RGB_DisplayPrimaries
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -133,9 +135,10 @@ LCD_DISPLAYS_RGB_PRIMARIES_DATA = {
     }
 }
 
-LCD_DISPLAYS_RGB_PRIMARIES = CaseInsensitiveMapping({
+LCD_DISPLAYS_RGB_PRIMARIES = LazyCaseInsensitiveMapping({
     'Apple Studio Display':
-        RGB_DisplayPrimaries(
+        partial(
+            RGB_DisplayPrimaries,
             LCD_DISPLAYS_RGB_PRIMARIES_DATA['Apple Studio Display'],
             name='Apple Studio Display')
 })
@@ -147,6 +150,6 @@ References
 -   :cite:`Fairchild1998b`
 -   :cite:`Machado2010a`
 
-LCD_DISPLAYS_RGB_PRIMARIES : CaseInsensitiveMapping
+LCD_DISPLAYS_RGB_PRIMARIES : LazyCaseInsensitiveMapping
     **{'Apple Studio Display'}**
 """
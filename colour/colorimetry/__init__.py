@@ -2,9 +2,10 @@
 
 from __future__ import absolute_import
 
-from .spectrum import (SpectralShape, SpectralPowerDistribution,
-                       MultiSpectralPowerDistribution, DEFAULT_SPECTRAL_SHAPE,
-                       constant_spd, zeros_spd, ones_spd)
+from .spectrum import (
+    SpectralShape, SpectralResampler, SpectralPowerDistribution,
+    MultiSpectralPowerDistribution, DEFAULT_SPECTRAL_SHAPE, constant_spd,
+    zeros_spd, ones_spd)
 from .blackbody import (blackbody_spd, blackbody_spectral_radiance, planck_law)
 from .cmfs import (LMS_ConeFundamentals, RGB_ColourMatchingFunctions,
                    XYZ_ColourMatchingFunctions)
@@ -37,13 +38,16 @@ from .transformations import LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs
 from .transformations import LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs
 from .tristimulus import SPECTRAL_TO_XYZ_METHODS
 from .tristimulus import spectral_to_XYZ
+from .tristimulus import MULTI_SPECTRAL_TO_XYZ_METHODS
+from .tristimulus import multi_spectral_to_XYZ
 from .tristimulus import (
     ASTME30815_PRACTISE_SHAPE, lagrange_coefficients_ASTME202211,
     tristimulus_weighting_factors_ASTME202211,
     adjust_tristimulus_weighting_factors_ASTME30815,
     spectral_to_XYZ_integration,
     spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
-    spectral_to_XYZ_ASTME30815, wavelength_to_XYZ)
+    spectral_to_XYZ_ASTME30815, multi_spectral_to_XYZ_integration,
+    multi_spectral_to_XYZ_ASTME30815, wavelength_to_XYZ)
 from .whiteness import WHITENESS_METHODS
 from .whiteness import whiteness
 from .whiteness import (whiteness_Berger1959, whiteness_Taube1960,
@@ -54,7 +58,7 @@ from .yellowness import yellowness
 from .yellowness import yellowness_ASTMD1925, yellowness_ASTME313
 
 __all__ = [
-    'SpectralShape', 'SpectralPowerDistribution',
+    'SpectralShape', 'SpectralResampler', 'SpectralPowerDistribution',
     'MultiSpectralPowerDistribution', 'DEFAULT_SPECTRAL_SHAPE', 'constant_spd',
     'zeros_spd', 'ones_spd'
 ]
@@ -95,13 +99,16 @@ __all__ += ['LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs']
 __all__ += ['LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs']
 __all__ += ['SPECTRAL_TO_XYZ_METHODS']
 __all__ += ['spectral_to_XYZ']
+__all__ += ['MULTI_SPECTRAL_TO_XYZ_METHODS']
+__all__ += ['multi_spectral_to_XYZ']
 __all__ += [
     'ASTME30815_PRACTISE_SHAPE', 'lagrange_coefficients_ASTME202211',
     'tristimulus_weighting_factors_ASTME202211',
     'adjust_tristimulus_weighting_factors_ASTME30815',
     'spectral_to_XYZ_integration',
     'spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
-    'spectral_to_XYZ_ASTME30815', 'wavelength_to_XYZ'
+    'spectral_to_XYZ_ASTME30815', 'multi_spectral_to_XYZ_integration',
+    'multi_spectral_to_XYZ_ASTME30815', 'wavelength_to_XYZ'
 ]
 __all__ += ['WHITENESS_METHODS']
 __all__ += ['whiteness']
@@ -51,8 +51,11 @@ Mesopic_vision#Mesopic_weighting_function
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import (CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -2347,35 +2350,41 @@ PHOTOPIC_LEFS_DATA = {
     }
 }
 
-PHOTOPIC_LEFS = CaseInsensitiveMapping({
+PHOTOPIC_LEFS = LazyCaseInsensitiveMapping({
     'CIE 1924 Photopic Standard Observer':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             PHOTOPIC_LEFS_DATA['CIE 1924 Photopic Standard Observer'],
             name='CIE 1924 Photopic Standard Observer'),
     'Judd Modified CIE 1951 Photopic Standard Observer':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             PHOTOPIC_LEFS_DATA[
                 'Judd Modified CIE 1951 Photopic Standard Observer'],
             name='Judd Modified CIE 1951 Photopic Standard Observer'),
     'Judd-Vos Modified CIE 1978 Photopic Standard Observer':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             PHOTOPIC_LEFS_DATA[
                 'Judd-Vos Modified CIE 1978 Photopic Standard Observer'],
             name='Judd-Vos Modified CIE 1978 Photopic Standard Observer'),
     'CIE 1964 Photopic 10 Degree Standard Observer':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             PHOTOPIC_LEFS_DATA[
                 'CIE 1964 Photopic 10 Degree Standard Observer'],
             name='CIE 1964 Photopic 10 Degree Standard Observer',
             strict_name='CIE 1964 Photopic 10$^\\circ$ Standard Observer'),
     'CIE 2008 2 Degree Physiologically Relevant LEF':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             PHOTOPIC_LEFS_DATA[
                 'CIE 2008 2 Degree Physiologically Relevant LEF'],
             name='CIE 2008 2 Degree Physiologically Relevant LEF',
             strict_name='CIE 2008 2$^\\circ$ Physiologically Relevant LEF'),
     'CIE 2008 10 Degree Physiologically Relevant LEF':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             PHOTOPIC_LEFS_DATA[
                 'CIE 2008 10 Degree Physiologically Relevant LEF'],
             name='CIE 2008 10 Degree Physiologically Relevant LEF',
@@ -2389,7 +2398,7 @@ References
 -   :cite:`CVRLq`
 -   :cite:`CVRLs`
 
-PHOTOPIC_LEFS : CaseInsensitiveMapping
+PHOTOPIC_LEFS : LazyCaseInsensitiveMapping
     **{'CIE 1924 Photopic Standard Observer',
     'Judd Modified CIE 1951 Photopic Standard Observer',
     'Judd-Vos Modified CIE 1978 Photopic Standard Observer',
@@ -2402,10 +2411,10 @@ Aliases:
 -   'cie_2_1924': 'CIE 1931 2 Degree Standard Observer'
 -   'cie_10_1964': 'CIE 1964 Photopic 10 Degree Standard Observer'
 """
-PHOTOPIC_LEFS['cie_2_1924'] = (
-    PHOTOPIC_LEFS['CIE 1924 Photopic Standard Observer'])
-PHOTOPIC_LEFS['cie_10_1964'] = (
-    PHOTOPIC_LEFS['CIE 1964 Photopic 10 Degree Standard Observer'])
+PHOTOPIC_LEFS['cie_2_1924'] = partial(
+    PHOTOPIC_LEFS.__getitem__, 'CIE 1924 Photopic Standard Observer')
+PHOTOPIC_LEFS['cie_10_1964'] = partial(
+    PHOTOPIC_LEFS.__getitem__, 'CIE 1964 Photopic 10 Degree Standard Observer')
 
 SCOTOPIC_LEFS_DATA = {
     'CIE 1951 Scotopic Standard Observer': {
@@ -2813,9 +2822,10 @@ SCOTOPIC_LEFS_DATA = {
     }
 }
 
-SCOTOPIC_LEFS = CaseInsensitiveMapping({
+SCOTOPIC_LEFS = LazyCaseInsensitiveMapping({
     'CIE 1951 Scotopic Standard Observer':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             SCOTOPIC_LEFS_DATA['CIE 1951 Scotopic Standard Observer'],
             name='CIE 1951 Scotopic Standard Observer')
 })
@@ -2826,17 +2836,17 @@ References
 ----------
 -   :cite:`CVRLs`
 
-SCOTOPIC_LEFS : CaseInsensitiveMapping
+SCOTOPIC_LEFS : LazyCaseInsensitiveMapping
     **{'CIE 1951 Scotopic Standard Observer', }**
 
 Aliases:
 
 -   'cie_1951': 'CIE 1951 Scotopic Standard Observer'
 """
-SCOTOPIC_LEFS['cie_1951'] = (
-    SCOTOPIC_LEFS['CIE 1951 Scotopic Standard Observer'])
+SCOTOPIC_LEFS['cie_1951'] = partial(
+    SCOTOPIC_LEFS.__getitem__, 'CIE 1951 Scotopic Standard Observer')
 
-LEFS = CaseInsensitiveMapping(PHOTOPIC_LEFS)
+LEFS = LazyCaseInsensitiveMapping(PHOTOPIC_LEFS)
 LEFS.__doc__ = """
 Aggregated luminous efficiency functions.
 
@@ -2846,7 +2856,7 @@ References
 -   :cite:`CVRLs`
 -   :cite:`Wikipediacc`
 
-LEFS : CaseInsensitiveMapping
+LEFS : LazyCaseInsensitiveMapping
     **{'CIE 1924 Photopic Standard Observer',
     'Judd Modified CIE 1951 Photopic Standard Observer',
     'Judd-Vos Modified CIE 1978 Photopic Standard Observer',
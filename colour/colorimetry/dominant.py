@@ -36,7 +36,6 @@ import scipy.spatial.distance
 from colour.algebra import (euclidean_distance, extend_line_segment,
                             intersect_line_segments)
 from colour.colorimetry import CMFS
-from colour.models import XYZ_to_xy
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -83,6 +82,7 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse=False):
 
     Examples
     --------
+    >>> from colour.models import XYZ_to_xy
     >>> xy = np.array([0.26415, 0.37770])
     >>> xy_n = np.array([0.31270, 0.32900])
     >>> xy_s = XYZ_to_xy(CMFS['CIE 1931 2 Degree Standard Observer'].values)
@@ -186,6 +186,10 @@ def dominant_wavelength(xy,
     xy = np.asarray(xy)
     xy_n = np.resize(xy_n, xy.shape)
 
+    # *colour.models* sub-package depends on *colour.colorimetry*, it is thus
+    # imported here so that both can be imported independently.
+    from colour.models import XYZ_to_xy
+
     xy_s = XYZ_to_xy(cmfs.values)
 
     i_wl, xy_wl = closest_spectral_locus_wavelength(xy, xy_n, xy_s, reverse)
@@ -6,6 +6,7 @@ Spectrum
 Defines the classes handling spectral data computations:
 
 -   :class:`colour.SpectralShape`
+-   :class:`colour.SpectralResampler`
 -   :class:`colour.SpectralPowerDistribution`
 -   :class:`colour.MultiSpectralPowerDistribution`
 
@@ -36,8 +37,9 @@ from colour.algebra import (Extrapolator, CubicSplineInterpolator,
                             SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal, MultiSignal
-from colour.utilities import (as_numeric, first_item, is_iterable, is_numeric,
-                              is_string, is_uniform, interval, warning)
+from colour.utilities import (LRUCache, as_numeric, first_item, is_iterable,
+                              is_numeric, is_string, is_uniform, interval,
+                              ndarray_digest, warning)
 from colour.utilities.deprecation import Removed, Renamed
 
 __author__ = 'Colour Developers'
@@ -48,7 +50,7 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'SpectralShape', 'SpectralPowerDistribution',
+    'SpectralShape', 'SpectralResampler', 'SpectralPowerDistribution',
     'MultiSpectralPowerDistribution', 'DEFAULT_SPECTRAL_SHAPE', 'constant_spd',
     'zeros_spd', 'ones_spd'
 ]
@@ -467,6 +469,323 @@ class SpectralShape(object):
         return self._range
 
 
+_SPECTRAL_RESAMPLERS_CACHE = LRUCache(maxsize=32)
+
+
+class SpectralResampler(object):
+    """
+    Defines a spectral resampler, i.e. the sparse linear operator resampling
+    spectral data from source wavelengths to target wavelengths with given
+    linear interpolator.
+
+    The operator is computed once at initialisation from the interpolator
+    weights and stacks of spectral data are then resampled with a single
+    sparse matrix product.
+
+    Parameters
+    ----------
+    source : SpectralShape or array_like
+        Spectral shape or wavelengths of the spectral data to resample.
+    target : SpectralShape or array_like
+        Spectral shape or wavelengths to resample the spectral data to.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function, it must be
+        linear in the :math:`y` variable, i.e. define a ``weights`` method,
+        e.g. :class:`colour.SpragueInterpolator`,
+        :class:`colour.CubicSplineInterpolator`,
+        :class:`colour.LinearInterpolator` or
+        :class:`colour.KernelInterpolator` classes. Defaults to
+        :class:`colour.SpragueInterpolator` class if the source wavelengths
+        are uniformly spaced, to :class:`colour.CubicSplineInterpolator`
+        class otherwise.
+    interpolator_args : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+
+    Attributes
+    ----------
+    source
+    target
+    interpolator
+    interpolator_args
+    operator
+
+    Methods
+    -------
+    __repr__
+    __call__
+
+    Raises
+    ------
+    ValueError
+        If the interpolator is not linear in the :math:`y` variable.
+
+    Examples
+    --------
+    >>> values = np.array([[0.0651, 0.0705, 0.0772, 0.0870, 0.1128, 0.1360],
+    ...                    [0.1360, 0.1128, 0.0870, 0.0772, 0.0705, 0.0651]])
+    >>> resampler = SpectralResampler(
+    ...     SpectralShape(500, 600, 20), SpectralShape(500, 600, 10))
+    >>> resampler
+    SpectralResampler(6 -> 11 wavelengths, SpragueInterpolator)
+    >>> resampler(values).shape
+    (2, 11)
+    >>> resampler(values)[..., 1]  # doctest: +ELLIPSIS
+    array([ 0.0676692...,  0.1250465...])
+    """
+
+    def __init__(self,
+                 source,
+                 target,
+                 interpolator=None,
+                 interpolator_args=None):
+        source = (source.range() if isinstance(source, SpectralShape) else
+                  np.asarray(source, dtype=DEFAULT_FLOAT_DTYPE))
+        target = (target.range() if isinstance(target, SpectralShape) else
+                  np.asarray(target, dtype=DEFAULT_FLOAT_DTYPE))
+
+        if interpolator is None:
+            interpolator = (SpragueInterpolator if is_uniform(source) else
+                            CubicSplineInterpolator)
+
+        if interpolator_args is None:
+            interpolator_args = {}
+
+        if not hasattr(interpolator, 'weights'):
+            raise ValueError(
+                '"{0}" interpolator is not linear, the spectral resampler '
+                'operator is undefined!'.format(interpolator.__name__))
+
+        self._source = source
+        self._target = target
+        self._interpolator = interpolator
+        self._interpolator_args = interpolator_args
+        self._operator = interpolator(source, np.zeros(source.shape),
+                                      **interpolator_args).weights(target)
+
+    @property
+    def source(self):
+        """
+        Getter and setter property for the source wavelengths.
+
+        Returns
+        -------
+        ndarray
+            Source wavelengths.
+
+        Warning
+        -------
+        :attr:`SpectralResampler.source` is read only.
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """
+        Getter and setter property for the target wavelengths.
+
+        Returns
+        -------
+        ndarray
+            Target wavelengths.
+
+        Warning
+        -------
+        :attr:`SpectralResampler.target` is read only.
+        """
+
+        return self._target
+
+    @property
+    def interpolator(self):
+        """
+        Getter and setter property for the interpolator class type.
+
+        Returns
+        -------
+        type
+            Interpolator class type.
+
+        Warning
+        -------
+        :attr:`SpectralResampler.interpolator` is read only.
+        """
+
+        return self._interpolator
+
+    @property
+    def interpolator_args(self):
+        """
+        Getter and setter property for the interpolator instantiation time
+        arguments.
+
+        Returns
+        -------
+        dict
+            Interpolator instantiation time arguments.
+
+        Warning
+        -------
+        :attr:`SpectralResampler.interpolator_args` is read only.
+        """
+
+        return self._interpolator_args
+
+    @property
+    def operator(self):
+        """
+        Getter and setter property for the sparse linear operator, i.e. the
+        matrix of shape (W_t, W_s) where W_t is the target wavelengths count
+        and W_s the source wavelengths count.
+
+        Returns
+        -------
+        csr_matrix
+            Sparse linear operator.
+
+        Warning
+        -------
+        :attr:`SpectralResampler.operator` is read only.
+        """
+
+        return self._operator
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the spectral resampler.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{0}({1} -> {2} wavelengths, {3})'.format(
+            self.__class__.__name__, len(self._source), len(self._target),
+            self._interpolator.__name__)
+
+    def __call__(self, values):
+        """
+        Resamples given spectral data.
+
+        Parameters
+        ----------
+        values : array_like
+            Spectral data values of shape (..., W_s) where W_s is the source
+            wavelengths count.
+
+        Returns
+        -------
+        ndarray
+            Resampled spectral data values of shape (..., W_t) where W_t is
+            the target wavelengths count.
+        """
+
+        values = np.asarray(values, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = values.shape
+
+        assert shape[-1] == len(self._source), (
+            'Spectral data values count must match the source wavelengths '
+            'count!')
+
+        values = self._operator.dot(
+            np.transpose(np.reshape(values, (-1, shape[-1]))))
+
+        return np.reshape(
+            np.transpose(values), shape[:-1] + (len(self._target), ))
+
+
+def _spectral_resampler(source, target, interpolator, interpolator_args):
+    """
+    Returns the :class:`colour.SpectralResampler` class instance of given
+    arguments, the instances are cached in the
+    :attr:`colour.colorimetry.spectrum._SPECTRAL_RESAMPLERS_CACHE` bounded
+    least recently used cache, keyed by a digest of the source and target
+    wavelengths.
+
+    Parameters
+    ----------
+    source : SpectralShape or array_like
+        Spectral shape or wavelengths of the spectral data to resample.
+    target : SpectralShape or array_like
+        Spectral shape or wavelengths to resample the spectral data to.
+    interpolator : object
+        Interpolator class type to use as interpolating function.
+    interpolator_args : dict_like
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    SpectralResampler or None
+        Spectral resampler or *None* if the interpolator is not linear.
+    """
+
+    if not hasattr(interpolator, 'weights'):
+        return None
+
+    source = (source.range() if isinstance(source, SpectralShape) else
+              np.asarray(source, dtype=DEFAULT_FLOAT_DTYPE))
+    target = (target.range() if isinstance(target, SpectralShape) else
+              np.asarray(target, dtype=DEFAULT_FLOAT_DTYPE))
+
+    key = (ndarray_digest(source, target), interpolator,
+           tuple(sorted(interpolator_args.items())))
+    try:
+        hash(key)
+    except TypeError:
+        key = None
+
+    if key is not None and key in _SPECTRAL_RESAMPLERS_CACHE:
+        return _SPECTRAL_RESAMPLERS_CACHE[key]
+
+    try:
+        resampler = SpectralResampler(source, target, interpolator,
+                                      interpolator_args)
+    except ValueError:
+        return None
+
+    if key is not None:
+        _SPECTRAL_RESAMPLERS_CACHE[key] = resampler
+
+    return resampler
+
+
+def _interpolation_shape(self_shape, shape):
+    """
+    Returns the spectral shape used to interpolate spectral data of given
+    spectral shape, i.e. given spectral shape with undefined attributes
+    defined from the spectral data one and its boundaries within the spectral
+    data ones.
+
+    Parameters
+    ----------
+    self_shape : SpectralShape
+        Spectral shape of the spectral data to interpolate.
+    shape : SpectralShape
+        Spectral shape used for interpolation.
+
+    Returns
+    -------
+    SpectralShape
+        Spectral shape used to interpolate the spectral data.
+    """
+
+    s_e_i = zip((shape.start, shape.end, shape.interval),
+                (self_shape.start, self_shape.end, self_shape.interval))
+    shape = SpectralShape(
+        * [x[0] if x[0] is not None else x[1] for x in s_e_i])
+    # Defining proper interpolation bounds.
+    # TODO: Provide support for fractional interval like 0.1, etc...
+    if (round(self_shape.start) != self_shape.start or
+            round(self_shape.end) != self_shape.end):
+        warning('Fractional bound encountered, rounding will occur!')
+
+    shape.start = max(shape.start, np.ceil(self_shape.start))
+    shape.end = min(shape.end, np.floor(self_shape.end))
+
+    return shape
+
+
 class SpectralPowerDistribution(Signal):
     """
     Defines the spectral power distribution: the base object for spectral
@@ -1100,19 +1419,7 @@ dict_like, optional
          [ 600.            0.136    ...]]
         """
 
-        self_shape = self.shape
-        s_e_i = zip((shape.start, shape.end, shape.interval),
-                    (self_shape.start, self_shape.end, self_shape.interval))
-        shape = SpectralShape(
-            * [x[0] if x[0] is not None else x[1] for x in s_e_i])
-        # Defining proper interpolation bounds.
-        # TODO: Provide support for fractional interval like 0.1, etc...
-        if (round(self_shape.start) != self_shape.start or
-                round(self_shape.end) != self_shape.end):
-            warning('Fractional bound encountered, rounding will occur!')
-
-        shape.start = max(shape.start, np.ceil(self_shape.start))
-        shape.end = min(shape.end, np.floor(self_shape.end))
+        shape = _interpolation_shape(self.shape, shape)
 
         if interpolator is None:
             if self.is_uniform():
@@ -1123,11 +1430,19 @@ dict_like, optional
         if interpolator_args is None:
             interpolator_args = {}
 
-        interpolator = interpolator(self.wavelengths, self.values,
-                                    **interpolator_args)
+        resampler = _spectral_resampler(self.wavelengths, shape, interpolator,
+                                        interpolator_args)
+        if resampler is not None:
+            values = resampler(self.values)
 
-        self.domain = shape.range()
-        self.range = interpolator(self.domain)
+            self.domain = shape.range()
+            self.range = values
+        else:
+            interpolator = interpolator(self.wavelengths, self.values,
+                                        **interpolator_args)
+
+            self.domain = shape.range()
+            self.range = interpolator(self.domain)
 
         return self
 
@@ -2056,8 +2371,36 @@ MultiSpectralPowerDistribution or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.interpolate(shape, interpolator, interpolator_args)
+        signals = list(self.signals.values())
+        if not signals or any(
+                not np.array_equal(signal.domain, signals[0].domain)
+                for signal in signals[1:]):
+            for signal in signals:
+                signal.interpolate(shape, interpolator, interpolator_args)
+
+            return self
+
+        interpolation_shape = _interpolation_shape(self.shape, shape)
+
+        if interpolator is None:
+            if self.is_uniform():
+                interpolator = SpragueInterpolator
+            else:
+                interpolator = CubicSplineInterpolator
+
+        if interpolator_args is None:
+            interpolator_args = {}
+
+        resampler = _spectral_resampler(self.wavelengths, interpolation_shape,
+                                        interpolator, interpolator_args)
+        if resampler is not None:
+            values = resampler(np.transpose(self.values))
+
+            self.domain = interpolation_shape.range()
+            self.range = np.transpose(values)
+        else:
+            for signal in signals:
+                signal.interpolate(shape, interpolator, interpolator_args)
 
         return self
 
@@ -2168,9 +2511,8 @@ MultiSpectralPowerDistribution or array_like or dict_like, optional
          [ 565.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.align(shape, interpolator, interpolator_args, extrapolator,
-                         extrapolator_args)
+        self.interpolate(shape, interpolator, interpolator_args)
+        self.extrapolate(shape, extrapolator, extrapolator_args)
 
         return self
 
@@ -10,9 +10,12 @@ import unittest
 import scipy
 from distutils.version import LooseVersion
 
+from colour.algebra import (LinearInterpolator, PchipInterpolator,
+                            SpragueInterpolator)
 from colour.colorimetry.spectrum import (
-    SpectralShape, SpectralPowerDistribution, MultiSpectralPowerDistribution,
-    constant_spd, zeros_spd, ones_spd)
+    SpectralShape, SpectralResampler, SpectralPowerDistribution,
+    MultiSpectralPowerDistribution, constant_spd, zeros_spd, ones_spd)
+from colour.colorimetry.spectrum import _spectral_resampler
 from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
@@ -26,9 +29,9 @@ __all__ = [
     'SAMPLE_SPD_DATA', 'NON_UNIFORM_SAMPLE_SPD_DATA',
     'INTERPOLATED_SAMPLE_SPD_DATA', 'INTERPOLATED_NON_UNIFORM_SAMPLE_SPD_DATA',
     'NORMALISED_SAMPLE_SPD_DATA', 'CIE_1931_2_DEGREE_STANDARD_OBSERVER',
-    'CMFS_DATA', 'TestSpectralShape', 'TestSpectralPowerDistribution',
-    'TestMultiSpectralPowerDistribution', 'TestConstantSpd', 'TestZerosSpd',
-    'TestOnes_spd'
+    'CMFS_DATA', 'TestSpectralShape', 'TestSpectralResampler',
+    'TestSpectralPowerDistribution', 'TestMultiSpectralPowerDistribution',
+    'TestConstantSpd', 'TestZerosSpd', 'TestOnes_spd'
 ]
 
 SAMPLE_SPD_DATA = {
@@ -1328,6 +1331,96 @@ class TestSpectralShape(unittest.TestCase):
             np.arange(0, 10 + 0.1, 0.1))
 
 
+class TestSpectralResampler(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.spectrum.SpectralResampler` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('source', 'target', 'interpolator',
+                               'interpolator_args', 'operator')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralResampler))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__repr__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralResampler))
+
+    def test__init__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralResampler.__init__`
+        method.
+        """
+
+        resampler = SpectralResampler(
+            SpectralShape(340, 820, 20), SpectralShape(340, 820, 1))
+        self.assertIs(resampler.interpolator, SpragueInterpolator)
+        self.assertTupleEqual(resampler.operator.shape, (481, 25))
+        np.testing.assert_equal(resampler.target, np.arange(340, 821))
+
+        self.assertRaises(ValueError, SpectralResampler,
+                          SpectralShape(340, 820, 20),
+                          SpectralShape(340, 820, 1), PchipInterpolator)
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralResampler.__call__`
+        method.
+        """
+
+        spd = SpectralPowerDistribution(SAMPLE_SPD_DATA)
+        resampler = SpectralResampler(spd.shape, SpectralShape(340, 820, 1))
+
+        values = resampler(spd.values)
+        np.testing.assert_almost_equal(
+            values, INTERPOLATED_SAMPLE_SPD_DATA, decimal=7)
+
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            resampler(np.tile(spd.values, (6, 1))), values, decimal=7)
+
+        values = np.reshape(values, (2, 3, 481))
+        np.testing.assert_almost_equal(
+            resampler(np.reshape(np.tile(spd.values, (6, 1)), (2, 3, 25))),
+            values,
+            decimal=7)
+
+        resampler = SpectralResampler(spd.shape, SpectralShape(340, 820, 1),
+                                      LinearInterpolator)
+        np.testing.assert_almost_equal(
+            resampler(spd.values),
+            LinearInterpolator(spd.wavelengths,
+                               spd.values)(np.arange(340, 821)),
+            decimal=7)
+
+    def test__spectral_resampler(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum._spectral_resampler`
+        definition.
+        """
+
+        source = SpectralShape(340, 820, 20)
+        target = SpectralShape(340, 820, 5)
+        self.assertIs(
+            _spectral_resampler(source, target, SpragueInterpolator, {}),
+            _spectral_resampler(source, target, SpragueInterpolator, {}))
+
+        self.assertIsNone(
+            _spectral_resampler(source, target, PchipInterpolator, {}))
+
+
 class TestSpectralPowerDistribution(unittest.TestCase):
     """
     Defines :class:`colour.colorimetry.spectrum.SpectralPowerDistribution`
@@ -1651,6 +1744,16 @@ MultiSpectralPowerDistribution.interpolate` method.
                 rtol=0.0000001,
                 atol=0.0000001)
 
+        # Non-linear interpolators are applied to each signal independently.
+        multi_spd = self._sample_multi_spd.copy()
+        multi_spd.interpolate(
+            SpectralShape(interval=1), interpolator=PchipInterpolator)
+        spd = SpectralPowerDistribution(SAMPLE_SPD_DATA)
+        spd.interpolate(
+            SpectralShape(interval=1), interpolator=PchipInterpolator)
+        for signal in multi_spd.signals.values():
+            np.testing.assert_almost_equal(signal.values, spd.values)
+
     def test_align(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
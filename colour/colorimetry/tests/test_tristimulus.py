@@ -15,16 +15,19 @@ import numpy as np
 import unittest
 
 from colour.algebra import LinearInterpolator
-from colour.colorimetry import (CMFS, CIE_standard_illuminant_A_function,
-                                ILLUMINANTS_RELATIVE_SPDS,
-                                SpectralPowerDistribution, SpectralShape)
+from colour.colorimetry import (
+    CMFS, CIE_standard_illuminant_A_function, ILLUMINANTS_RELATIVE_SPDS,
+    MultiSpectralPowerDistribution, SpectralPowerDistribution, SpectralShape)
 from colour.colorimetry import (
     lagrange_coefficients_ASTME202211,
     tristimulus_weighting_factors_ASTME202211,
     adjust_tristimulus_weighting_factors_ASTME30815,
     spectral_to_XYZ_integration,
     spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
-    spectral_to_XYZ_ASTME30815, wavelength_to_XYZ)
+    spectral_to_XYZ_ASTME30815, multi_spectral_to_XYZ_integration,
+    multi_spectral_to_XYZ_ASTME30815, wavelength_to_XYZ)
+from colour.colorimetry.tristimulus import (
+    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -40,7 +43,8 @@ __all__ = [
     'TestTristimulusWeightingFactorsASTME202211',
     'TestAdjustTristimulusWeightingFactorsASTME30815',
     'TestSpectral_to_XYZ_integration', 'TestSpectral_to_XYZ_ASTME30815',
-    'TestWavelength_to_XYZ'
+    'TestMultiSpectral_to_XYZ_integration',
+    'TestMultiSpectral_to_XYZ_ASTME30815', 'TestWavelength_to_XYZ'
 ]
 
 SAMPLE_SPD = SpectralPowerDistribution({
@@ -363,6 +367,41 @@ tristimulus_weighting_factors_ASTME202211` definition.
         np.testing.assert_almost_equal(
             np.round(twf, 3), D65_CIE_1931_2_20_TWF, decimal=3)
 
+    def test_cache_tristimulus_weighting_factors_ASTME202211(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME202211` definition cache.
+        """
+
+        cache = _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
+        cache.clear()
+
+        cmfs = CMFS['CIE 1964 10 Degree Standard Observer']
+        wl = cmfs.shape.range()
+        A = SpectralPowerDistribution(
+            dict(zip(wl, CIE_standard_illuminant_A_function(wl))),
+            name='A (360, 830, 1)')
+
+        twf = tristimulus_weighting_factors_ASTME202211(
+            cmfs, A, SpectralShape(360, 830, 10))
+        self.assertEqual(cache.misses, 1)
+        self.assertIs(
+            tristimulus_weighting_factors_ASTME202211(
+                cmfs, A.copy(), SpectralShape(400, 700, 10)), twf)
+        self.assertEqual(cache.hits, 1)
+
+        twf = tristimulus_weighting_factors_ASTME202211(
+            cmfs, A * 2, SpectralShape(360, 830, 10))
+        np.testing.assert_almost_equal(
+            np.round(twf, 3), A_CIE_1964_10_10_TWF, decimal=3)
+
+        A_n = A.copy()
+        A_n[560] = 0
+        twf_n = tristimulus_weighting_factors_ASTME202211(
+            cmfs, A_n, SpectralShape(360, 830, 10))
+        self.assertEqual(cache.misses, 3)
+        self.assertFalse(np.allclose(twf, twf_n))
+
 
 class TestAdjustTristimulusWeightingFactorsASTME30815(unittest.TestCase):
     """
@@ -721,6 +760,208 @@ class TestSpectral_to_XYZ_ASTME30815(unittest.TestCase):
             decimal=7)
 
 
+class TestMultiSpectral_to_XYZ_integration(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        self._spds = [
+            SAMPLE_SPD.copy().align(self._cmfs.shape) * factor
+            for factor in (0.5, 1, 2)
+        ]
+        self._msa = np.array([spd.values for spd in self._spds])
+
+    def test_multi_spectral_to_XYZ_integration(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition.
+        """
+
+        for illuminant in ('A', 'C', 'F2'):
+            illuminant = ILLUMINANTS_RELATIVE_SPDS[illuminant]
+            np.testing.assert_almost_equal(
+                multi_spectral_to_XYZ_integration(
+                    self._msa, self._cmfs.shape, self._cmfs, illuminant),
+                np.array([
+                    spectral_to_XYZ_integration(spd, self._cmfs, illuminant)
+                    for spd in self._spds
+                ]),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(
+                self._msa[..., ::5], SpectralShape(360, 830, 5), self._cmfs,
+                ILLUMINANTS_RELATIVE_SPDS['A']),
+            np.array([
+                spectral_to_XYZ_integration(
+                    spd.copy().interpolate(SpectralShape(interval=5)),
+                    self._cmfs, ILLUMINANTS_RELATIVE_SPDS['A'])
+                for spd in self._spds
+            ]),
+            decimal=7)
+
+    def test_multi_spectral_power_distribution(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition with a multi-spectral power
+        distribution.
+        """
+
+        multi_spd = MultiSpectralPowerDistribution(
+            np.transpose(self._msa), self._cmfs.shape.range())
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(
+                multi_spd, cmfs=self._cmfs,
+                illuminant=ILLUMINANTS_RELATIVE_SPDS['A']),
+            multi_spectral_to_XYZ_integration(self._msa, self._cmfs.shape,
+                                              self._cmfs,
+                                              ILLUMINANTS_RELATIVE_SPDS['A']),
+            decimal=7)
+
+    def test_n_dimensional_multi_spectral_to_XYZ_integration(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition n-dimensional arrays support.
+        """
+
+        XYZ = multi_spectral_to_XYZ_integration(
+            self._msa, self._cmfs.shape, self._cmfs,
+            ILLUMINANTS_RELATIVE_SPDS['A'])
+
+        msa = np.reshape(np.tile(self._msa, (2, 1)), (2, 3, -1))
+        XYZ = np.reshape(np.tile(XYZ, (2, 1)), (2, 3, 3))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(msa, self._cmfs.shape,
+                                              self._cmfs,
+                                              ILLUMINANTS_RELATIVE_SPDS['A']),
+            XYZ,
+            decimal=7)
+
+    def test_raise_exception_multi_spectral_to_XYZ_integration(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, multi_spectral_to_XYZ_integration,
+                          self._msa, SpectralShape(360, 830, 5))
+
+
+class TestMultiSpectral_to_XYZ_ASTME30815(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        wl = self._cmfs.shape.range()
+        self._A = SpectralPowerDistribution(
+            dict(zip(wl, CIE_standard_illuminant_A_function(wl))),
+            name='A (360, 830, 1)')
+
+    def _assert_multi_spectral_to_XYZ_ASTME30815(self, shape, **kwargs):
+        """
+        Asserts that :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition matches
+        :func:`colour.colorimetry.tristimulus.spectral_to_XYZ_ASTME30815`
+        definition for given spectral shape.
+        """
+
+        spds = [
+            SAMPLE_SPD.copy().align(shape) * factor
+            for factor in (0.5, 1, 2)
+        ]
+        msa = np.array([spd.values for spd in spds])
+
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_ASTME30815(msa, shape, self._cmfs, self._A,
+                                             **kwargs),
+            np.array([
+                spectral_to_XYZ_ASTME30815(spd, self._cmfs, self._A, **kwargs)
+                for spd in spds
+            ]),
+            decimal=7)
+
+    def test_multi_spectral_to_XYZ_ASTME30815_mi_1nm(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition for 1 nm measurement intervals.
+        """
+
+        for shape in (self._cmfs.shape, SpectralShape(400, 700, 1)):
+            self._assert_multi_spectral_to_XYZ_ASTME30815(shape)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape, use_practice_range=False)
+
+    def test_multi_spectral_to_XYZ_ASTME30815_mi_5nm(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition for 5 nm measurement intervals.
+        """
+
+        for shape in (SpectralShape(360, 830, 5), SpectralShape(400, 700, 5)):
+            self._assert_multi_spectral_to_XYZ_ASTME30815(shape)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape, use_practice_range=False)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape, mi_5nm_omission_method=False)
+
+    def test_multi_spectral_to_XYZ_ASTME30815_mi_10nm(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition for 10 nm measurement intervals.
+        """
+
+        for shape in (SpectralShape(360, 830, 10),
+                      SpectralShape(400, 700, 10)):
+            self._assert_multi_spectral_to_XYZ_ASTME30815(shape)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape, use_practice_range=False)
+
+    def test_multi_spectral_to_XYZ_ASTME30815_mi_20nm(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition for 20 nm measurement intervals.
+        """
+
+        for shape in (SpectralShape(360, 820, 20),
+                      SpectralShape(400, 700, 20)):
+            self._assert_multi_spectral_to_XYZ_ASTME30815(shape)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape, use_practice_range=False)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape, mi_20nm_interpolation_method=False)
+            self._assert_multi_spectral_to_XYZ_ASTME30815(
+                shape,
+                use_practice_range=False,
+                mi_20nm_interpolation_method=False)
+
+    def test_raise_exception_multi_spectral_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, multi_spectral_to_XYZ_ASTME30815,
+                          np.ones((3, 60)), SpectralShape(400, 700, 5),
+                          self._cmfs, self._A)
+        self.assertRaises(ValueError, multi_spectral_to_XYZ_ASTME30815,
+                          np.ones((3, 31)), SpectralShape(400, 700, 2),
+                          self._cmfs, self._A)
+
+
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ` definition
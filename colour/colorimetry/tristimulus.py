@@ -11,6 +11,9 @@ Defines objects for tristimulus values computation from spectral data:
 spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815`
 -   :func:`colour.colorimetry.spectral_to_XYZ_ASTME30815`
 -   :func:`colour.spectral_to_XYZ`
+-   :func:`colour.colorimetry.multi_spectral_to_XYZ_integration`
+-   :func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`
+-   :func:`colour.multi_spectral_to_XYZ`
 -   :func:`colour.wavelength_to_XYZ`
 
 The default implementation is based on practise *ASTM E308-15* method.
@@ -33,10 +36,13 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.algebra import lagrange_coefficients
-from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, SpectralShape,
-                                STANDARD_OBSERVERS_CMFS, ones_spd)
-from colour.utilities import (CaseInsensitiveMapping, filter_kwargs, tsplit,
-                              warning)
+from colour.colorimetry import (
+    DEFAULT_SPECTRAL_SHAPE, MultiSpectralPowerDistribution,
+    SpectralPowerDistribution, SpectralShape, STANDARD_OBSERVERS_CMFS,
+    ones_spd)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, LRUCache, filter_kwargs,
+                              ndarray_digest, tsplit, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -52,6 +58,8 @@ __all__ = [
     'spectral_to_XYZ_integration',
     'spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
     'spectral_to_XYZ_ASTME30815', 'SPECTRAL_TO_XYZ_METHODS', 'spectral_to_XYZ',
+    'multi_spectral_to_XYZ_integration', 'multi_spectral_to_XYZ_ASTME30815',
+    'MULTI_SPECTRAL_TO_XYZ_METHODS', 'multi_spectral_to_XYZ',
     'wavelength_to_XYZ'
 ]
 
@@ -68,7 +76,7 @@ ASTME30815_PRACTISE_SHAPE : SpectralShape
 
 _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = None
 
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE = LRUCache(maxsize=64)
 
 
 def lagrange_coefficients_ASTME202211(interval=10, interval_type='inner'):
@@ -168,20 +176,16 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
         If the colour matching functions or illuminant intervals are not equal
         to 1 nm.
 
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-
     Notes
     -----
+    -   The tables of tristimulus weighting factors are cached in the
+        :attr:`colour.colorimetry.tristimulus.\
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` bounded least recently used cache
+        whose hits and misses are counted. Their identifier key is defined by
+        a digest of the colour matching functions and illuminant spectral data
+        along the shape interval, thus colour matching functions and
+        illuminants sharing the same name but with different spectral data
+        yield different tables.
     -   Input colour matching functions and illuminant intervals are expected
         to be equal to 1 nm. If the illuminant data is not available at 1 nm
         interval, it needs to be interpolated using *CIE* recommendations:
@@ -240,19 +244,19 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
-    if _TRISTIMULUS_WEIGHTING_FACTORS_CACHE is None:
-        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = CaseInsensitiveMapping()
-
-    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape)))
-    if name_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
-        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf]
+    key_twf = (ndarray_digest(cmfs.wavelengths, cmfs.values,
+                              illuminant.wavelengths, illuminant.values),
+               shape.interval)
+    W = _TRISTIMULUS_WEIGHTING_FACTORS_CACHE.get(key_twf)
+    if W is not None:
+        return W
 
     Y = cmfs.values
     S = illuminant.values
+    P = S[..., np.newaxis] * Y
 
     interval_i = np.int_(shape.interval)
-    W = S[::interval_i, np.newaxis] * Y[::interval_i, :]
+    W = np.copy(P[::interval_i, :])
 
     # First and last measurement intervals *Lagrange Coefficients*.
     c_c = lagrange_coefficients_ASTME202211(interval_i, 'boundary')
@@ -270,34 +274,27 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
     i_c = W.shape[0]
     i_cm = i_c - 1
 
-    for i in range(3):
+    if r_c > 0:
         # First interval.
-        for j in range(r_c):
-            for k in range(3):
-                W[k, i] = W[k, i] + c_c[j, k] * S[j + 1] * Y[j + 1, i]
+        W[0:3] += np.dot(np.transpose(c_c), P[1:r_c + 1])
 
         # Last interval.
-        for j in range(r_c):
-            for k in range(i_cm, i_cm - 3, -1):
-                W[k, i] = (W[k, i] + c_c[r_c - j - 1, i_cm - k] * S[j + w_lif]
-                           * Y[j + w_lif, i])
+        W[i_cm - 2:i_cm + 1] += np.dot(
+            np.transpose(c_c[::-1]), P[w_lif:w_lif + r_c])[::-1]
 
         # Intermediate intervals.
-        for j in range(i_c - 3):
-            for k in range(r_c):
-                w_i = (r_c + 1) * (j + 1) + 1 + k
-                W[j, i] = W[j, i] + c_b[k, 0] * S[w_i] * Y[w_i, i]
-                W[j + 1, i] = W[j + 1, i] + c_b[k, 1] * S[w_i] * Y[w_i, i]
-                W[j + 2, i] = W[j + 2, i] + c_b[k, 2] * S[w_i] * Y[w_i, i]
-                W[j + 3, i] = W[j + 3, i] + c_b[k, 3] * S[w_i] * Y[w_i, i]
-
-        # Extrapolation of potential incomplete interval.
-        for j in range(int(w_c - ((w_c - 1) % interval_i)), w_c, 1):
-            W[i_cm, i] = W[i_cm, i] + S[j] * Y[j, i]
+        w_i = (interval_i * (np.arange(i_c - 3) + 1)[..., np.newaxis] + 1 +
+               np.arange(r_c))
+        W_i = np.einsum('kl,jkc->jlc', c_b, P[w_i])
+        for i in range(4):
+            W[i:i_c - 3 + i] += W_i[:, i]
+
+    # Extrapolation of potential incomplete interval.
+    W[i_cm] += np.sum(P[int(w_c - ((w_c - 1) % interval_i)):w_c], axis=0)
 
     W *= 100 / np.sum(W, axis=0)[1]
 
-    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf] = W
+    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[key_twf] = W
 
     return W
 
@@ -599,20 +596,16 @@ def spectral_to_XYZ_ASTME30815(
 
     Warning
     -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-    -   The output range of that definition is non standard!
+    The output range of that definition is non standard!
 
     Notes
     -----
     -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+    -   The tables of tristimulus weighting factors are cached in the
+        :attr:`colour.colorimetry.tristimulus.\
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` bounded least recently used cache,
+        see :func:`colour.colorimetry.\
+tristimulus_weighting_factors_ASTME202211` definition.
 
     References
     ----------
@@ -823,6 +816,488 @@ def spectral_to_XYZ(
     return function(spd, cmfs, illuminant, **filter_kwargs(function, **kwargs))
 
 
+def _multi_spectral_array(msa, shape):
+    """
+    Returns given multi-spectral power distribution or multi-spectral array as
+    an array of spectral values with wavelengths along the last axis and its
+    spectral shape.
+
+    Parameters
+    ----------
+    msa : MultiSpectralPowerDistribution or array_like
+        Multi-spectral power distribution or multi-spectral array.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array, ignored if a
+        multi-spectral power distribution is given.
+
+    Returns
+    -------
+    tuple
+        Spectral values array and spectral shape.
+
+    Raises
+    ------
+    ValueError
+        If the multi-spectral array wavelengths count does not match the
+        spectral shape wavelengths count.
+    """
+
+    if isinstance(msa, MultiSpectralPowerDistribution):
+        return np.transpose(msa.values), msa.shape
+
+    R = np.asarray(msa, dtype=DEFAULT_FLOAT_DTYPE)
+    if R.shape[-1] != len(shape):
+        raise ValueError('Multi-spectral array wavelengths count "{0}" does '
+                         'not match "{1}" shape wavelengths count "{2}"!'.
+                         format(R.shape[-1], shape, len(shape)))
+
+    return R, shape
+
+
+def _align_multi_spectral_array(R, shape, shape_a):
+    """
+    Aligns given multi-spectral array from given spectral shape to given
+    alignment spectral shape, slicing the array whenever possible instead of
+    interpolating each spectral power distribution.
+
+    Parameters
+    ----------
+    R : ndarray
+        Multi-spectral array.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    shape_a : SpectralShape
+        Spectral shape to align the multi-spectral array to.
+
+    Returns
+    -------
+    ndarray
+        Aligned multi-spectral array.
+    """
+
+    if shape == shape_a:
+        return R
+
+    wavelengths = shape.range()
+    wavelengths_a = shape_a.range()
+    if (shape.interval == shape_a.interval and
+            shape.start <= shape_a.start and shape.end >= shape_a.end):
+        indexes = np.searchsorted(wavelengths, wavelengths_a)
+        if np.allclose(wavelengths[indexes], wavelengths_a):
+            return R[..., indexes]
+
+    R_a = np.empty(R.shape[:-1] + (len(wavelengths_a), ))
+    for index in np.ndindex(*R.shape[:-1]):
+        R_a[index] = SpectralPowerDistribution(
+            R[index], wavelengths).align(shape_a).values
+
+    return R_a
+
+
+def _trim_multi_spectral_array(R, shape, shape_t):
+    """
+    Trims given multi-spectral array wavelengths to given spectral shape
+    boundaries.
+
+    Parameters
+    ----------
+    R : ndarray
+        Multi-spectral array.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    shape_t : SpectralShape
+        Spectral shape used for trimming.
+
+    Returns
+    -------
+    tuple
+        Trimmed multi-spectral array and its spectral shape.
+    """
+
+    wavelengths = shape.range()
+    indexes = np.where(
+        np.logical_and(wavelengths >= max(shape_t.start, shape.start),
+                       wavelengths <= min(shape_t.end, shape.end)))[0]
+    wavelengths = wavelengths[indexes]
+
+    return R[..., indexes], SpectralShape(wavelengths[0], wavelengths[-1],
+                                          shape.interval)
+
+
+def multi_spectral_to_XYZ_integration(
+        msa,
+        shape=DEFAULT_SPECTRAL_SHAPE,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ones_spd(STANDARD_OBSERVERS_CMFS[
+            'CIE 1931 2 Degree Standard Observer'].shape)):
+    """
+    Converts given multi-spectral power distribution or multi-spectral array
+    to *CIE XYZ* tristimulus values using given colour matching functions and
+    illuminant according to classical integration method.
+
+    The colour matching functions and illuminant are folded into a single
+    weighting matrix, the tristimulus values of all the spectral power
+    distributions are then computed with a single matrix product.
+
+    Parameters
+    ----------
+    msa : MultiSpectralPowerDistribution or array_like
+        Multi-spectral power distribution or multi-spectral array with
+        wavelengths along the last axis, e.g. (N, W).
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, ignored if a
+        multi-spectral power distribution is given.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+
+    References
+    ----------
+    -   :cite:`Wyszecki2000bf`
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS, SpectralShape
+    >>> cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852, 0.0641, 0.0645,
+    ...      0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772, 0.0870, 0.1128]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS['D50']
+    >>> multi_spectral_to_XYZ_integration(
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 11.5296285...,   9.9499467...,   4.7066079...],
+           [  7.5389878...,   7.9761778...,  16.0471726...]])
+    """
+
+    R, shape = _multi_spectral_array(msa, shape)
+
+    if illuminant.shape != cmfs.shape:
+        warning('Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    if shape != cmfs.shape:
+        warning('Aligning multi-spectral array shape to "{0}" colour matching '
+                'functions shape.'.format(cmfs.name))
+        R = _align_multi_spectral_array(R, shape, cmfs.shape)
+
+    S = illuminant.values
+    dw = cmfs.shape.interval
+
+    k = 100 / (np.sum(cmfs.values[..., 1] * S) * dw)
+
+    W = k * cmfs.values * S[..., np.newaxis] * dw
+
+    XYZ = np.dot(R, W)
+
+    return XYZ
+
+
+def _multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+        R, shape, cmfs, illuminant):
+    """
+    Converts given multi-spectral array to *CIE XYZ* tristimulus values using
+    given colour matching functions and illuminant using a table of
+    tristimulus weighting factors according to practise *ASTM E308-15* method.
+
+    Parameters
+    ----------
+    R : ndarray
+        Multi-spectral array.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+    """
+
+    if illuminant.shape != cmfs.shape:
+        warning('Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    if shape.boundaries != cmfs.shape.boundaries:
+        warning('Trimming multi-spectral array shape to "{0}" colour matching '
+                'functions shape.'.format(cmfs.name))
+        R, shape = _trim_multi_spectral_array(R, shape, cmfs.shape)
+
+    W = tristimulus_weighting_factors_ASTME202211(
+        cmfs, illuminant,
+        SpectralShape(cmfs.shape.start, cmfs.shape.end, shape.interval))
+    start_w = cmfs.shape.start
+    end_w = cmfs.shape.start + shape.interval * (W.shape[0] - 1)
+    W = adjust_tristimulus_weighting_factors_ASTME30815(
+        W, SpectralShape(start_w, end_w, shape.interval), shape)
+
+    XYZ = np.dot(R, W)
+
+    return XYZ
+
+
+def multi_spectral_to_XYZ_ASTME30815(
+        msa,
+        shape=ASTME30815_PRACTISE_SHAPE,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ones_spd(ASTME30815_PRACTISE_SHAPE),
+        use_practice_range=True,
+        mi_5nm_omission_method=True,
+        mi_20nm_interpolation_method=True):
+    """
+    Converts given multi-spectral power distribution or multi-spectral array
+    to *CIE XYZ* tristimulus values using given colour matching functions and
+    illuminant according to practise *ASTM E308-15* method.
+
+    The weighting factors are computed once for the whole multi-spectral
+    array whose tristimulus values are then computed with a single matrix
+    product.
+
+    Parameters
+    ----------
+    msa : MultiSpectralPowerDistribution or array_like
+        Multi-spectral power distribution or multi-spectral array with
+        wavelengths along the last axis, e.g. (N, W).
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, ignored if a
+        multi-spectral power distribution is given.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    use_practice_range : bool, optional
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        5 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        20 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+    -   The tristimulus values are equal to those returned by
+        :func:`colour.colorimetry.spectral_to_XYZ_ASTME30815` definition
+        for each spectral power distribution of the multi-spectral array.
+
+    References
+    ----------
+    -   :cite:`ASTMInternational2015b`
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS, SpectralShape
+    >>> cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852, 0.0641, 0.0645,
+    ...      0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772, 0.0870, 0.1128]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS['D50']
+    >>> multi_spectral_to_XYZ_ASTME30815(
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 11.5290265...,   9.9502091...,   4.7098882...],
+           [  7.5412243...,   7.9900153...,  16.0642177...]])
+    """
+
+    R, shape = _multi_spectral_array(msa, shape)
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if use_practice_range:
+        cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
+    if shape.interval == 1:
+        return multi_spectral_to_XYZ_integration(R, shape, cmfs, illuminant)
+    elif shape.interval == 5 and mi_5nm_omission_method:
+        if cmfs.shape.interval != 5:
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=5))
+
+        return multi_spectral_to_XYZ_integration(R, shape, cmfs, illuminant)
+    elif shape.interval == 20 and mi_20nm_interpolation_method:
+        if shape.boundaries != cmfs.shape.boundaries:
+            warning('Trimming multi-spectral array shape to "{0}" colour '
+                    'matching functions shape.'.format(cmfs.name))
+            R, shape = _trim_multi_spectral_array(R, shape, cmfs.shape)
+
+        # Extrapolation of additional 20nm padding intervals.
+        R_e = np.empty(R.shape[:-1] + (R.shape[-1] + 2, ))
+        R_e[..., 1:-1] = R
+        R_e[..., 0] = 3 * R[..., 0] - 3 * R[..., 1] + R[..., 2]
+        R_e[..., -1] = R[..., -3] - 3 * R[..., -2] + 3 * R[..., -1]
+
+        # Interpolating every odd numbered values.
+        R_i = np.empty(R.shape[:-1] + (R.shape[-1] * 2 - 1, ))
+        R_i[..., ::2] = R
+        R_i[..., 1::2] = (-0.0625 * R_e[..., :-3] + 0.5625 * R_e[..., 1:-2] +
+                          0.5625 * R_e[..., 2:-1] - 0.0625 * R_e[..., 3:])
+
+        R = R_i
+        shape = SpectralShape(shape.start, shape.end, 10)
+
+    return _multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+        R, shape, cmfs, illuminant)
+
+
+MULTI_SPECTRAL_TO_XYZ_METHODS = CaseInsensitiveMapping({
+    'ASTM E308-15': multi_spectral_to_XYZ_ASTME30815,
+    'Integration': multi_spectral_to_XYZ_integration
+})
+MULTI_SPECTRAL_TO_XYZ_METHODS.__doc__ = """
+Supported multi-spectral power distribution or multi-spectral array to
+*CIE XYZ* tristimulus values conversion methods
+
+References
+----------
+-   :cite:`ASTMInternational2011a`
+-   :cite:`ASTMInternational2015b`
+-   :cite:`Wyszecki2000bf`
+
+MULTI_SPECTRAL_TO_XYZ_METHODS : CaseInsensitiveMapping
+    **{'ASTM E308-15', 'Integration'}**
+
+Aliases:
+
+-   'astm2015': 'ASTM E308-15'
+"""
+MULTI_SPECTRAL_TO_XYZ_METHODS['astm2015'] = (
+    MULTI_SPECTRAL_TO_XYZ_METHODS['ASTM E308-15'])
+
+
+def multi_spectral_to_XYZ(
+        msa,
+        shape=DEFAULT_SPECTRAL_SHAPE,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ones_spd(ASTME30815_PRACTISE_SHAPE),
+        method='ASTM E308-15',
+        **kwargs):
+    """
+    Converts given multi-spectral power distribution or multi-spectral array
+    to *CIE XYZ* tristimulus values using given colour matching functions,
+    illuminant and method.
+
+    Parameters
+    ----------
+    msa : MultiSpectralPowerDistribution or array_like
+        Multi-spectral power distribution or multi-spectral array with
+        wavelengths along the last axis, e.g. (N, W).
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, ignored if a
+        multi-spectral power distribution is given.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    method : unicode, optional
+        **{'ASTM E308-15', 'Integration'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        5 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.multi_spectral_to_XYZ_ASTME30815`},
+        20 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+
+    References
+    ----------
+    -   :cite:`ASTMInternational2011a`
+    -   :cite:`ASTMInternational2015b`
+    -   :cite:`Wyszecki2000bf`
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS, SpectralShape
+    >>> cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852, 0.0641, 0.0645,
+    ...      0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772, 0.0870, 0.1128]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS['D50']
+    >>> multi_spectral_to_XYZ(
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 11.5290265...,   9.9502091...,   4.7098882...],
+           [  7.5412243...,   7.9900153...,  16.0642177...]])
+    >>> multi_spectral_to_XYZ(
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant,
+    ...     method='Integration')
+    ... # doctest: +ELLIPSIS
+    array([[ 11.5296285...,   9.9499467...,   4.7066079...],
+           [  7.5389878...,   7.9761778...,  16.0471726...]])
+    """
+
+    function = MULTI_SPECTRAL_TO_XYZ_METHODS[method]
+
+    return function(msa, shape, cmfs, illuminant,
+                    **filter_kwargs(function, **kwargs))
+
+
 def wavelength_to_XYZ(
         wavelength,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']):
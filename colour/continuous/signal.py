@@ -12,6 +12,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 from collections import Iterator, Mapping, OrderedDict, Sequence
+from contextlib import contextmanager
 from operator import add, mul, pow, sub, iadd, imul, ipow, isub
 
 # Python 3 compatibility.
@@ -88,6 +89,7 @@ class Signal(AbstractContinuousFunction):
     extrapolator
     extrapolator_args
     function
+    function_rebuilds
 
     Methods
     -------
@@ -99,6 +101,7 @@ class Signal(AbstractContinuousFunction):
     __eq__
     __ne__
     arithmetical_operation
+    bulk_update
     signal_unpack_data
     fill_nan
     to_series
@@ -207,6 +210,9 @@ class Signal(AbstractContinuousFunction):
             'left': np.nan,
             'right': np.nan
         }
+        self._function = None
+        self._function_rebuilds = 0
+        self._bulk_updates = 0
 
         self.domain, self.range = self.signal_unpack_data(data, domain)
 
@@ -217,8 +223,6 @@ class Signal(AbstractContinuousFunction):
         self.extrapolator = kwargs.get('extrapolator')
         self.extrapolator_args = kwargs.get('extrapolator_args')
 
-        self._create_function()
-
     @property
     def dtype(self):
         """
@@ -302,7 +306,7 @@ class Signal(AbstractContinuousFunction):
                     self._range = np.resize(self._range, value.shape)
 
             self._domain = value
-            self._create_function()
+            self._function = None
 
     @property
     def range(self):
@@ -342,7 +346,7 @@ class Signal(AbstractContinuousFunction):
                     '"domain" and "range" variables must have same size!')
 
             self._range = value
-            self._create_function()
+            self._function = None
 
     @property
     def interpolator(self):
@@ -372,7 +376,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._function = None
 
     @property
     def interpolator_args(self):
@@ -407,7 +411,7 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_args', value)
 
             self._interpolator_args = value
-            self._create_function()
+            self._function = None
 
     @property
     def extrapolator(self):
@@ -437,7 +441,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._function = None
 
     @property
     def extrapolator_args(self):
@@ -472,7 +476,7 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_args', value))
 
             self._extrapolator_args = value
-            self._create_function()
+            self._function = None
 
     @property
     def function(self):
@@ -492,10 +496,33 @@ class Signal(AbstractContinuousFunction):
         Notes
         -----
         -   This property is read only.
+        -   The callable is built lazily, on first access after any
+            modification of the continuous signal.
         """
 
+        if self._function is None:
+            self._create_function()
+
         return self._function
 
+    @property
+    def function_rebuilds(self):
+        """
+        Getter and setter property for the continuous signal callable builds
+        count.
+
+        Returns
+        -------
+        int
+            Continuous signal callable builds count.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._function_rebuilds
+
     def __str__(self):
         """
         Returns a formatted string representation of the continuous signal.
@@ -623,7 +650,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -713,7 +740,7 @@ class Signal(AbstractContinuousFunction):
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
 
-        self._create_function()
+        self._function = None
 
     def __contains__(self, x):
         """
@@ -839,6 +866,7 @@ class Signal(AbstractContinuousFunction):
                 self._interpolator(self.domain, self.range,
                                    **self._interpolator_args),
                 **self._extrapolator_args)
+            self._function_rebuilds += 1
         else:
 
             def _undefined_function(*args, **kwargs):
@@ -864,6 +892,52 @@ class Signal(AbstractContinuousFunction):
 
             self._function = _undefined_function
 
+    @contextmanager
+    def bulk_update(self):
+        """
+        A context manager deferring the continuous signal callable build
+        until the last nested block exits, the callable is then built once if
+        the continuous signal was modified.
+
+        Returns
+        -------
+        Signal
+            Continuous signal.
+
+        Notes
+        -----
+        -   The callable is always built lazily, i.e. on first evaluation
+            after any modification, evaluating the continuous signal within
+            the block thus still builds it.
+
+        Examples
+        --------
+        >>> range_ = np.linspace(10, 100, 10)
+        >>> signal = Signal(range_)
+        >>> signal[4.5]  # doctest: +ELLIPSIS
+        54.6864201...
+        >>> signal.function_rebuilds
+        1
+        >>> with signal.bulk_update():
+        ...     for x in range(10):
+        ...         signal[x] = x * 20
+        >>> signal.function_rebuilds
+        2
+        >>> signal[4.5]  # doctest: +ELLIPSIS
+        89.4868693...
+        >>> signal.function_rebuilds
+        2
+        """
+
+        self._bulk_updates += 1
+        try:
+            yield self
+        finally:
+            self._bulk_updates -= 1
+
+            if self._bulk_updates == 0 and self._function is None:
+                self._create_function()
+
     def _fill_domain_nan(self, method='Interpolation', default=0):
         """
         Fill NaNs in independent domain :math:`x` variable using given method.
@@ -885,7 +959,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._function = None
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -908,7 +982,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._function = None
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
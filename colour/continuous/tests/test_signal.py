@@ -47,7 +47,8 @@ class TestSignal(unittest.TestCase):
 
         required_attributes = ('dtype', 'domain', 'range', 'interpolator',
                                'interpolator_args', 'extrapolator',
-                               'extrapolator_args', 'function')
+                               'extrapolator_args', 'function',
+                               'function_rebuilds')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(Signal))
@@ -59,8 +60,9 @@ class TestSignal(unittest.TestCase):
 
         required_methods = ('__str__', '__repr__', '__getitem__',
                             '__setitem__', '__contains__', '__eq__', '__ne__',
-                            'arithmetical_operation', 'signal_unpack_data',
-                            'fill_nan', 'domain_distance', 'to_series')
+                            'arithmetical_operation', 'bulk_update',
+                            'signal_unpack_data', 'fill_nan',
+                            'domain_distance', 'to_series')
 
         for method in required_methods:
             self.assertIn(method, dir(Signal))
@@ -185,6 +187,32 @@ class TestSignal(unittest.TestCase):
 
         assert hasattr(self._signal.function, '__call__')
 
+    def test_function_rebuilds(self):
+        """
+        Tests :func:`colour.continuous.signal.Signal.function_rebuilds`
+        property.
+        """
+
+        signal = Signal(self._range, self._domain)
+        self.assertEqual(signal.function_rebuilds, 0)
+
+        signal[150]
+        signal[np.array([150, 250])]
+        self.assertEqual(signal.function_rebuilds, 1)
+
+        for x in self._domain:
+            signal[x] = 0
+        signal[1050] = 0
+        signal.interpolator = CubicSplineInterpolator
+        self.assertEqual(signal.function_rebuilds, 1)
+
+        signal[150]
+        self.assertEqual(signal.function_rebuilds, 2)
+
+        signal[0:2] = 10
+        self.assertEqual(signal[100], 10)
+        self.assertEqual(signal.function_rebuilds, 3)
+
     def test__init__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__init__` method.
@@ -489,6 +517,33 @@ class TestSignal(unittest.TestCase):
             signal.range + signal._range,
             decimal=7)
 
+    def test_bulk_update(self):
+        """
+        Tests :func:`colour.continuous.signal.Signal.bulk_update` method.
+        """
+
+        signal = Signal(self._range, self._domain)
+
+        with signal.bulk_update() as updated_signal:
+            self.assertIs(updated_signal, signal)
+
+            with signal.bulk_update():
+                for x in self._domain:
+                    signal[x] = 10
+
+            self.assertEqual(signal.function_rebuilds, 0)
+
+            signal[150] = 10
+
+        self.assertEqual(signal.function_rebuilds, 1)
+        self.assertEqual(signal[200], 10)
+        self.assertEqual(signal.function_rebuilds, 1)
+
+        with signal.bulk_update():
+            pass
+
+        self.assertEqual(signal.function_rebuilds, 1)
+
     def test_is_uniform(self):
         """
         Tests :func:`colour.continuous.signal.Signal.is_uniform` method.
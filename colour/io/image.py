@@ -11,7 +11,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import CaseInsensitiveMapping, is_openimageio_installed
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, is_openimageio_installed,
+                              is_string)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -21,7 +23,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'BitDepth_Specification', 'BIT_DEPTH_MAPPING', 'read_image', 'write_image'
+    'BitDepth_Specification', 'BIT_DEPTH_MAPPING', 'IMAGE_IO_CHUNK_SIZE',
+    'read_image_blocks', 'read_image', 'write_image_blocks', 'write_image'
 ]
 
 BitDepth_Specification = namedtuple('BitDepth_Specification',
@@ -53,8 +56,140 @@ else:
             BitDepth_Specification('float32', np.float32, None, 1, False)
     })
 
+IMAGE_IO_CHUNK_SIZE = 64
+"""
+Default scanlines count of the blocks the images are read and written by.
+
+IMAGE_IO_CHUNK_SIZE : integer
+"""
+
+
+def _convert_block(block, bit_depth_specification):
+    """
+    Converts given image block to given bit depth specification, the block is
+    never modified in place.
+
+    Parameters
+    ----------
+    block : array_like
+        Image block data.
+    bit_depth_specification : BitDepth_Specification
+        Bit depth specification to convert the block to.
+
+    Returns
+    -------
+    ndarray
+        Converted C-contiguous image block.
+    """
+
+    domain = bit_depth_specification.domain
+    if domain != 1:
+        block = np.multiply(block, domain, dtype=DEFAULT_FLOAT_DTYPE)
+        if bit_depth_specification.clip:
+            np.clip(block, 0, domain, out=block)
+
+    return np.ascontiguousarray(block, dtype=bit_depth_specification.numpy)
+
+
+def _read_scanlines_blocks(image, bit_depth, chunk_size):
+    """
+    Reads given opened *OpenImageIO* image input by blocks of scanlines.
+
+    Parameters
+    ----------
+    image : ImageInput
+        Opened *OpenImageIO* image input.
+    bit_depth : unicode
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    chunk_size : integer
+        Scanlines count of the blocks, rounded up to a multiple of the tiles
+        height for tiled images.
+
+    Returns
+    -------
+    generator
+        Image blocks generator, each iteration yields the first scanline
+        index of the block and the block as a ndarray of shape
+        (scanlines, width, channels).
+    """
+
+    bit_depth = BIT_DEPTH_MAPPING[bit_depth].openimageio
+
+    specification = image.spec()
+    width = specification.width
+    height = specification.height
+    channels = specification.nchannels
+
+    chunk_size = int(chunk_size)
+    if specification.tile_height > 0:
+        # Reading whole rows of tiles avoids decoding the tiles repeatedly.
+        chunk_size = int(
+            np.ceil(chunk_size / specification.tile_height) *
+            specification.tile_height)
+
+    for y in range(0, height, chunk_size):
+        scanlines = min(chunk_size, height - y)
+        block = image.read_scanlines(specification.y + y,
+                                     specification.y + y + scanlines, 0, 0,
+                                     channels, bit_depth)
+
+        yield y, np.reshape(np.asarray(block), (scanlines, width, channels))
+
+
+def read_image_blocks(path,
+                      bit_depth='float32',
+                      chunk_size=IMAGE_IO_CHUNK_SIZE):
+    """
+    Reads given image by blocks of scanlines using *OpenImageIO*.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    chunk_size : integer, optional
+        Scanlines count of the blocks, rounded up to a multiple of the tiles
+        height for tiled images.
+
+    Returns
+    -------
+    generator
+        Image blocks generator, each iteration yields the first scanline
+        index of the block and the block as a ndarray of shape
+        (scanlines, width, channels).
+
+    Notes
+    -----
+    -   A single block is held in memory at a time, images larger than the
+        available memory can thus be processed.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> for y, block in read_image_blocks(path):  # doctest: +SKIP
+    ...     print(y, block.shape)
+    """
 
-def read_image(path, bit_depth='float32'):
+    if is_openimageio_installed(raise_exception=True):
+        from OpenImageIO import ImageInput
+
+        image = ImageInput.open(path)
+        try:
+            for y, block in _read_scanlines_blocks(image, bit_depth,
+                                                   chunk_size):
+                yield y, block
+        finally:
+            image.close()
+
+
+def read_image(path,
+               bit_depth='float32',
+               out=None,
+               chunk_size=IMAGE_IO_CHUNK_SIZE):
     """
     Reads given image using *OpenImageIO*.
 
@@ -65,6 +200,12 @@ def read_image(path, bit_depth='float32'):
     bit_depth : unicode, optional
         **{'float32', 'uint8', 'uint16', 'float16'}**,
         Image bit_depth.
+    out : ndarray or unicode, optional
+        Array to read the image into, e.g. a :class:`numpy.memmap` class
+        instance, or path of the *.npy* file to create and memory map to read
+        the image into.
+    chunk_size : integer, optional
+        Scanlines count of the blocks the image is read by.
 
     Returns
     -------
@@ -74,38 +215,61 @@ def read_image(path, bit_depth='float32'):
     Notes
     -----
     -   For convenience, single channel images are squeezed to 2d arrays.
+    -   The image is read by blocks of scanlines directly into the output
+        array, images larger than the available memory can thus be read into
+        a memory mapped array.
 
     Examples
     --------
     >>> import os
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
     >>> image = read_image(path)  # doctest: +SKIP
+    >>> image = read_image(path, out='CMSTestPattern.npy')  # doctest: +SKIP
     """
 
     if is_openimageio_installed(raise_exception=True):
         from OpenImageIO import ImageInput
 
-        bit_depth = BIT_DEPTH_MAPPING[bit_depth].openimageio
-
         image = ImageInput.open(path)
-        specification = image.spec()
+        try:
+            specification = image.spec()
+            shape = (specification.height, specification.width,
+                     specification.nchannels)
+            dtype = BIT_DEPTH_MAPPING[bit_depth].numpy
+
+            if out is None:
+                out = np.empty(shape, dtype)
+            elif is_string(out):
+                out = np.lib.format.open_memmap(out, 'w+', dtype, shape)
 
-        shape = (specification.height, specification.width,
-                 specification.nchannels)
+            assert out.size == np.prod(shape) and out.flags.c_contiguous, (
+                '"out" array must be a C-contiguous array of {0} '
+                'shape!'.format(shape))
 
-        return np.squeeze(np.array(image.read_image(bit_depth)).reshape(shape))
+            # Reshaping a C-contiguous array returns a view.
+            out_r = np.reshape(out, shape)
+            for y, block in _read_scanlines_blocks(image, bit_depth,
+                                                   chunk_size):
+                out_r[y:y + block.shape[0]] = block
+        finally:
+            image.close()
 
+        return np.squeeze(out_r)
 
-def write_image(image, path, bit_depth='float32'):
+
+def write_image_blocks(blocks, path, shape, bit_depth='float32'):
     """
-    Writes given image using *OpenImageIO*.
+    Writes given image blocks of scanlines using *OpenImageIO*.
 
     Parameters
     ----------
-    image : array_like
-        Image data.
+    blocks : iterable
+        Image blocks of scanlines, in top to bottom order, each block is an
+        array_like of shape (scanlines, width) or (scanlines, width, channels).
     path : unicode
         Image path.
+    shape : array_like
+        Image shape, (height, width) or (height, width, channels).
     bit_depth : unicode, optional
         **{'float32', 'uint8', 'uint16', 'float16'}**,
         Image bit_depth.
@@ -115,13 +279,25 @@ def write_image(image, path, bit_depth='float32'):
     bool
         Definition success.
 
+    Notes
+    -----
+    -   The blocks are converted to given bit depth one at a time and are
+        never modified in place, images larger than the available memory can
+        thus be written from a generator or a memory mapped array.
+
     Examples
     --------
+    Streaming an image through a *LUT*:
+
     >>> import os
+    >>> from colour import LUT3D
+    >>> LUT = LUT3D(LUT3D.linear_table(33) ** (1 / 2.2))
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
-    >>> image = read_image(path)  # doctest: +SKIP
+    >>> blocks = (LUT.apply(block) for _y, block in read_image_blocks(path))
+    ... # doctest: +SKIP
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.png')
-    >>> write_image(image, path, 'uint8')  # doctest: +SKIP
+    >>> write_image_blocks(blocks, path, (1080, 1920, 3), 'uint8')
+    ... # doctest: +SKIP
     True
     """
 
@@ -131,22 +307,81 @@ def write_image(image, path, bit_depth='float32'):
         bit_depth_specification = BIT_DEPTH_MAPPING[bit_depth]
         bit_depth = bit_depth_specification.openimageio
 
-        image = np.asarray(image)
-        image *= bit_depth_specification.domain
-        if bit_depth_specification.clip:
-            image = np.clip(image, 0, bit_depth_specification.domain)
-        image = image.astype(bit_depth_specification.numpy)
-
-        if image.ndim == 2:
-            height, width = image.shape
-            channels = 1
-        else:
-            height, width, channels = image.shape
+        height, width = shape[0], shape[1]
+        channels = shape[2] if len(shape) == 3 else 1
         specification = ImageSpec(width, height, channels, bit_depth)
 
         image_output = ImageOutput.create(path)
         image_output.open(path, specification, ImageOutputOpenMode.Create)
-        image_output.write_image(bit_depth, image.tostring())
-        image_output.close()
+        try:
+            y = 0
+            for block in blocks:
+                block = _convert_block(block, bit_depth_specification)
+                scanlines = block.shape[0]
+
+                assert block.size == scanlines * width * channels, (
+                    'Block scanlines must have {0} pixels of {1} '
+                    'channels!'.format(width, channels))
+                assert y + scanlines <= height, (
+                    'Blocks have more than {0} scanlines!'.format(height))
+
+                image_output.write_scanlines(y, y + scanlines, 0, bit_depth,
+                                             block.tostring())
+                y += scanlines
+
+            assert y == height, (
+                'Blocks have {0} scanlines, {1} scanlines were '
+                'expected!'.format(y, height))
+        finally:
+            image_output.close()
 
         return True
+
+
+def write_image(image,
+                path,
+                bit_depth='float32',
+                chunk_size=IMAGE_IO_CHUNK_SIZE):
+    """
+    Writes given image using *OpenImageIO*.
+
+    Parameters
+    ----------
+    image : array_like
+        Image data.
+    path : unicode
+        Image path.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    chunk_size : integer, optional
+        Scanlines count of the blocks the image is written by.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The image is converted to given bit depth and written by blocks of
+        scanlines, it is not modified nor copied as a whole.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> image = read_image(path)  # doctest: +SKIP
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.png')
+    >>> write_image(image, path, 'uint8')  # doctest: +SKIP
+    True
+    """
+
+    image = np.asarray(image)
+    chunk_size = int(chunk_size)
+
+    # Slicing returns views, the blocks are only copied once converted.
+    blocks = (image[y:y + chunk_size]
+              for y in range(0, image.shape[0], chunk_size))
+
+    return write_image_blocks(blocks, path, image.shape, bit_depth)
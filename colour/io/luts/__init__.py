@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import os
+
+from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+
+from .lut import (LUT_CHUNK_SIZE, AbstractLUT, LUT1D, LUT3x1D, LUT3D,
+                  bake_LUT)
+from .common import LUT_IO_CHUNK_SIZE
+from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
+from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
+from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
+from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+
+__all__ = [
+    'LUT_CHUNK_SIZE', 'AbstractLUT', 'LUT1D', 'LUT3x1D', 'LUT3D', 'bake_LUT'
+]
+__all__ += ['LUT_IO_CHUNK_SIZE']
+__all__ += ['read_LUT_IridasCube', 'write_LUT_IridasCube']
+__all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
+__all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
+__all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+
+EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
+    '.cube': 'Iridas Cube',
+    '.spi1d': 'Sony SPI1D',
+    '.spi3d': 'Sony SPI3D',
+    '.csp': 'Cinespace'
+})
+"""
+Extension to *LUT* format.
+
+EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
+    **{'.cube', '.spi1d', '.spi3d', '.csp'}**
+"""
+
+LUT_READ_METHODS = CaseInsensitiveMapping({
+    'Cinespace': read_LUT_Cinespace,
+    'Iridas Cube': read_LUT_IridasCube,
+    'Sony SPI1D': read_LUT_SonySPI1D,
+    'Sony SPI3D': read_LUT_SonySPI3D
+})
+LUT_READ_METHODS.__doc__ = """
+Supported read *LUT* methods.
+
+LUT_READ_METHODS : CaseInsensitiveMapping
+    **{'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**
+"""
+
+
+def _LUT_format(path, method):
+    """
+    Returns the *LUT* format of given path if given method is not defined.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    method : unicode
+        *LUT* method.
+
+    Returns
+    -------
+    unicode
+        *LUT* format.
+    """
+
+    if method is not None:
+        return method
+
+    extension = os.path.splitext(path)[-1]
+    assert extension in EXTENSION_TO_LUT_FORMAT_MAPPING, (
+        '"{0}" extension is not supported, the "method" argument must be '
+        'given!'.format(extension))
+
+    return EXTENSION_TO_LUT_FORMAT_MAPPING[extension]
+
+
+def read_LUT(path, method=None, **kwargs):
+    """
+    Reads given *LUT* file using given method.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    method : unicode, optional
+        **{None, 'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**,
+        Reading method, if *None*, the method will be auto-detected according
+        to extension.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D or LUT3D
+        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance.
+
+    Examples
+    --------
+    Reading a 3x1D *Iridas* *.cube* *LUT*:
+
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'ACES_Proxy_10_to_ACES.cube')
+    >>> print(read_LUT(path))
+    LUT3x1D - ACES Proxy 10 to ACES
+    -------------------------------
+    <BLANKLINE>
+    Dimensions : 2
+    Domain     : [[ 0.,  0.,  0.],
+                  [ 1.,  1.,  1.]]
+    Size       : (32, 3)
+
+    Reading a 1D *Sony* *.spi1d* *LUT*:
+
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'sony_spi1d',
+    ...     'oetf_reverse_sRGB_1D.spi1d')
+    >>> print(read_LUT(path))
+    LUT1D - oetf reverse sRGB 1D
+    ----------------------------
+    <BLANKLINE>
+    Dimensions : 1
+    Domain     : [-0.1,  1.5]
+    Size       : (16,)
+    Comment 01 : Generated by "Colour 0.3.11".
+    Comment 02 : "colour.models.oetf_reverse_sRGB".
+    """
+
+    function = LUT_READ_METHODS[_LUT_format(path, method)]
+
+    return function(path, **filter_kwargs(function, **kwargs))
+
+
+LUT_WRITE_METHODS = CaseInsensitiveMapping({
+    'Cinespace': write_LUT_Cinespace,
+    'Iridas Cube': write_LUT_IridasCube,
+    'Sony SPI1D': write_LUT_SonySPI1D,
+    'Sony SPI3D': write_LUT_SonySPI3D
+})
+LUT_WRITE_METHODS.__doc__ = """
+Supported write *LUT* methods.
+
+LUT_WRITE_METHODS : CaseInsensitiveMapping
+    **{'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**
+"""
+
+
+def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
+    """
+    Writes given *LUT* to given file using given method.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D
+        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance to
+        write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+    method : unicode, optional
+        **{None, 'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**,
+        Writing method, if *None*, the method will be auto-detected according
+        to extension.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    Writing a 3x1D *Iridas* *.cube* *LUT*:
+
+    >>> import numpy as np
+    >>> import tempfile
+    >>> LUT = LUT3x1D(
+    ...     LUT3x1D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]),
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT(LUT, os.path.join(tempfile.mkdtemp(), 'My_LUT.cube'))
+    True
+
+    Writing a 1D *Sony* *.spi1d* *LUT*:
+
+    >>> LUT = LUT1D(
+    ...     LUT1D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     np.array([-0.1, 1.5]),
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT(LUT, os.path.join(tempfile.mkdtemp(), 'My_LUT.spi1d'))
+    True
+    """
+
+    function = LUT_WRITE_METHODS[_LUT_format(path, method)]
+
+    return function(LUT, path, decimals, **filter_kwargs(function, **kwargs))
+
+
+__all__ += [
+    'EXTENSION_TO_LUT_FORMAT_MAPPING', 'LUT_READ_METHODS', 'read_LUT',
+    'LUT_WRITE_METHODS', 'write_LUT'
+]
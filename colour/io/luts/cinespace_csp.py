@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+Cinespace .csp LUT Format Input / Output Utilities
+==================================================
+
+Defines *Cinespace* *.csp* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_Cinespace`
+-   :func:`colour.io.write_LUT_Cinespace`
+
+References
+----------
+-   :cite:`Chamberlain2015` : Chamberlain, P. (2015). LUT documentation (to
+    create from another program). Retrieved August 23, 2018, from
+    https://sourceforge.net/projects/cinespacelutlib/files/Docs/
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.luts import LUT1D, LUT3x1D, LUT3D
+from colour.io.luts.common import path_to_title, read_array, write_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+
+
+def _next_line(file_):
+    """
+    Returns the next non blank line of given file.
+
+    Parameters
+    ----------
+    file_ : file
+        File to return the next non blank line of.
+
+    Returns
+    -------
+    unicode
+        Next non blank line, stripped.
+
+    Raises
+    ------
+    ValueError
+        If the file is exhausted.
+    """
+
+    for line in file_:
+        line = line.strip()
+        if line:
+            return line
+
+    raise ValueError('Unexpected end of file!')
+
+
+def _pre_LUT_domain(inputs, outputs):
+    """
+    Returns the domain of given *Cinespace* *.csp* *LUT* linear pre-*LUT*,
+    i.e. the input values mapped to 0 and 1.
+
+    Parameters
+    ----------
+    inputs : array_like
+        Pre-*LUT* input values.
+    outputs : array_like
+        Pre-*LUT* output values.
+
+    Returns
+    -------
+    ndarray
+        Pre-*LUT* domain.
+
+    Raises
+    ------
+    ValueError
+        If the pre-*LUT* is not linear.
+    """
+
+    inputs = np.asarray(inputs, dtype=DEFAULT_FLOAT_DTYPE)
+    outputs = np.asarray(outputs, dtype=DEFAULT_FLOAT_DTYPE)
+
+    slope = (outputs[-1] - outputs[0]) / (inputs[-1] - inputs[0])
+    if (inputs.size != outputs.size or slope == 0 or not np.allclose(
+            outputs, outputs[0] + slope * (inputs - inputs[0]))):
+        raise ValueError('Only linear pre-LUTs are supported!')
+
+    return inputs[0] + (np.array([0, 1]) - outputs[0]) / slope
+
+
+def read_LUT_Cinespace(path):
+    """
+    Reads given *Cinespace* *.csp* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT3x1D or LUT3D
+        :class:`LUT3x1D` or :class:`LUT3D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid *Cinespace* *.csp* *LUT* file or if its
+        pre-*LUTs* are not linear.
+
+    Notes
+    -----
+    -   The *LUT* name is the first metadata line, the remaining lines are
+        the *LUT* comments.
+    -   Only linear pre-*LUTs* are supported, they define the *LUT* domain.
+    -   The table is parsed by chunks of lines directly into a preallocated
+        array.
+    -   The *3D* tables red component varies fastest.
+
+    References
+    ----------
+    -   :cite:`Chamberlain2015`
+
+    Examples
+    --------
+    Reading a 3x1D *Cinespace* *.csp* *LUT*:
+
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'cinespace_csp',
+    ...     'ACES_Proxy_10_to_ACES.csp')
+    >>> print(read_LUT_Cinespace(path))
+    LUT3x1D - ACES Proxy 10 to ACES
+    -------------------------------
+    <BLANKLINE>
+    Dimensions : 2
+    Domain     : [[ 0.,  0.,  0.],
+                  [ 1.,  1.,  1.]]
+    Size       : (32, 3)
+
+    Reading a 3D *Cinespace* *.csp* *LUT*:
+
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'cinespace_csp',
+    ...     'ColourCorrect.csp')
+    >>> print(read_LUT_Cinespace(path))
+    LUT3D - Generated by Foundry::LUT
+    ---------------------------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[-0.1, -0.2, -0.4],
+                  [ 1.5,  3. ,  6. ]]
+    Size       : (4, 4, 4, 3)
+    Comment 01 : Colour Correct
+    """
+
+    title = path_to_title(path)
+    comments = []
+
+    with open(path) as csp_file:
+        if _next_line(csp_file) != 'CSPLUTV100':
+            raise ValueError(
+                '"{0}" file is not a valid "Cinespace" ".csp" file!'.format(
+                    path))
+
+        dimensions = _next_line(csp_file)
+        if dimensions not in ('1D', '3D'):
+            raise ValueError(
+                '"{0}" "LUT" type is not supported!'.format(dimensions))
+
+        line = _next_line(csp_file)
+        if line == 'BEGIN METADATA':
+            metadata = []
+            line = _next_line(csp_file)
+            while line != 'END METADATA':
+                metadata.append(line)
+                line = _next_line(csp_file)
+
+            if metadata:
+                title, comments = metadata[0], metadata[1:]
+
+            line = _next_line(csp_file)
+
+        domain = np.empty((2, 3))
+        for i in range(3):
+            # The pre-LUT count has been read already for the first channel.
+            if i > 0:
+                line = _next_line(csp_file)
+
+            count = int(line)
+            inputs = np.array(
+                _next_line(csp_file).split(), dtype=DEFAULT_FLOAT_DTYPE)
+            outputs = np.array(
+                _next_line(csp_file).split(), dtype=DEFAULT_FLOAT_DTYPE)
+
+            if inputs.size != count:
+                raise ValueError('Pre-LUT values count is not {0}!'.format(
+                    count))
+
+            domain[..., i] = _pre_LUT_domain(inputs, outputs)
+
+        size = tuple(int(token) for token in _next_line(csp_file).split())
+        if dimensions == '1D':
+            table = read_array(csp_file, np.empty((size[0], 3)))
+
+            return LUT3x1D(table, title, domain, comments=comments)
+        else:
+            assert len(size) == 3 and size[0] == size[1] == size[2], (
+                'Only cubic tables are supported!')
+
+            size = size[0]
+            table = read_array(csp_file, np.empty((size ** 3, 3)))
+            table = np.transpose(
+                np.reshape(table, (size, size, size, 3)), (2, 1, 0, 3))
+
+            return LUT3D(table, title, domain, comments=comments)
+
+
+def write_LUT_Cinespace(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Cinespace* *.csp* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D
+        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance to
+        write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The *LUT* domain is written as linear pre-*LUTs*.
+    -   :class:`LUT1D` class instances are written as 1D tables with identical
+        channels.
+
+    References
+    ----------
+    -   :cite:`Chamberlain2015`
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> LUT = LUT3D(
+    ...     LUT3D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]),
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> path = os.path.join(tempfile.mkdtemp(), 'My_LUT.csp')
+    >>> write_LUT_Cinespace(LUT, path)
+    True
+    """
+
+    assert isinstance(LUT, (LUT1D, LUT3x1D, LUT3D)), (
+        '"LUT" must be a 1D, 3x1D or 3D "LUT"!')
+
+    domain = LUT.domain
+    table = LUT.table
+    if isinstance(LUT, LUT1D):
+        domain = np.transpose(np.tile(domain, (3, 1)))
+        table = np.transpose(np.tile(table, (3, 1)))
+
+    with open(path, 'w') as csp_file:
+        csp_file.write('CSPLUTV100\n')
+        csp_file.write('{0}\n\n'.format(
+            '3D' if isinstance(LUT, LUT3D) else '1D'))
+
+        csp_file.write('BEGIN METADATA\n')
+        for line in [LUT.name] + LUT.comments:
+            csp_file.write('{0}\n'.format(line))
+        csp_file.write('END METADATA\n\n')
+
+        for i in range(3):
+            csp_file.write('2\n')
+            csp_file.write('{1:.{0}f} {2:.{0}f}\n'.format(
+                decimals, domain[0, i], domain[1, i]))
+            csp_file.write('{1:.{0}f} {2:.{0}f}\n'.format(decimals, 0, 1))
+        csp_file.write('\n')
+
+        if isinstance(LUT, LUT3D):
+            csp_file.write('{0} {0} {0}\n'.format(LUT.size))
+            table = np.reshape(np.transpose(table, (2, 1, 0, 3)), (-1, 3))
+        else:
+            csp_file.write('{0}\n'.format(LUT.size))
+
+        write_array(csp_file, table, decimals)
+
+    return True
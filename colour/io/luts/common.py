@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing Common Utilities
+===============================
+
+Defines the common utilities objects that don't fall in any specific category
+and used to read and write *LUT* files:
+
+-   :func:`colour.io.luts.common.path_to_title`
+-   :func:`colour.io.luts.common.read_array`
+-   :func:`colour.io.luts.common.write_array`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import re
+from itertools import islice
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUT_IO_CHUNK_SIZE', 'path_to_title', 'read_array', 'write_array'
+]
+
+LUT_IO_CHUNK_SIZE = 16384
+"""
+Default lines count of the chunks the *LUT* files tables are read and written
+by.
+
+LUT_IO_CHUNK_SIZE : integer
+"""
+
+
+def path_to_title(path):
+    """
+    Converts given file path to title.
+
+    Parameters
+    ----------
+    path : unicode
+        File path to convert to title.
+
+    Returns
+    -------
+    unicode
+        File path converted to title.
+
+    Examples
+    --------
+    >>> # Doctests skip for Python 2.x compatibility.
+    >>> path_to_title(
+    ...     'colour/io/luts/tests/resources/sony_spi3d/ColourCorrect.spi3d')
+    ... # doctest: +SKIP
+    'ColourCorrect'
+    """
+
+    return re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
+
+
+def read_array(lines, array, comment='#', chunk_size=LUT_IO_CHUNK_SIZE):
+    """
+    Reads the whitespace separated values of given lines into given
+    preallocated array, one array row per line.
+
+    Exactly the lines holding the array rows are consumed from given lines
+    iterator, the chunks of lines are parsed at once, blank and comment lines
+    are skipped.
+
+    Parameters
+    ----------
+    lines : iterator
+        Lines iterator, e.g. a file object.
+    array : ndarray, (R, C)
+        C-contiguous array to read the values into.
+    comment : unicode, optional
+        Comment lines prefix.
+    chunk_size : integer, optional
+        Lines count of the chunks the values are parsed by.
+
+    Returns
+    -------
+    ndarray
+        Read array.
+
+    Raises
+    ------
+    ValueError
+        If the lines are exhausted before the array is filled or if they
+        cannot be parsed.
+
+    Examples
+    --------
+    >>> lines = iter(['0.0 0.5\\n', '# Comment\\n', '1.0 1.5\\n', 'END\\n'])
+    >>> read_array(lines, np.empty((2, 2)))
+    array([[ 0. ,  0.5],
+           [ 1. ,  1.5]])
+    >>> next(lines)
+    'END\\n'
+    """
+
+    assert array.flags.c_contiguous, '"array" must be C-contiguous!'
+
+    values = np.reshape(array, -1)
+    columns = array.shape[-1] if array.ndim > 1 else 1
+
+    i = 0
+    while i < values.size:
+        chunk = list(islice(lines, min((values.size - i) // columns,
+                                       int(chunk_size))))
+        if not chunk:
+            raise ValueError(
+                'Lines were exhausted after reading {0} values, {1} values '
+                'were expected!'.format(i, values.size))
+
+        chunk_values = np.fromstring(
+            ''.join(chunk), dtype=DEFAULT_FLOAT_DTYPE, sep=' ')
+
+        if chunk_values.size != len(chunk) * columns:
+            # Skipping the blank and comment lines, the rows still missing
+            # are read with the next chunk.
+            chunk = [
+                line for line in chunk
+                if line.strip() and not line.lstrip().startswith(comment)
+            ]
+            chunk_values = np.fromstring(
+                ''.join(chunk), dtype=DEFAULT_FLOAT_DTYPE, sep=' ')
+
+            if chunk_values.size != len(chunk) * columns:
+                raise ValueError(
+                    'Lines could not be parsed as rows of {0} values!'.format(
+                        columns))
+
+        values[i:i + chunk_values.size] = chunk_values
+        i += chunk_values.size
+
+    return array
+
+
+def write_array(file_,
+                array,
+                decimals=7,
+                formats=None,
+                chunk_size=LUT_IO_CHUNK_SIZE):
+    """
+    Writes given array into given file, one array row per line.
+
+    The chunks of rows are formatted at once.
+
+    Parameters
+    ----------
+    file_ : file
+        File to write the array into.
+    array : array_like, (R, C)
+        Array to write.
+    decimals : int, optional
+        Formatting decimals.
+    formats : array_like, optional
+        Columns formats, the columns are formatted with ``decimals`` decimals
+        if not given.
+    chunk_size : integer, optional
+        Rows count of the chunks the array is written by.
+
+    Examples
+    --------
+    >>> import sys
+    >>> write_array(sys.stdout, np.array([[0, 0.5], [1, 1.5]]), 3)
+    0.000 0.500
+    1.000 1.500
+    """
+
+    array = np.asarray(array, dtype=DEFAULT_FLOAT_DTYPE)
+    array = np.reshape(array, (array.shape[0], -1))
+    chunk_size = int(chunk_size)
+
+    if formats is None:
+        formats = ['%.{0}f'.format(decimals)] * array.shape[-1]
+
+    row_format = ' '.join(formats) + '\n'
+    for i in range(0, array.shape[0], chunk_size):
+        chunk = array[i:i + chunk_size]
+        file_.write((row_format * chunk.shape[0]) % tuple(np.ravel(chunk)))
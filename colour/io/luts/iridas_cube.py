@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Iridas .cube LUT Format Input / Output Utilities
+================================================
+
+Defines *Iridas* *.cube* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_IridasCube`
+-   :func:`colour.io.write_LUT_IridasCube`
+
+References
+----------
+-   :cite:`AdobeSystems2013b` : Adobe Systems. (2013). Cube LUT
+    Specification. Retrieved from https://drive.google.com/\\
+open?id=143Eh08ZYncCAMwJ1q4gWxVOqR_OSWYvs
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from itertools import chain
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.luts import LUT1D, LUT3x1D, LUT3D
+from colour.io.luts.common import path_to_title, read_array, write_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['read_LUT_IridasCube', 'write_LUT_IridasCube']
+
+
+def read_LUT_IridasCube(path):
+    """
+    Reads given *Iridas* *.cube* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT3x1D or LUT3D
+        :class:`LUT3x1D` or :class:`LUT3D` class instance.
+
+    Notes
+    -----
+    -   The table is parsed by chunks of lines directly into a preallocated
+        array.
+    -   The *3D* tables red component varies fastest.
+
+    References
+    ----------
+    -   :cite:`AdobeSystems2013b`
+
+    Examples
+    --------
+    Reading a 3x1D *Iridas* *.cube* *LUT*:
+
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'ACES_Proxy_10_to_ACES.cube')
+    >>> print(read_LUT_IridasCube(path))
+    LUT3x1D - ACES Proxy 10 to ACES
+    -------------------------------
+    <BLANKLINE>
+    Dimensions : 2
+    Domain     : [[ 0.,  0.,  0.],
+                  [ 1.,  1.,  1.]]
+    Size       : (32, 3)
+
+    Reading a 3D *Iridas* *.cube* *LUT*:
+
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'ColourCorrect.cube')
+    >>> print(read_LUT_IridasCube(path))
+    LUT3D - Generated by Foundry::LUT
+    ---------------------------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[-0.1, -0.2, -0.4],
+                  [ 1.5,  3. ,  6. ]]
+    Size       : (4, 4, 4, 3)
+    Comment 01 : Colour Correct
+    """
+
+    title = path_to_title(path)
+    dimensions = size = None
+    domain_min, domain_max = np.zeros(3), np.ones(3)
+    comments = []
+
+    with open(path) as cube_file:
+        for line in cube_file:
+            line = line.strip()
+
+            if len(line) == 0:
+                continue
+
+            if line.startswith('#'):
+                comments.append(line[1:].strip())
+                continue
+
+            tokens = line.split()
+            if tokens[0] == 'TITLE':
+                title = line[len('TITLE'):].strip().strip('"')
+            elif tokens[0] == 'DOMAIN_MIN':
+                domain_min = np.array(tokens[1:], dtype=DEFAULT_FLOAT_DTYPE)
+            elif tokens[0] == 'DOMAIN_MAX':
+                domain_max = np.array(tokens[1:], dtype=DEFAULT_FLOAT_DTYPE)
+            elif tokens[0] in ('LUT_1D_INPUT_RANGE', 'LUT_3D_INPUT_RANGE'):
+                domain_min, domain_max = (
+                    np.full(3, DEFAULT_FLOAT_DTYPE(token))
+                    for token in tokens[1:3])
+            elif tokens[0] in ('LUT_1D_SIZE', 'LUT_3D_SIZE'):
+                assert dimensions is None, (
+                    '"Iridas" ".cube" files defining both a 1D and a 3D table '
+                    'are not supported!')
+
+                dimensions = 2 if tokens[0] == 'LUT_1D_SIZE' else 3
+                size = int(tokens[1])
+            else:
+                # First table row, the remaining rows are parsed at once.
+                assert dimensions is not None, (
+                    'Table size is not defined!')
+
+                table = read_array(
+                    chain(['{0}\n'.format(line)], cube_file),
+                    np.empty((size ** 3 if dimensions == 3 else size, 3)))
+                break
+        else:
+            raise ValueError(
+                '"{0}" file does not define a table!'.format(path))
+
+    domain = np.array([domain_min, domain_max])
+    if dimensions == 2:
+        return LUT3x1D(table, title, domain, comments=comments)
+    else:
+        table = np.transpose(np.reshape(table, (size, size, size, 3)),
+                             (2, 1, 0, 3))
+
+        return LUT3D(table, title, domain, comments=comments)
+
+
+def write_LUT_IridasCube(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Iridas* *.cube* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D or LUT3D
+        :class:`LUT1D`, :class:`LUT3x1D` or :class:`LUT3D` class instance to
+        write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   :class:`LUT1D` class instances are written as 1D tables with identical
+        channels.
+
+    References
+    ----------
+    -   :cite:`AdobeSystems2013b`
+
+    Examples
+    --------
+    Writing a 3x1D *Iridas* *.cube* *LUT*:
+
+    >>> import os
+    >>> import tempfile
+    >>> LUT = LUT3x1D(
+    ...     LUT3x1D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]),
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> path = os.path.join(tempfile.mkdtemp(), 'My_LUT.cube')
+    >>> write_LUT_IridasCube(LUT, path)
+    True
+
+    Writing a 3D *Iridas* *.cube* *LUT*:
+
+    >>> LUT = LUT3D(
+    ...     LUT3D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]),
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_IridasCube(LUT, path)
+    True
+    """
+
+    assert isinstance(LUT, (LUT1D, LUT3x1D, LUT3D)), (
+        '"LUT" must be a 1D, 3x1D or 3D "LUT"!')
+
+    domain = LUT.domain
+    table = LUT.table
+    if isinstance(LUT, LUT1D):
+        domain = np.transpose(np.tile(domain, (3, 1)))
+        table = np.transpose(np.tile(table, (3, 1)))
+
+    with open(path, 'w') as cube_file:
+        cube_file.write('TITLE "{0}"\n'.format(LUT.name))
+
+        for comment in LUT.comments:
+            cube_file.write('# {0}\n'.format(comment))
+
+        for keyword, values in (('DOMAIN_MIN', domain[0]),
+                                ('DOMAIN_MAX', domain[1])):
+            cube_file.write('{0} {1}\n'.format(keyword, ' '.join(
+                '{0:.{1}f}'.format(value, decimals) for value in values)))
+
+        if isinstance(LUT, LUT3D):
+            cube_file.write('LUT_3D_SIZE {0}\n'.format(LUT.size))
+            table = np.reshape(
+                np.transpose(table, (2, 1, 0, 3)), (-1, 3))
+        else:
+            cube_file.write('LUT_1D_SIZE {0}\n'.format(LUT.size))
+
+        write_array(cube_file, table, decimals)
+
+    return True
@@ -0,0 +1,1163 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing
+==============
+
+Defines the classes and definitions handling *LUT* processing:
+
+-   :class:`colour.io.luts.AbstractLUT`
+-   :class:`colour.LUT1D`
+-   :class:`colour.LUT3x1D`
+-   :class:`colour.LUT3D`
+-   :func:`colour.bake_LUT`
+
+The *LUTs* tables sample uniformly their domain, they are applied with
+vectorised linear interpolation for :class:`colour.LUT1D` and
+:class:`colour.LUT3x1D` classes and with trilinear or tetrahedral
+interpolation for :class:`colour.LUT3D` class.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from abc import ABCMeta, abstractmethod
+from copy import deepcopy
+from six import add_metaclass
+
+from colour.algebra import table_interpolation
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import filter_kwargs, is_string, tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUT_CHUNK_SIZE', 'AbstractLUT', 'LUT1D', 'LUT3x1D', 'LUT3D', 'bake_LUT'
+]
+
+LUT_CHUNK_SIZE = 65536
+"""
+Default values count of the chunks the *LUTs* are applied by, the chunks
+temporary arrays fit in the processor caches.
+
+LUT_CHUNK_SIZE : integer
+"""
+
+
+def _interpolate_linear_uniform(x, table, slopes, domain, out):
+    """
+    Performs linear interpolation of given values using given table uniformly
+    sampling given domain, the interpolated values are written into given
+    output array.
+
+    The table cell enclosing each value is indexed directly, no search is
+    performed.
+
+    Parameters
+    ----------
+    x : ndarray
+        Values to interpolate.
+    table : ndarray
+        Table uniformly sampling the domain.
+    slopes : ndarray
+        Table successive samples differences.
+    domain : array_like
+        Table domain minimum and maximum values.
+    out : ndarray
+        Output array with the same shape than ``x``.
+    """
+
+    minimum, maximum = domain
+
+    p = np.clip(x, minimum, maximum)
+    p -= minimum
+    p *= (table.shape[0] - 1) / (maximum - minimum)
+
+    # Casting *nan* to integer is undefined, clipping the indexes keeps them
+    # valid and the fractional positions propagate the *nan*.
+    i = np.clip(p.astype(np.int_), 0, table.shape[0] - 2)
+    p -= i
+
+    np.multiply(p, slopes.take(i), out=out)
+    out += table.take(i)
+
+
+@add_metaclass(ABCMeta)
+class AbstractLUT:
+    """
+    Defines the base class for *LUTs*.
+
+    This is an :class:`ABCMeta` abstract class that must be inherited by
+    sub-classes.
+
+    Parameters
+    ----------
+    table : array_like, optional
+        Underlying *LUT* table, a linear table of given size is used if not
+        given.
+    name : unicode, optional
+        *LUT* name.
+    dimensions : int, optional
+        *LUT* dimensions, typically, 1 for a 1D *LUT*, 2 for a 3x1D *LUT* and 3
+        for a 3D *LUT*.
+    domain : array_like, optional
+        *LUT* domain, also used to define the linear table.
+    size : int, optional
+        Size of the linear table.
+    comments : array_like, optional
+        Comments to add to the *LUT*.
+
+    Attributes
+    ----------
+    table
+    name
+    dimensions
+    domain
+    size
+    comments
+
+    Methods
+    -------
+    __str__
+    __repr__
+    __eq__
+    __ne__
+    apply
+    maximum_error
+    copy
+    linear_table
+    """
+
+    def __init__(self,
+                 table=None,
+                 name=None,
+                 dimensions=None,
+                 domain=None,
+                 size=None,
+                 comments=None):
+        self._dimensions = dimensions
+
+        self._domain = None
+        self.domain = domain
+
+        self._table = None
+        self.table = (self.linear_table(size, self._domain)
+                      if table is None else table)
+
+        self._name = None
+        self.name = (name if name is not None else
+                     'Unity {0}'.format(self.size)
+                     if table is None else self.__class__.__name__)
+
+        self._comments = []
+        self.comments = comments
+
+    @property
+    def table(self):
+        """
+        Getter and setter property for the underlying *LUT* table.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the underlying *LUT* table with.
+
+        Returns
+        -------
+        ndarray
+            Underlying *LUT* table.
+        """
+
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        """
+        Setter for **self.table** property.
+        """
+
+        if value is not None:
+            value = np.asarray(value, dtype=DEFAULT_FLOAT_DTYPE)
+
+            self._validate_table(value)
+
+        self._table = value
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the *LUT* name.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the *LUT* name with.
+
+        Returns
+        -------
+        unicode
+            *LUT* name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for **self.name** property.
+        """
+
+        if value is not None:
+            assert is_string(value), (
+                ('"{0}" attribute: "{1}" is not a "string" like object!'
+                 ).format('name', value))
+
+        self._name = value
+
+    @property
+    def dimensions(self):
+        """
+        Getter and setter property for the *LUT* dimensions.
+
+        Returns
+        -------
+        int
+            *LUT* dimensions.
+
+        Warning
+        -------
+        :attr:`AbstractLUT.dimensions` is read only.
+        """
+
+        return self._dimensions
+
+    @property
+    def domain(self):
+        """
+        Getter and setter property for the *LUT* domain, the table samples
+        uniformly the domain.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the *LUT* domain with.
+
+        Returns
+        -------
+        ndarray
+            *LUT* domain.
+        """
+
+        return self._domain
+
+    @domain.setter
+    def domain(self, value):
+        """
+        Setter for **self.domain** property.
+        """
+
+        value = self._validate_domain(value)
+
+        assert np.all(value[0] < value[1]), (
+            '"{0}" attribute: "{1}" minimum values must be lesser than its '
+            'maximum values!'.format('domain', value))
+
+        self._domain = value
+
+    @property
+    def size(self):
+        """
+        Getter and setter property for the *LUT* size, i.e. the table samples
+        count along each axis.
+
+        Returns
+        -------
+        int
+            *LUT* size.
+
+        Warning
+        -------
+        :attr:`AbstractLUT.size` is read only.
+        """
+
+        return self._table.shape[0]
+
+    @property
+    def comments(self):
+        """
+        Getter and setter property for the *LUT* comments.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the *LUT* comments with.
+
+        Returns
+        -------
+        list
+            *LUT* comments.
+        """
+
+        return self._comments
+
+    @comments.setter
+    def comments(self, value):
+        """
+        Setter for **self.comments** property.
+        """
+
+        self._comments = list(value) if value is not None else []
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the *LUT*.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return ('{0} - {1}\n'
+                '{2}\n\n'
+                'Dimensions : {3}\n'
+                'Domain     : {4}\n'
+                'Size       : {5!s}'.format(
+                    self.__class__.__name__, self._name,
+                    '-' * (len(self.__class__.__name__) + 3 + len(self._name)),
+                    self._dimensions,
+                    np.array2string(self._domain, separator=', ').replace(
+                        '\n', '\n' + ' ' * 13), self._table.shape) + ''.join(
+                            '\nComment {0:02d} : {1}'.format(i + 1, comment)
+                            for i, comment in enumerate(self._comments)))
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the *LUT*.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}(name=\'{1}\', size={2}, domain={3})'.format(
+            self.__class__.__name__, self._name, self.size,
+            np.array2string(self._domain, separator=', ').replace(
+                '\n', ''))
+
+    def __eq__(self, other):
+        """
+        Returns whether the *LUT* is equal to given other object.
+
+        Parameters
+        ----------
+        other : object
+            Object to test whether it is equal to the *LUT*.
+
+        Returns
+        -------
+        bool
+            Is given object equal to the *LUT*.
+        """
+
+        if isinstance(other, AbstractLUT):
+            if all([
+                    type(self) is type(other),
+                    np.array_equal(self._table, other.table),
+                    np.array_equal(self._domain, other.domain)
+            ]):
+                return True
+
+        return False
+
+    def __ne__(self, other):
+        """
+        Returns whether the *LUT* is not equal to given other object.
+
+        Parameters
+        ----------
+        other : object
+            Object to test whether it is not equal to the *LUT*.
+
+        Returns
+        -------
+        bool
+            Is given object not equal to the *LUT*.
+        """
+
+        return not (self == other)
+
+    @abstractmethod
+    def _validate_table(self, table):
+        """
+        Validates given table shape, must be reimplemented by sub-classes.
+
+        Parameters
+        ----------
+        table : ndarray
+            Table to validate.
+        """
+
+        pass
+
+    @abstractmethod
+    def _validate_domain(self, domain):
+        """
+        Validates given domain, must be reimplemented by sub-classes.
+
+        Parameters
+        ----------
+        domain : array_like
+            Domain to validate, *None* leads to the default domain.
+
+        Returns
+        -------
+        ndarray
+            Validated domain.
+        """
+
+        pass
+
+    @abstractmethod
+    def apply(self, RGB, chunk_size=LUT_CHUNK_SIZE):
+        """
+        Applies the *LUT* to given *RGB* colourspace array, must be
+        reimplemented by sub-classes.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the *LUT* onto.
+        chunk_size : integer, optional
+            Values count of the chunks the *LUT* is applied by, bounding the
+            memory footprint.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+        """
+
+        pass
+
+    def maximum_error(self, function, samples=None, **kwargs):
+        """
+        Returns the maximum absolute error of the *LUT* against given function,
+        typically the function it was baked from.
+
+        The *LUT* and the function are evaluated on a linear table uniformly
+        sampling the *LUT* domain.
+
+        Parameters
+        ----------
+        function : callable
+            Function to compare the *LUT* against.
+        samples : int, optional
+            Samples count along each axis of the evaluation linear table, the
+            default samples 16 values per cell for the 1D and 3x1D *LUTs* and
+            the nodes and cells centres for the 3D *LUTs*.
+
+        Other Parameters
+        ----------------
+        method : unicode, optional
+            {:meth:`colour.LUT3D.apply`},
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+
+        Returns
+        -------
+        numeric
+            Maximum absolute error.
+
+        Examples
+        --------
+        >>> from colour.models import oetf_BT709
+        >>> LUT = bake_LUT(oetf_BT709, LUT1D, 1024)
+        >>> LUT.maximum_error(oetf_BT709)  # doctest: +ELLIPSIS
+        0.0001477...
+        >>> LUT = bake_LUT(oetf_BT709, LUT3D, 17)
+        >>> LUT.maximum_error(oetf_BT709, method='Tetrahedral')
+        ... # doctest: +ELLIPSIS
+        0.0237338...
+        """
+
+        if samples is None:
+            samples = (2 if self._dimensions == 3 else 16) * (
+                self.size - 1) + 1
+
+        table = self.linear_table(samples, self._domain)
+
+        return np.max(
+            np.abs(
+                self.apply(table, **filter_kwargs(self.apply, **kwargs)) -
+                function(table)))
+
+    def copy(self):
+        """
+        Returns a copy of the sub-class instance.
+
+        Returns
+        -------
+        AbstractLUT
+            *LUT* copy.
+        """
+
+        return deepcopy(self)
+
+    @staticmethod
+    @abstractmethod
+    def linear_table(size, domain):
+        """
+        Returns a linear table of given size and domain, must be reimplemented
+        by sub-classes.
+
+        Parameters
+        ----------
+        size : int
+            Expected table size.
+        domain : array_like
+            Domain of the table.
+
+        Returns
+        -------
+        ndarray
+            Linear table.
+        """
+
+        pass
+
+
+class LUT1D(AbstractLUT):
+    """
+    Defines the base class for a 1D *LUT*.
+
+    Parameters
+    ----------
+    table : array_like, optional
+        Underlying *LUT* table.
+    name : unicode, optional
+        *LUT* name.
+    domain : array_like, optional
+        *LUT* domain minimum and maximum values, also used to define the
+        linear table.
+    size : int, optional
+        Size of the linear table.
+    comments : array_like, optional
+        Comments to add to the *LUT*.
+
+    Methods
+    -------
+    apply
+    linear_table
+
+    Examples
+    --------
+    Instantiating a unity *LUT* with a table with 16 elements:
+
+    >>> print(LUT1D(size=16))
+    LUT1D - Unity 16
+    ----------------
+    <BLANKLINE>
+    Dimensions : 1
+    Domain     : [ 0.,  1.]
+    Size       : (16,)
+
+    Instantiating a *LUT* using a custom table with 16 elements:
+
+    >>> print(LUT1D(LUT1D.linear_table(16) ** (1 / 2.2)))
+    ... # doctest: +ELLIPSIS
+    LUT1D - LUT1D
+    -------------
+    <BLANKLINE>
+    Dimensions : 1
+    Domain     : [ 0.,  1.]
+    Size       : (16,)
+
+    Instantiating a *LUT* using a custom table with 16 elements, custom name
+    and custom domain:
+
+    >>> print(LUT1D(
+    ...     LUT1D.linear_table(16, np.array([0.1, 1.5])) ** (1 / 2.2),
+    ...     'My LUT', np.array([0.1, 1.5])))
+    LUT1D - My LUT
+    --------------
+    <BLANKLINE>
+    Dimensions : 1
+    Domain     : [ 0.1,  1.5]
+    Size       : (16,)
+    """
+
+    def __init__(self,
+                 table=None,
+                 name=None,
+                 domain=None,
+                 size=10,
+                 comments=None):
+        super(LUT1D, self).__init__(table, name, 1, domain, size, comments)
+
+    def _validate_table(self, table):
+        """
+        Validates given table is a 1D array.
+
+        Parameters
+        ----------
+        table : ndarray
+            Table to validate.
+        """
+
+        assert table.ndim == 1 and table.shape[0] >= 2, (
+            'The table must be a 1D array with at least 2 elements!')
+
+    def _validate_domain(self, domain):
+        """
+        Validates given domain is a 1D array with 2 elements.
+
+        Parameters
+        ----------
+        domain : array_like
+            Domain to validate, *None* leads to the [0, 1] domain.
+
+        Returns
+        -------
+        ndarray
+            Validated domain.
+        """
+
+        if domain is None:
+            domain = np.array([0, 1])
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        assert domain.shape == (2, ), (
+            'The domain must be a 1D array with 2 elements!')
+
+        return domain
+
+    def apply(self, RGB, chunk_size=LUT_CHUNK_SIZE):
+        """
+        Applies the *LUT* to given *RGB* colourspace array using linear
+        interpolation.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the *LUT* onto.
+        chunk_size : integer, optional
+            Values count of the chunks the *LUT* is applied by, bounding the
+            memory footprint.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+
+        Notes
+        -----
+        -   *RGB* colourspace array values outside the *LUT* domain are
+            clamped.
+
+        Examples
+        --------
+        >>> LUT = LUT1D(LUT1D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.apply(RGB)  # doctest: +ELLIPSIS
+        array([ 0.4529220...,  0.4529220...,  0.4529220...])
+        """
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = RGB.shape
+        RGB = np.ravel(RGB)
+        chunk_size = int(chunk_size)
+
+        slopes = np.diff(self._table)
+
+        RGB_i = np.empty(RGB.shape)
+        for i in range(0, RGB.shape[0], chunk_size):
+            _interpolate_linear_uniform(RGB[i:i + chunk_size], self._table,
+                                        slopes, self._domain,
+                                        RGB_i[i:i + chunk_size])
+
+        return np.reshape(RGB_i, shape)
+
+    @staticmethod
+    def linear_table(size=10, domain=np.array([0, 1])):
+        """
+        Returns a linear table, the number of output samples :math:`n` is
+        equal to ``size``.
+
+        Parameters
+        ----------
+        size : int, optional
+            Expected table size.
+        domain : array_like, optional
+            Domain minimum and maximum values of the table.
+
+        Returns
+        -------
+        ndarray
+            Linear table with ``size`` samples.
+
+        Examples
+        --------
+        >>> LUT1D.linear_table(5, np.array([-0.1, 1.5]))
+        array([-0.1,  0.3,  0.7,  1.1,  1.5])
+        """
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        return np.linspace(domain[0], domain[1], size)
+
+
+class LUT3x1D(AbstractLUT):
+    """
+    Defines the base class for a 3x1D *LUT*, i.e. a 1D *LUT* per *RGB*
+    colourspace array channel.
+
+    Parameters
+    ----------
+    table : array_like, optional
+        Underlying *LUT* table with shape (size, 3).
+    name : unicode, optional
+        *LUT* name.
+    domain : array_like, optional
+        *LUT* domain minimum and maximum values per channel, with shape
+        (2, 3), also used to define the linear table.
+    size : int, optional
+        Size of the linear table.
+    comments : array_like, optional
+        Comments to add to the *LUT*.
+
+    Methods
+    -------
+    apply
+    linear_table
+
+    Examples
+    --------
+    Instantiating a unity *LUT* with a table with 16x3 elements:
+
+    >>> print(LUT3x1D(size=16))
+    LUT3x1D - Unity 16
+    ------------------
+    <BLANKLINE>
+    Dimensions : 2
+    Domain     : [[ 0.,  0.,  0.],
+                  [ 1.,  1.,  1.]]
+    Size       : (16, 3)
+
+    Instantiating a *LUT* using a custom table with 16x3 elements, custom name
+    and custom domain:
+
+    >>> domain = np.array([[0.1, 0.2, 0.4], [1.5, 1.0, 2.0]])
+    >>> print(LUT3x1D(
+    ...     LUT3x1D.linear_table(16, domain) ** (1 / 2.2), 'My LUT', domain))
+    LUT3x1D - My LUT
+    ----------------
+    <BLANKLINE>
+    Dimensions : 2
+    Domain     : [[ 0.1,  0.2,  0.4],
+                  [ 1.5,  1. ,  2. ]]
+    Size       : (16, 3)
+    """
+
+    def __init__(self,
+                 table=None,
+                 name=None,
+                 domain=None,
+                 size=10,
+                 comments=None):
+        super(LUT3x1D, self).__init__(table, name, 2, domain, size, comments)
+
+    def _validate_table(self, table):
+        """
+        Validates given table is a 2D array with 3 columns.
+
+        Parameters
+        ----------
+        table : ndarray
+            Table to validate.
+        """
+
+        assert (table.ndim == 2 and table.shape[0] >= 2 and
+                table.shape[-1] == 3), (
+                    'The table must be a 2D array with at least 2 rows and 3 '
+                    'columns!')
+
+    def _validate_domain(self, domain):
+        """
+        Validates given domain is a 2D array with shape (2, 3).
+
+        Parameters
+        ----------
+        domain : array_like
+            Domain to validate, *None* leads to the [0, 1] domain for each
+            channel.
+
+        Returns
+        -------
+        ndarray
+            Validated domain.
+        """
+
+        if domain is None:
+            domain = np.array([[0, 0, 0], [1, 1, 1]])
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        assert domain.shape == (2, 3), (
+            'The domain must be a 2D array with shape (2, 3)!')
+
+        return domain
+
+    def apply(self, RGB, chunk_size=LUT_CHUNK_SIZE):
+        """
+        Applies the *LUT* to given *RGB* colourspace array using linear
+        interpolation.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the *LUT* onto.
+        chunk_size : integer, optional
+            *RGB* colourspace array count of the chunks the *LUT* is applied
+            by, bounding the memory footprint.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+
+        Notes
+        -----
+        -   *RGB* colourspace array values outside the *LUT* domain are
+            clamped.
+
+        Examples
+        --------
+        >>> LUT = LUT3x1D(LUT3x1D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.apply(RGB)  # doctest: +ELLIPSIS
+        array([ 0.4529220...,  0.4529220...,  0.4529220...])
+        """
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = RGB.shape
+        RGB = np.reshape(RGB, (-1, 3))
+        chunk_size = int(chunk_size)
+
+        tables = [np.ascontiguousarray(table) for table in tsplit(self._table)]
+        slopes = [np.diff(table) for table in tables]
+
+        RGB_i = np.empty(RGB.shape)
+        for i in range(0, RGB.shape[0], chunk_size):
+            for j in range(3):
+                _interpolate_linear_uniform(
+                    RGB[i:i + chunk_size, j], tables[j], slopes[j],
+                    self._domain[..., j], RGB_i[i:i + chunk_size, j])
+
+        return np.reshape(RGB_i, shape)
+
+    @staticmethod
+    def linear_table(size=10, domain=np.array([[0, 0, 0], [1, 1, 1]])):
+        """
+        Returns a linear table, the number of output samples :math:`n` is
+        equal to ``size * 3``.
+
+        Parameters
+        ----------
+        size : int, optional
+            Expected table size.
+        domain : array_like, optional
+            Domain minimum and maximum values of the table per channel.
+
+        Returns
+        -------
+        ndarray
+            Linear table with ``size * 3`` samples.
+
+        Examples
+        --------
+        >>> LUT3x1D.linear_table(
+        ...     5, np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]))
+        array([[-0.1, -0.2, -0.4],
+               [ 0.3,  0.6,  1.2],
+               [ 0.7,  1.4,  2.8],
+               [ 1.1,  2.2,  4.4],
+               [ 1.5,  3. ,  6. ]])
+        """
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        return tstack([np.linspace(a, b, size) for a, b in zip(*domain)])
+
+
+class LUT3D(AbstractLUT):
+    """
+    Defines the base class for a 3D *LUT*.
+
+    Parameters
+    ----------
+    table : array_like, optional
+        Underlying *LUT* table with shape (size, size, size, 3), the first
+        three axes are respectively the *R*, *G* and *B* samples.
+    name : unicode, optional
+        *LUT* name.
+    domain : array_like, optional
+        *LUT* domain minimum and maximum values per channel, with shape
+        (2, 3), also used to define the linear table.
+    size : int, optional
+        Size of the linear table.
+    comments : array_like, optional
+        Comments to add to the *LUT*.
+
+    Methods
+    -------
+    apply
+    linear_table
+
+    Examples
+    --------
+    Instantiating a unity *LUT* with a table with 16x16x16x3 elements:
+
+    >>> print(LUT3D(size=16))
+    LUT3D - Unity 16
+    ----------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.,  0.,  0.],
+                  [ 1.,  1.,  1.]]
+    Size       : (16, 16, 16, 3)
+
+    Instantiating a *LUT* using a custom table with 16x16x16x3 elements,
+    custom name and custom domain:
+
+    >>> domain = np.array([[0.1, 0.2, 0.4], [1.5, 1.0, 2.0]])
+    >>> print(LUT3D(
+    ...     LUT3D.linear_table(16, domain) ** (1 / 2.2), 'My LUT', domain))
+    LUT3D - My LUT
+    --------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.1,  0.2,  0.4],
+                  [ 1.5,  1. ,  2. ]]
+    Size       : (16, 16, 16, 3)
+    """
+
+    def __init__(self,
+                 table=None,
+                 name=None,
+                 domain=None,
+                 size=33,
+                 comments=None):
+        super(LUT3D, self).__init__(table, name, 3, domain, size, comments)
+
+    def _validate_table(self, table):
+        """
+        Validates given table is a 4D array with shape (size, size, size, 3).
+
+        Parameters
+        ----------
+        table : ndarray
+            Table to validate.
+        """
+
+        assert (table.ndim == 4 and table.shape[0] >= 2 and
+                table.shape[:3] == (table.shape[0], ) * 3 and
+                table.shape[-1] == 3), (
+                    'The table must be a 4D array with shape '
+                    '(size, size, size, 3)!')
+
+    def _validate_domain(self, domain):
+        """
+        Validates given domain is a 2D array with shape (2, 3).
+
+        Parameters
+        ----------
+        domain : array_like
+            Domain to validate, *None* leads to the [0, 1] domain for each
+            channel.
+
+        Returns
+        -------
+        ndarray
+            Validated domain.
+        """
+
+        if domain is None:
+            domain = np.array([[0, 0, 0], [1, 1, 1]])
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        assert domain.shape == (2, 3), (
+            'The domain must be a 2D array with shape (2, 3)!')
+
+        return domain
+
+    def apply(self, RGB, chunk_size=LUT_CHUNK_SIZE, method='Trilinear'):
+        """
+        Applies the *LUT* to given *RGB* colourspace array using given
+        interpolation method.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the *LUT* onto.
+        chunk_size : integer, optional
+            *RGB* colourspace array count of the chunks the *LUT* is applied
+            by, bounding the memory footprint.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+
+        Notes
+        -----
+        -   *RGB* colourspace array values outside the *LUT* domain are
+            clamped.
+
+        Examples
+        --------
+        >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
+        >>> RGB = np.array([0.18, 0.18, 0.18])
+        >>> LUT.apply(RGB)  # doctest: +ELLIPSIS
+        array([ 0.4583277...,  0.4583277...,  0.4583277...])
+        >>> LUT.apply(RGB, method='Tetrahedral')  # doctest: +ELLIPSIS
+        array([ 0.4583277...,  0.4583277...,  0.4583277...])
+        """
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = RGB.shape
+        RGB = np.reshape(RGB, (-1, 3))
+        chunk_size = int(chunk_size)
+
+        minimum, maximum = self._domain
+        normalise = np.any(minimum != 0) or np.any(maximum != 1)
+
+        RGB_i = np.empty(RGB.shape)
+        for i in range(0, RGB.shape[0], chunk_size):
+            RGB_c = RGB[i:i + chunk_size]
+            if normalise:
+                RGB_c = (RGB_c - minimum) / (maximum - minimum)
+
+            RGB_i[i:i + chunk_size] = table_interpolation(
+                RGB_c, self._table, method)
+
+        return np.reshape(RGB_i, shape)
+
+    @staticmethod
+    def linear_table(size=33, domain=np.array([[0, 0, 0], [1, 1, 1]])):
+        """
+        Returns a linear table, the number of output samples :math:`n` is
+        equal to ``size**3 * 3``.
+
+        Parameters
+        ----------
+        size : int, optional
+            Expected table size.
+        domain : array_like, optional
+            Domain minimum and maximum values of the table per channel.
+
+        Returns
+        -------
+        ndarray
+            Linear table with ``size**3 * 3`` samples.
+
+        Examples
+        --------
+        >>> LUT3D.linear_table(
+        ...     3, np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]))
+        ... # doctest: +ELLIPSIS
+        array([[[[-0.1, -0.2, -0.4],
+                 [-0.1, -0.2,  2.8],
+                 [-0.1, -0.2,  6. ]],
+        ...
+                [[ 1.5,  3. , -0.4],
+                 [ 1.5,  3. ,  2.8],
+                 [ 1.5,  3. ,  6. ]]]])
+        """
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        R, G, B = np.meshgrid(
+            *[np.linspace(a, b, size) for a, b in zip(*domain)],
+            indexing='ij')
+
+        return tstack([R, G, B])
+
+
+def bake_LUT(function, LUT_class=LUT3D, size=None, domain=None, name=None):
+    """
+    Bakes given function, e.g. a colour component transfer function or a
+    colourspace conversion, into a *LUT* of given class, size and domain.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bake, it is evaluated on the *LUT* class linear table.
+    LUT_class : type, optional
+        **{LUT1D, LUT3x1D, LUT3D}**,
+        *LUT* class.
+    size : int, optional
+        *LUT* size, the *LUT* class default size is used if not given.
+    domain : array_like, optional
+        *LUT* domain, the *LUT* class default domain is used if not given.
+    name : unicode, optional
+        *LUT* name, the function name is used if not given.
+
+    Returns
+    -------
+    AbstractLUT
+        Baked *LUT*.
+
+    Notes
+    -----
+    -   :meth:`colour.io.luts.AbstractLUT.maximum_error` method returns the
+        baked *LUT* maximum absolute error against the function.
+
+    Examples
+    --------
+    Baking a colour component transfer function:
+
+    >>> from colour.models import eotf_ST2084
+    >>> LUT = bake_LUT(eotf_ST2084, LUT1D, 4096)
+    >>> print(LUT)
+    LUT1D - eotf_ST2084
+    -------------------
+    <BLANKLINE>
+    Dimensions : 1
+    Domain     : [ 0.,  1.]
+    Size       : (4096,)
+
+    Baking a colourspace conversion:
+
+    >>> from colour.models import (ACES_CG_COLOURSPACE, sRGB_COLOURSPACE,
+    ...                            ColourspaceConversion)
+    >>> conversion = ColourspaceConversion(
+    ...     sRGB_COLOURSPACE, ACES_CG_COLOURSPACE, apply_decoding_cctf=True)
+    >>> LUT = bake_LUT(conversion, LUT3D, 33)
+    >>> LUT.name
+    "ColourspaceConversion('sRGB' -> 'ACEScg', 'CAT02')"
+    >>> LUT.maximum_error(conversion)  # doctest: +ELLIPSIS
+    0.0003...
+    """
+
+    settings = {}
+    if size is not None:
+        settings['size'] = size
+    if domain is not None:
+        settings['domain'] = domain
+
+    if name is None:
+        name = getattr(function, '__name__', '{0!r}'.format(function))
+
+    return LUT_class(
+        function(LUT_class.linear_table(**settings)), name, domain=domain)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Sony .spi1d LUT Format Input / Output Utilities
+===============================================
+
+Defines *Sony* *.spi1d* *LUT* Format related input / output utilities objects.
+
+-   :func:`colour.io.read_LUT_SonySPI1D`
+-   :func:`colour.io.write_LUT_SonySPI1D`
+
+References
+----------
+-   :cite:`SonyPicturesImageworks` : Sony Pictures Imageworks. (n.d.).
+    OpenColorIO - src/core/FileFormatSpi1D.cpp and
+    src/core/FileFormatSpi3D.cpp. Retrieved August 23, 2018, from
+    https://github.com/imageworks/OpenColorIO/tree/master/src/core
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.luts import LUT1D, LUT3x1D
+from colour.io.luts.common import path_to_title, read_array, write_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
+
+
+def read_LUT_SonySPI1D(path):
+    """
+    Reads given *Sony* *.spi1d* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D or LUT3x1D
+        :class:`LUT1D` or :class:`LUT3x1D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the table components count is not supported.
+
+    Notes
+    -----
+    -   The table is parsed by chunks of lines directly into a preallocated
+        array.
+
+    References
+    ----------
+    -   :cite:`SonyPicturesImageworks`
+
+    Examples
+    --------
+    Reading a 1D *Sony* *.spi1d* *LUT*:
+
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'sony_spi1d',
+    ...     'oetf_reverse_sRGB_1D.spi1d')
+    >>> print(read_LUT_SonySPI1D(path))
+    LUT1D - oetf reverse sRGB 1D
+    ----------------------------
+    <BLANKLINE>
+    Dimensions : 1
+    Domain     : [-0.1,  1.5]
+    Size       : (16,)
+    Comment 01 : Generated by "Colour 0.3.11".
+    Comment 02 : "colour.models.oetf_reverse_sRGB".
+    """
+
+    title = path_to_title(path)
+    domain = size = components = None
+    comments = []
+
+    with open(path) as spi1d_file:
+        for line in spi1d_file:
+            line = line.strip()
+
+            if len(line) == 0:
+                continue
+
+            if line.startswith('#'):
+                comments.append(line[1:].strip())
+                continue
+
+            tokens = line.split()
+            if tokens[0] == 'Version':
+                continue
+            elif tokens[0] == 'From':
+                domain = np.array(tokens[1:3], dtype=DEFAULT_FLOAT_DTYPE)
+            elif tokens[0] == 'Length':
+                size = int(tokens[1])
+            elif tokens[0] == 'Components':
+                components = int(tokens[1])
+                if components not in (1, 3):
+                    raise ValueError(
+                        'Only 1 and 3 components tables are supported!')
+            elif tokens[0] == '{':
+                assert size is not None and components is not None, (
+                    'Table length and components count are not defined!')
+
+                table = read_array(spi1d_file, np.empty((size, components)))
+                break
+        else:
+            raise ValueError(
+                '"{0}" file does not define a table!'.format(path))
+
+    if domain is None:
+        domain = np.array([0, 1])
+
+    if components == 1:
+        return LUT1D(table[..., 0], title, domain, comments=comments)
+    else:
+        return LUT3x1D(
+            table,
+            title,
+            np.transpose(np.tile(domain, (3, 1))),
+            comments=comments)
+
+
+def write_LUT_SonySPI1D(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Sony* *.spi1d* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3x1D
+        :class:`LUT1D` or :class:`LUT3x1D` class instance to write at given
+        path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Warning
+    -------
+    The *Sony* *.spi1d* *LUT* format defines a single domain for all the
+    channels, :class:`LUT3x1D` class instances must thus have identical
+    channels domains.
+
+    References
+    ----------
+    -   :cite:`SonyPicturesImageworks`
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> LUT = LUT1D(
+    ...     LUT1D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     np.array([-0.1, 1.5]),
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> path = os.path.join(tempfile.mkdtemp(), 'My_LUT.spi1d')
+    >>> write_LUT_SonySPI1D(LUT, path)
+    True
+    """
+
+    assert isinstance(LUT, (LUT1D, LUT3x1D)), (
+        '"LUT" must be a 1D or 3x1D "LUT"!')
+
+    domain = LUT.domain
+    if isinstance(LUT, LUT3x1D):
+        assert np.all(domain == domain[..., 0:1]), (
+            '"LUT" channels must have identical domains!')
+
+        domain = domain[..., 0]
+        components = 3
+    else:
+        components = 1
+
+    with open(path, 'w') as spi1d_file:
+        for comment in LUT.comments:
+            spi1d_file.write('# {0}\n'.format(comment))
+
+        spi1d_file.write('Version 1\n')
+        spi1d_file.write('From {1:.{0}f} {2:.{0}f}\n'.format(
+            decimals, domain[0], domain[1]))
+        spi1d_file.write('Length {0}\n'.format(LUT.size))
+        spi1d_file.write('Components {0}\n'.format(components))
+
+        spi1d_file.write('{\n')
+        write_array(spi1d_file,
+                    np.reshape(LUT.table, (LUT.size, components)), decimals,
+                    ['    %.{0}f'.format(decimals)] +
+                    ['%.{0}f'.format(decimals)] * (components - 1))
+        spi1d_file.write('}\n')
+
+    return True
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Sony .spi3d LUT Format Input / Output Utilities
+===============================================
+
+Defines *Sony* *.spi3d* *LUT* Format related input / output utilities objects.
+
+-   :func:`colour.io.read_LUT_SonySPI3D`
+-   :func:`colour.io.write_LUT_SonySPI3D`
+
+References
+----------
+-   :cite:`SonyPicturesImageworks` : Sony Pictures Imageworks. (n.d.).
+    OpenColorIO - src/core/FileFormatSpi1D.cpp and
+    src/core/FileFormatSpi3D.cpp. Retrieved August 23, 2018, from
+    https://github.com/imageworks/OpenColorIO/tree/master/src/core
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from itertools import chain
+
+from colour.io.luts import LUT3D
+from colour.io.luts.common import path_to_title, read_array, write_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
+
+
+def read_LUT_SonySPI3D(path):
+    """
+    Reads given *Sony* *.spi3d* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT3D
+        :class:`LUT3D` class instance.
+
+    Notes
+    -----
+    -   The table is parsed by chunks of lines directly into a preallocated
+        array, the rows are then scattered in the table according to their
+        indexes, thus their order does not matter.
+
+    References
+    ----------
+    -   :cite:`SonyPicturesImageworks`
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'sony_spi3d',
+    ...     'ColourCorrect.spi3d')
+    >>> print(read_LUT_SonySPI3D(path))
+    LUT3D - ColourCorrect
+    ---------------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.,  0.,  0.],
+                  [ 1.,  1.,  1.]]
+    Size       : (4, 4, 4, 3)
+    Comment 01 : Adapted from a LUT generated by Foundry::LUT.
+    """
+
+    title = path_to_title(path)
+    header = []
+    comments = []
+
+    with open(path) as spi3d_file:
+        for line in spi3d_file:
+            line = line.strip()
+
+            if len(line) == 0:
+                continue
+
+            if line.startswith('#'):
+                comments.append(line[1:].strip())
+                continue
+
+            if len(header) < 3:
+                header.append(line.split())
+                continue
+
+            # First table row, the remaining rows are parsed at once.
+            if header[0][0] != 'SPILUT':
+                raise ValueError(
+                    '"{0}" file is not a valid "Sony" ".spi3d" file!'.format(
+                        path))
+
+            size = tuple(int(token) for token in header[2][:3])
+            assert size[0] == size[1] == size[2], (
+                'Only cubic tables are supported!')
+
+            size = size[0]
+            rows = read_array(
+                chain(['{0}\n'.format(line)], spi3d_file),
+                np.empty((size ** 3, 6)))
+            break
+        else:
+            raise ValueError(
+                '"{0}" file does not define a table!'.format(path))
+
+    indexes = np.asarray(rows[..., 0:3], dtype=np.int_)
+    table = np.empty((size, size, size, 3))
+    table[indexes[..., 0], indexes[..., 1], indexes[..., 2]] = rows[..., 3:6]
+
+    return LUT3D(table, title, comments=comments)
+
+
+def write_LUT_SonySPI3D(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Sony* *.spi3d* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        :class:`LUT3D` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Warning
+    -------
+    The *Sony* *.spi3d* *LUT* format does not define a domain, only
+    :class:`LUT3D` class instances with a unit domain can be written.
+
+    References
+    ----------
+    -   :cite:`SonyPicturesImageworks`
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> LUT = LUT3D(
+    ...     LUT3D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> path = os.path.join(tempfile.mkdtemp(), 'My_LUT.spi3d')
+    >>> write_LUT_SonySPI3D(LUT, path)
+    True
+    """
+
+    assert isinstance(LUT, LUT3D), '"LUT" must be a 3D "LUT"!'
+    assert np.array_equal(LUT.domain, np.array([[0, 0, 0], [1, 1, 1]])), (
+        '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!')
+
+    size = LUT.size
+    indexes = np.reshape(
+        np.transpose(np.indices((size, size, size)), (1, 2, 3, 0)), (-1, 3))
+
+    with open(path, 'w') as spi3d_file:
+        spi3d_file.write('SPILUT 1.0\n')
+        spi3d_file.write('3 3\n')
+        spi3d_file.write('{0} {0} {0}\n'.format(size))
+
+        for comment in LUT.comments:
+            spi3d_file.write('# {0}\n'.format(comment))
+
+        write_array(
+            spi3d_file,
+            np.hstack([indexes, np.reshape(LUT.table, (-1, 3))]),
+            formats=['%d'] * 3 + ['%.{0}f'.format(decimals)] * 3)
+
+    return True
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.__init__` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import LUT1D, LUT3D, read_LUT, write_LUT
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUT', 'TestWriteLUT']
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.read_LUT` definition unit tests methods.
+    """
+
+    def test_read_LUT(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT` definition.
+        """
+
+        for directory, name, dimensions in (
+            ('cinespace_csp', 'ColourCorrect.csp', 3),
+            ('iridas_cube', 'ACES_Proxy_10_to_ACES.cube', 2),
+            ('sony_spi1d', 'oetf_reverse_sRGB_1D.spi1d', 1),
+            ('sony_spi3d', 'ColourCorrect.spi3d', 3),
+        ):
+            LUT = read_LUT(os.path.join(LUTS_DIRECTORY, directory, name))
+            self.assertEqual(LUT.dimensions, dimensions)
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'ColourCorrect.lut')
+            shutil.copyfile(
+                os.path.join(LUTS_DIRECTORY, 'sony_spi3d',
+                             'ColourCorrect.spi3d'), path)
+
+            self.assertRaises(AssertionError, read_LUT, path)
+            self.assertIsInstance(read_LUT(path, 'Sony SPI3D'), LUT3D)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
+class TestWriteLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.write_LUT` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT(self):
+        """
+        Tests :func:`colour.io.luts.write_LUT` definition.
+        """
+
+        LUT = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My LUT')
+        for extension in ('.csp', '.cube', '.spi1d'):
+            path = os.path.join(self._temporary_directory,
+                                'My_LUT{0}'.format(extension))
+            self.assertTrue(write_LUT(LUT, path))
+            self.assertTrue(os.path.exists(path))
+
+        LUT = LUT3D(LUT3D.linear_table(5) ** (1 / 2.2), 'My LUT')
+        path = os.path.join(self._temporary_directory, 'My_LUT.lut')
+        self.assertRaises(AssertionError, write_LUT, LUT, path)
+
+        self.assertTrue(write_LUT(LUT, path, method='Sony SPI3D'))
+        np.testing.assert_almost_equal(
+            read_LUT(path, method='Sony SPI3D').table, LUT.table, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.cinespace_csp` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (LUT1D, LUT3x1D, LUT3D, read_LUT_Cinespace,
+                       read_LUT_IridasCube, write_LUT_Cinespace)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUTCinespace', 'TestWriteLUTCinespace']
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUTCinespace(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_Cinespace(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
+        definition.
+        """
+
+        # The *Cinespace* *.csp* resources hold the same tables than the
+        # *Iridas* *.cube* ones.
+        for name in ('ACES_Proxy_10_to_ACES', 'ColourCorrect'):
+            LUT = read_LUT_Cinespace(
+                os.path.join(LUTS_DIRECTORY, 'cinespace_csp',
+                             '{0}.csp'.format(name)))
+            LUT_c = read_LUT_IridasCube(
+                os.path.join(LUTS_DIRECTORY, 'iridas_cube',
+                             '{0}.cube'.format(name)))
+
+            self.assertEqual(LUT, LUT_c)
+            self.assertEqual(LUT.name, LUT_c.name)
+            self.assertListEqual(LUT.comments, LUT_c.comments)
+
+        self.assertIsInstance(LUT, LUT3D)
+
+    def test_raise_exception_read_LUT_Cinespace(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
+        definition raised exception.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'Invalid.csp')
+            with open(path, 'w') as csp_file:
+                csp_file.write('CSPLUTV100\n1D\n\n')
+                csp_file.write('3\n0 0.5 1\n0 0.25 1\n' * 3)
+                csp_file.write('\n2\n0 0 0\n1 1 1\n')
+
+            self.assertRaises(ValueError, read_LUT_Cinespace, path)
+
+            with open(path, 'w') as csp_file:
+                csp_file.write('SPILUT 1.0\n3 3\n2 2 2\n')
+
+            self.assertRaises(ValueError, read_LUT_Cinespace, path)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
+class TestWriteLUTCinespace(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.cinespace_csp.write_LUT_Cinespace`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_Cinespace(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.write_LUT_Cinespace`
+        definition.
+        """
+
+        for name in ('ACES_Proxy_10_to_ACES.csp', 'ColourCorrect.csp'):
+            LUT_r = read_LUT_Cinespace(
+                os.path.join(LUTS_DIRECTORY, 'cinespace_csp', name))
+
+            path = os.path.join(self._temporary_directory, name)
+            self.assertTrue(write_LUT_Cinespace(LUT_r, path))
+
+            LUT_t = read_LUT_Cinespace(path)
+            self.assertEqual(LUT_r, LUT_t)
+            self.assertEqual(LUT_r.name, LUT_t.name)
+            self.assertListEqual(LUT_r.comments, LUT_t.comments)
+
+        LUT = LUT1D(
+            LUT1D.linear_table(16) ** 2, 'My LUT', np.array([-0.1, 1.5]))
+        path = os.path.join(self._temporary_directory, 'My_LUT.csp')
+        write_LUT_Cinespace(LUT, path)
+
+        LUT_t = read_LUT_Cinespace(path)
+        self.assertIsInstance(LUT_t, LUT3x1D)
+        np.testing.assert_almost_equal(
+            LUT_t.table, np.transpose(np.tile(LUT.table, (3, 1))), decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.common` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from six import StringIO
+
+from colour.io.luts.common import path_to_title, read_array, write_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestPathToTitle', 'TestReadArray', 'TestWriteArray']
+
+
+class TestPathToTitle(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.path_to_title` definition unit tests
+    methods.
+    """
+
+    def test_path_to_title(self):
+        """
+        Tests :func:`colour.io.luts.common.path_to_title` definition.
+        """
+
+        self.assertEqual(
+            path_to_title(
+                'colour/io/luts/tests/resources/sony_spi3d/ColourCorrect.spi3d'
+            ), 'ColourCorrect')
+
+        self.assertEqual(
+            path_to_title('ACES_Proxy-10.to_ACES.cube'),
+            'ACES Proxy 10 to ACES')
+
+
+class TestReadArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.read_array` definition unit tests
+    methods.
+    """
+
+    def test_read_array(self):
+        """
+        Tests :func:`colour.io.luts.common.read_array` definition.
+        """
+
+        lines = iter([
+            '0 1 2\n', '\n', '# Comment\n', '3 4 5\n', '6 7 8\n', '9 10 11\n',
+            '}\n'
+        ])
+        np.testing.assert_equal(
+            read_array(lines, np.empty((3, 3)), chunk_size=2),
+            np.reshape(np.arange(9), (3, 3)))
+
+        # Only the lines holding the array rows are consumed.
+        self.assertEqual(next(lines), '9 10 11\n')
+
+        np.testing.assert_equal(
+            read_array(iter(['0\n', '1\n', '2\n']), np.empty(3)),
+            np.array([0, 1, 2]))
+
+        # Results do not depend on the chunks size.
+        array = np.random.RandomState(4).random_sample((64, 3))
+        text = ['{0!r} {1!r} {2!r}\n'.format(*row) for row in array]
+        for chunk_size in (1, 7, 64, 128):
+            np.testing.assert_equal(
+                read_array(
+                    iter(text), np.empty((64, 3)), chunk_size=chunk_size),
+                array)
+
+    def test_raise_exception_read_array(self):
+        """
+        Tests :func:`colour.io.luts.common.read_array` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, read_array, iter(['0 1 2\n']),
+                          np.empty((2, 3)))
+
+        self.assertRaises(ValueError, read_array,
+                          iter(['0 1 2\n', '3 4\n']), np.empty((2, 3)))
+
+        self.assertRaises(ValueError, read_array,
+                          iter(['0 1 2\n', 'END\n']), np.empty((2, 3)))
+
+
+class TestWriteArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.write_array` definition unit tests
+    methods.
+    """
+
+    def test_write_array(self):
+        """
+        Tests :func:`colour.io.luts.common.write_array` definition.
+        """
+
+        file_ = StringIO()
+        write_array(file_, np.array([[0, 0.5], [1, 1.5], [2, 2.5]]), 2,
+                    chunk_size=2)
+        self.assertEqual(file_.getvalue(), '0.00 0.50\n1.00 1.50\n2.00 2.50\n')
+
+        file_ = StringIO()
+        write_array(
+            file_, np.array([[0, 0.5], [1, 1.5]]), formats=['%d', '%.1f'])
+        self.assertEqual(file_.getvalue(), '0 0.5\n1 1.5\n')
+
+        file_ = StringIO()
+        write_array(file_, np.array([0, 1]), 1)
+        self.assertEqual(file_.getvalue(), '0.0\n1.0\n')
+
+        # Written arrays are read back at given decimals precision.
+        array = np.random.RandomState(4).random_sample((64, 3))
+        file_ = StringIO()
+        write_array(file_, array, 10)
+        file_.seek(0)
+        np.testing.assert_almost_equal(
+            read_array(file_, np.empty((64, 3))), array, decimal=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
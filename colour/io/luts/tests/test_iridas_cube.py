@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.iridas_cube` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (LUT1D, LUT3x1D, LUT3D, read_LUT_IridasCube,
+                       write_LUT_IridasCube)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUTS_DIRECTORY', 'TestReadLUTIridasCube', 'TestWriteLUTIridasCube'
+]
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'iridas_cube')
+
+
+class TestReadLUTIridasCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
+        definition.
+        """
+
+        LUT = read_LUT_IridasCube(
+            os.path.join(LUTS_DIRECTORY, 'ACES_Proxy_10_to_ACES.cube'))
+        self.assertIsInstance(LUT, LUT3x1D)
+        self.assertEqual(LUT.name, 'ACES Proxy 10 to ACES')
+        self.assertListEqual(LUT.comments, [])
+        self.assertTupleEqual(LUT.table.shape, (32, 3))
+        np.testing.assert_equal(LUT.domain,
+                                np.array([[0, 0, 0], [1, 1, 1]]))
+        np.testing.assert_almost_equal(
+            LUT.table[[0, 15, 31]],
+            np.array([
+                [0.000488, 0.000488, 0.000488],
+                [0.466516, 0.466516, 0.466516],
+                [704.277411, 704.277411, 704.277411],
+            ]),
+            decimal=7)
+
+        LUT = read_LUT_IridasCube(
+            os.path.join(LUTS_DIRECTORY, 'ColourCorrect.cube'))
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.name, 'Generated by Foundry::LUT')
+        self.assertListEqual(LUT.comments, ['Colour Correct'])
+        self.assertTupleEqual(LUT.table.shape, (4, 4, 4, 3))
+        np.testing.assert_equal(
+            LUT.domain, np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]))
+
+        # The red component varies fastest in the file.
+        np.testing.assert_almost_equal(
+            LUT.table[1, 2, 3],
+            np.array([0.020000, 1.645117, 5.456549]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.table[3, 0, 1],
+            np.array([1.514989, 0.020000, 1.901016]),
+            decimal=7)
+
+    def test_raise_exception_read_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
+        definition raised exception.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'Truncated.cube')
+            with open(path, 'w') as cube_file:
+                cube_file.write('LUT_3D_SIZE 2\n0 0 0\n1 0 0\n')
+
+            self.assertRaises(ValueError, read_LUT_IridasCube, path)
+
+            with open(path, 'w') as cube_file:
+                cube_file.write('LUT_1D_SIZE 2\nLUT_3D_SIZE 2\n')
+
+            self.assertRaises(AssertionError, read_LUT_IridasCube, path)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
+class TestWriteLUTIridasCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.iridas_cube.write_LUT_IridasCube` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.write_LUT_IridasCube`
+        definition.
+        """
+
+        for name in ('ACES_Proxy_10_to_ACES.cube', 'ColourCorrect.cube'):
+            LUT_r = read_LUT_IridasCube(os.path.join(LUTS_DIRECTORY, name))
+
+            path = os.path.join(self._temporary_directory, name)
+            self.assertTrue(write_LUT_IridasCube(LUT_r, path))
+
+            LUT_t = read_LUT_IridasCube(path)
+            self.assertEqual(LUT_r, LUT_t)
+            self.assertEqual(LUT_r.name, LUT_t.name)
+            self.assertListEqual(LUT_r.comments, LUT_t.comments)
+
+        LUT = LUT1D(
+            LUT1D.linear_table(16) ** 2, 'My LUT', np.array([-0.1, 1.5]))
+        path = os.path.join(self._temporary_directory, 'My_LUT.cube')
+        write_LUT_IridasCube(LUT, path)
+
+        LUT_t = read_LUT_IridasCube(path)
+        self.assertIsInstance(LUT_t, LUT3x1D)
+        np.testing.assert_almost_equal(
+            LUT_t.table, np.transpose(np.tile(LUT.table, (3, 1))), decimal=7)
+        np.testing.assert_almost_equal(
+            LUT_t.domain,
+            np.array([[-0.1, -0.1, -0.1], [1.5, 1.5, 1.5]]),
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
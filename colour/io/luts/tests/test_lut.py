@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.lut` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from colour.io.luts import AbstractLUT, LUT1D, LUT3x1D, LUT3D, bake_LUT
+from colour.models import (ACES_CG_COLOURSPACE, ColourspaceConversion,
+                           eotf_ST2084, oetf_BT709, sRGB_COLOURSPACE)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'DOMAIN_A', 'TestAbstractLUT', 'TestLUT1D', 'TestLUT3x1D', 'TestLUT3D',
+    'TestBakeLUT'
+]
+
+DOMAIN_A = np.array([[-0.1, -0.2, -0.4], [1.5, 1.0, 2.0]])
+
+
+class TestAbstractLUT(unittest.TestCase):
+    """
+    Defines :class:`colour.io.luts.lut.AbstractLUT` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'name', 'dimensions', 'domain',
+                               'size', 'comments')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(AbstractLUT))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__str__', '__repr__', '__eq__', '__ne__',
+                            'apply', 'maximum_error', 'copy', 'linear_table')
+
+        for method in required_methods:
+            self.assertIn(method, dir(AbstractLUT))
+
+    def test__eq__(self):
+        """
+        Tests :meth:`colour.io.luts.lut.AbstractLUT.__eq__` and
+        :meth:`colour.io.luts.lut.AbstractLUT.__ne__` methods.
+        """
+
+        self.assertEqual(LUT3D(), LUT3D())
+        self.assertEqual(LUT3D(), LUT3D().copy())
+        self.assertNotEqual(LUT3D(), LUT3D(size=9))
+        self.assertNotEqual(LUT3x1D(), LUT3x1D(domain=DOMAIN_A))
+        self.assertNotEqual(LUT1D(), LUT3x1D())
+
+
+class TestLUT1D(unittest.TestCase):
+    """
+    Defines :class:`colour.io.luts.lut.LUT1D` class unit tests methods.
+    """
+
+    def test__init__(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT1D.__init__` method.
+        """
+
+        LUT = LUT1D()
+        self.assertEqual(LUT.name, 'Unity 10')
+        self.assertEqual(LUT.dimensions, 1)
+        self.assertEqual(LUT.size, 10)
+        np.testing.assert_equal(LUT.table, np.linspace(0, 1, 10))
+
+        LUT = LUT1D(np.linspace(0, 1, 16) ** 2, 'My LUT')
+        self.assertEqual(LUT.name, 'My LUT')
+        self.assertEqual(LUT.size, 16)
+        self.assertListEqual(LUT.comments, [])
+
+        LUT = LUT1D(comments=('A first comment.', 'A second comment.'))
+        self.assertListEqual(LUT.comments,
+                             ['A first comment.', 'A second comment.'])
+        self.assertIn('Comment 02 : A second comment.', str(LUT))
+
+        self.assertRaises(AssertionError, LUT1D, np.ones((4, 3)))
+        self.assertRaises(AssertionError, LUT1D, domain=np.array([1, 0]))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT1D.apply` method.
+        """
+
+        LUT = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2))
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0.18, 0.50, -0.10, 1.20])),
+            np.array([0.45686065, 0.72933741, 0.00000000, 1.00000000]),
+            decimal=7)
+
+        # Tables nodes values are returned as is.
+        np.testing.assert_almost_equal(
+            LUT.apply(LUT1D.linear_table(16)), LUT.table, decimal=7)
+
+        # Results do not depend on the chunks size.
+        RGB = np.random.RandomState(4).random_sample((4, 5, 3))
+        np.testing.assert_equal(LUT.apply(RGB), LUT.apply(RGB, chunk_size=7))
+
+        # Linear interpolation matches *Numpy* implementation.
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB),
+            np.interp(RGB, LUT1D.linear_table(16), LUT.table),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT1D.apply` method nan support.
+        """
+
+        RGB = LUT1D().apply(
+            np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]))
+        self.assertTrue(np.isnan(RGB[-1]))
+        np.testing.assert_equal(RGB[:-1], np.array([0, 0, 1, 0, 1]))
+
+    def test_linear_table(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT1D.linear_table` method.
+        """
+
+        np.testing.assert_almost_equal(
+            LUT1D.linear_table(5, np.array([-0.1, 1.5])),
+            np.array([-0.1, 0.3, 0.7, 1.1, 1.5]),
+            decimal=7)
+
+
+class TestLUT3x1D(unittest.TestCase):
+    """
+    Defines :class:`colour.io.luts.lut.LUT3x1D` class unit tests methods.
+    """
+
+    def test__init__(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT3x1D.__init__` method.
+        """
+
+        LUT = LUT3x1D(size=16)
+        self.assertEqual(LUT.name, 'Unity 16')
+        self.assertEqual(LUT.dimensions, 2)
+        self.assertTupleEqual(LUT.table.shape, (16, 3))
+
+        self.assertRaises(AssertionError, LUT3x1D, np.ones(16))
+        self.assertRaises(AssertionError, LUT3x1D, domain=np.array([0, 1]))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT3x1D.apply` method.
+        """
+
+        LUT = LUT3x1D(LUT3x1D.linear_table(16, DOMAIN_A) ** 2, domain=DOMAIN_A)
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0.18, 0.50, 1.70])),
+            np.array([0.03506667, 0.25120000, 2.89280000]),
+            decimal=7)
+
+        RGB = np.random.RandomState(4).random_sample((4, 5, 3))
+        np.testing.assert_equal(LUT.apply(RGB), LUT.apply(RGB, chunk_size=7))
+
+        # Each channel is processed by its own 1D *LUT*.
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                LUT.apply(RGB)[..., i],
+                LUT1D(LUT.table[..., i], domain=DOMAIN_A[..., i]).apply(
+                    RGB[..., i]),
+                decimal=7)
+
+    def test_linear_table(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT3x1D.linear_table` method.
+        """
+
+        np.testing.assert_almost_equal(
+            LUT3x1D.linear_table(3, DOMAIN_A),
+            np.array([
+                [-0.1, -0.2, -0.4],
+                [0.7, 0.4, 0.8],
+                [1.5, 1.0, 2.0],
+            ]),
+            decimal=7)
+
+
+class TestLUT3D(unittest.TestCase):
+    """
+    Defines :class:`colour.io.luts.lut.LUT3D` class unit tests methods.
+    """
+
+    def test__init__(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT3D.__init__` method.
+        """
+
+        LUT = LUT3D()
+        self.assertEqual(LUT.name, 'Unity 33')
+        self.assertEqual(LUT.dimensions, 3)
+        self.assertTupleEqual(LUT.table.shape, (33, 33, 33, 3))
+
+        self.assertRaises(AssertionError, LUT3D, np.ones((4, 4, 5, 3)))
+        self.assertRaises(AssertionError, LUT3D, np.ones((4, 3)))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT3D.apply` method.
+        """
+
+        LUT = LUT3D(LUT3D.linear_table(9, DOMAIN_A) ** 2, domain=DOMAIN_A)
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0.18, 0.50, 1.70])),
+            np.array([0.04200000, 0.25500000, 2.89000000]),
+            decimal=7)
+
+        RGB = np.random.RandomState(4).random_sample((4, 5, 3))
+        for method, interpolator in (('Trilinear',
+                                      table_interpolation_trilinear),
+                                     ('Tetrahedral',
+                                      table_interpolation_tetrahedral)):
+            np.testing.assert_equal(
+                LUT.apply(RGB, method=method),
+                LUT.apply(RGB, 7, method))
+
+            np.testing.assert_almost_equal(
+                LUT.apply(RGB, method=method),
+                interpolator((RGB - DOMAIN_A[0]) / (DOMAIN_A[1] - DOMAIN_A[0]),
+                             LUT.table),
+                decimal=7)
+
+        # Unity *LUTs* are transparent within their domain.
+        np.testing.assert_almost_equal(
+            LUT3D(size=5).apply(RGB, method='Tetrahedral'), RGB, decimal=7)
+
+    def test_linear_table(self):
+        """
+        Tests :meth:`colour.io.luts.lut.LUT3D.linear_table` method.
+        """
+
+        table = LUT3D.linear_table(3, DOMAIN_A)
+
+        self.assertTupleEqual(table.shape, (3, 3, 3, 3))
+        np.testing.assert_almost_equal(
+            table[1, 0, 2], np.array([0.7, -0.2, 2.0]), decimal=7)
+
+
+class TestBakeLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.lut.bake_LUT` definition unit tests methods.
+    """
+
+    def test_bake_LUT(self):
+        """
+        Tests :func:`colour.io.luts.lut.bake_LUT` definition.
+        """
+
+        LUT = bake_LUT(oetf_BT709, LUT1D, 1024)
+        self.assertIsInstance(LUT, LUT1D)
+        self.assertEqual(LUT.name, 'oetf_BT709')
+        np.testing.assert_almost_equal(
+            LUT.table, oetf_BT709(np.linspace(0, 1, 1024)), decimal=7)
+
+        LUT = bake_LUT(eotf_ST2084, LUT3x1D, 64, DOMAIN_A / 2, 'My LUT')
+        self.assertEqual(LUT.name, 'My LUT')
+        np.testing.assert_equal(LUT.domain, DOMAIN_A / 2)
+
+        conversion = ColourspaceConversion(
+            sRGB_COLOURSPACE, ACES_CG_COLOURSPACE, apply_decoding_cctf=True)
+        LUT = bake_LUT(conversion)
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.size, 33)
+        np.testing.assert_almost_equal(
+            LUT.table[16, 8, 4],
+            conversion(LUT3D.linear_table(33)[16, 8, 4]),
+            decimal=7)
+
+    def test_maximum_error(self):
+        """
+        Tests :meth:`colour.io.luts.lut.AbstractLUT.maximum_error` method.
+        """
+
+        LUT = bake_LUT(oetf_BT709, LUT1D, 1024)
+        RGB = np.linspace(0, 1, 100000)
+        error = LUT.maximum_error(oetf_BT709)
+
+        self.assertAlmostEqual(
+            error, np.max(np.abs(LUT.apply(RGB) - oetf_BT709(RGB))), places=4)
+
+        # The error of smooth functions decreases as the *LUT* size increases.
+        self.assertLess(
+            bake_LUT(eotf_ST2084, LUT1D, 4096).maximum_error(eotf_ST2084),
+            bake_LUT(eotf_ST2084, LUT1D, 1024).maximum_error(eotf_ST2084))
+
+        # Linear functions are baked without error.
+        self.assertAlmostEqual(
+            bake_LUT(lambda x: 2 * x + 1, LUT3D, 5).maximum_error(
+                lambda x: 2 * x + 1, 17),
+            0,
+            places=7)
+
+        # The interpolation method is forwarded to the *LUT* application, the
+        # channels of the function must be dependent for the interpolation
+        # methods to differ.
+        def function(RGB):
+            return RGB * np.mean(RGB, axis=-1)[..., np.newaxis]
+
+        LUT = bake_LUT(function, LUT3D, 9)
+        RGB = LUT3D.linear_table(17)
+        for method in ('Trilinear', 'Tetrahedral'):
+            self.assertAlmostEqual(
+                LUT.maximum_error(function, method=method),
+                np.max(np.abs(LUT.apply(RGB, method=method) - function(RGB))),
+                places=7)
+
+        self.assertNotAlmostEqual(
+            LUT.maximum_error(function, method='Trilinear'),
+            LUT.maximum_error(function, method='Tetrahedral'),
+            places=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
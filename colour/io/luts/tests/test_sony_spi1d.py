@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.sony_spi1d` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (LUT1D, LUT3x1D, read_LUT_SonySPI1D,
+                       write_LUT_SonySPI1D)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUTSonySPI1D', 'TestWriteLUTSonySPI1D']
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'sony_spi1d')
+
+
+class TestReadLUTSonySPI1D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi1d.read_LUT_SonySPI1D` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.read_LUT_SonySPI1D` definition.
+        """
+
+        LUT = read_LUT_SonySPI1D(
+            os.path.join(LUTS_DIRECTORY, 'oetf_reverse_sRGB_1D.spi1d'))
+        self.assertIsInstance(LUT, LUT1D)
+        self.assertEqual(LUT.name, 'oetf reverse sRGB 1D')
+        self.assertListEqual(LUT.comments, [
+            'Generated by "Colour 0.3.11".',
+            '"colour.models.oetf_reverse_sRGB".'
+        ])
+        np.testing.assert_equal(LUT.domain, np.array([-0.1, 1.5]))
+        np.testing.assert_almost_equal(
+            LUT.table[[0, 7, 15]],
+            np.array([-0.010023, 0.375758, 2.537155]),
+            decimal=7)
+
+        LUT = read_LUT_SonySPI1D(
+            os.path.join(LUTS_DIRECTORY, 'oetf_reverse_sRGB_3D.spi1d'))
+        self.assertIsInstance(LUT, LUT3x1D)
+        np.testing.assert_equal(
+            LUT.domain, np.array([[-0.1, -0.1, -0.1], [1.5, 1.5, 1.5]]))
+        np.testing.assert_almost_equal(
+            LUT.table[7], np.array([0.375758, 0.338182, 0.300606]), decimal=7)
+
+    def test_raise_exception_read_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.read_LUT_SonySPI1D` definition
+        raised exception.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'Invalid.spi1d')
+            with open(path, 'w') as spi1d_file:
+                spi1d_file.write('Version 1\nFrom 0 1\nLength 2\n'
+                                 'Components 2\n{\n0 0\n1 1\n}\n')
+
+            self.assertRaises(ValueError, read_LUT_SonySPI1D, path)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
+class TestWriteLUTSonySPI1D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi1d.write_LUT_SonySPI1D` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.write_LUT_SonySPI1D`
+        definition.
+        """
+
+        for name in ('oetf_reverse_sRGB_1D.spi1d',
+                     'oetf_reverse_sRGB_3D.spi1d'):
+            LUT_r = read_LUT_SonySPI1D(os.path.join(LUTS_DIRECTORY, name))
+
+            path = os.path.join(self._temporary_directory, name)
+            self.assertTrue(write_LUT_SonySPI1D(LUT_r, path))
+
+            LUT_t = read_LUT_SonySPI1D(path)
+            self.assertEqual(LUT_r, LUT_t)
+            self.assertEqual(LUT_r.name, LUT_t.name)
+            self.assertListEqual(LUT_r.comments, LUT_t.comments)
+
+    def test_raise_exception_write_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.write_LUT_SonySPI1D`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'My_LUT.spi1d')
+        self.assertRaises(
+            AssertionError, write_LUT_SonySPI1D,
+            LUT3x1D(domain=np.array([[0, 0, 0], [1, 2, 1]])), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.sony_spi3d` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import LUT3D, read_LUT_SonySPI3D, write_LUT_SonySPI3D
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUTSonySPI3D', 'TestWriteLUTSonySPI3D']
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'sony_spi3d')
+
+
+class TestReadLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition.
+        """
+
+        LUT = read_LUT_SonySPI3D(
+            os.path.join(LUTS_DIRECTORY, 'ColourCorrect.spi3d'))
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.name, 'ColourCorrect')
+        self.assertListEqual(
+            LUT.comments, ['Adapted from a LUT generated by Foundry::LUT.'])
+        self.assertTupleEqual(LUT.table.shape, (4, 4, 4, 3))
+        np.testing.assert_equal(LUT.domain,
+                                np.array([[0, 0, 0], [1, 1, 1]]))
+        np.testing.assert_almost_equal(
+            LUT.table[1, 2, 3],
+            np.array([0.273021, 0.677114, 1.027405]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.table[3, 0, 1],
+            np.array([1.112910, 0.020000, 0.433009]),
+            decimal=7)
+
+    def test_raise_exception_read_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition
+        raised exception.
+        """
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temporary_directory, 'Invalid.spi3d')
+            with open(path, 'w') as spi3d_file:
+                spi3d_file.write('SPILUT 1.0\n3 3\n2 2 2\n0 0 0 0 0 0\n')
+
+            self.assertRaises(ValueError, read_LUT_SonySPI3D, path)
+
+            with open(path, 'w') as spi3d_file:
+                spi3d_file.write('CSPLUTV100\n3D\n2 2 2\n0 0 0 0 0 0\n')
+
+            self.assertRaises(ValueError, read_LUT_SonySPI3D, path)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+
+class TestWriteLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi3d.write_LUT_SonySPI3D` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.write_LUT_SonySPI3D`
+        definition.
+        """
+
+        LUT_r = read_LUT_SonySPI3D(
+            os.path.join(LUTS_DIRECTORY, 'ColourCorrect.spi3d'))
+
+        path = os.path.join(self._temporary_directory, 'ColourCorrect.spi3d')
+        self.assertTrue(write_LUT_SonySPI3D(LUT_r, path))
+
+        LUT_t = read_LUT_SonySPI3D(path)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertEqual(LUT_r.name, LUT_t.name)
+        self.assertListEqual(LUT_r.comments, LUT_t.comments)
+
+    def test_raise_exception_write_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.write_LUT_SonySPI3D`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'My_LUT.spi3d')
+        self.assertRaises(
+            AssertionError, write_LUT_SonySPI3D,
+            LUT3D(size=2, domain=np.array([[0, 0, 0], [1, 2, 1]])), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
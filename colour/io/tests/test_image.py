@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.image` module.
+
+Notes
+-----
+-   *OpenImageIO* is replaced with a mocked module storing the images in
+    memory so that the reading and writing by blocks of scanlines logic is
+    tested whether *OpenImageIO* is installed or not.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from colour.io import (read_image_blocks, read_image, write_image_blocks,
+                       write_image)
+from colour.io.image import BIT_DEPTH_MAPPING, _convert_block
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'mock_OpenImageIO', 'OpenImageIOTestCase', 'TestConvertBlock',
+    'TestReadImageBlocks', 'TestReadImage', 'TestWriteImageBlocks',
+    'TestWriteImage'
+]
+
+
+def mock_OpenImageIO(images):
+    """
+    Returns a mocked *OpenImageIO* module reading the images from and writing
+    them to given mapping.
+
+    Parameters
+    ----------
+    images : dict
+        Mapping of the images paths to the images specifications and data,
+        the written images data are stored as bytes.
+
+    Returns
+    -------
+    module
+        Mocked *OpenImageIO* module, the scanlines reading and writing calls
+        are recorded in its *calls* attribute.
+    """
+
+    module = types.ModuleType('OpenImageIO')
+    module.calls = []
+    module.UINT8, module.UINT16, module.HALF, module.FLOAT = range(4)
+    module.ImageOutputOpenMode = types.ModuleType('ImageOutputOpenMode')
+    module.ImageOutputOpenMode.Create = 0
+
+    class ImageSpec(object):
+        def __init__(self, width, height, nchannels, format, y=0,
+                     tile_height=0):
+            self.width = width
+            self.height = height
+            self.nchannels = nchannels
+            self.format = format
+            self.y = y
+            self.tile_height = tile_height
+
+    class ImageInput(object):
+        def __init__(self, path):
+            self._specification, self._image = images[path]
+
+        @staticmethod
+        def open(path):
+            return ImageInput(path)
+
+        def spec(self):
+            return self._specification
+
+        def read_scanlines(self, ybegin, yend, z, chbegin, chend, format):
+            module.calls.append(('read_scanlines', ybegin, yend))
+
+            y = self._specification.y
+            return self._image[ybegin - y:yend - y, :, chbegin:chend]
+
+        def close(self):
+            pass
+
+    class ImageOutput(object):
+        def __init__(self, path):
+            self._path = path
+            self._data = []
+
+        @staticmethod
+        def create(path):
+            return ImageOutput(path)
+
+        def open(self, path, specification, mode):
+            self._specification = specification
+
+        def write_scanlines(self, ybegin, yend, z, format, data):
+            module.calls.append(('write_scanlines', ybegin, yend))
+
+            self._data.append(data)
+
+        def close(self):
+            images[self._path] = (self._specification, b''.join(self._data))
+
+    module.ImageSpec = ImageSpec
+    module.ImageInput = ImageInput
+    module.ImageOutput = ImageOutput
+
+    return module
+
+
+class OpenImageIOTestCase(unittest.TestCase):
+    """
+    Defines a unit test case with a mocked *OpenImageIO* module.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._images = {}
+        self._OpenImageIO = mock_OpenImageIO(self._images)
+
+        self._patcher = mock.patch.dict('sys.modules',
+                                        {'OpenImageIO': self._OpenImageIO})
+        self._patcher.start()
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._image = np.reshape(
+            np.arange(10 * 4 * 3, dtype=np.float32) / 120, (10, 4, 3))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        self._patcher.stop()
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _add_image(self, path, image, y=0, tile_height=0):
+        """
+        Adds given image to the mocked *OpenImageIO* module images.
+        """
+
+        height, width, channels = image.shape
+        self._images[path] = (self._OpenImageIO.ImageSpec(
+            width, height, channels, None, y, tile_height), image)
+
+    def _written_image(self, path, shape, dtype):
+        """
+        Returns the image written at given path by the mocked *OpenImageIO*
+        module.
+        """
+
+        _specification, data = self._images[path]
+
+        return np.reshape(np.frombuffer(data, dtype=dtype), shape)
+
+
+class TestConvertBlock(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image._convert_block` definition unit tests
+    methods.
+    """
+
+    def test__convert_block(self):
+        """
+        Tests :func:`colour.io.image._convert_block` definition.
+        """
+
+        block = np.array([[[-0.5, 0.25, 1.5]]])
+        block_c = np.copy(block)
+
+        converted = _convert_block(block, BIT_DEPTH_MAPPING['uint8'])
+        self.assertEqual(converted.dtype, np.uint8)
+        np.testing.assert_equal(converted, np.array([[[0, 63, 255]]]))
+        np.testing.assert_equal(block, block_c)
+
+        block = np.asfortranarray(np.array([[0.5, 1.5]]))
+        converted = _convert_block(block, BIT_DEPTH_MAPPING['float16'])
+        self.assertEqual(converted.dtype, np.float16)
+        self.assertTrue(converted.flags.c_contiguous)
+        np.testing.assert_equal(converted, block)
+
+
+class TestReadImageBlocks(OpenImageIOTestCase):
+    """
+    Defines :func:`colour.io.image.read_image_blocks` definition unit tests
+    methods.
+    """
+
+    def test_read_image_blocks(self):
+        """
+        Tests :func:`colour.io.image.read_image_blocks` definition.
+        """
+
+        self._add_image('image.exr', self._image)
+
+        blocks = list(read_image_blocks('image.exr', chunk_size=3))
+        self.assertListEqual([y for y, _block in blocks], [0, 3, 6, 9])
+        self.assertListEqual([block.shape for _y, block in blocks],
+                             [(3, 4, 3), (3, 4, 3), (3, 4, 3), (1, 4, 3)])
+        np.testing.assert_equal(
+            np.concatenate([block for _y, block in blocks]), self._image)
+
+    def test_read_image_blocks_tiles(self):
+        """
+        Tests :func:`colour.io.image.read_image_blocks` definition with tiled
+        images.
+        """
+
+        self._add_image('image.exr', self._image, y=5, tile_height=4)
+
+        blocks = list(read_image_blocks('image.exr', chunk_size=3))
+        self.assertListEqual([y for y, _block in blocks], [0, 4, 8])
+        self.assertListEqual(self._OpenImageIO.calls,
+                             [('read_scanlines', 5, 9),
+                              ('read_scanlines', 9, 13),
+                              ('read_scanlines', 13, 15)])
+        np.testing.assert_equal(
+            np.concatenate([block for _y, block in blocks]), self._image)
+
+
+class TestReadImage(OpenImageIOTestCase):
+    """
+    Defines :func:`colour.io.image.read_image` definition unit tests methods.
+    """
+
+    def test_read_image(self):
+        """
+        Tests :func:`colour.io.image.read_image` definition.
+        """
+
+        self._add_image('image.exr', self._image)
+
+        np.testing.assert_equal(
+            read_image('image.exr', chunk_size=3), self._image)
+
+        self._add_image('image.exr', self._image[..., 0:1])
+        self.assertTupleEqual(read_image('image.exr').shape, (10, 4))
+
+    def test_read_image_out(self):
+        """
+        Tests :func:`colour.io.image.read_image` definition ``out`` argument.
+        """
+
+        self._add_image('image.exr', self._image)
+
+        out = np.zeros(self._image.size, dtype=np.float32)
+        image = read_image('image.exr', out=out, chunk_size=3)
+        np.testing.assert_equal(image, self._image)
+        np.testing.assert_equal(np.reshape(out, (10, 4, 3)), self._image)
+
+        path = os.path.join(self._temporary_directory, 'image.npy')
+        image = read_image('image.exr', out=path, chunk_size=3)
+        self.assertIsInstance(image, np.memmap)
+        del image
+        np.testing.assert_equal(np.load(path), self._image)
+
+        self.assertRaises(
+            AssertionError,
+            read_image,
+            'image.exr',
+            out=np.zeros((10, 4, 2), dtype=np.float32))
+
+        self.assertRaises(
+            AssertionError,
+            read_image,
+            'image.exr',
+            out=np.zeros((3, 4, 10), dtype=np.float32).transpose())
+
+
+class TestWriteImageBlocks(OpenImageIOTestCase):
+    """
+    Defines :func:`colour.io.image.write_image_blocks` definition unit tests
+    methods.
+    """
+
+    def test_write_image_blocks(self):
+        """
+        Tests :func:`colour.io.image.write_image_blocks` definition.
+        """
+
+        blocks = (self._image[y:y + 4] for y in range(0, 10, 4))
+        self.assertTrue(
+            write_image_blocks(blocks, 'image.exr', self._image.shape))
+        self.assertListEqual(self._OpenImageIO.calls,
+                             [('write_scanlines', 0, 4),
+                              ('write_scanlines', 4, 8),
+                              ('write_scanlines', 8, 10)])
+        np.testing.assert_equal(
+            self._written_image('image.exr', self._image.shape, np.float32),
+            self._image)
+
+    def test_raise_exception_write_image_blocks(self):
+        """
+        Tests :func:`colour.io.image.write_image_blocks` definition raised
+        exception.
+        """
+
+        # Block scanlines of incorrect size.
+        blocks = (self._image[y:y + 4, 0:2] for y in range(0, 10, 4))
+        self.assertRaises(AssertionError, write_image_blocks, blocks,
+                          'image.exr', self._image.shape)
+
+        # More scanlines than the image height.
+        blocks = (self._image[y:y + 4] for y in range(0, 10, 4))
+        self.assertRaises(AssertionError, write_image_blocks, blocks,
+                          'image.exr', (8, 4, 3))
+
+        # Fewer scanlines than the image height.
+        blocks = (self._image[y:y + 4] for y in range(0, 8, 4))
+        self.assertRaises(AssertionError, write_image_blocks, blocks,
+                          'image.exr', self._image.shape)
+
+
+class TestWriteImage(OpenImageIOTestCase):
+    """
+    Defines :func:`colour.io.image.write_image` definition unit tests methods.
+    """
+
+    def test_write_image(self):
+        """
+        Tests :func:`colour.io.image.write_image` definition.
+        """
+
+        self.assertTrue(write_image(self._image, 'image.exr', chunk_size=3))
+        np.testing.assert_equal(
+            self._written_image('image.exr', self._image.shape, np.float32),
+            self._image)
+
+        image = np.copy(self._image)
+        self.assertTrue(write_image(image, 'image.png', 'uint8', 3))
+        np.testing.assert_equal(image, self._image)
+        np.testing.assert_equal(
+            self._written_image('image.png', self._image.shape, np.uint8),
+            (self._image.astype(np.float64) * 255).astype(np.uint8))
+
+        image = self._image[..., 0]
+        self.assertTrue(write_image(image, 'image.exr'))
+        self.assertEqual(self._images['image.exr'][0].nchannels, 1)
+        np.testing.assert_equal(
+            self._written_image('image.exr', image.shape, np.float32), image)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ dataset from :mod:`colour.models.dataset.aces_rgb`, etc... and the following
 -   :func:`colour.RGB_to_XYZ`
 -   :func:`colour.RGB_to_RGB_matrix`
 -   :func:`colour.RGB_to_RGB`
+-   :class:`colour.ColourspaceConversion`
 
 See Also
 --------
@@ -33,10 +34,12 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.models import (xy_to_XYZ, xy_to_xyY, xyY_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models import xy_to_xyY, xyY_to_XYZ
 from colour.models.rgb import normalised_primary_matrix
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
-from colour.utilities import dot_matrix, dot_vector, is_string
+from colour.utilities import (LRUCache, dot_matrix, dot_vector, is_string,
+                              ndarray_digest)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -46,10 +49,20 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'RGB_to_RGB_matrix',
-    'RGB_to_RGB'
+    'COLOURSPACE_CONVERSION_CHUNK_SIZE', 'RGB_Colourspace', 'XYZ_to_RGB',
+    'RGB_to_XYZ', 'RGB_to_RGB_matrix', 'RGB_to_RGB', 'ColourspaceConversion'
 ]
 
+COLOURSPACE_CONVERSION_CHUNK_SIZE = 65536
+"""
+Default colour values count of the chunks the colourspace conversions are
+applied by.
+
+COLOURSPACE_CONVERSION_CHUNK_SIZE : integer
+"""
+
+_CONVERSION_MATRICES_CACHE = LRUCache(maxsize=64)
+
 
 class RGB_Colourspace(object):
     """
@@ -816,6 +829,14 @@ def XYZ_to_RGB(XYZ,
     array([ 0.0110015...,  0.1273504...,  0.1163271...])
     """
 
+    if _is_single_conversion(illuminant_XYZ, illuminant_RGB,
+                             XYZ_to_RGB_matrix):
+        M = _conversion_matrix(illuminant_XYZ, illuminant_RGB,
+                               np.identity(3), XYZ_to_RGB_matrix,
+                               chromatic_adaptation_transform)
+
+        return _apply_conversion(XYZ, M, encoding_cctf=encoding_cctf)
+
     M = chromatic_adaptation_matrix_VonKries(
         xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
         xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
@@ -891,6 +912,14 @@ def RGB_to_XYZ(RGB,
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
+    if _is_single_conversion(illuminant_RGB, illuminant_XYZ,
+                             RGB_to_XYZ_matrix):
+        M = _conversion_matrix(illuminant_RGB, illuminant_XYZ,
+                               RGB_to_XYZ_matrix, np.identity(3),
+                               chromatic_adaptation_transform)
+
+        return _apply_conversion(RGB, M, decoding_cctf=decoding_cctf)
+
     if decoding_cctf is not None:
         RGB = decoding_cctf(RGB)
 
@@ -941,15 +970,12 @@ def RGB_to_RGB_matrix(input_colourspace,
            [ 0.0163599...,  0.1066124...,  0.8772485...]])
     """
 
-    cat = chromatic_adaptation_matrix_VonKries(
-        xy_to_XYZ(input_colourspace.whitepoint),
-        xy_to_XYZ(output_colourspace.whitepoint),
-        chromatic_adaptation_transform)
-
-    M = dot_matrix(cat, input_colourspace.RGB_to_XYZ_matrix)
-    M = dot_matrix(output_colourspace.XYZ_to_RGB_matrix, M)
-
-    return M
+    return np.copy(
+        _conversion_matrix(
+            input_colourspace.whitepoint, output_colourspace.whitepoint,
+            input_colourspace.RGB_to_XYZ_matrix,
+            output_colourspace.XYZ_to_RGB_matrix,
+            chromatic_adaptation_transform))
 
 
 def RGB_to_RGB(RGB,
@@ -1002,15 +1028,423 @@ def RGB_to_RGB(RGB,
     array([ 0.0643561...,  0.1157331...,  0.1158069...])
     """
 
-    if apply_decoding_cctf:
-        RGB = input_colourspace.decoding_cctf(RGB)
+    conversion = ColourspaceConversion(
+        input_colourspace, output_colourspace, chromatic_adaptation_transform,
+        apply_decoding_cctf, apply_encoding_cctf)
 
-    M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
-                          chromatic_adaptation_transform)
+    return conversion(RGB)
 
-    RGB = dot_vector(M, RGB)
 
-    if apply_encoding_cctf:
-        RGB = output_colourspace.encoding_cctf(RGB)
+class ColourspaceConversion(object):
+    """
+    Defines a conversion from given input colourspace to output colourspace
+    using given *chromatic adaptation* method.
 
-    return RGB
+    The *chromatic adaptation* matrix and the colourspaces normalised primary
+    matrices are folded into a single conversion matrix at initialisation,
+    the colour values are then decoded, converted and encoded by chunks in a
+    single pass.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace or array_like
+        *RGB* input colourspace or *CIE XYZ* tristimulus values
+        *illuminant* *xy* chromaticity coordinates or *CIE xyY* colourspace
+        array.
+    output_colourspace : RGB_Colourspace or array_like
+        *RGB* output colourspace or *CIE XYZ* tristimulus values
+        *illuminant* *xy* chromaticity coordinates or *CIE xyY* colourspace
+        array.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* transform.
+    apply_decoding_cctf : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function, ignored if the input colourspace
+        is *CIE XYZ*.
+    apply_encoding_cctf : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function, ignored if the output colourspace
+        is *CIE XYZ*.
+
+    Attributes
+    ----------
+    input_colourspace
+    output_colourspace
+    chromatic_adaptation_transform
+    matrix
+    decoding_cctf
+    encoding_cctf
+
+    Methods
+    -------
+    __repr__
+    __call__
+
+    Notes
+    -----
+    -   The conversion matrices are cached in the
+        :attr:`colour.models.rgb.rgb_colourspace._CONVERSION_MATRICES_CACHE`
+        bounded least recently used cache, keyed by a digest of the
+        colourspaces whitepoints and normalised primary matrices and the
+        *chromatic adaptation* transform, thus instantiating successive
+        conversions between the same colourspaces computes the conversion
+        matrix once.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> conversion = ColourspaceConversion(
+    ...     sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
+    >>> conversion
+    ColourspaceConversion('sRGB' -> 'ProPhoto RGB', 'CAT02')
+    >>> RGB = np.array([0.01103742, 0.12734226, 0.11632971])
+    >>> conversion(RGB)  # doctest: +ELLIPSIS
+    array([ 0.0643561...,  0.1157331...,  0.1158069...])
+    >>> conversion = ColourspaceConversion(
+    ...     np.array([0.34570, 0.35850]), sRGB_COLOURSPACE, 'Bradford')
+    >>> conversion
+    ColourspaceConversion('CIE XYZ' -> 'sRGB', 'Bradford')
+    >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+    >>> conversion(XYZ)  # doctest: +ELLIPSIS
+    array([ 0.0110041...,  0.1273549...,  0.1163290...])
+    """
+
+    def __init__(self,
+                 input_colourspace,
+                 output_colourspace,
+                 chromatic_adaptation_transform='CAT02',
+                 apply_decoding_cctf=False,
+                 apply_encoding_cctf=False):
+        self._input_colourspace = input_colourspace
+        self._output_colourspace = output_colourspace
+        self._chromatic_adaptation_transform = chromatic_adaptation_transform
+
+        if isinstance(input_colourspace, RGB_Colourspace):
+            illuminant_i = input_colourspace.whitepoint
+            M_i = input_colourspace.RGB_to_XYZ_matrix
+            self._decoding_cctf = (input_colourspace.decoding_cctf
+                                   if apply_decoding_cctf else None)
+        else:
+            illuminant_i = input_colourspace
+            M_i = np.identity(3)
+            self._decoding_cctf = None
+
+        if isinstance(output_colourspace, RGB_Colourspace):
+            illuminant_o = output_colourspace.whitepoint
+            M_o = output_colourspace.XYZ_to_RGB_matrix
+            self._encoding_cctf = (output_colourspace.encoding_cctf
+                                   if apply_encoding_cctf else None)
+        else:
+            illuminant_o = output_colourspace
+            M_o = np.identity(3)
+            self._encoding_cctf = None
+
+        self._matrix = _conversion_matrix(illuminant_i, illuminant_o, M_i,
+                                          M_o, chromatic_adaptation_transform)
+
+    @property
+    def input_colourspace(self):
+        """
+        Getter and setter property for the input colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace or ndarray
+            Input colourspace.
+
+        Warning
+        -------
+        :attr:`ColourspaceConversion.input_colourspace` is read only.
+        """
+
+        return self._input_colourspace
+
+    @property
+    def output_colourspace(self):
+        """
+        Getter and setter property for the output colourspace.
+
+        Returns
+        -------
+        RGB_Colourspace or ndarray
+            Output colourspace.
+
+        Warning
+        -------
+        :attr:`ColourspaceConversion.output_colourspace` is read only.
+        """
+
+        return self._output_colourspace
+
+    @property
+    def chromatic_adaptation_transform(self):
+        """
+        Getter and setter property for the *chromatic adaptation* transform.
+
+        Returns
+        -------
+        unicode
+            *Chromatic adaptation* transform.
+
+        Warning
+        -------
+        :attr:`ColourspaceConversion.chromatic_adaptation_transform` is read
+        only.
+        """
+
+        return self._chromatic_adaptation_transform
+
+    @property
+    def matrix(self):
+        """
+        Getter and setter property for the conversion matrix, i.e. the
+        product of the output colourspace inverse normalised primary matrix,
+        the *chromatic adaptation* matrix and the input colourspace
+        normalised primary matrix.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix.
+
+        Warning
+        -------
+        :attr:`ColourspaceConversion.matrix` is read only.
+        """
+
+        return self._matrix
+
+    @property
+    def decoding_cctf(self):
+        """
+        Getter and setter property for the decoding colour component transfer
+        function applied before the conversion matrix.
+
+        Returns
+        -------
+        object or None
+            Decoding colour component transfer function.
+
+        Warning
+        -------
+        :attr:`ColourspaceConversion.decoding_cctf` is read only.
+        """
+
+        return self._decoding_cctf
+
+    @property
+    def encoding_cctf(self):
+        """
+        Getter and setter property for the encoding colour component transfer
+        function applied after the conversion matrix.
+
+        Returns
+        -------
+        object or None
+            Encoding colour component transfer function.
+
+        Warning
+        -------
+        :attr:`ColourspaceConversion.encoding_cctf` is read only.
+        """
+
+        return self._encoding_cctf
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the colourspace
+        conversion.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        def name(colourspace):
+            """
+            Returns given colourspace name.
+            """
+
+            return (colourspace.name if isinstance(
+                colourspace, RGB_Colourspace) else 'CIE XYZ')
+
+        return "{0}('{1}' -> '{2}', '{3}')".format(
+            self.__class__.__name__, name(self._input_colourspace),
+            name(self._output_colourspace),
+            self._chromatic_adaptation_transform)
+
+    def __call__(self, a, out=None,
+                 chunk_size=COLOURSPACE_CONVERSION_CHUNK_SIZE):
+        """
+        Converts given colour values from the input colourspace to the output
+        colourspace.
+
+        Parameters
+        ----------
+        a : array_like
+            Input colourspace colour values.
+        out : ndarray, optional
+            C-contiguous floating point array with the same shape as the
+            input colour values the output colourspace colour values are
+            written to, it can be the input colour values array itself.
+        chunk_size : integer, optional
+            Colour values count of the chunks the conversion is applied by,
+            bounding the temporary arrays memory footprint.
+
+        Returns
+        -------
+        ndarray
+            Output colourspace colour values.
+        """
+
+        return _apply_conversion(a, self._matrix, self._decoding_cctf,
+                                 self._encoding_cctf, out, chunk_size)
+
+
+def _is_single_conversion(illuminant_i, illuminant_o, matrix):
+    """
+    Returns whether given illuminants and matrix define a single conversion,
+    i.e. are not n-dimensional arrays of illuminants and matrices.
+
+    Parameters
+    ----------
+    illuminant_i : array_like
+        Input *illuminant* *xy* chromaticity coordinates or *CIE xyY*
+        colourspace array.
+    illuminant_o : array_like
+        Output *illuminant* *xy* chromaticity coordinates or *CIE xyY*
+        colourspace array.
+    matrix : array_like
+        Normalised primary matrix.
+
+    Returns
+    -------
+    bool
+        Whether given arguments define a single conversion.
+    """
+
+    return (np.ndim(illuminant_i) == 1 and np.ndim(illuminant_o) == 1 and
+            np.ndim(matrix) == 2)
+
+
+def _conversion_matrix(illuminant_i, illuminant_o, RGB_to_XYZ_matrix,
+                       XYZ_to_RGB_matrix, chromatic_adaptation_transform):
+    """
+    Returns the matrix converting from the input colourspace to the output
+    colourspace defined by given illuminants and normalised primary matrices,
+    the matrices are cached in the
+    :attr:`colour.models.rgb.rgb_colourspace._CONVERSION_MATRICES_CACHE`
+    bounded least recently used cache.
+
+    Parameters
+    ----------
+    illuminant_i : array_like
+        Input colourspace *illuminant* *xy* chromaticity coordinates or
+        *CIE xyY* colourspace array.
+    illuminant_o : array_like
+        Output colourspace *illuminant* *xy* chromaticity coordinates or
+        *CIE xyY* colourspace array.
+    RGB_to_XYZ_matrix : array_like
+        Input colourspace *normalised primary matrix*.
+    XYZ_to_RGB_matrix : array_like
+        Output colourspace inverse *normalised primary matrix*.
+    chromatic_adaptation_transform : unicode
+        *Chromatic adaptation* transform.
+
+    Returns
+    -------
+    ndarray
+        Read only conversion matrix.
+    """
+
+    illuminant_i = np.asarray(illuminant_i, dtype=DEFAULT_FLOAT_DTYPE)
+    illuminant_o = np.asarray(illuminant_o, dtype=DEFAULT_FLOAT_DTYPE)
+    RGB_to_XYZ_matrix = np.asarray(
+        RGB_to_XYZ_matrix, dtype=DEFAULT_FLOAT_DTYPE)
+    XYZ_to_RGB_matrix = np.asarray(
+        XYZ_to_RGB_matrix, dtype=DEFAULT_FLOAT_DTYPE)
+
+    key = (ndarray_digest(illuminant_i, illuminant_o, RGB_to_XYZ_matrix,
+                          XYZ_to_RGB_matrix), chromatic_adaptation_transform)
+    try:
+        return _CONVERSION_MATRICES_CACHE[key]
+    except KeyError:
+        M = chromatic_adaptation_matrix_VonKries(
+            xyY_to_XYZ(xy_to_xyY(illuminant_i)),
+            xyY_to_XYZ(xy_to_xyY(illuminant_o)),
+            transform=chromatic_adaptation_transform)
+
+        M = dot_matrix(XYZ_to_RGB_matrix, dot_matrix(M, RGB_to_XYZ_matrix))
+        M.setflags(write=False)
+
+        _CONVERSION_MATRICES_CACHE[key] = M
+
+        return M
+
+
+def _apply_conversion(a,
+                      M,
+                      decoding_cctf=None,
+                      encoding_cctf=None,
+                      out=None,
+                      chunk_size=COLOURSPACE_CONVERSION_CHUNK_SIZE):
+    """
+    Decodes, converts with given matrix and encodes given colour values by
+    chunks in a single pass.
+
+    Parameters
+    ----------
+    a : array_like
+        Colour values.
+    M : array_like
+        Conversion matrix.
+    decoding_cctf : object, optional
+        Decoding colour component transfer function.
+    encoding_cctf : object, optional
+        Encoding colour component transfer function.
+    out : ndarray, optional
+        C-contiguous floating point array with the same shape as the colour
+        values the converted colour values are written to.
+    chunk_size : integer, optional
+        Colour values count of the chunks the conversion is applied by.
+
+    Returns
+    -------
+    ndarray
+        Converted colour values.
+    """
+
+    a = np.asarray(a)
+    if a.dtype.kind != 'f':
+        a = a.astype(DEFAULT_FLOAT_DTYPE)
+
+    if out is None:
+        out = np.empty(a.shape, dtype=a.dtype)
+    else:
+        assert out.shape == a.shape, (
+            '"out" array shape must match the colour values shape!')
+        assert out.flags.c_contiguous, '"out" array must be C-contiguous!'
+
+    a_f = np.reshape(a, (-1, 3))
+    out_f = np.reshape(out, (-1, 3))
+    M_T = np.transpose(M)
+    chunk_size = int(chunk_size)
+
+    for i in range(0, a_f.shape[0], chunk_size):
+        chunk = a_f[i:i + chunk_size]
+
+        if decoding_cctf is not None:
+            chunk = decoding_cctf(chunk)
+
+        chunk = np.dot(chunk, M_T)
+
+        if encoding_cctf is not None:
+            chunk = encoding_cctf(chunk)
+
+        out_f[i:i + chunk_size] = chunk
+
+    return out
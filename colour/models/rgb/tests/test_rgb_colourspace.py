@@ -16,8 +16,8 @@ from itertools import permutations
 
 from colour.models import (RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB,
                            RGB_to_XYZ, RGB_to_RGB_matrix, RGB_to_RGB,
-                           normalised_primary_matrix, oetf_sRGB,
-                           oetf_reverse_sRGB)
+                           ColourspaceConversion, normalised_primary_matrix,
+                           oetf_sRGB, oetf_reverse_sRGB)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -29,7 +29,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_COLOURSPACES', 'TestRGB_Colourspace', 'TestXYZ_to_RGB',
-    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB'
+    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB',
+    'TestColourspaceConversion'
 ]
 
 
@@ -665,5 +666,114 @@ class TestRGB_to_RGB(unittest.TestCase):
             RGB_to_RGB(RGB, aces_2065_1_colourspace, sRGB_colourspace)
 
 
+class TestColourspaceConversion(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.rgb_colourspace.ColourspaceConversion`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('input_colourspace', 'output_colourspace',
+                               'chromatic_adaptation_transform', 'matrix',
+                               'decoding_cctf', 'encoding_cctf')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ColourspaceConversion))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__repr__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ColourspaceConversion))
+
+    def test_matrix(self):
+        """
+        Tests :attr:`colour.models.rgb.rgb_colourspace.\
+ColourspaceConversion.matrix` attribute.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        conversion = ColourspaceConversion(aces_2065_1_colourspace,
+                                           sRGB_colourspace, 'Bradford')
+        np.testing.assert_almost_equal(
+            conversion.matrix,
+            RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace,
+                              'Bradford'),
+            decimal=12)
+        self.assertFalse(conversion.matrix.flags.writeable)
+
+        # Conversion matrices are cached.
+        self.assertIs(
+            ColourspaceConversion(aces_2065_1_colourspace, sRGB_colourspace,
+                                  'Bradford').matrix, conversion.matrix)
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.\
+ColourspaceConversion.__call__` method.
+        """
+
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+        W_R = np.array([0.34570, 0.35850])
+
+        prng = np.random.RandomState(4)
+        RGB = prng.random_sample((16, 16, 3))
+
+        conversion = ColourspaceConversion(aces_cc_colourspace,
+                                           sRGB_colourspace, 'Bradford', True,
+                                           True)
+        RGB_o = RGB_to_RGB(RGB, aces_cc_colourspace, sRGB_colourspace,
+                           'Bradford', True, True)
+        for chunk_size in (1, 7, 256, 1024):
+            np.testing.assert_almost_equal(
+                conversion(RGB, chunk_size=chunk_size), RGB_o, decimal=7)
+
+        # Conversion into given buffer and in place.
+        out = np.empty(RGB.shape)
+        self.assertIs(conversion(RGB, out=out, chunk_size=7), out)
+        np.testing.assert_almost_equal(out, RGB_o, decimal=7)
+
+        out = np.copy(RGB)
+        conversion(out, out=out, chunk_size=7)
+        np.testing.assert_almost_equal(out, RGB_o, decimal=7)
+
+        self.assertRaises(
+            AssertionError, conversion, RGB, out=np.empty((16, 3)))
+
+        # Conversions from and to *CIE XYZ* tristimulus values.
+        conversion = ColourspaceConversion(W_R, sRGB_colourspace, 'CAT02',
+                                           apply_encoding_cctf=True)
+        np.testing.assert_almost_equal(
+            conversion(RGB),
+            XYZ_to_RGB(RGB, W_R, sRGB_colourspace.whitepoint,
+                       sRGB_colourspace.XYZ_to_RGB_matrix, 'CAT02',
+                       sRGB_colourspace.encoding_cctf),
+            decimal=7)
+
+        conversion = ColourspaceConversion(sRGB_colourspace, W_R, 'CAT02',
+                                           apply_decoding_cctf=True)
+        np.testing.assert_almost_equal(
+            conversion(RGB),
+            RGB_to_XYZ(RGB, sRGB_colourspace.whitepoint, W_R,
+                       sRGB_colourspace.RGB_to_XYZ_matrix, 'CAT02',
+                       sRGB_colourspace.decoding_cctf),
+            decimal=7)
+
+        # The input colour values floating point type is preserved.
+        self.assertEqual(
+            conversion(RGB.astype(np.float32)).dtype, np.float32)
+
+
 if __name__ == '__main__':
     unittest.main()
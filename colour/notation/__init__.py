@@ -11,6 +11,7 @@ from .munsell import (munsell_value_Priest1920, munsell_value_Munsell1933,
                       munsell_value_Ladd1955, munsell_value_McCamy1987,
                       munsell_value_ASTMD153508)
 from .munsell import munsell_colour_to_xyY, xyY_to_munsell_colour
+from .munsell import MunsellxyYTable
 from .triplet import RGB_to_HEX, HEX_to_RGB
 
 __all__ = []
@@ -24,4 +25,5 @@ __all__ += [
     'munsell_value_ASTMD153508'
 ]
 __all__ += ['munsell_colour_to_xyY', 'xyY_to_munsell_colour']
+__all__ += ['MunsellxyYTable']
 __all__ += ['RGB_to_HEX', 'HEX_to_RGB']
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Common Munsell Renotation System Dataset Utilities
+==================================================
+
+Defines various *Munsell Renotation System* datasets common utilities.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['munsell_colours_to_dataset', 'munsell_colours_from_dataset']
+
+
+def munsell_colours_to_dataset(munsell_colours):
+    """
+    Converts given *Munsell* colours to datasets writable with
+    :func:`colour.utilities.write_memory_mapped_dataset` definition.
+
+    The datasets are keyed by the *Munsell* colours hues, their domain is the
+    *Munsell* colours indexes and their range columns are the *Munsell*
+    colours values, chromas and *CIE xyY* colourspace arrays.
+
+    Parameters
+    ----------
+    munsell_colours : tuple
+        *Munsell* colours, i.e. (('hue', 'value', 'chroma'),
+        np.array(['x', 'y', 'Y'])) tuples.
+
+    Returns
+    -------
+    dict
+        *Munsell* colours datasets.
+
+    Examples
+    --------
+    >>> munsell_colours = (
+    ...     (('2.5GY', 0.2, 2.0), np.array([0.7130, 1.4140, 0.2370])),
+    ...     (('5GY', 0.2, 2.0), np.array([0.4490, 1.1450, 0.2370])))
+    >>> datasets = munsell_colours_to_dataset(munsell_colours)
+    >>> datasets['5GY']
+    {1: (0.2, 2.0, 0.449, 1.145, 0.237)}
+    """
+
+    datasets = {}
+    for i, ((hue, value, chroma), xyY) in enumerate(munsell_colours):
+        datasets.setdefault(hue, {})[i] = (value, chroma) + tuple(
+            np.asarray(xyY).tolist())
+
+    return datasets
+
+
+def munsell_colours_from_dataset(dataset):
+    """
+    Converts given :class:`colour.utilities.MemoryMappedDataset` class
+    instance of *Munsell* colours datasets back to *Munsell* colours.
+
+    Parameters
+    ----------
+    dataset : MemoryMappedDataset
+        *Munsell* colours datasets as returned by
+        :func:`colour.notation.dataset.munsell.common.\
+munsell_colours_to_dataset` definition.
+
+    Returns
+    -------
+    tuple
+        *Munsell* colours, i.e. (('hue', 'value', 'chroma'),
+        np.array(['x', 'y', 'Y'])) tuples.
+
+    Notes
+    -----
+    -   The *CIE xyY* colourspace arrays are rows of a single array copied
+        from the memory mapped dataset array.
+    """
+
+    hues, indexes, values = [], [], []
+    for hue in dataset:
+        domain = dataset.domain(hue)
+        hues.extend([hue] * len(domain))
+        indexes.append(domain)
+        values.append(dataset.range(hue))
+
+    order = np.argsort(np.concatenate(indexes), kind='mergesort')
+    values = np.concatenate(values)[order]
+
+    specifications = zip([hues[i] for i in order], *values[:, :2].T.tolist())
+
+    return tuple(zip(specifications, list(values[:, 2:])))
@@ -25,6 +25,7 @@ from colour.notation.munsell import maximum_chroma_from_renotation
 from colour.notation.munsell import munsell_specification_to_xy
 from colour.notation.munsell import (munsell_specification_to_xyY,
                                      xyY_to_munsell_specification)
+from colour.notation.munsell import MunsellxyYTable
 from colour.notation import (munsell_value_Priest1920,
                              munsell_value_Munsell1933, munsell_value_Moon1943,
                              munsell_value_Saunderson1944,
@@ -57,7 +58,8 @@ __all__ = [
     'TestHueToHueAngle', 'TestHueAngleToHue', 'TestHueTo_ASTM_hue',
     'TestInterpolationMethodFromRenotationOvoid',
     'Test_xy_fromRenotationOvoid', 'TestLCHabToMunsellSpecification',
-    'TestMaximumChromaFromRenotation', 'TestMunsellSpecification_to_xy'
+    'TestMaximumChromaFromRenotation', 'TestMunsellSpecification_to_xy',
+    'TestMunsellxyYTable'
 ]
 
 
@@ -1167,6 +1169,19 @@ class TestMunsellSpecification_to_xyY(unittest.TestCase):
             np.testing.assert_almost_equal(
                 munsell_specification_to_xyY(specification[0]), xyY, decimal=7)
 
+        table = MunsellxyYTable()
+        for specification, xyY in MUNSELL_SPECIFICATIONS:
+            np.testing.assert_allclose(
+                munsell_specification_to_xyY(specification, table),
+                xyY,
+                atol=0.001)
+
+        for specification, xyY in MUNSELL_GREYS_SPECIFICATIONS:
+            np.testing.assert_almost_equal(
+                munsell_specification_to_xyY(specification[0], table),
+                xyY,
+                decimal=7)
+
 
 class TestMunsellColour_to_xyY(unittest.TestCase):
     """
@@ -1211,6 +1226,45 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
                 rtol=0.00001,
                 atol=0.00001)
 
+    def test_n_dimensional_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition n-dimensional arrays support.
+        """
+
+        xyY = np.array([x[1] for x in MUNSELL_SPECIFICATIONS])
+        specification = np.array([
+            xyY_to_munsell_specification(x) for x in xyY[:16]
+        ])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY[:16]),
+            specification,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            np.array([x[0] for x in MUNSELL_SPECIFICATIONS]),
+            rtol=0.00001,
+            atol=0.00001)
+
+        xyY = np.reshape(xyY[:16], (2, 8, 3))
+        specification = np.reshape(specification, (2, 8, 4))
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+        xyY = np.array([x[1] for x in MUNSELL_GREYS_SPECIFICATIONS])
+        specification = xyY_to_munsell_specification(xyY)
+        np.testing.assert_allclose(
+            specification[..., 1],
+            np.array([x[0][0] for x in MUNSELL_GREYS_SPECIFICATIONS]),
+            rtol=0.00001,
+            atol=0.00001)
+        self.assertTrue(np.all(np.isnan(specification[..., [0, 2, 3]])))
+
 
 class TestxyY_to_munsell_colour(unittest.TestCase):
     """
@@ -1574,5 +1628,79 @@ class TestMunsellSpecification_to_xy(unittest.TestCase):
                 decimal=7)
 
 
+class TestMunsellxyYTable(unittest.TestCase):
+    """
+    Defines :class:`colour.notation.munsell.MunsellxyYTable` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('hue_step', 'hues', 'values', 'chromas', 'xy')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(MunsellxyYTable))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__repr__', '__len__', 'xyY')
+
+        for method in required_methods:
+            self.assertIn(method, dir(MunsellxyYTable))
+
+    def test__init__(self):
+        """
+        Tests :func:`colour.notation.munsell.MunsellxyYTable.__init__`
+        method.
+        """
+
+        table = MunsellxyYTable(1.25)
+        self.assertEqual(len(table), 80 * 10 * 26)
+        self.assertTupleEqual(table.xy.shape, (80, 10, 26, 2))
+        np.testing.assert_almost_equal(table.hues[0:3], [0, 1.25, 2.5])
+        np.testing.assert_almost_equal(table.values, np.arange(1, 11))
+        np.testing.assert_almost_equal(table.chromas, np.arange(0, 52, 2))
+
+        self.assertRaises(AssertionError, MunsellxyYTable, 1)
+
+    def test_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.MunsellxyYTable.xyY` method.
+        """
+
+        table = MunsellxyYTable()
+
+        # Even specifications are lying on the table entries.
+        for specification, xyY in MUNSELL_EVEN_SPECIFICATIONS:
+            np.testing.assert_almost_equal(
+                table.xyY(specification), xyY, decimal=7)
+
+        specifications = np.array(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS])
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        np.testing.assert_allclose(table.xyY(specifications), xyY, atol=0.001)
+
+        np.testing.assert_allclose(
+            table.xyY(np.reshape(specifications, (10, -1, 4))),
+            np.reshape(xyY, (10, -1, 3)),
+            atol=0.001)
+
+        np.testing.assert_almost_equal(
+            table.xyY(np.array([np.nan, 8.9, np.nan, np.nan])),
+            munsell_specification_to_xyY(8.9),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            table.xyY(np.array([5.0, 8.9, 0.0, 3])),
+            munsell_specification_to_xyY(8.9),
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
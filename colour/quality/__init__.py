@@ -4,10 +4,17 @@ from __future__ import absolute_import
 
 from .dataset import *  # noqa
 from . import dataset
-from .cri import CRI_Specification, colour_rendering_index
-from .cqs import CQS_Specification, colour_quality_scale
+from .cri import (CRI_Specification, colour_rendering_index,
+                  multi_colour_rendering_index)
+from .cqs import (CQS_Specification, colour_quality_scale,
+                  multi_colour_quality_scale)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['CRI_Specification', 'colour_rendering_index']
-__all__ += ['CQS_Specification', 'colour_quality_scale']
+__all__ += [
+    'CRI_Specification', 'colour_rendering_index',
+    'multi_colour_rendering_index'
+]
+__all__ += [
+    'CQS_Specification', 'colour_quality_scale', 'multi_colour_quality_scale'
+]
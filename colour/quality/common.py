@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Common Colour Quality Utilities
+===============================
+
+Defines various colour quality common utilities used by the batched
+*Colour Rendering Index* (CRI) and *Colour Quality Scale* (CQS) computations:
+
+-   :func:`colour.quality.common.reference_illuminants_values`
+-   :func:`colour.quality.common.samples_to_XYZ`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import D_ILLUMINANTS_S_SPDS, planck_law
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.temperature import CCT_to_xy_CIE_D
+from colour.utilities import LRUCache, tsplit
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'QUALITY_CHUNK_SIZE', 'reference_illuminants_values', 'samples_to_XYZ'
+]
+
+QUALITY_CHUNK_SIZE = 4096
+"""
+Default test spectral power distributions count of the chunks the batched
+colour quality computations are performed by.
+
+QUALITY_CHUNK_SIZE : integer
+"""
+
+_D_ILLUMINANTS_S_VALUES_CACHE = LRUCache(maxsize=8)
+
+
+def _D_illuminants_S_values(shape):
+    """
+    Returns the *CIE Standard Illuminant D Series* :math:`S_n(\lambda)`
+    distributions values aligned to given spectral shape, the values are
+    cached in the
+    :attr:`colour.quality.common._D_ILLUMINANTS_S_VALUES_CACHE` bounded least
+    recently used cache, keyed by the spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape to align the distributions to.
+
+    Returns
+    -------
+    ndarray, (3, W)
+        :math:`S_0(\lambda)`, :math:`S_1(\lambda)` and :math:`S_2(\lambda)`
+        distributions values.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+    try:
+        return _D_ILLUMINANTS_S_VALUES_CACHE[key]
+    except KeyError:
+        # Aligning is linear in the values, aligning the distributions prior
+        # to combining them is thus equivalent to aligning their combination.
+        S = _D_ILLUMINANTS_S_VALUES_CACHE[key] = np.array([
+            D_ILLUMINANTS_S_SPDS[name].copy().align(shape).values
+            for name in ('S0', 'S1', 'S2')
+        ])
+
+        return S
+
+
+def reference_illuminants_values(CCT, shape):
+    """
+    Returns the values of the reference illuminants of given correlated colour
+    temperatures :math:`T_{cp}` used by the *Colour Rendering Index* (CRI) and
+    *Colour Quality Scale* (CQS) computations, i.e. a planckian radiator below
+    5000K and a *CIE Standard Illuminant D Series* otherwise.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Reference illuminants values.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> values = reference_illuminants_values(
+    ...     np.array([4230, 6500]), SpectralShape(360, 830, 1))
+    >>> values.shape
+    (2, 471)
+    >>> values[..., 100]  # doctest: +ELLIPSIS
+    array([  3.5568319...e+12,   1.1776662...e+02])
+    """
+
+    CCT = np.asarray(CCT, dtype=DEFAULT_FLOAT_DTYPE)[..., np.newaxis]
+    wavelengths = shape.range()
+
+    values = np.empty(CCT.shape[:-1] + wavelengths.shape)
+
+    blackbody = CCT[..., 0] < 5000
+    values[blackbody] = planck_law(wavelengths * 1e-9, CCT[blackbody])
+
+    D_series = ~blackbody
+    if np.any(D_series):
+        x, y = tsplit(CCT_to_xy_CIE_D(CCT[D_series][..., 0]))
+
+        M = 0.0241 + 0.2562 * x - 0.7341 * y
+        M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+        M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+        S0, S1, S2 = _D_illuminants_S_values(shape)
+        values[D_series] = (S0 + M1[..., np.newaxis] * S1 +
+                            M2[..., np.newaxis] * S2)
+
+    return values
+
+
+def samples_to_XYZ(values, samples, cmfs):
+    """
+    Converts given test spectral power distributions values and samples
+    reflectances to *CIE XYZ* tristimulus values using given colour matching
+    functions according to classical integration method.
+
+    The colour matching functions and samples reflectances are folded into a
+    single weighting matrix, the tristimulus values of all the samples under
+    all the test spectral power distributions are then computed with a single
+    matrix product.
+
+    Parameters
+    ----------
+    values : array_like, (N, W)
+        Test spectral power distributions values aligned to the colour
+        matching functions shape.
+    samples : array_like, (S, W)
+        Samples reflectances aligned to the colour matching functions shape.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        *CIE XYZ* tristimulus values of the test spectral power distributions
+        with shape (N, 3) and of the samples with shape (N, S, 3).
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+    -   The test spectral power distributions tristimulus values are those of
+        light sources, i.e. computed with an equal-energy illuminant.
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> values = np.ones((1, len(cmfs.wavelengths)))
+    >>> samples = np.full((2, len(cmfs.wavelengths)), 0.5)
+    >>> XYZ, XYZ_s = samples_to_XYZ(values, samples, cmfs)
+    >>> XYZ  # doctest: +ELLIPSIS
+    array([[ 100.0080035...,  100.        ,  100.0330668...]])
+    >>> XYZ_s  # doctest: +ELLIPSIS
+    array([[[  50.0040017...,   50.        ,   50.0165334...],
+            [  50.0040017...,   50.        ,   50.0165334...]]])
+    """
+
+    values = np.asarray(values, dtype=DEFAULT_FLOAT_DTYPE)
+    samples = np.asarray(samples, dtype=DEFAULT_FLOAT_DTYPE)
+    x_bar_y_bar_z_bar = cmfs.values
+    y_bar = x_bar_y_bar_z_bar[..., 1]
+
+    # The integration interval factors out of the normalisation constant.
+    M = samples[..., np.newaxis] * x_bar_y_bar_z_bar
+    M = np.reshape(np.transpose(M, (1, 0, 2)), (M.shape[1], -1))
+
+    XYZ = 100 * np.dot(values, x_bar_y_bar_z_bar) / np.sum(y_bar)
+
+    XYZ_s = np.reshape(
+        np.dot(values, M), (values.shape[0], samples.shape[0], 3))
+    XYZ_s *= (100 / np.dot(values, y_bar))[..., np.newaxis, np.newaxis]
+
+    return XYZ, XYZ_s
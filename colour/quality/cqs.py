@@ -7,6 +7,7 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 
 -   :class:`colour.quality.CQS_Specification`
 -   :func:`colour.colour_quality_scale`
+-   :func:`colour.multi_colour_quality_scale`
 
 See Also
 --------
@@ -32,12 +33,16 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd, ILLUMINANTS,
     STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.quality.common import (QUALITY_CHUNK_SIZE,
+                                   reference_illuminants_values,
+                                   samples_to_XYZ)
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import tsplit
+from colour.utilities import LRUCache, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -48,13 +53,16 @@ __status__ = 'Production'
 
 __all__ = [
     'D65_GAMUT_AREA', 'VS_ColorimetryData', 'VS_ColourQualityScaleData',
-    'CQS_Specification', 'colour_quality_scale', 'gamut_area',
+    'CQS_Specification', 'colour_quality_scale', 'multi_colour_quality_scale',
+    'gamut_area',
     'vs_colorimetry_data', 'CCT_factor', 'scale_conversion', 'delta_E_RMS',
     'colour_quality_scales'
 ]
 
 D65_GAMUT_AREA = 8210
 
+_VS_SPDS_CACHE = LRUCache(maxsize=8)
+
 
 class VS_ColorimetryData(
         namedtuple('VS_ColorimetryData', ('name', 'XYZ', 'Lab', 'C'))):
@@ -147,7 +155,7 @@ def colour_quality_scale(spd_test, additional_data=False):
 
     shape = cmfs.shape
     spd_test = spd_test.copy().align(shape)
-    vs_spds = {spd.name: spd.copy().align(shape) for spd in VS_SPDS.values()}
+    vs_spds, _reflectances = _vs_spds(shape)
 
     XYZ = spectral_to_XYZ(spd_test, cmfs)
     uv = UCS_to_uv(XYZ_to_UCS(XYZ))
@@ -200,6 +208,173 @@ def colour_quality_scale(spd_test, additional_data=False):
         return Q_a
 
 
+def multi_colour_quality_scale(mspd_test, chunk_size=QUALITY_CHUNK_SIZE):
+    """
+    Returns the *Colour Quality Scale* (CQS) scales and the individual
+    *VS test colour samples* scales :math:`Q_{as}` of given multi-spectral
+    power distribution test spectral power distributions.
+
+    The *VS test colour samples* reflectances are aligned once per spectral
+    shape and the test spectral power distributions are evaluated by chunks
+    with array operations.
+
+    Parameters
+    ----------
+    mspd_test : MultiSpectralPowerDistribution
+        Test multi-spectral power distribution.
+    chunk_size : integer, optional
+        Test spectral power distributions count of the chunks the computation
+        is performed by, bounding the memory footprint.
+
+    Returns
+    -------
+    ndarray
+        Structured array with the test spectral power distributions names as
+        *name* field, their colour quality scale :math:`Q_a`, colour fidelity
+        scale :math:`Q_f`, colour preference scale :math:`Q_p`, gamut area
+        scale :math:`Q_g` and relative gamut area scale :math:`Q_d` as *Q_a*,
+        *Q_f*, *Q_p*, *Q_g* and *Q_d* fields and their individual
+        *VS test colour samples* scales as *Q_as* field, ordered by
+        *VS test colour samples* indexes.
+
+    Notes
+    -----
+    -   The results match those of :func:`colour.colour_quality_scale`
+        definition for each test spectral power distribution.
+
+    References
+    ----------
+    -   :cite:`Davis2010a`
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import (ILLUMINANTS_RELATIVE_SPDS,
+    ...                     MultiSpectralPowerDistribution)
+    >>> from colour.utilities import tstack
+    >>> spds = [ILLUMINANTS_RELATIVE_SPDS[name] for name in ('F2', 'F7')]
+    >>> mspd = MultiSpectralPowerDistribution(
+    ...     tstack([spd.values for spd in spds]),
+    ...     spds[0].wavelengths,
+    ...     labels=['F2', 'F7'])
+    >>> specification = multi_colour_quality_scale(mspd)
+    >>> specification['Q_a']  # doctest: +ELLIPSIS
+    array([ 64.6863391...,  90.9118831...])
+    >>> specification['Q_as'].shape
+    (2, 15)
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    shape = cmfs.shape
+    _vs_spds_, reflectances = _vs_spds(shape)
+    values = np.transpose(mspd_test.copy().align(shape).values)
+    names = np.asarray(mspd_test.labels)
+    chunk_size = int(chunk_size)
+
+    fields = [(str('name'), names.dtype)]
+    fields += [(str(field), DEFAULT_FLOAT_DTYPE)
+               for field in ('Q_a', 'Q_f', 'Q_p', 'Q_g', 'Q_d')]
+    fields += [(str('Q_as'), DEFAULT_FLOAT_DTYPE, (len(reflectances), ))]
+    specification = np.zeros(len(names), dtype=fields)
+    specification['name'] = names
+
+    xy_w = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+    XYZ_w = xy_to_XYZ(xy_w)
+
+    for i in range(0, len(names), chunk_size):
+        values_t = values[i:i + chunk_size]
+        chunk = specification[i:i + chunk_size]
+
+        XYZ_t, XYZ_vs_t = samples_to_XYZ(values_t, reflectances, cmfs)
+        CCT, _D_uv = tsplit(uv_to_CCT_Ohno2013(UCS_to_uv(XYZ_to_UCS(XYZ_t))))
+
+        values_r = reference_illuminants_values(CCT, shape)
+        XYZ_r, XYZ_vs_r = samples_to_XYZ(values_r, reflectances, cmfs)
+
+        XYZ_t = (XYZ_t / XYZ_t[..., 1, np.newaxis])[..., np.newaxis, :]
+        XYZ_r = (XYZ_r / XYZ_r[..., 1, np.newaxis])[..., np.newaxis, :]
+        xy_r = XYZ_to_xy(XYZ_r)
+        XYZ_vs_t /= 100
+        XYZ_vs_r /= 100
+
+        XYZ_vs_t = chromatic_adaptation_VonKries(
+            XYZ_vs_t, XYZ_t, XYZ_r, transform='CMCCAT2000')
+
+        Lab_t = XYZ_to_Lab(XYZ_vs_t, illuminant=xy_r)
+        Lab_r = XYZ_to_Lab(XYZ_vs_r, illuminant=xy_r)
+        _L_t, C_t, _Hab_t = tsplit(Lab_to_LCHab(Lab_t))
+        _L_r, C_r, _Hab_r = tsplit(Lab_to_LCHab(Lab_r))
+
+        G_r = gamut_area(
+            XYZ_to_Lab(
+                chromatic_adaptation_VonKries(
+                    XYZ_vs_r, XYZ_r, XYZ_w, transform='CMCCAT2000'),
+                illuminant=xy_w)) / D65_GAMUT_AREA
+        CCT_f = np.where(G_r > 1, 1, G_r)
+
+        D_C_ab = C_t - C_r
+        D_E_ab = euclidean_distance(Lab_t, Lab_r)
+        D_Ep_ab = np.copy(D_E_ab)
+        increased = D_C_ab > 0
+        D_Ep_ab[increased] = np.sqrt(D_E_ab[increased] ** 2 -
+                                     D_C_ab[increased] ** 2)
+
+        D_E_RMS = np.sqrt(np.average(D_E_ab ** 2, axis=-1))
+        D_Ep_RMS = np.sqrt(np.average(D_Ep_ab ** 2, axis=-1))
+
+        G_t = gamut_area(Lab_t)
+
+        chunk['Q_as'] = scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis])
+        chunk['Q_a'] = scale_conversion(D_Ep_RMS, CCT_f)
+        chunk['Q_f'] = scale_conversion(D_E_RMS, CCT_f, 2.928)
+        chunk['Q_p'] = 100 - 3.6 * (
+            D_Ep_RMS - np.average(np.maximum(D_C_ab, 0), axis=-1))
+        chunk['Q_g'] = G_t / D65_GAMUT_AREA * 100
+        chunk['Q_d'] = G_t / gamut_area(Lab_r) * CCT_f * 100
+
+    return specification
+
+
+def _vs_spds(shape):
+    """
+    Returns the *VS test colour samples* spectral power distributions aligned
+    to given spectral shape and their reflectances array ordered by
+    *VS test colour samples* indexes, they are cached in the
+    :attr:`colour.quality.cqs._VS_SPDS_CACHE` bounded least recently used
+    cache, keyed by the spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape to align the *VS test colour samples* to.
+
+    Returns
+    -------
+    tuple
+        *VS test colour samples* spectral power distributions and
+        reflectances.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+    try:
+        return _VS_SPDS_CACHE[key]
+    except KeyError:
+        vs_spds = {
+            spd.name: spd.copy().align(shape)
+            for spd in VS_SPDS.values()
+        }
+        reflectances = np.array([
+            vs_spds[name].values
+            for _index, name in sorted(VS_INDEXES_TO_NAMES.items())
+        ])
+
+        _VS_SPDS_CACHE[key] = vs_spds, reflectances
+
+        return vs_spds, reflectances
+
+
 def gamut_area(Lab):
     """
     Returns the gamut area :math:`G` covered by given *CIE L\*a\*b\** matrices.
@@ -207,11 +382,12 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE L\*a\*b\** colourspace matrices.
+        *CIE L\*a\*b\** colourspace matrices, the gamut vertices are along
+        the penultimate axis.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -238,18 +414,15 @@ def gamut_area(Lab):
     """
 
     Lab = np.asarray(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
-
-    _L, a, b = tsplit(Lab)
-    _L_s, a_s, b_s = tsplit(Lab_s)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack((a_s - a, b_s - b)), axis=-1)
+    C = np.linalg.norm(Lab_s[..., 1:3] - Lab[..., 1:3], axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(spd_test,
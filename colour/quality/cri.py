@@ -7,6 +7,7 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 
 -   :class:`colour.quality.CRI_Specification`
 -   :func:`colour.colour_rendering_index`
+-   :func:`colour.multi_colour_rendering_index`
 
 See Also
 --------
@@ -30,9 +31,14 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd,
     STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.quality.common import (QUALITY_CHUNK_SIZE,
+                                   reference_illuminants_values,
+                                   samples_to_XYZ)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
+from colour.utilities import LRUCache, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -43,10 +49,12 @@ __status__ = 'Production'
 
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData', 'CRI_Specification',
-    'colour_rendering_index', 'tcs_colorimetry_data',
-    'colour_rendering_indexes'
+    'colour_rendering_index', 'multi_colour_rendering_index',
+    'tcs_colorimetry_data', 'colour_rendering_indexes'
 ]
 
+_TCS_SPDS_CACHE = LRUCache(maxsize=8)
+
 
 class TCS_ColorimetryData(
         namedtuple('TCS_ColorimetryData', ('name', 'XYZ', 'uv', 'UVW'))):
@@ -120,7 +128,7 @@ def colour_rendering_index(spd_test, additional_data=False):
 
     shape = cmfs.shape
     spd_test = spd_test.copy().align(shape)
-    tcs_spds = {spd.name: spd.copy().align(shape) for spd in TCS_SPDS.values()}
+    tcs_spds, _reflectances = _tcs_spds(shape)
 
     XYZ = spectral_to_XYZ(spd_test, cmfs)
     uv = UCS_to_uv(XYZ_to_UCS(XYZ))
@@ -153,6 +161,196 @@ def colour_rendering_index(spd_test, additional_data=False):
         return Q_a
 
 
+def multi_colour_rendering_index(mspd_test, chunk_size=QUALITY_CHUNK_SIZE):
+    """
+    Returns the *Colour Rendering Index* (CRI) :math:`Q_a` and the individual
+    *colour rendering indexes* :math:`Q_{as}` of given multi-spectral power
+    distribution test spectral power distributions.
+
+    The *test colour samples* reflectances are aligned once per spectral shape
+    and the test spectral power distributions are evaluated by chunks with
+    array operations.
+
+    Parameters
+    ----------
+    mspd_test : MultiSpectralPowerDistribution
+        Test multi-spectral power distribution.
+    chunk_size : integer, optional
+        Test spectral power distributions count of the chunks the computation
+        is performed by, bounding the memory footprint.
+
+    Returns
+    -------
+    ndarray
+        Structured array with the test spectral power distributions names as
+        *name* field, their *Colour Rendering Index* (CRI) :math:`Q_a` as
+        *Q_a* field and their individual *colour rendering indexes* as *Q_as*
+        field, ordered by *test colour samples* indexes.
+
+    Notes
+    -----
+    -   The results match those of :func:`colour.colour_rendering_index`
+        definition for each test spectral power distribution.
+
+    References
+    ----------
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import (ILLUMINANTS_RELATIVE_SPDS,
+    ...                     MultiSpectralPowerDistribution)
+    >>> from colour.utilities import tstack
+    >>> spds = [ILLUMINANTS_RELATIVE_SPDS[name] for name in ('F2', 'F7')]
+    >>> mspd = MultiSpectralPowerDistribution(
+    ...     tstack([spd.values for spd in spds]),
+    ...     spds[0].wavelengths,
+    ...     labels=['F2', 'F7'])
+    >>> specification = multi_colour_rendering_index(mspd)
+    >>> specification['name']  # doctest: +SKIP
+    array(['F2', 'F7'],
+          dtype='<U2')
+    >>> specification['Q_a']  # doctest: +ELLIPSIS
+    array([ 64.1515202...,  90.1836583...])
+    >>> specification['Q_as'].shape
+    (2, 14)
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    shape = cmfs.shape
+    _tcs_spds_, reflectances = _tcs_spds(shape)
+    values = np.transpose(mspd_test.copy().align(shape).values)
+    names = np.asarray(mspd_test.labels)
+    chunk_size = int(chunk_size)
+
+    specification = np.zeros(
+        len(names),
+        dtype=[(str('name'), names.dtype), (str('Q_a'), DEFAULT_FLOAT_DTYPE),
+               (str('Q_as'), DEFAULT_FLOAT_DTYPE, (len(reflectances), ))])
+    specification['name'] = names
+
+    for i in range(0, len(names), chunk_size):
+        values_t = values[i:i + chunk_size]
+
+        XYZ_t, XYZ_tcs_t = samples_to_XYZ(values_t, reflectances, cmfs)
+        uv_t = UCS_to_uv(XYZ_to_UCS(XYZ_t))
+        CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv_t))
+
+        values_r = reference_illuminants_values(CCT, shape)
+        XYZ_r, XYZ_tcs_r = samples_to_XYZ(values_r, reflectances, cmfs)
+        uv_r = UCS_to_uv(XYZ_to_UCS(XYZ_r))
+
+        uv_t = uv_t[..., np.newaxis, :]
+        uv_r = uv_r[..., np.newaxis, :]
+        UVW_t = _tcs_UVW(XYZ_tcs_t, uv_t, uv_r, chromatic_adaptation=True)
+        UVW_r = _tcs_UVW(XYZ_tcs_r, uv_r, uv_r)
+
+        specification['Q_as'][i:i + chunk_size] = (
+            100 - 4.6 * euclidean_distance(UVW_r, UVW_t))
+
+    specification['Q_a'] = np.average(specification['Q_as'][..., :8], axis=-1)
+
+    return specification
+
+
+def _tcs_spds(shape):
+    """
+    Returns the *test colour samples* spectral power distributions aligned to
+    given spectral shape and their reflectances array ordered by
+    *test colour samples* indexes, they are cached in the
+    :attr:`colour.quality.cri._TCS_SPDS_CACHE` bounded least recently used
+    cache, keyed by the spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape to align the *test colour samples* to.
+
+    Returns
+    -------
+    tuple
+        *Test colour samples* spectral power distributions and reflectances.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+    try:
+        return _TCS_SPDS_CACHE[key]
+    except KeyError:
+        tcs_spds = {
+            spd.name: spd.copy().align(shape)
+            for spd in TCS_SPDS.values()
+        }
+        reflectances = np.array([
+            tcs_spds[name].values
+            for _index, name in sorted(TCS_INDEXES_TO_NAMES.items())
+        ])
+
+        _TCS_SPDS_CACHE[key] = tcs_spds, reflectances
+
+        return tcs_spds, reflectances
+
+
+def _tcs_UVW(XYZ_tcs, uv_t, uv_r, chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* *CIE 1964 U\*V\*W\** colourspace
+    arrays from given *test colour samples* tristimulus values and test and
+    reference illuminants *uv* chromaticity coordinates.
+
+    Parameters
+    ----------
+    XYZ_tcs : array_like
+        *Test colour samples* *CIE XYZ* tristimulus values.
+    uv_t : array_like
+        Test illuminant *CIE UCS* colourspace *uv* chromaticity coordinates.
+    uv_r : array_like
+        Reference illuminant *CIE UCS* colourspace *uv* chromaticity
+        coordinates.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    ndarray
+        *Test colour samples* *CIE 1964 U\*V\*W\** colourspace arrays.
+    """
+
+    u_t, v_t = tsplit(uv_t)
+    u_r, v_r = tsplit(uv_r)
+    u_tcs, v_tcs = tsplit(UCS_to_uv(XYZ_to_UCS(XYZ_tcs)))
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = ((10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (5.52 /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+
+    W_tcs = 25 * XYZ_to_xyY(XYZ_tcs)[..., -1] ** (1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
+
+    return tstack((U_tcs, V_tcs, W_tcs))
+
+
 def tcs_colorimetry_data(spd_t,
                          spd_r,
                          spds_tcs,
@@ -182,52 +380,19 @@ def tcs_colorimetry_data(spd_t,
 
     XYZ_t = spectral_to_XYZ(spd_t, cmfs)
     uv_t = UCS_to_uv(XYZ_to_UCS(XYZ_t))
-    u_t, v_t = uv_t[0], uv_t[1]
 
     XYZ_r = spectral_to_XYZ(spd_r, cmfs)
     uv_r = UCS_to_uv(XYZ_to_UCS(XYZ_r))
-    u_r, v_r = uv_r[0], uv_r[1]
 
     tcs_data = []
     for _key, value in sorted(TCS_INDEXES_TO_NAMES.items()):
         spd_tcs = spds_tcs[value]
         XYZ_tcs = spectral_to_XYZ(spd_tcs, cmfs, spd_t)
-        xyY_tcs = XYZ_to_xyY(XYZ_tcs)
         uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
-        u_tcs, v_tcs = uv_tcs[0], uv_tcs[1]
-
-        if chromatic_adaptation:
-
-            def c(x, y):
-                """
-                Computes the :math:`c` term.
-                """
-
-                return (4 - x - 10 * y) / y
-
-            def d(x, y):
-                """
-                Computes the :math:`d` term.
-                """
-
-                return (1.708 * y + 0.404 - 1.481 * x) / y
-
-            c_t, d_t = c(u_t, v_t), d(u_t, v_t)
-            c_r, d_r = c(u_r, v_r), d(u_r, v_r)
-            tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
-            u_tcs = ((
-                10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
-                     (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
-            v_tcs = (5.52 /
-                     (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
-
-        W_tcs = 25 * xyY_tcs[-1] ** (1 / 3) - 17
-        U_tcs = 13 * W_tcs * (u_tcs - u_r)
-        V_tcs = 13 * W_tcs * (v_tcs - v_r)
+        UVW_tcs = _tcs_UVW(XYZ_tcs, uv_t, uv_r, chromatic_adaptation)
 
         tcs_data.append(
-            TCS_ColorimetryData(spd_tcs.name, XYZ_tcs, uv_tcs,
-                                np.array([U_tcs, V_tcs, W_tcs])))
+            TCS_ColorimetryData(spd_tcs.name, XYZ_tcs, uv_tcs, UVW_tcs))
 
     return tcs_data
 
@@ -5,11 +5,14 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_quality_scale
+from colour.quality import colour_quality_scale, multi_colour_quality_scale
 from colour.colorimetry import (ILLUMINANTS_RELATIVE_SPDS,
-                                LIGHT_SOURCES_RELATIVE_SPDS)
+                                LIGHT_SOURCES_RELATIVE_SPDS,
+                                MultiSpectralPowerDistribution, SpectralShape)
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = ['TestColourQualityScale', 'TestMultiColourQualityScale']
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -67,5 +70,56 @@ class TestColourQualityScale(unittest.TestCase):
             places=7)
 
 
+class TestMultiColourQualityScale(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.multi_colour_quality_scale` definition
+    unit tests methods.
+    """
+
+    def test_multi_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.multi_colour_quality_scale`
+        definition.
+        """
+
+        shape = SpectralShape(380, 780, 5)
+        spds = [
+            ILLUMINANTS_RELATIVE_SPDS['F1'], ILLUMINANTS_RELATIVE_SPDS['F2'],
+            LIGHT_SOURCES_RELATIVE_SPDS['Neodimium Incandescent'].copy()
+            .align(shape),
+            LIGHT_SOURCES_RELATIVE_SPDS['H38HT-100 (Mercury)'].copy()
+            .align(shape)
+        ]
+        mspd = MultiSpectralPowerDistribution(
+            tstack([spd.values for spd in spds]),
+            shape.range(),
+            labels=['F1', 'F2', 'Neodimium', 'Mercury'])
+
+        for chunk_size in (1, 3, 4096):
+            specification = multi_colour_quality_scale(mspd, chunk_size)
+
+            self.assertListEqual(
+                list(specification['name']),
+                ['F1', 'F2', 'Neodimium', 'Mercury'])
+            self.assertTupleEqual(specification['Q_as'].shape, (4, 15))
+
+            np.testing.assert_almost_equal(
+                specification['Q_a'][:2],
+                np.array([75.342591389578701, 64.686339173112856]),
+                decimal=7)
+
+            for i, spd in enumerate(spds):
+                reference = colour_quality_scale(spd, additional_data=True)
+                for field in ('Q_a', 'Q_f', 'Q_p', 'Q_g', 'Q_d'):
+                    self.assertAlmostEqual(
+                        specification[field][i],
+                        getattr(reference, field),
+                        places=7)
+                np.testing.assert_almost_equal(
+                    specification['Q_as'][i],
+                    [reference.Q_as[j].Q_a for j in sorted(reference.Q_as)],
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
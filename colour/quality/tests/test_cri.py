@@ -5,11 +5,15 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_rendering_index
+from colour.quality import (colour_rendering_index,
+                            multi_colour_rendering_index)
 from colour.colorimetry import (ILLUMINANTS_RELATIVE_SPDS,
+                                MultiSpectralPowerDistribution,
                                 SpectralPowerDistribution)
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +22,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex', 'TestMultiColourRenderingIndex']
 
 SAMPLE_SPD_DATA = {
     380: 0.00588346,
@@ -132,5 +136,49 @@ class TestColourRenderingIndex(unittest.TestCase):
             places=7)
 
 
+class TestMultiColourRenderingIndex(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.multi_colour_rendering_index`
+    definition unit tests methods.
+    """
+
+    def test_multi_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.multi_colour_rendering_index`
+        definition.
+        """
+
+        spds = [
+            ILLUMINANTS_RELATIVE_SPDS['F1'], ILLUMINANTS_RELATIVE_SPDS['F2'],
+            ILLUMINANTS_RELATIVE_SPDS['F7'],
+            SpectralPowerDistribution(SAMPLE_SPD_DATA)
+        ]
+        mspd = MultiSpectralPowerDistribution(
+            tstack([spd.values for spd in spds]),
+            spds[0].wavelengths,
+            labels=['F1', 'F2', 'F7', 'Sample'])
+
+        for chunk_size in (1, 3, 4096):
+            specification = multi_colour_rendering_index(mspd, chunk_size)
+
+            self.assertListEqual(
+                list(specification['name']), ['F1', 'F2', 'F7', 'Sample'])
+            self.assertTupleEqual(specification['Q_as'].shape, (4, 14))
+
+            np.testing.assert_almost_equal(
+                specification['Q_a'][[1, 3]],
+                np.array([64.151520202968015, 70.805386570659394]),
+                decimal=7)
+
+            for i, spd in enumerate(spds):
+                reference = colour_rendering_index(spd, additional_data=True)
+                self.assertAlmostEqual(
+                    specification['Q_a'][i], reference.Q_a, places=7)
+                np.testing.assert_almost_equal(
+                    specification['Q_as'][i],
+                    [reference.Q_as[j].Q_a for j in sorted(reference.Q_as)],
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,17 +18,29 @@ from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
 from .dataset import *  # noqa
 from . import dataset
-from .meng2015 import XYZ_to_spectral_Meng2015
-from .smits1999 import RGB_to_spectral_Smits1999
+from .meng2015 import (XYZ_to_spectral_values_Meng2015,
+                       XYZ_to_spectral_Meng2015)
+from .smits1999 import (RGB_to_spectral_values_Smits1999,
+                        RGB_to_spectral_Smits1999)
+from .upsampling_table import (
+    SpectralUpsamplingTable, generate_spectral_upsampling_table,
+    read_spectral_upsampling_table, write_spectral_upsampling_table,
+    XYZ_to_spectral_UpsamplingTable)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['XYZ_to_spectral_Meng2015']
-__all__ += ['RGB_to_spectral_Smits1999']
+__all__ += ['XYZ_to_spectral_values_Meng2015', 'XYZ_to_spectral_Meng2015']
+__all__ += ['RGB_to_spectral_values_Smits1999', 'RGB_to_spectral_Smits1999']
+__all__ += [
+    'SpectralUpsamplingTable', 'generate_spectral_upsampling_table',
+    'read_spectral_upsampling_table', 'write_spectral_upsampling_table',
+    'XYZ_to_spectral_UpsamplingTable'
+]
 
 REFLECTANCE_RECOVERY_METHODS = CaseInsensitiveMapping({
     'Meng 2015': XYZ_to_spectral_Meng2015,
     'Smits 1999': RGB_to_spectral_Smits1999,
+    'Upsampling Table': XYZ_to_spectral_UpsamplingTable,
 })
 REFLECTANCE_RECOVERY_METHODS.__doc__ = """
 Supported reflectance recovery methods.
@@ -39,7 +51,7 @@ References
 -   :cite:`Smits1999a`
 
 REFLECTANCE_RECOVERY_METHODS : CaseInsensitiveMapping
-    **{'Meng 2015', 'Smits 1999'}**
+    **{'Meng 2015', 'Smits 1999', 'Upsampling Table'}**
 """
 
 
@@ -54,7 +66,7 @@ def XYZ_to_spectral(XYZ, method='Meng 2015', **kwargs):
         *CIE XYZ* tristimulus values to recover the spectral power distribution
         from.
     method : unicode, optional
-        **{'Meng 2015', 'Smits 1999'}**,
+        **{'Meng 2015', 'Smits 1999', 'Upsampling Table'}**,
         Computation method.
 
     Other Parameters
@@ -73,6 +85,19 @@ def XYZ_to_spectral(XYZ, method='Meng 2015', **kwargs):
     maximum_iterations : int, optional
         {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
         Maximum number of iterations to perform.
+    processes : integer, optional
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        Workers count solving the bounded problems.
+    executor : unicode, optional
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        **{'Process', 'Thread'}**,
+        Workers type, processes or threads.
+    bounds : array_like, optional
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        Recovered spectral values bounds, before scaling to percents.
+    table : SpectralUpsamplingTable, optional
+        {:func:`colour.recovery.XYZ_to_spectral_UpsamplingTable`},
+        Spectral upsampling table.
 
     Returns
     -------
@@ -101,60 +126,60 @@ def XYZ_to_spectral(XYZ, method='Meng 2015', **kwargs):
     >>> spd = XYZ_to_spectral(XYZ, interval=10)
     >>> with numpy_print_options(suppress=True):
     ...     spd  # doctest: +ELLIPSIS
-    SpectralPowerDistribution([[ 360.        ,    0.0788075...],
-                               [ 370.        ,    0.0788543...],
-                               [ 380.        ,    0.0788825...],
-                               [ 390.        ,    0.0788714...],
-                               [ 400.        ,    0.0788911...],
-                               [ 410.        ,    0.07893  ...],
-                               [ 420.        ,    0.0797471...],
-                               [ 430.        ,    0.0813339...],
-                               [ 440.        ,    0.0840145...],
-                               [ 450.        ,    0.0892826...],
-                               [ 460.        ,    0.0965359...],
-                               [ 470.        ,    0.1053176...],
-                               [ 480.        ,    0.1150921...],
-                               [ 490.        ,    0.1244252...],
-                               [ 500.        ,    0.1326083...],
-                               [ 510.        ,    0.1390282...],
-                               [ 520.        ,    0.1423548...],
-                               [ 530.        ,    0.1414636...],
-                               [ 540.        ,    0.1365195...],
-                               [ 550.        ,    0.1277319...],
-                               [ 560.        ,    0.1152622...],
-                               [ 570.        ,    0.1004513...],
-                               [ 580.        ,    0.0844187...],
-                               [ 590.        ,    0.0686863...],
-                               [ 600.        ,    0.0543013...],
-                               [ 610.        ,    0.0423486...],
-                               [ 620.        ,    0.0333861...],
-                               [ 630.        ,    0.0273558...],
-                               [ 640.        ,    0.0233407...],
-                               [ 650.        ,    0.0211208...],
-                               [ 660.        ,    0.0197248...],
-                               [ 670.        ,    0.0187157...],
-                               [ 680.        ,    0.0181510...],
-                               [ 690.        ,    0.0179691...],
-                               [ 700.        ,    0.0179247...],
-                               [ 710.        ,    0.0178665...],
-                               [ 720.        ,    0.0178005...],
-                               [ 730.        ,    0.0177570...],
-                               [ 740.        ,    0.0177090...],
-                               [ 750.        ,    0.0175743...],
-                               [ 760.        ,    0.0175058...],
-                               [ 770.        ,    0.0174492...],
-                               [ 780.        ,    0.0174984...],
-                               [ 790.        ,    0.0175667...],
-                               [ 800.        ,    0.0175657...],
-                               [ 810.        ,    0.0175319...],
-                               [ 820.        ,    0.0175184...],
-                               [ 830.        ,    0.0175390...]],
+    SpectralPowerDistribution([[ 360.        ,    0.0793194...],
+                               [ 370.        ,    0.0793202...],
+                               [ 380.        ,    0.0793237...],
+                               [ 390.        ,    0.0793358...],
+                               [ 400.        ,    0.0793748...],
+                               [ 410.        ,    0.0795047...],
+                               [ 420.        ,    0.0799108...],
+                               [ 430.        ,    0.0811692...],
+                               [ 440.        ,    0.0842114...],
+                               [ 450.        ,    0.0893938...],
+                               [ 460.        ,    0.0965556...],
+                               [ 470.        ,    0.1052798...],
+                               [ 480.        ,    0.1147637...],
+                               [ 490.        ,    0.1240647...],
+                               [ 500.        ,    0.1323426...],
+                               [ 510.        ,    0.1387131...],
+                               [ 520.        ,    0.1420931...],
+                               [ 530.        ,    0.1415352...],
+                               [ 540.        ,    0.1367208...],
+                               [ 550.        ,    0.1278337...],
+                               [ 560.        ,    0.1154785...],
+                               [ 570.        ,    0.1006174...],
+                               [ 580.        ,    0.0845141...],
+                               [ 590.        ,    0.0685901...],
+                               [ 600.        ,    0.0541914...],
+                               [ 610.        ,    0.0423002...],
+                               [ 620.        ,    0.0333397...],
+                               [ 630.        ,    0.0271674...],
+                               [ 640.        ,    0.0232218...],
+                               [ 650.        ,    0.0208883...],
+                               [ 660.        ,    0.0195981...],
+                               [ 670.        ,    0.0189223...],
+                               [ 680.        ,    0.0185742...],
+                               [ 690.        ,    0.0184021...],
+                               [ 700.        ,    0.0183158...],
+                               [ 710.        ,    0.0182724...],
+                               [ 720.        ,    0.0182509...],
+                               [ 730.        ,    0.0182403...],
+                               [ 740.        ,    0.0182352...],
+                               [ 750.        ,    0.0182327...],
+                               [ 760.        ,    0.0182315...],
+                               [ 770.        ,    0.0182308...],
+                               [ 780.        ,    0.0182305...],
+                               [ 790.        ,    0.0182304...],
+                               [ 800.        ,    0.0182303...],
+                               [ 810.        ,    0.0182303...],
+                               [ 820.        ,    0.0182303...],
+                               [ 830.        ,    0.0182303...]],
                               interpolator=SpragueInterpolator,
                               interpolator_args={},
                               extrapolator=Extrapolator,
                               extrapolator_args={...})
     >>> spectral_to_XYZ_integration(spd) / 100  # doctest: +ELLIPSIS
-    array([ 0.0705100...,  0.1007987...,  0.0956738...])
+    array([ 0.0705100...,  0.1007986...,  0.0956738...])
 
     *Smits (1999)* reflectance recovery:
 
@@ -177,6 +202,14 @@ def XYZ_to_spectral(XYZ, method='Meng 2015', **kwargs):
                               extrapolator_args={...})
     >>> spectral_to_XYZ_integration(spd) / 100  # doctest: +ELLIPSIS
     array([ 0.0753341...,  0.1054586...,  0.0977855...])
+
+    Spectral upsampling table reflectance recovery:
+
+    >>> from colour.recovery import generate_spectral_upsampling_table
+    >>> table = generate_spectral_upsampling_table(resolution=3)
+    >>> spd = XYZ_to_spectral(XYZ, method='Upsampling Table', table=table)
+    >>> spd[550]  # doctest: +ELLIPSIS
+    0.1340937...
     """
 
     a = np.asarray(XYZ)
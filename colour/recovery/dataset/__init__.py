@@ -3,5 +3,7 @@
 from __future__ import absolute_import
 
 from .smits1999 import SMITS_1999_SPDS
+from .upsampling_table import SPECTRAL_UPSAMPLING_TABLE_PATH
 
 __all__ = ['SMITS_1999_SPDS']
+__all__ += ['SPECTRAL_UPSAMPLING_TABLE_PATH']
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Spectral Upsampling Table - Reflectance Recovery Dataset
+========================================================
+
+Defines the dataset for reflectance recovery using a spectral upsampling
+table.
+
+References
+----------
+-   :cite:`Meng2015c` : Meng, J., Simon, F., Hanika, J., & Dachsbacher, C.
+    (2015). Physically Meaningful Rendering using Tristimulus Colours.
+    Computer Graphics Forum, 34(4), 31-40. doi:10.1111/cgf.12676
+"""
+
+from __future__ import division, unicode_literals
+
+import os
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SPECTRAL_UPSAMPLING_TABLE_PATH']
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+SPECTRAL_UPSAMPLING_TABLE_PATH = os.path.join(
+    RESOURCES_DIRECTORY, 'spectral_upsampling_table_sRGB.npz')
+"""
+Default spectral upsampling table path, the table is generated for *sRGB*
+colourspace with :func:`colour.recovery.generate_spectral_upsampling_table`
+definition default arguments and written with
+:func:`colour.recovery.write_spectral_upsampling_table` definition.
+
+References
+----------
+-   :cite:`Meng2015c`
+
+SPECTRAL_UPSAMPLING_TABLE_PATH : unicode
+"""
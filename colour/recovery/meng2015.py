@@ -6,6 +6,7 @@ Meng et al. (2015) - Reflectance Recovery
 Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
+-   :func:`colour.recovery.XYZ_to_spectral_values_Meng2015`
 -   :func:`colour.recovery.XYZ_to_spectral_Meng2015`
 
 See Also
@@ -23,12 +24,16 @@ References
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
+import multiprocessing.pool
 import numpy as np
 from scipy.optimize import minimize
 
-from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
-                                SpectralPowerDistribution, SpectralShape,
-                                ones_spd, spectral_to_XYZ_integration)
+from colour.colorimetry import (
+    STANDARD_OBSERVERS_CMFS, MultiSpectralPowerDistribution,
+    SpectralPowerDistribution, SpectralShape, ones_spd)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import LRUCache, ndarray_digest
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,7 +42,280 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XYZ_to_spectral_Meng2015']
+__all__ = [
+    'MENG2015_BOUNDS', 'XYZ_to_spectral_values_Meng2015',
+    'XYZ_to_spectral_Meng2015'
+]
+
+MENG2015_BOUNDS = np.array([0, 1000])
+"""
+*Meng et alii (2015)* method recovered spectral values bounds, before scaling
+to percents.
+
+MENG2015_BOUNDS : ndarray
+"""
+
+_MENG2015_PROBLEMS_CACHE = LRUCache(maxsize=8)
+
+
+def _Meng2015_problem(cmfs, interval):
+    """
+    Returns the *Meng et alii (2015)* method problem matrices for given colour
+    matching functions and wavelength range interval, the matrices are cached
+    in the :attr:`colour.recovery.meng2015._MENG2015_PROBLEMS_CACHE` bounded
+    least recently used cache.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric
+        Wavelength :math:`\lambda_{i}` range interval in nm.
+
+    Returns
+    -------
+    tuple
+        Wavelengths :math:`\lambda_{i}`, weighted colour matching functions
+        matrix :math:`M` of shape (3, W) converting spectral values to
+        *CIE XYZ* tristimulus values and closed-form solution matrix :math:`P`
+        of shape (W, 3) minimising the objective function under the
+        :math:`M\cdot a=XYZ` constraint without bounds.
+
+    Notes
+    -----
+    -   The weighted colour matching functions matrix is equivalent to
+        :func:`colour.colorimetry.spectral_to_XYZ_integration` definition with
+        an equal energy illuminant.
+    -   The objective function :math:`a^T\cdot D^T\cdot D\cdot a`, where
+        :math:`D` is the first differences matrix, being quadratic and the
+        constraint linear, the closed-form solution matrix is extracted from
+        the inverse of the *Karush-Kuhn-Tucker* system matrix.
+    """
+
+    key = (ndarray_digest(cmfs.wavelengths, cmfs.values), interval)
+    try:
+        return _MENG2015_PROBLEMS_CACHE[key]
+    except KeyError:
+        pass
+
+    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+    cmfs = cmfs.copy().align(shape)
+    illuminant = ones_spd(shape)
+
+    S = illuminant.values
+    dw = cmfs.shape.interval
+    k = 100 / (np.sum(cmfs.values[..., 1] * S) * dw)
+
+    M = k * np.transpose(cmfs.values * S[..., np.newaxis] * dw)
+
+    bins = M.shape[-1]
+    D = np.diff(np.identity(bins), axis=0)
+    K = np.vstack([
+        np.hstack([2 * np.dot(np.transpose(D), D), np.transpose(M)]),
+        np.hstack([M, np.zeros((3, 3))]),
+    ])
+    P = np.linalg.solve(K, np.vstack([np.zeros((bins, 3)),
+                                      np.identity(3)]))[:bins]
+
+    problem = _MENG2015_PROBLEMS_CACHE[key] = (cmfs.wavelengths, M, P)
+
+    return problem
+
+
+def _objective_function_Meng2015(a):
+    """
+    *Meng et alii (2015)* method objective function, i.e. the spectral values
+    smoothness.
+    """
+
+    return np.sum(np.diff(a) ** 2)
+
+
+def _objective_function_jacobian_Meng2015(a):
+    """
+    *Meng et alii (2015)* method objective function analytic *Jacobian*.
+    """
+
+    d = 2 * np.diff(a)
+
+    J = np.zeros(a.shape)
+    J[:-1] -= d
+    J[1:] += d
+
+    return J
+
+
+def _solve_Meng2015(arguments):
+    """
+    Solves the *Meng et alii (2015)* method problem for given *CIE XYZ*
+    tristimulus values with *Sequential Least SQuares Programming* (SLSQP)
+    method.
+
+    Parameters
+    ----------
+    arguments : tuple
+        *CIE XYZ* tristimulus values, initial spectral values, weighted colour
+        matching functions matrix, spectral values bounds, tolerance and
+        maximum iterations count.
+
+    Returns
+    -------
+    ndarray
+        Spectral values.
+    """
+
+    XYZ, a_0, M, bounds, tolerance, maximum_iterations = arguments
+
+    constraints = {
+        'type': 'eq',
+        'fun': lambda a: np.dot(M, a) - XYZ,
+        'jac': lambda a: M
+    }
+
+    bounds = np.tile(bounds, (a_0.size, 1))
+
+    result = minimize(
+        _objective_function_Meng2015,
+        a_0,
+        jac=_objective_function_jacobian_Meng2015,
+        method='SLSQP',
+        constraints=constraints,
+        bounds=bounds,
+        options={'ftol': tolerance,
+                 'maxiter': maximum_iterations})
+
+    if not result.success:
+        raise RuntimeError(
+            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
+                XYZ, result.nit, result.message))
+
+    return result.x
+
+
+def XYZ_to_spectral_values_Meng2015(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5,
+        tolerance=1e-10,
+        maximum_iterations=2000,
+        processes=1,
+        executor='Process',
+        bounds=MENG2015_BOUNDS):
+    """
+    Recovers the spectral values of given *CIE XYZ* tristimulus values using
+    *Meng et alii (2015)* method.
+
+    The problem being a quadratic objective function under a linear
+    constraint, it is first solved in closed-form for all the *CIE XYZ*
+    tristimulus values at once. The spectral values violating the bounds are
+    then solved with *Sequential Least SQuares Programming* (SLSQP) method,
+    using analytic *Jacobians* and warm-started from the closed-form solution
+    clipped to the bounds.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm. The smaller
+        ``interval`` is, the longer the computations will be.
+    tolerance : numeric, optional
+        Tolerance for termination. The lower ``tolerance`` is, the smoother
+        the recovered spectral values will be.
+    maximum_iterations : int, optional
+        Maximum number of iterations to perform.
+    processes : integer, optional
+        Workers count solving the bounded problems, 1 by default,
+        :func:`multiprocessing.cpu_count` definition if *None* or 0, the
+        problems are solved in the current process if equal to 1.
+    executor : unicode, optional
+        **{'Process', 'Thread'}**,
+        Workers type, processes or threads.
+    bounds : array_like, optional
+        Recovered spectral values bounds, before scaling to percents, e.g.
+        ``np.array([0, 0.01])`` bounds the recovered spectral values to
+        domain [0, 1].
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral values sampled at the wavelengths of the colour
+        matching functions range with given ``interval``.
+
+    Raises
+    ------
+    RuntimeError
+        If the optimization fails for any of the *CIE XYZ* tristimulus values.
+
+    Notes
+    -----
+    -   Input *CIE XYZ* tristimulus values are in domain [0, 1].
+    -   The closed-form solution is the solution of the bounded problem when
+        it satisfies the bounds, this is the case of most of the non-saturated
+        *CIE XYZ* tristimulus values. The closed-form solution of the closest
+        solved neighbour corrected for the tristimulus values difference is
+        the closed-form solution itself, it is thus the warm-start used.
+
+    References
+    ----------
+    -   :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+    ...                 [0.20654008, 0.12197225, 0.05136952]])
+    >>> values = XYZ_to_spectral_values_Meng2015(XYZ, interval=10)
+    >>> values.shape
+    (2, 48)
+    >>> values[..., 20] * 100  # doctest: +ELLIPSIS
+    array([ 11.5478...,   7.7265...])
+    """
+
+    if executor.lower() not in ('process', 'thread'):
+        raise ValueError(
+            '"{0}" executor is invalid, it must be one of '
+            '{{"Process", "Thread"}}!'.format(executor))
+
+    XYZ = np.asarray(XYZ)
+    shape = XYZ.shape
+
+    _wavelengths, M, P = _Meng2015_problem(cmfs, interval)
+
+    bounds = np.asarray(bounds, dtype=DEFAULT_FLOAT_DTYPE)
+
+    XYZ = np.reshape(XYZ, (-1, 3))
+    a = np.dot(XYZ, np.transpose(P))
+
+    # Closed-form solutions lying on the bounds, e.g. the perfect reflecting
+    # diffuser for a [0, 1] domain, exceed them by rounding errors only, they
+    # are clipped rather than solved.
+    epsilon = np.finfo(DEFAULT_FLOAT_DTYPE).eps * 1e3 * np.max(np.abs(bounds))
+    bounded = np.any(
+        np.logical_or(a < bounds[0] - epsilon, a > bounds[1] + epsilon),
+        axis=-1)
+    a = np.clip(a, *bounds)
+
+    arguments = [(XYZ_b, a_b, M, bounds, tolerance, maximum_iterations)
+                 for XYZ_b, a_b in zip(XYZ[bounded], a[bounded])]
+
+    workers = processes if processes else multiprocessing.cpu_count()
+    if workers == 1 or len(arguments) <= 1:
+        solutions = [_solve_Meng2015(argument) for argument in arguments]
+    else:
+        pool = (multiprocessing.Pool(processes=workers)
+                if executor.lower() == 'process' else
+                multiprocessing.pool.ThreadPool(processes=workers))
+        try:
+            solutions = pool.map(_solve_Meng2015, arguments)
+        finally:
+            pool.terminate()
+
+    if solutions:
+        a[bounded] = solutions
+
+    return np.reshape(a * 100, shape[:-1] + (a.shape[-1], ))
 
 
 def XYZ_to_spectral_Meng2015(
@@ -45,14 +323,17 @@ def XYZ_to_spectral_Meng2015(
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
         interval=5,
         tolerance=1e-10,
-        maximum_iterations=2000):
+        maximum_iterations=2000,
+        processes=1,
+        executor='Process',
+        bounds=MENG2015_BOUNDS):
     """
     Recovers the spectral power distribution of given *CIE XYZ* tristimulus
     values using *Meng et alii (2015)* method.
 
     Parameters
     ----------
-    XYZ : array_like, (3,)
+    XYZ : array_like, (..., 3)
         *CIE XYZ* tristimulus values to recover the spectral power distribution
         from.
     cmfs : XYZ_ColourMatchingFunctions
@@ -65,11 +346,30 @@ def XYZ_to_spectral_Meng2015(
         the recovered spectral power distribution will be.
     maximum_iterations : int, optional
         Maximum number of iterations to perform.
+    processes : integer, optional
+        Workers count solving the bounded problems, 1 by default,
+        :func:`multiprocessing.cpu_count` definition if *None* or 0, the
+        problems are solved in the current process if equal to 1.
+    executor : unicode, optional
+        **{'Process', 'Thread'}**,
+        Workers type, processes or threads.
+    bounds : array_like, optional
+        Recovered spectral values bounds, before scaling to percents, e.g.
+        ``np.array([0, 0.01])`` bounds the recovered spectral values to
+        domain [0, 1].
 
     Returns
     -------
-    SpectralPowerDistribution
-        Recovered spectral power distribution.
+    SpectralPowerDistribution or MultiSpectralPowerDistribution
+        Recovered spectral power distribution if given a single *CIE XYZ*
+        tristimulus values array, multi-spectral power distribution holding
+        one recovered spectral power distribution per *CIE XYZ* tristimulus
+        values array otherwise.
+
+    Raises
+    ------
+    RuntimeError
+        If the optimization fails for any of the *CIE XYZ* tristimulus values.
 
     Notes
     -----
@@ -78,6 +378,8 @@ def XYZ_to_spectral_Meng2015(
         definition because it processes any measurement interval opposed to
         :func:`colour.colorimetry.spectral_to_XYZ_ASTME30815` definition that
         handles only measurement interval of 1, 5, 10 or 20nm.
+    -   The spectral power distributions are recovered with
+        :func:`colour.recovery.XYZ_to_spectral_values_Meng2015` definition.
 
     References
     ----------
@@ -85,110 +387,81 @@ def XYZ_to_spectral_Meng2015(
 
     Examples
     --------
+    >>> from colour.colorimetry import spectral_to_XYZ_integration
     >>> from colour.utilities import numpy_print_options
     >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
     >>> spd = XYZ_to_spectral_Meng2015(XYZ, interval=10)
     >>> with numpy_print_options(suppress=True):
     ...     spd  # doctest: +ELLIPSIS
-    SpectralPowerDistribution([[ 360.        ,    0.0788075...],
-                               [ 370.        ,    0.0788543...],
-                               [ 380.        ,    0.0788825...],
-                               [ 390.        ,    0.0788714...],
-                               [ 400.        ,    0.0788911...],
-                               [ 410.        ,    0.07893  ...],
-                               [ 420.        ,    0.0797471...],
-                               [ 430.        ,    0.0813339...],
-                               [ 440.        ,    0.0840145...],
-                               [ 450.        ,    0.0892826...],
-                               [ 460.        ,    0.0965359...],
-                               [ 470.        ,    0.1053176...],
-                               [ 480.        ,    0.1150921...],
-                               [ 490.        ,    0.1244252...],
-                               [ 500.        ,    0.1326083...],
-                               [ 510.        ,    0.1390282...],
-                               [ 520.        ,    0.1423548...],
-                               [ 530.        ,    0.1414636...],
-                               [ 540.        ,    0.1365195...],
-                               [ 550.        ,    0.1277319...],
-                               [ 560.        ,    0.1152622...],
-                               [ 570.        ,    0.1004513...],
-                               [ 580.        ,    0.0844187...],
-                               [ 590.        ,    0.0686863...],
-                               [ 600.        ,    0.0543013...],
-                               [ 610.        ,    0.0423486...],
-                               [ 620.        ,    0.0333861...],
-                               [ 630.        ,    0.0273558...],
-                               [ 640.        ,    0.0233407...],
-                               [ 650.        ,    0.0211208...],
-                               [ 660.        ,    0.0197248...],
-                               [ 670.        ,    0.0187157...],
-                               [ 680.        ,    0.0181510...],
-                               [ 690.        ,    0.0179691...],
-                               [ 700.        ,    0.0179247...],
-                               [ 710.        ,    0.0178665...],
-                               [ 720.        ,    0.0178005...],
-                               [ 730.        ,    0.0177570...],
-                               [ 740.        ,    0.0177090...],
-                               [ 750.        ,    0.0175743...],
-                               [ 760.        ,    0.0175058...],
-                               [ 770.        ,    0.0174492...],
-                               [ 780.        ,    0.0174984...],
-                               [ 790.        ,    0.0175667...],
-                               [ 800.        ,    0.0175657...],
-                               [ 810.        ,    0.0175319...],
-                               [ 820.        ,    0.0175184...],
-                               [ 830.        ,    0.0175390...]],
+    SpectralPowerDistribution([[ 360.        ,    0.0793194...],
+                               [ 370.        ,    0.0793202...],
+                               [ 380.        ,    0.0793237...],
+                               [ 390.        ,    0.0793358...],
+                               [ 400.        ,    0.0793748...],
+                               [ 410.        ,    0.0795047...],
+                               [ 420.        ,    0.0799108...],
+                               [ 430.        ,    0.0811692...],
+                               [ 440.        ,    0.0842114...],
+                               [ 450.        ,    0.0893938...],
+                               [ 460.        ,    0.0965556...],
+                               [ 470.        ,    0.1052798...],
+                               [ 480.        ,    0.1147637...],
+                               [ 490.        ,    0.1240647...],
+                               [ 500.        ,    0.1323426...],
+                               [ 510.        ,    0.1387131...],
+                               [ 520.        ,    0.1420931...],
+                               [ 530.        ,    0.1415352...],
+                               [ 540.        ,    0.1367208...],
+                               [ 550.        ,    0.1278337...],
+                               [ 560.        ,    0.1154785...],
+                               [ 570.        ,    0.1006174...],
+                               [ 580.        ,    0.0845141...],
+                               [ 590.        ,    0.0685901...],
+                               [ 600.        ,    0.0541914...],
+                               [ 610.        ,    0.0423002...],
+                               [ 620.        ,    0.0333397...],
+                               [ 630.        ,    0.0271674...],
+                               [ 640.        ,    0.0232218...],
+                               [ 650.        ,    0.0208883...],
+                               [ 660.        ,    0.0195981...],
+                               [ 670.        ,    0.0189223...],
+                               [ 680.        ,    0.0185742...],
+                               [ 690.        ,    0.0184021...],
+                               [ 700.        ,    0.0183158...],
+                               [ 710.        ,    0.0182724...],
+                               [ 720.        ,    0.0182509...],
+                               [ 730.        ,    0.0182403...],
+                               [ 740.        ,    0.0182352...],
+                               [ 750.        ,    0.0182327...],
+                               [ 760.        ,    0.0182315...],
+                               [ 770.        ,    0.0182308...],
+                               [ 780.        ,    0.0182305...],
+                               [ 790.        ,    0.0182304...],
+                               [ 800.        ,    0.0182303...],
+                               [ 810.        ,    0.0182303...],
+                               [ 820.        ,    0.0182303...],
+                               [ 830.        ,    0.0182303...]],
                               interpolator=SpragueInterpolator,
                               interpolator_args={},
                               extrapolator=Extrapolator,
                               extrapolator_args={...})
     >>> spectral_to_XYZ_integration(spd) / 100  # doctest: +ELLIPSIS
-    array([ 0.0705100...,  0.1007987...,  0.0956738...])
+    array([ 0.0705100...,  0.1007986...,  0.0956738...])
     """
 
     XYZ = np.asarray(XYZ)
-    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
-    cmfs = cmfs.copy().align(shape)
-    illuminant = ones_spd(shape)
-    spd = ones_spd(shape)
-
-    def function_objective(a):
-        """
-        Objective function.
-        """
 
-        return np.sum(np.diff(a) ** 2)
-
-    def function_constraint(a):
-        """
-        Function defining the constraint.
-        """
-
-        spd[:] = a
-        return spectral_to_XYZ_integration(
-            spd, cmfs=cmfs, illuminant=illuminant) - XYZ
-
-    wavelengths = spd.wavelengths
-    bins = wavelengths.size
-
-    constraints = {'type': 'eq', 'fun': function_constraint}
-
-    bounds = np.tile(np.array([0, 1000]), (bins, 1))
-
-    result = minimize(
-        function_objective,
-        spd.values,
-        method='SLSQP',
-        constraints=constraints,
-        bounds=bounds,
-        options={'ftol': tolerance,
-                 'maxiter': maximum_iterations})
-
-    if not result.success:
-        raise RuntimeError(
-            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
-                XYZ, result.nit, result.message))
+    wavelengths, _M, _P = _Meng2015_problem(cmfs, interval)
+    values = XYZ_to_spectral_values_Meng2015(
+        XYZ, cmfs, interval, tolerance, maximum_iterations, processes,
+        executor, bounds)
 
-    return SpectralPowerDistribution(
-        dict(zip(wavelengths, result.x * 100)),
-        name='Meng (2015) - {0}'.format(XYZ))
+    if XYZ.ndim == 1:
+        return SpectralPowerDistribution(
+            dict(zip(wavelengths, values)),
+            name='Meng (2015) - {0}'.format(XYZ))
+    else:
+        return MultiSpectralPowerDistribution(
+            np.transpose(np.reshape(values, (-1, values.shape[-1]))),
+            wavelengths,
+            name='Meng (2015)')
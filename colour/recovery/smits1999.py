@@ -22,10 +22,11 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import ILLUMINANTS
+from colour.colorimetry import ILLUMINANTS, MultiSpectralPowerDistribution
 from colour.models import (XYZ_to_RGB, normalised_primary_matrix,
                            sRGB_COLOURSPACE)
 from colour.recovery import SMITS_1999_SPDS
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,7 +37,8 @@ __status__ = 'Production'
 
 __all__ = [
     'SMITS1999_PRIMARIES', 'SMITS1999_WHITEPOINT',
-    'SMITS1999_XYZ_TO_RGB_MATRIX', 'XYZ_to_RGB_Smits1999',
+    'SMITS1999_XYZ_TO_RGB_MATRIX', 'SMITS1999_BASIS_SPDS_NAMES',
+    'XYZ_to_RGB_Smits1999', 'RGB_to_spectral_values_Smits1999',
     'RGB_to_spectral_Smits1999'
 ]
 
@@ -64,6 +66,17 @@ Current *Smits (1999)* method implementation *RGB* colourspace to
 SMITS1999_XYZ_TO_RGB_MATRIX : array_like, (3, 3)
 """
 
+SMITS1999_BASIS_SPDS_NAMES = ('white', 'cyan', 'magenta', 'yellow', 'red',
+                              'green', 'blue')
+"""
+*Smits (1999)* method basis spectral power distributions names, ordered as
+the rows of the basis matrix.
+
+SMITS1999_BASIS_SPDS_NAMES : tuple
+"""
+
+_SMITS1999_BASIS_CACHE = None
+
 
 def XYZ_to_RGB_Smits1999(XYZ):
     """
@@ -100,6 +113,101 @@ def XYZ_to_RGB_Smits1999(XYZ):
         encoding_cctf=None)
 
 
+def _smits1999_basis():
+    """
+    Returns the *Smits (1999)* method basis spectral power distributions
+    wavelengths and values stacked into a matrix, the matrix is computed once
+    and cached.
+
+    Returns
+    -------
+    tuple
+        Basis wavelengths :math:`\lambda` and values matrix of shape
+        (7, W), the rows ordered as
+        :attr:`colour.recovery.smits1999.SMITS1999_BASIS_SPDS_NAMES`
+        attribute.
+    """
+
+    global _SMITS1999_BASIS_CACHE
+
+    if _SMITS1999_BASIS_CACHE is None:
+        _SMITS1999_BASIS_CACHE = (
+            SMITS_1999_SPDS['white'].wavelengths,
+            np.vstack([
+                SMITS_1999_SPDS[name].values
+                for name in SMITS1999_BASIS_SPDS_NAMES
+            ]))
+
+    return _SMITS1999_BASIS_CACHE
+
+
+def RGB_to_spectral_values_Smits1999(RGB):
+    """
+    Recovers the spectral values of given *RGB* colourspace array using
+    *Smits (1999)* method.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array to recover the spectral values from.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral values sampled at the *Smits (1999)* method basis
+        spectral power distributions wavelengths.
+
+    Notes
+    -----
+    -   The weights of the basis spectral power distributions are selected
+        with masks for the whole array at once, the recovered spectral values
+        are then a single matrix product with the basis matrix.
+
+    References
+    ----------
+    -   :cite:`Smits1999a`
+
+    Examples
+    --------
+    >>> RGB = np.array([0.02144962, 0.13154603, 0.09287601])
+    >>> RGB_to_spectral_values_Smits1999(RGB)  # doctest: +ELLIPSIS
+    array([ 0.0908046...,  0.0887761...,  0.0939795...,  0.1236033...,
+            0.1315788...,  0.1293411...,  0.0392680...,  0.0214496...,
+            0.0214496...,  0.0215463...])
+    >>> RGB = np.tile(RGB, (4, 3, 1))
+    >>> RGB_to_spectral_values_Smits1999(RGB).shape
+    (4, 3, 10)
+    """
+
+    R, G, B = tsplit(RGB)
+    R, G, B = np.asarray(R), np.asarray(G), np.asarray(B)
+
+    R_m = np.logical_and(R <= G, R <= B)
+    G_m = np.logical_and(~R_m, np.logical_and(G <= R, G <= B))
+    B_m = np.logical_and(~R_m, ~G_m)
+
+    # Weights of the "white", "cyan", "magenta", "yellow", "red", "green" and
+    # "blue" basis spectral power distributions.
+    zeros = np.zeros(R.shape)
+    W_w = np.select([R_m, G_m], [R, G], B)
+    C_w = np.where(R_m, np.where(G <= B, G - R, B - R), zeros)
+    M_w = np.where(G_m, np.where(R <= B, R - G, B - G), zeros)
+    Y_w = np.where(B_m, np.where(R <= G, R - B, G - B), zeros)
+    R_w = np.select(
+        [np.logical_and(G_m, R > B),
+         np.logical_and(B_m, R > G)], [R - B, R - G], zeros)
+    G_w = np.select(
+        [np.logical_and(R_m, G > B),
+         np.logical_and(B_m, R <= G)], [G - B, G - R], zeros)
+    B_w = np.select(
+        [np.logical_and(R_m, G <= B),
+         np.logical_and(G_m, R <= B)], [B - G, B - R], zeros)
+
+    _wavelengths, basis = _smits1999_basis()
+
+    return np.dot(tstack((W_w, C_w, M_w, Y_w, R_w, G_w, B_w)), basis)
+
+
 def RGB_to_spectral_Smits1999(RGB):
     """
     Recovers the spectral power distribution of given *RGB* colourspace array
@@ -107,14 +215,24 @@ def RGB_to_spectral_Smits1999(RGB):
 
     Parameters
     ----------
-    RGB : array_like, (3,)
+    RGB : array_like, (..., 3)
         *RGB* colourspace array to recover the spectral power distribution
         from.
 
     Returns
     -------
-    SpectralPowerDistribution
-        Recovered spectral power distribution.
+    SpectralPowerDistribution or MultiSpectralPowerDistribution
+        Recovered spectral power distribution if given a single *RGB*
+        colourspace array, multi-spectral power distribution holding one
+        recovered spectral power distribution per *RGB* colourspace array
+        otherwise.
+
+    Notes
+    -----
+    -   The spectral power distributions are recovered with
+        :func:`colour.recovery.RGB_to_spectral_values_Smits1999` definition,
+        it should be preferred to recover large arrays, e.g. images, as it
+        does not construct any spectral power distribution.
 
     References
     ----------
@@ -142,41 +260,25 @@ def RGB_to_spectral_Smits1999(RGB):
                               extrapolator_args={...})
     """
 
-    white_spd = SMITS_1999_SPDS['white'].copy()
-    cyan_spd = SMITS_1999_SPDS['cyan'].copy()
-    magenta_spd = SMITS_1999_SPDS['magenta'].copy()
-    yellow_spd = SMITS_1999_SPDS['yellow'].copy()
-    red_spd = SMITS_1999_SPDS['red'].copy()
-    green_spd = SMITS_1999_SPDS['green'].copy()
-    blue_spd = SMITS_1999_SPDS['blue'].copy()
-
-    R, G, B = np.ravel(RGB)
-    spd = white_spd.copy() * 0
-    spd.name = 'Smits (1999) - {0}'.format(RGB)
-
-    if R <= G and R <= B:
-        spd += white_spd * R
-        if G <= B:
-            spd += cyan_spd * (G - R)
-            spd += blue_spd * (B - G)
-        else:
-            spd += cyan_spd * (B - R)
-            spd += green_spd * (G - B)
-    elif G <= R and G <= B:
-        spd += white_spd * G
-        if R <= B:
-            spd += magenta_spd * (R - G)
-            spd += blue_spd * (B - R)
-        else:
-            spd += magenta_spd * (B - G)
-            spd += red_spd * (R - B)
+    RGB = np.asarray(RGB)
+
+    wavelengths, _basis = _smits1999_basis()
+    values = RGB_to_spectral_values_Smits1999(RGB)
+
+    if RGB.ndim == 1:
+        spd = SMITS_1999_SPDS['white'].copy()
+        spd.name = 'Smits (1999) - {0}'.format(RGB)
+        spd.values = values
+
+        return spd
     else:
-        spd += white_spd * B
-        if R <= G:
-            spd += yellow_spd * (R - B)
-            spd += green_spd * (G - R)
-        else:
-            spd += yellow_spd * (G - B)
-            spd += red_spd * (R - G)
-
-    return spd
+        white_spd = SMITS_1999_SPDS['white']
+
+        return MultiSpectralPowerDistribution(
+            np.transpose(np.reshape(values, (-1, values.shape[-1]))),
+            wavelengths,
+            name='Smits (1999)',
+            interpolator=white_spd.interpolator,
+            interpolator_args=white_spd.interpolator_args,
+            extrapolator=white_spd.extrapolator,
+            extrapolator_args=white_spd.extrapolator_args)
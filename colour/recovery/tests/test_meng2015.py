@@ -8,9 +8,11 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.colorimetry import (STANDARD_OBSERVERS_CMFS, SpectralShape,
-                                spectral_to_XYZ_integration)
-from colour.recovery import XYZ_to_spectral_Meng2015
+from colour.colorimetry import (
+    STANDARD_OBSERVERS_CMFS, MultiSpectralPowerDistribution, SpectralShape,
+    spectral_to_XYZ_integration)
+from colour.recovery import (XYZ_to_spectral_values_Meng2015,
+                             XYZ_to_spectral_Meng2015)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +21,94 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_spectral_Meng2015']
+__all__ = [
+    'TestXYZ_to_spectral_values_Meng2015', 'TestXYZ_to_spectral_Meng2015'
+]
+
+
+class TestXYZ_to_spectral_values_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_spectral_values_Meng2015`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_to_spectral_values_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.\
+XYZ_to_spectral_values_Meng2015` definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+        cmfs_c = cmfs.copy().align(shape)
+
+        # The second and third *CIE XYZ* tristimulus values require bounded
+        # solves.
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.20654008, 0.12197225, 0.05136952],
+            [0.10728000, 0.21456000, 0.03576000],
+        ])
+        values = XYZ_to_spectral_values_Meng2015(XYZ, interval=10)
+
+        self.assertTupleEqual(values.shape, (3, 48))
+        self.assertGreaterEqual(np.min(values), 0)
+
+        for i, XYZ_i in enumerate(XYZ):
+            spd = XYZ_to_spectral_Meng2015(XYZ_i, interval=10)
+            np.testing.assert_almost_equal(values[i], spd.values, decimal=7)
+            np.testing.assert_almost_equal(
+                spectral_to_XYZ_integration(spd, cmfs=cmfs_c) / 100,
+                XYZ_i,
+                decimal=7)
+
+    def test_n_dimensional_XYZ_to_spectral_values_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.\
+XYZ_to_spectral_values_Meng2015` definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        values = XYZ_to_spectral_values_Meng2015(XYZ, interval=10)
+
+        XYZ = np.tile(XYZ, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_values_Meng2015(XYZ, interval=10),
+            values,
+            decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 48))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_values_Meng2015(XYZ, interval=10),
+            values,
+            decimal=7)
+
+    def test_processes_XYZ_to_spectral_values_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.\
+XYZ_to_spectral_values_Meng2015` definition workers consistency.
+        """
+
+        XYZ = np.array([
+            [0.20654008, 0.12197225, 0.05136952],
+            [0.10728000, 0.21456000, 0.03576000],
+            [0.05415000, 0.02166000, 0.28515000],
+        ])
+
+        values = XYZ_to_spectral_values_Meng2015(XYZ, interval=10)
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_values_Meng2015(
+                XYZ, interval=10, processes=2, executor='Thread'),
+            values,
+            decimal=7)
+
+        self.assertRaises(
+            ValueError,
+            XYZ_to_spectral_values_Meng2015,
+            XYZ,
+            executor='Undefined')
 
 
 class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
@@ -69,6 +158,24 @@ class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
             XYZ,
             decimal=7)
 
+    def test_n_dimensional_XYZ_to_spectral_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_Meng2015`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.20654008, 0.12197225, 0.05136952],
+        ])
+        mspd = XYZ_to_spectral_Meng2015(XYZ, interval=10)
+
+        self.assertIsInstance(mspd, MultiSpectralPowerDistribution)
+        np.testing.assert_almost_equal(
+            mspd.values,
+            np.transpose(XYZ_to_spectral_values_Meng2015(XYZ, interval=10)),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,7 +8,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.recovery import RGB_to_spectral_Smits1999
+from colour.colorimetry import MultiSpectralPowerDistribution
+from colour.recovery import (RGB_to_spectral_values_Smits1999,
+                             RGB_to_spectral_Smits1999)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +19,85 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_spectral_Smits1999']
+__all__ = [
+    'TestRGB_to_spectral_values_Smits1999', 'TestRGB_to_spectral_Smits1999'
+]
+
+
+class TestRGB_to_spectral_values_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_values_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(
+                np.array([0.45293517, 0.31732158, 0.26414773])),
+            np.array([
+                0.27787714, 0.27113183, 0.26990663, 0.29932875, 0.31711026,
+                0.31726875, 0.43019862, 0.45275442, 0.45328084, 0.45410503
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(
+                np.array([0.35505307, 0.47995567, 0.61088035])),
+            np.array([
+                0.60725817, 0.60371094, 0.59674004, 0.52330084, 0.47975906,
+                0.47997209, 0.37462711, 0.35988419, 0.36137673, 0.36154693
+            ]),
+            decimal=7)
+
+    def test_n_dimensional_RGB_to_spectral_values_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        values = RGB_to_spectral_values_Smits1999(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(RGB), values, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 10))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(RGB), values, decimal=7)
+
+    def test_branches_RGB_to_spectral_values_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition branches selection consistency
+        with :func:`colour.recovery.smits1999.RGB_to_spectral_Smits1999`
+        definition.
+        """
+
+        RGB = np.array([
+            [0.2, 0.5, 0.8],
+            [0.2, 0.8, 0.5],
+            [0.5, 0.2, 0.8],
+            [0.8, 0.2, 0.5],
+            [0.5, 0.8, 0.2],
+            [0.8, 0.5, 0.2],
+            [0.5, 0.5, 0.5],
+            [0.2, 0.2, 0.5],
+            [0.5, 0.2, 0.2],
+            [0.2, 0.5, 0.2],
+        ])
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(RGB),
+            np.array([RGB_to_spectral_Smits1999(a).values for a in RGB]),
+            decimal=7)
 
 
 class TestRGB_to_spectral_Smits1999(unittest.TestCase):
@@ -59,6 +139,24 @@ class TestRGB_to_spectral_Smits1999(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_n_dimensional_RGB_to_spectral_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_spectral_Smits1999`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([
+            [0.45293517, 0.31732158, 0.26414773],
+            [0.77875824, 0.57726450, 0.50453169],
+        ])
+        mspd = RGB_to_spectral_Smits1999(np.reshape(RGB, (2, 1, 3)))
+
+        self.assertIsInstance(mspd, MultiSpectralPowerDistribution)
+        np.testing.assert_almost_equal(
+            mspd.values,
+            np.transpose(RGB_to_spectral_values_Smits1999(RGB)),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.recovery.upsampling_table` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
+                                MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
+from colour.models import (XYZ_to_xy, normalised_primary_matrix,
+                           sRGB_COLOURSPACE)
+from colour.recovery import (
+    SPECTRAL_UPSAMPLING_TABLE_PATH, SpectralUpsamplingTable,
+    XYZ_to_spectral_values_Meng2015, generate_spectral_upsampling_table,
+    read_spectral_upsampling_table, write_spectral_upsampling_table,
+    XYZ_to_spectral_UpsamplingTable)
+from colour.recovery.meng2015 import _Meng2015_problem
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestSpectralUpsamplingTable', 'TestReadWriteSpectralUpsamplingTable',
+    'TestSpectralUpsamplingTableDataset', 'TestXYZ_to_spectral_UpsamplingTable'
+]
+
+TABLE = generate_spectral_upsampling_table(resolution=5)
+
+
+class TestSpectralUpsamplingTable(unittest.TestCase):
+    """
+    Defines :class:`colour.recovery.upsampling_table.SpectralUpsamplingTable`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('wavelengths', 'values', 'RGB_to_XYZ_matrix',
+                               'XYZ_to_RGB_matrix', 'name', 'resolution')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralUpsamplingTable))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__repr__', 'RGB_to_spectral_values',
+                            'XYZ_to_spectral_values')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralUpsamplingTable))
+
+    def test_RGB_to_spectral_values(self):
+        """
+        Tests :func:`colour.recovery.upsampling_table.\
+SpectralUpsamplingTable.RGB_to_spectral_values` method.
+        """
+
+        self.assertEqual(TABLE.resolution, 5)
+        self.assertTupleEqual(TABLE.values.shape, (5, 5, 5, 48))
+
+        # Grid nodes spectral values are returned as is.
+        RGB = np.array([
+            [0.00, 0.25, 0.50],
+            [1.00, 0.75, 0.00],
+            [1.00, 1.00, 1.00],
+        ])
+        np.testing.assert_almost_equal(
+            TABLE.RGB_to_spectral_values(RGB),
+            np.array([TABLE.values[0, 1, 2], TABLE.values[4, 3, 0],
+                      TABLE.values[4, 4, 4]]),
+            decimal=7)
+
+        # *RGB* colourspace arrays outside the cube are clipped.
+        np.testing.assert_almost_equal(
+            TABLE.RGB_to_spectral_values(np.array([-0.50, 0.25, 1.50])),
+            TABLE.values[0, 1, 4],
+            decimal=7)
+
+    def test_XYZ_to_spectral_values(self):
+        """
+        Tests :func:`colour.recovery.upsampling_table.\
+SpectralUpsamplingTable.XYZ_to_spectral_values` method.
+        """
+
+        _wavelengths, M, _P = _Meng2015_problem(
+            STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+            10)
+
+        prng = np.random.RandomState(4)
+        RGB = prng.random_sample((100, 3))
+        XYZ = np.dot(RGB, np.transpose(TABLE.RGB_to_XYZ_matrix))
+
+        values = TABLE.XYZ_to_spectral_values(XYZ)
+
+        self.assertGreaterEqual(np.min(values), 0)
+        np.testing.assert_almost_equal(
+            np.dot(values / 100, np.transpose(M)), XYZ, decimal=7)
+
+        # Spectral values are close to those of *Meng et alii (2015)* method
+        # with bounded reflectances.
+        np.testing.assert_allclose(
+            values,
+            XYZ_to_spectral_values_Meng2015(
+                XYZ, interval=10, bounds=np.array([0, 0.01])),
+            atol=0.1)
+
+    def test_values(self):
+        """
+        Tests :attr:`colour.recovery.upsampling_table.\
+SpectralUpsamplingTable.values` attribute bounds.
+        """
+
+        self.assertTrue(np.all(TABLE.values >= 0))
+        self.assertTrue(np.all(TABLE.values <= 1))
+
+        np.testing.assert_almost_equal(
+            TABLE.values[-1, -1, -1], np.ones(48), decimal=7)
+
+    def test_n_dimensional_RGB_to_spectral_values(self):
+        """
+        Tests :func:`colour.recovery.upsampling_table.\
+SpectralUpsamplingTable.RGB_to_spectral_values` method n-dimensional arrays
+        support.
+        """
+
+        RGB = np.array([0.02144962, 0.13154603, 0.09287601])
+        values = TABLE.RGB_to_spectral_values(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            TABLE.RGB_to_spectral_values(RGB), values, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 48))
+        np.testing.assert_almost_equal(
+            TABLE.RGB_to_spectral_values(RGB), values, decimal=7)
+
+
+class TestReadWriteSpectralUpsamplingTable(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.upsampling_table.\
+read_spectral_upsampling_table` and
+    :func:`colour.recovery.upsampling_table.write_spectral_upsampling_table`
+    definitions unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_write_spectral_upsampling_table(self):
+        """
+        Tests :func:`colour.recovery.upsampling_table.\
+read_spectral_upsampling_table` and
+        :func:`colour.recovery.upsampling_table.\
+write_spectral_upsampling_table` definitions.
+        """
+
+        path = os.path.join(self._temporary_directory, 'table.npz')
+
+        self.assertTrue(write_spectral_upsampling_table(TABLE, path))
+
+        table = read_spectral_upsampling_table(path)
+        self.assertEqual(table.name, TABLE.name)
+        self.assertEqual(table.values.dtype, np.float32)
+        np.testing.assert_equal(table.wavelengths, TABLE.wavelengths)
+        np.testing.assert_equal(table.RGB_to_XYZ_matrix,
+                                TABLE.RGB_to_XYZ_matrix)
+        np.testing.assert_almost_equal(table.values, TABLE.values, decimal=6)
+
+
+class TestSpectralUpsamplingTableDataset(unittest.TestCase):
+    """
+    Defines :attr:`colour.recovery.dataset.upsampling_table.\
+SPECTRAL_UPSAMPLING_TABLE_PATH` attribute unit tests methods.
+    """
+
+    def test_SPECTRAL_UPSAMPLING_TABLE_PATH(self):
+        """
+        Tests :attr:`colour.recovery.dataset.upsampling_table.\
+SPECTRAL_UPSAMPLING_TABLE_PATH` attribute.
+        """
+
+        table = read_spectral_upsampling_table(SPECTRAL_UPSAMPLING_TABLE_PATH)
+
+        self.assertEqual(table.name, 'sRGB - Meng (2015)')
+        self.assertEqual(table.resolution, 17)
+        np.testing.assert_equal(table.wavelengths, TABLE.wavelengths)
+        self.assertTrue(np.all(table.values >= 0))
+        self.assertTrue(np.all(table.values <= 1))
+
+        _wavelengths, M, _P = _Meng2015_problem(
+            STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+            10)
+        np.testing.assert_almost_equal(
+            table.RGB_to_XYZ_matrix,
+            normalised_primary_matrix(sRGB_COLOURSPACE.primaries,
+                                      XYZ_to_xy(np.sum(M, axis=-1))),
+            decimal=7)
+
+        # Grid nodes shared with the lower resolution table are identical.
+        np.testing.assert_almost_equal(
+            table.values[::4, ::4, ::4], TABLE.values, decimal=5)
+
+
+class TestXYZ_to_spectral_UpsamplingTable(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.upsampling_table.\
+XYZ_to_spectral_UpsamplingTable` definition unit tests methods.
+    """
+
+    def test_XYZ_to_spectral_UpsamplingTable(self):
+        """
+        Tests :func:`colour.recovery.upsampling_table.\
+XYZ_to_spectral_UpsamplingTable` definition.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        spd = XYZ_to_spectral_UpsamplingTable(XYZ, TABLE)
+
+        self.assertIsInstance(spd, SpectralPowerDistribution)
+        np.testing.assert_equal(spd.wavelengths, TABLE.wavelengths)
+        np.testing.assert_almost_equal(
+            spd.values, TABLE.XYZ_to_spectral_values(XYZ), decimal=7)
+
+        XYZ = np.tile(XYZ, (2, 2, 1))
+        mspd = XYZ_to_spectral_UpsamplingTable(XYZ, TABLE)
+
+        self.assertIsInstance(mspd, MultiSpectralPowerDistribution)
+        self.assertTupleEqual(mspd.values.shape, (48, 4))
+
+        table = read_spectral_upsampling_table(SPECTRAL_UPSAMPLING_TABLE_PATH)
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_UpsamplingTable(XYZ).values,
+            table.XYZ_to_spectral_values(XYZ),
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,562 @@
+# -*- coding: utf-8 -*-
+"""
+Spectral Upsampling Table - Reflectance Recovery
+================================================
+
+Defines objects for reflectance recovery using a precomputed spectral
+upsampling table:
+
+-   :class:`colour.recovery.SpectralUpsamplingTable`
+-   :func:`colour.recovery.generate_spectral_upsampling_table`
+-   :func:`colour.recovery.read_spectral_upsampling_table`
+-   :func:`colour.recovery.write_spectral_upsampling_table`
+-   :func:`colour.recovery.XYZ_to_spectral_UpsamplingTable`
+
+The spectral upsampling table samples the *RGB* colourspace cube with a
+regular grid whose nodes hold the spectral values recovered offline with
+*Meng et alii (2015)* method. The spectral values of any *RGB* colourspace
+array are then recovered with a lookup and a trilinear interpolation.
+
+References
+----------
+-   :cite:`Meng2015c` : Meng, J., Simon, F., Hanika, J., & Dachsbacher, C.
+    (2015). Physically Meaningful Rendering using Tristimulus Colours. Computer
+    Graphics Forum, 34(4), 31-40. doi:10.1111/cgf.12676
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
+                                MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models import (XYZ_to_xy, normalised_primary_matrix,
+                           sRGB_COLOURSPACE)
+from colour.recovery.dataset import SPECTRAL_UPSAMPLING_TABLE_PATH
+from colour.recovery.meng2015 import (XYZ_to_spectral_values_Meng2015,
+                                      _Meng2015_problem)
+from colour.utilities import tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SpectralUpsamplingTable', 'generate_spectral_upsampling_table',
+    'read_spectral_upsampling_table', 'write_spectral_upsampling_table',
+    'XYZ_to_spectral_UpsamplingTable'
+]
+
+_SPECTRAL_UPSAMPLING_TABLE_CACHE = None
+
+
+class SpectralUpsamplingTable(object):
+    """
+    Defines a spectral upsampling table, i.e. a regular grid sampling the
+    *RGB* colourspace cube whose nodes hold spectral values.
+
+    Parameters
+    ----------
+    wavelengths : array_like, (W,)
+        Wavelengths :math:`\lambda_{i}` of the spectral values.
+    values : array_like, (N, N, N, W)
+        Spectral values of the grid nodes, the first three axes indexing
+        respectively the *R*, *G* and *B* components in domain [0, 1].
+    RGB_to_XYZ_matrix : array_like, (3, 3)
+        Matrix converting from the *RGB* colourspace of the grid to *CIE XYZ*
+        tristimulus values.
+    name : unicode, optional
+        Spectral upsampling table name.
+
+    Attributes
+    ----------
+    wavelengths
+    values
+    RGB_to_XYZ_matrix
+    XYZ_to_RGB_matrix
+    name
+    resolution
+
+    Methods
+    -------
+    __repr__
+    RGB_to_spectral_values
+    XYZ_to_spectral_values
+
+    Notes
+    -----
+    -   The recovered spectral values are convex combinations of the grid
+        nodes spectral values, they are thus non-negative if the latter are.
+        The *CIE XYZ* tristimulus values being linear in the spectral values
+        and the trilinear interpolation reproducing linear functions exactly,
+        the recovered spectral values convert back to the given *CIE XYZ*
+        tristimulus values if the grid nodes spectral values do.
+    -   *RGB* colourspace arrays outside the *RGB* colourspace cube are
+        clipped to it.
+
+    Examples
+    --------
+    >>> table = generate_spectral_upsampling_table(resolution=3)
+    >>> table
+    SpectralUpsamplingTable(3x3x3 nodes, 48 wavelengths)
+    >>> RGB = np.array([0.02144962, 0.13154603, 0.09287601])
+    >>> table.RGB_to_spectral_values(RGB)[20]  # doctest: +ELLIPSIS
+    0.1200535...
+    """
+
+    def __init__(self, wavelengths, values, RGB_to_XYZ_matrix, name=None):
+        values = np.asarray(values)
+
+        assert values.ndim == 4 and len(set(values.shape[:3])) == 1, (
+            '"values" must be an array of shape (N, N, N, W)!')
+
+        self._wavelengths = np.asarray(wavelengths, dtype=DEFAULT_FLOAT_DTYPE)
+        self._values = values
+        self._RGB_to_XYZ_matrix = np.asarray(
+            RGB_to_XYZ_matrix, dtype=DEFAULT_FLOAT_DTYPE)
+        self._XYZ_to_RGB_matrix = np.linalg.inv(self._RGB_to_XYZ_matrix)
+        self._name = ('{0} ({1})'.format(self.__class__.__name__, id(self))
+                      if name is None else name)
+
+    @property
+    def wavelengths(self):
+        """
+        Getter and setter property for the wavelengths :math:`\lambda_{i}` of
+        the spectral values.
+
+        Returns
+        -------
+        ndarray
+            Wavelengths :math:`\lambda_{i}`.
+
+        Warning
+        -------
+        :attr:`SpectralUpsamplingTable.wavelengths` is read only.
+        """
+
+        return self._wavelengths
+
+    @property
+    def values(self):
+        """
+        Getter and setter property for the grid nodes spectral values.
+
+        Returns
+        -------
+        ndarray
+            Grid nodes spectral values.
+
+        Warning
+        -------
+        :attr:`SpectralUpsamplingTable.values` is read only.
+        """
+
+        return self._values
+
+    @property
+    def RGB_to_XYZ_matrix(self):
+        """
+        Getter and setter property for the matrix converting from the grid
+        *RGB* colourspace to *CIE XYZ* tristimulus values.
+
+        Returns
+        -------
+        ndarray
+            *RGB* colourspace to *CIE XYZ* tristimulus values matrix.
+
+        Warning
+        -------
+        :attr:`SpectralUpsamplingTable.RGB_to_XYZ_matrix` is read only.
+        """
+
+        return self._RGB_to_XYZ_matrix
+
+    @property
+    def XYZ_to_RGB_matrix(self):
+        """
+        Getter and setter property for the matrix converting from *CIE XYZ*
+        tristimulus values to the grid *RGB* colourspace.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values to *RGB* colourspace matrix.
+
+        Warning
+        -------
+        :attr:`SpectralUpsamplingTable.XYZ_to_RGB_matrix` is read only.
+        """
+
+        return self._XYZ_to_RGB_matrix
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the spectral upsampling table name.
+
+        Returns
+        -------
+        unicode
+            Spectral upsampling table name.
+
+        Warning
+        -------
+        :attr:`SpectralUpsamplingTable.name` is read only.
+        """
+
+        return self._name
+
+    @property
+    def resolution(self):
+        """
+        Getter and setter property for the grid nodes count per axis.
+
+        Returns
+        -------
+        int
+            Grid nodes count per axis.
+
+        Warning
+        -------
+        :attr:`SpectralUpsamplingTable.resolution` is read only.
+        """
+
+        return self._values.shape[0]
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the spectral upsampling
+        table.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{0}({1}x{1}x{1} nodes, {2} wavelengths)'.format(
+            self.__class__.__name__, self.resolution, len(self._wavelengths))
+
+    def RGB_to_spectral_values(self, RGB):
+        """
+        Recovers the spectral values of given *RGB* colourspace array using
+        trilinear interpolation of the grid nodes spectral values.
+
+        Parameters
+        ----------
+        RGB : array_like, (..., 3)
+            *RGB* colourspace array to recover the spectral values from.
+
+        Returns
+        -------
+        ndarray, (..., W)
+            Recovered spectral values.
+
+        Notes
+        -----
+        -   Input *RGB* colourspace array is in domain [0, 1].
+
+        Examples
+        --------
+        >>> table = generate_spectral_upsampling_table(resolution=3)
+        >>> RGB = np.array([[0.02144962, 0.13154603, 0.09287601],
+        ...                 [1.00000000, 1.00000000, 1.00000000]])
+        >>> table.RGB_to_spectral_values(RGB)[..., 20]  # doctest: +ELLIPSIS
+        array([ 0.1200535...,  1.        ])
+        """
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = RGB.shape[:-1]
+
+        n = self.resolution - 1
+        RGB = np.clip(np.reshape(RGB, (-1, 3)), 0, 1) * n
+
+        i_0 = np.clip(np.floor(RGB), 0, n - 1).astype(np.int_)
+        t = RGB - i_0
+        (i, j, k), (t_i, t_j, t_k) = np.transpose(i_0), np.transpose(t)
+
+        values = np.zeros((RGB.shape[0], self._values.shape[-1]))
+        for d_i, w_i in ((0, 1 - t_i), (1, t_i)):
+            for d_j, w_j in ((0, 1 - t_j), (1, t_j)):
+                for d_k, w_k in ((0, 1 - t_k), (1, t_k)):
+                    values += ((w_i * w_j * w_k)[..., np.newaxis] *
+                               self._values[i + d_i, j + d_j, k + d_k])
+
+        return np.reshape(values, shape + (self._values.shape[-1], ))
+
+    def XYZ_to_spectral_values(self, XYZ):
+        """
+        Recovers the spectral values of given *CIE XYZ* tristimulus values
+        using trilinear interpolation of the grid nodes spectral values.
+
+        Parameters
+        ----------
+        XYZ : array_like, (..., 3)
+            *CIE XYZ* tristimulus values to recover the spectral values from.
+
+        Returns
+        -------
+        ndarray, (..., W)
+            Recovered spectral values.
+
+        Notes
+        -----
+        -   Input *CIE XYZ* tristimulus values are in domain [0, 1].
+
+        Examples
+        --------
+        >>> table = generate_spectral_upsampling_table(resolution=3)
+        >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        >>> table.XYZ_to_spectral_values(XYZ)[20]  # doctest: +ELLIPSIS
+        0.1200374...
+        """
+
+        RGB = np.dot(np.asarray(XYZ), np.transpose(self._XYZ_to_RGB_matrix))
+
+        return self.RGB_to_spectral_values(RGB)
+
+
+def generate_spectral_upsampling_table(
+        colourspace=sRGB_COLOURSPACE,
+        resolution=17,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=10,
+        processes=1,
+        executor='Process'):
+    """
+    Generates a spectral upsampling table for given *RGB* colourspace using
+    *Meng et alii (2015)* method.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace, optional
+        *RGB* colourspace whose primaries define the grid *RGB* colourspace.
+    resolution : int, optional
+        Grid nodes count per axis.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm.
+    processes : integer, optional
+        {:func:`colour.recovery.XYZ_to_spectral_values_Meng2015`},
+        Workers count solving the bounded problems.
+    executor : unicode, optional
+        {:func:`colour.recovery.XYZ_to_spectral_values_Meng2015`},
+        **{'Process', 'Thread'}**,
+        Workers type, processes or threads.
+
+    Returns
+    -------
+    SpectralUpsamplingTable
+        Spectral upsampling table.
+
+    Notes
+    -----
+    -   The grid *RGB* colourspace uses the given *RGB* colourspace primaries
+        and the chromaticity coordinates of the perfect reflecting diffuser
+        under the equal energy illuminant *E* assumed by
+        *Meng et alii (2015)* method, computed with the given colour matching
+        functions, so that the *RGB* colourspace array (1, 1, 1) is recovered
+        as a perfect reflecting diffuser.
+    -   The grid nodes spectral values are recovered with a single call to
+        :func:`colour.recovery.XYZ_to_spectral_values_Meng2015` definition,
+        bounded to domain [0, 1] so that they are physically meaningful
+        reflectances.
+
+    References
+    ----------
+    -   :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> generate_spectral_upsampling_table(resolution=3)
+    SpectralUpsamplingTable(3x3x3 nodes, 48 wavelengths)
+    """
+
+    wavelengths, M, _P = _Meng2015_problem(cmfs, interval)
+
+    # The colour matching functions integrals slightly differ, the perfect
+    # reflecting diffuser chromaticity coordinates thus differ from those of
+    # the equal energy illuminant *E* and the latter is not a bounded
+    # reflectance.
+    RGB_to_XYZ_matrix = normalised_primary_matrix(
+        colourspace.primaries, XYZ_to_xy(np.sum(M, axis=-1)))
+
+    samples = np.linspace(0, 1, resolution)
+    RGB = tstack(np.meshgrid(samples, samples, samples, indexing='ij'))
+    XYZ = np.dot(RGB, np.transpose(RGB_to_XYZ_matrix))
+
+    # The grid nodes spectral values are bounded reflectances, i.e. in domain
+    # [0, 1] once scaled to percents.
+    values = XYZ_to_spectral_values_Meng2015(
+        XYZ,
+        cmfs,
+        interval,
+        processes=processes,
+        executor=executor,
+        bounds=np.array([0, 0.01]))
+
+    return SpectralUpsamplingTable(
+        wavelengths,
+        values,
+        RGB_to_XYZ_matrix,
+        name='{0} - Meng (2015)'.format(colourspace.name))
+
+
+def read_spectral_upsampling_table(path):
+    """
+    Reads given binary file and returns its spectral upsampling table.
+
+    Parameters
+    ----------
+    path : unicode
+        Binary file path as written by
+        :func:`colour.recovery.write_spectral_upsampling_table` definition.
+
+    Returns
+    -------
+    SpectralUpsamplingTable
+        Spectral upsampling table.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'table.npz')
+    >>> table = generate_spectral_upsampling_table(resolution=3)
+    >>> write_spectral_upsampling_table(table, path)
+    True
+    >>> read_spectral_upsampling_table(path)
+    SpectralUpsamplingTable(3x3x3 nodes, 48 wavelengths)
+    """
+
+    with np.load(path) as data:
+        return SpectralUpsamplingTable(
+            data['wavelengths'],
+            data['values'],
+            data['RGB_to_XYZ_matrix'],
+            name=str(data['name']))
+
+
+def write_spectral_upsampling_table(table, path):
+    """
+    Writes given spectral upsampling table to given compressed binary file.
+
+    Parameters
+    ----------
+    table : SpectralUpsamplingTable
+        Spectral upsampling table.
+    path : unicode
+        Binary file path, the *.npz* extension is appended if missing.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The grid nodes spectral values are stored as single precision
+        floating point numbers.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'table.npz')
+    >>> table = generate_spectral_upsampling_table(resolution=3)
+    >>> write_spectral_upsampling_table(table, path)
+    True
+    """
+
+    np.savez_compressed(
+        path,
+        wavelengths=table.wavelengths,
+        values=table.values.astype(np.float32),
+        RGB_to_XYZ_matrix=table.RGB_to_XYZ_matrix,
+        name=np.array(table.name))
+
+    return True
+
+
+def XYZ_to_spectral_UpsamplingTable(XYZ, table=None):
+    """
+    Recovers the spectral power distribution of given *CIE XYZ* tristimulus
+    values using given spectral upsampling table.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral power distribution
+        from.
+    table : SpectralUpsamplingTable, optional
+        Spectral upsampling table, if not given, the default *sRGB*
+        colourspace table is read from
+        :attr:`colour.recovery.SPECTRAL_UPSAMPLING_TABLE_PATH` attribute path
+        and cached on first use.
+
+    Returns
+    -------
+    SpectralPowerDistribution or MultiSpectralPowerDistribution
+        Recovered spectral power distribution if given a single *CIE XYZ*
+        tristimulus values array, multi-spectral power distribution holding
+        one recovered spectral power distribution per *CIE XYZ* tristimulus
+        values array otherwise.
+
+    Notes
+    -----
+    -   Input *CIE XYZ* tristimulus values are in domain [0, 1].
+    -   Large arrays, e.g. images, should be recovered with
+        :meth:`colour.recovery.SpectralUpsamplingTable.XYZ_to_spectral_values`
+        method as it does not construct any spectral power distribution.
+    -   A table for another *RGB* colourspace, colour matching functions or
+        resolution must be generated explicitly with
+        :func:`colour.recovery.generate_spectral_upsampling_table` definition
+        and given with the ``table`` argument.
+
+    References
+    ----------
+    -   :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+    >>> spd = XYZ_to_spectral_UpsamplingTable(XYZ)
+    >>> spd[550]  # doctest: +ELLIPSIS
+    0.1278717...
+
+    Using a generated spectral upsampling table:
+
+    >>> table = generate_spectral_upsampling_table(resolution=3)
+    >>> spd = XYZ_to_spectral_UpsamplingTable(XYZ, table)
+    >>> spd[550]  # doctest: +ELLIPSIS
+    0.1340937...
+    """
+
+    global _SPECTRAL_UPSAMPLING_TABLE_CACHE
+
+    if table is None:
+        if _SPECTRAL_UPSAMPLING_TABLE_CACHE is None:
+            _SPECTRAL_UPSAMPLING_TABLE_CACHE = (
+                read_spectral_upsampling_table(
+                    SPECTRAL_UPSAMPLING_TABLE_PATH))
+
+        table = _SPECTRAL_UPSAMPLING_TABLE_CACHE
+
+    XYZ = np.asarray(XYZ)
+    values = table.XYZ_to_spectral_values(XYZ)
+
+    if XYZ.ndim == 1:
+        return SpectralPowerDistribution(
+            dict(zip(table.wavelengths, values)),
+            name='{0} - {1}'.format(table.name, XYZ))
+    else:
+        return MultiSpectralPowerDistribution(
+            np.transpose(np.reshape(values, (-1, values.shape[-1]))),
+            table.wavelengths,
+            name=table.name)
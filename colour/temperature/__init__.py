@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import
 
+from .cct import PlanckianLocusTable
 from .cct import CCT_TO_UV_METHODS, UV_TO_CCT_METHODS
 from .cct import CCT_to_uv
 from .cct import (CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968,
@@ -15,9 +16,10 @@ from .cct import xy_to_CCT
 from .cct import xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999
 
 __all__ = [
-    'CCT_TO_UV_METHODS', 'UV_TO_CCT_METHODS', 'CCT_to_uv',
-    'CCT_to_uv_Ohno2013', 'CCT_to_uv_Robertson1968', 'CCT_to_uv_Krystek1985',
-    'uv_to_CCT', 'uv_to_CCT_Ohno2013', 'uv_to_CCT_Robertson1968',
+    'PlanckianLocusTable', 'CCT_TO_UV_METHODS', 'UV_TO_CCT_METHODS',
+    'CCT_to_uv', 'CCT_to_uv_Ohno2013', 'CCT_to_uv_Robertson1968',
+    'CCT_to_uv_Krystek1985', 'uv_to_CCT', 'uv_to_CCT_Ohno2013',
+    'uv_to_CCT_Robertson1968',
     'CCT_TO_XY_METHODS', 'XY_TO_CCT_METHODS', 'CCT_to_xy',
     'CCT_to_xy_Kang2002', 'CCT_to_xy_CIE_D', 'xy_to_CCT',
     'xy_to_CCT_McCamy1992', 'xy_to_CCT_Hernandez1999'
@@ -87,14 +87,20 @@ dng_temperature.cpp::dng_temperature::xy_coord. Retrieved from
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import struct
+import zipfile
 from collections import namedtuple
 
 from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
                                 STANDARD_OBSERVERS_CMFS, blackbody_spd,
-                                spectral_to_XYZ)
+                                planck_law, spectral_to_XYZ)
+from colour.colorimetry.blackbody import C2
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import (CaseInsensitiveMapping, as_numeric,
-                              filter_kwargs, tsplit, tstack, warning)
+from colour.utilities import (CaseInsensitiveMapping, LRUCache, as_numeric,
+                              filter_kwargs, ndarray_digest, tsplit, tstack,
+                              warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -108,9 +114,10 @@ __all__ = [
     'CCT_CALCULATION_ITERATIONS', 'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
     'ROBERTSON_ISOTEMPERATURE_LINES_RUVT', 'ROBERTSON_ISOTEMPERATURE_LINES',
     'planckian_table', 'planckian_table_minimal_distance_index',
-    'uv_to_CCT_Ohno2013', 'CCT_to_uv_Ohno2013', 'uv_to_CCT_Robertson1968',
-    'CCT_to_uv_Robertson1968', 'CCT_to_uv_Krystek1985', 'UV_TO_CCT_METHODS',
-    'uv_to_CCT', 'CCT_TO_UV_METHODS', 'CCT_to_uv', 'xy_to_CCT_McCamy1992',
+    'PlanckianLocusTable', 'uv_to_CCT_Ohno2013', 'CCT_to_uv_Ohno2013',
+    'uv_to_CCT_Robertson1968', 'CCT_to_uv_Robertson1968',
+    'CCT_to_uv_Krystek1985', 'UV_TO_CCT_METHODS', 'uv_to_CCT',
+    'CCT_TO_UV_METHODS', 'CCT_to_uv', 'xy_to_CCT_McCamy1992',
     'xy_to_CCT_Hernandez1999', 'CCT_to_xy_Kang2002', 'CCT_to_xy_CIE_D',
     'XY_TO_CCT_METHODS', 'xy_to_CCT', 'CCT_TO_XY_METHODS', 'CCT_to_xy'
 ]
@@ -123,6 +130,10 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+_PLANCKIAN_LOCUS_DECADE_SAMPLES = 2048
+
+_PLANCKIAN_LOCUS_TABLE_CACHE = LRUCache(maxsize=16)
+
 ROBERTSON_ISOTEMPERATURE_LINES_DATA = (
     (0, 0.18006, 0.26352, -0.24341),
     (10, 0.18066, 0.26589, -0.25479),
@@ -285,13 +296,500 @@ def planckian_table_minimal_distance_index(planckian_table_):
     return distances.index(min(distances))
 
 
+class PlanckianLocusTable(object):
+    """
+    Defines a dense planckian locus table, i.e. the temperatures, the
+    *CIE UCS* colourspace *uv* chromaticity coordinates and their analytical
+    derivatives with respect to temperature, for given colour matching
+    functions and temperature range.
+
+    The table values in-between the temperatures samples are computed using
+    cubic *Hermite* interpolation.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions, default to the
+        *CIE 1931 2 Degree Standard Observer*.
+    start : numeric, optional
+        Temperature range start in kelvins.
+    end : numeric, optional
+        Temperature range end in kelvins.
+    samples : int, optional
+        Temperatures count in the planckian locus table, if not given, it is
+        computed so that the interpolation error on the *uv* chromaticity
+        coordinates is negligible.
+    spacing : unicode, optional
+        **{'Logarithmic', 'Mired'}**,
+        Temperatures spacing, either uniform in logarithmic space or in
+        reciprocal megakelvin space.
+
+    Attributes
+    ----------
+    name
+    spacing
+    T
+    u
+    v
+    du_dT
+    dv_dT
+
+    Methods
+    -------
+    __repr__
+    __len__
+    uv
+    duv_dT
+    save
+    load
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> table = PlanckianLocusTable(cmfs, 1000, 100000)
+    >>> len(table)
+    4096
+    >>> table.uv(6500)  # doctest: +ELLIPSIS
+    array([ 0.2004485...,  0.3103617...])
+    """
+
+    def __init__(self,
+                 cmfs=None,
+                 start=CCT_MINIMAL,
+                 end=CCT_MAXIMAL,
+                 samples=None,
+                 spacing='Logarithmic'):
+        if cmfs is None:
+            cmfs = STANDARD_OBSERVERS_CMFS[
+                'CIE 1931 2 Degree Standard Observer']
+
+        if spacing.lower() not in ('logarithmic', 'mired'):
+            raise ValueError(
+                '"{0}" spacing is invalid, it must be one of '
+                '{{"Logarithmic", "Mired"}}!'.format(spacing))
+
+        if samples is None:
+            samples = max(
+                int(
+                    np.ceil(
+                        np.log10(end / start) *
+                        _PLANCKIAN_LOCUS_DECADE_SAMPLES)), 2)
+
+        if spacing.lower() == 'logarithmic':
+            T = np.logspace(np.log10(start), np.log10(end), samples)
+        else:
+            T = 1e6 / np.linspace(1e6 / start, 1e6 / end, samples)
+
+        cmfs_t = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+
+        l = cmfs_t.wavelengths * 1e-9  # noqa
+        B = planck_law(l, T[..., np.newaxis])
+        # Analytical derivative of *Planck's law* with respect to temperature.
+        E = np.exp(C2 / (l * T[..., np.newaxis]))
+        dB_dT = B * E / (E - 1) * C2 / (l * T[..., np.newaxis] ** 2)
+
+        X, Y, Z = tsplit(np.dot(B, cmfs_t.values))
+        dX, dY, dZ = tsplit(np.dot(dB_dT, cmfs_t.values))
+
+        D = X + 15 * Y + 3 * Z
+        dD = dX + 15 * dY + 3 * dZ
+
+        self._name = cmfs.name
+        self._spacing = spacing
+        self._T = T
+        self._u = 4 * X / D
+        self._v = 6 * Y / D
+        self._du_dT = 4 * (dX * D - X * dD) / D ** 2
+        self._dv_dT = 6 * (dY * D - Y * dD) / D ** 2
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the planckian locus table colour
+        matching functions name.
+
+        Returns
+        -------
+        unicode
+            Planckian locus table colour matching functions name.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.name` is read only.
+        """
+
+        return self._name
+
+    @property
+    def spacing(self):
+        """
+        Getter and setter property for the planckian locus table temperatures
+        spacing.
+
+        Returns
+        -------
+        unicode
+            Planckian locus table temperatures spacing.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.spacing` is read only.
+        """
+
+        return self._spacing
+
+    @property
+    def T(self):
+        """
+        Getter and setter property for the planckian locus table temperatures.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus table temperatures.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.T` is read only.
+        """
+
+        return self._T
+
+    @property
+    def u(self):
+        """
+        Getter and setter property for the planckian locus table *u*
+        chromaticity coordinates.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus table *u* chromaticity coordinates.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.u` is read only.
+        """
+
+        return self._u
+
+    @property
+    def v(self):
+        """
+        Getter and setter property for the planckian locus table *v*
+        chromaticity coordinates.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus table *v* chromaticity coordinates.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.v` is read only.
+        """
+
+        return self._v
+
+    @property
+    def du_dT(self):
+        """
+        Getter and setter property for the planckian locus table *u*
+        chromaticity coordinates derivatives with respect to temperature.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus table *u* chromaticity coordinates derivatives.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.du_dT` is read only.
+        """
+
+        return self._du_dT
+
+    @property
+    def dv_dT(self):
+        """
+        Getter and setter property for the planckian locus table *v*
+        chromaticity coordinates derivatives with respect to temperature.
+
+        Returns
+        -------
+        ndarray
+            Planckian locus table *v* chromaticity coordinates derivatives.
+
+        Warning
+        -------
+        :attr:`PlanckianLocusTable.dv_dT` is read only.
+        """
+
+        return self._dv_dT
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the planckian locus
+        table.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return ('PlanckianLocusTable(\'{0}\', {1}, {2}, {3}, '
+                '\'{4}\')').format(self._name, self._T[0], self._T[-1],
+                                   len(self), self._spacing)
+
+    def __len__(self):
+        """
+        Returns the planckian locus table temperatures count.
+
+        Returns
+        -------
+        int
+            Temperatures count.
+        """
+
+        return len(self._T)
+
+    def _hermite_basis(self, T):
+        """
+        Returns the cubic *Hermite* interpolation indexes, interval widths and
+        normalised positions for given temperatures.
+        """
+
+        T = np.asarray(T)
+
+        i = np.clip(np.searchsorted(self._T, T) - 1, 0, len(self._T) - 2)
+        h = self._T[i + 1] - self._T[i]
+        t = (T - self._T[i]) / h
+
+        return i, h, t
+
+    def uv(self, T):
+        """
+        Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of
+        given temperatures.
+
+        Parameters
+        ----------
+        T : numeric or array_like
+            Temperatures in kelvins.
+
+        Returns
+        -------
+        ndarray
+            *uv* chromaticity coordinates.
+
+        Examples
+        --------
+        >>> table = PlanckianLocusTable()
+        >>> table.uv(np.array([2856, 6504]))  # doctest: +ELLIPSIS
+        array([[ 0.2559512...,  0.3495210...],
+               [ 0.2004280...,  0.3103334...]])
+        """
+
+        i, h, t = self._hermite_basis(T)
+
+        t2 = t ** 2
+        t3 = t ** 3
+
+        h00 = 2 * t3 - 3 * t2 + 1
+        h10 = (t3 - 2 * t2 + t) * h
+        h01 = -2 * t3 + 3 * t2
+        h11 = (t3 - t2) * h
+
+        u = (h00 * self._u[i] + h10 * self._du_dT[i] +
+             h01 * self._u[i + 1] + h11 * self._du_dT[i + 1])
+        v = (h00 * self._v[i] + h10 * self._dv_dT[i] +
+             h01 * self._v[i + 1] + h11 * self._dv_dT[i + 1])
+
+        return tstack((u, v))
+
+    def duv_dT(self, T):
+        """
+        Returns the *CIE UCS* colourspace *uv* chromaticity coordinates
+        derivatives with respect to temperature of given temperatures.
+
+        Parameters
+        ----------
+        T : numeric or array_like
+            Temperatures in kelvins.
+
+        Returns
+        -------
+        ndarray
+            *uv* chromaticity coordinates derivatives.
+
+        Examples
+        --------
+        >>> table = PlanckianLocusTable()
+        >>> table.duv_dT(6504)  # doctest: +ELLIPSIS
+        array([ -5.1227169...e-06,  -7.0667166...e-06])
+        """
+
+        i, h, t = self._hermite_basis(T)
+
+        t2 = t ** 2
+
+        d00 = (6 * t2 - 6 * t) / h
+        d10 = 3 * t2 - 4 * t + 1
+        d01 = (-6 * t2 + 6 * t) / h
+        d11 = 3 * t2 - 2 * t
+
+        du_dT = (d00 * self._u[i] + d10 * self._du_dT[i] +
+                 d01 * self._u[i + 1] + d11 * self._du_dT[i + 1])
+        dv_dT = (d00 * self._v[i] + d10 * self._dv_dT[i] +
+                 d01 * self._v[i + 1] + d11 * self._dv_dT[i + 1])
+
+        return tstack((du_dT, dv_dT))
+
+    def save(self, path):
+        """
+        Saves the planckian locus table into given *.npz* file.
+
+        The arrays are stored uncompressed so that
+        :meth:`PlanckianLocusTable.load` can memory-map them.
+
+        Parameters
+        ----------
+        path : unicode
+            *.npz* file path.
+
+        Examples
+        --------
+        >>> import os
+        >>> import tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'CIE_1931_2.npz')
+        >>> PlanckianLocusTable().save(path)
+        """
+
+        np.savez(
+            path,
+            name=np.array(self._name),
+            spacing=np.array(self._spacing),
+            T=self._T,
+            u=self._u,
+            v=self._v,
+            du_dT=self._du_dT,
+            dv_dT=self._dv_dT)
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Loads a planckian locus table from given *.npz* file.
+
+        Parameters
+        ----------
+        path : unicode
+            *.npz* file path.
+        mmap : bool, optional
+            Whether to memory-map the table arrays rather than reading them
+            into memory. Memory-mapping requires the *.npz* file to be
+            uncompressed, compressed arrays are always read.
+
+        Returns
+        -------
+        PlanckianLocusTable
+            Planckian locus table.
+
+        Examples
+        --------
+        >>> import os
+        >>> import tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'CIE_1931_2.npz')
+        >>> PlanckianLocusTable().save(path)
+        >>> PlanckianLocusTable.load(path)  # doctest: +ELLIPSIS
+        PlanckianLocusTable('CIE 1931 2 Degree Standard Observer', 1000.0, \
+100000.0..., 4096, 'Logarithmic')
+        """
+
+        table = PlanckianLocusTable.__new__(PlanckianLocusTable)
+
+        with zipfile.ZipFile(path) as archive, open(path, 'rb') as file_:
+            for info in archive.infolist():
+                attribute = '_{0}'.format(os.path.splitext(info.filename)[0])
+
+                if mmap and info.compress_type == zipfile.ZIP_STORED:
+                    # Skipping the member local file header to reach the
+                    # *.npy* data.
+                    file_.seek(info.header_offset + 26)
+                    name_length, extra_length = struct.unpack(
+                        '<HH', file_.read(4))
+                    file_.seek(name_length + extra_length, os.SEEK_CUR)
+
+                    version = np.lib.format.read_magic(file_)
+                    if version == (1, 0):
+                        shape, fortran_order, dtype = (
+                            np.lib.format.read_array_header_1_0(file_))
+                    else:
+                        shape, fortran_order, dtype = (
+                            np.lib.format.read_array_header_2_0(file_))
+
+                    if shape and dtype.kind == 'f':
+                        setattr(table, attribute,
+                                np.memmap(
+                                    path,
+                                    dtype=dtype,
+                                    mode='r',
+                                    offset=file_.tell(),
+                                    shape=shape,
+                                    order='F' if fortran_order else 'C'))
+                        continue
+
+                with archive.open(info) as member:
+                    value = np.lib.format.read_array(member)
+
+                setattr(table, attribute, value[()]
+                        if value.ndim == 0 else value)
+
+        return table
+
+
+def _planckian_locus_table(cmfs, start, end):
+    """
+    Returns a cached logarithmically spaced planckian locus table for given
+    colour matching functions and temperature range.
+
+    The cache is keyed using the colour matching functions content and the
+    temperature range.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+
+    Returns
+    -------
+    PlanckianLocusTable
+        Planckian locus table.
+    """
+
+    key = (ndarray_digest(cmfs.wavelengths, cmfs.values), float(start),
+           float(end))
+    table = _PLANCKIAN_LOCUS_TABLE_CACHE.get(key)
+    if table is None:
+        table = PlanckianLocusTable(cmfs, start, end)
+        _PLANCKIAN_LOCUS_TABLE_CACHE[key] = table
+
+    return table
+
+
 def uv_to_CCT_Ohno2013(
         uv,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
         start=CCT_MINIMAL,
         end=CCT_MAXIMAL,
         count=CCT_SAMPLES,
-        iterations=CCT_CALCULATION_ITERATIONS):
+        iterations=CCT_CALCULATION_ITERATIONS,
+        table=None):
     """
     Returns the correlated colour temperature :math:`T_{cp}` and
     :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
@@ -302,6 +800,11 @@ def uv_to_CCT_Ohno2013(
     value, the more planckian tables will be generated through cascade
     expansion in order to converge to the exact solution.
 
+    The planckian tables are interpolated from a
+    :class:`colour.temperature.PlanckianLocusTable` class instance computed
+    once per colour matching functions and temperature range, allowing arrays
+    of *uv* chromaticity coordinates to be processed at once.
+
     Parameters
     ----------
     uv : array_like
@@ -316,6 +819,10 @@ def uv_to_CCT_Ohno2013(
         Temperatures count in the planckian tables.
     iterations : int, optional
         Number of planckian tables to generate.
+    table : PlanckianLocusTable, optional
+        Planckian locus table to use instead of the one computed from the
+        ``cmfs`` argument, the temperature range is then clipped to the table
+        temperature range.
 
     Returns
     -------
@@ -333,35 +840,62 @@ def uv_to_CCT_Ohno2013(
     >>> uv = np.array([0.1978, 0.3122])
     >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
     array([  6.5074738...e+03,   3.2233461...e-03])
+    >>> uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+    >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
+    array([[  6.5074738...e+03,   3.2233461...e-03],
+           [  1.0416831...e+03,  -6.7378021...e-02]])
+
+    Using a planckian locus table:
+
+    >>> table = PlanckianLocusTable(cmfs, spacing='Mired')
+    >>> uv_to_CCT_Ohno2013(uv, table=table)  # doctest: +ELLIPSIS
+    array([[  6.5074738...e+03,   3.2233461...e-03],
+           [  1.0416831...e+03,  -6.7378021...e-02]])
     """
 
+    uv = np.asarray(uv)
+    ux, vx = tsplit(np.reshape(uv, (-1, 2)))
+
+    if table is None:
+        table = _planckian_locus_table(cmfs, start, end)
+    else:
+        start = max(start, table.T[0])
+        end = min(end, table.T[-1])
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
-    # Planckian table creation through cascade expansion.
+    samples = np.linspace(0, 1, count)
+    start = np.full(ux.shape, start, dtype=DEFAULT_FLOAT_DTYPE)
+    end = np.full(ux.shape, end, dtype=DEFAULT_FLOAT_DTYPE)
+    rows = np.arange(ux.shape[0])[..., np.newaxis]
+
+    # Planckian tables creation through cascade expansion.
     for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+        Ti = (start[..., np.newaxis] +
+              (end - start)[..., np.newaxis] * samples)
+        ui, vi = tsplit(table.uv(Ti))
+        di = np.hypot(ux[..., np.newaxis] - ui, vx[..., np.newaxis] - vi)
+
+        index = np.argmin(di, axis=-1)
+        if np.any(index == 0):
             warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+        if np.any(index == count - 1):
             warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
+        index = np.clip(index, 1, count - 2)[..., np.newaxis]
 
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        start, _T, end = np.transpose(
+            Ti[rows, index + np.array([-1, 0, 1])])
 
-    _ux, vx = uv
-
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    indexes = index + np.array([-1, 0, 1])
+    Tip, Ti, Tin = np.transpose(Ti[rows, indexes])
+    uip, _ui, uin = np.transpose(ui[rows, indexes])
+    vip, _vi, vin = np.transpose(vi[rows, indexes])
+    dip, di, din = np.transpose(di[rows, indexes])
 
     # Triangular solution.
     l = np.hypot(uin - uip, vin - vip)  # noqa
@@ -369,11 +903,12 @@ def uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
+    parabolic = np.abs(D_uv) >= 0.002
+    if np.any(parabolic):
         X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
         a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
         b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
@@ -382,17 +917,19 @@ def uv_to_CCT_Ohno2013(
                (Tip - Tin) * Tip * Tin + din *
                (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+        T_p = -b / (2 * a)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+        T = np.where(parabolic, T_p, T)
+        D_uv = np.where(parabolic, sign * (a * T_p ** 2 + b * T_p + c), D_uv)
 
-    return np.array([T, D_uv])
+    return np.reshape(tstack((T, D_uv)), uv.shape)
 
 
 def CCT_to_uv_Ohno2013(
         CCT,
         D_uv=0,
-        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']):
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        table=None):
     """
     Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
     correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}` and
@@ -406,12 +943,21 @@ def CCT_to_uv_Ohno2013(
         :math:`\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
+    table : PlanckianLocusTable, optional
+        Planckian locus table to use instead of integrating the ``cmfs``
+        argument, ``CCT`` and ``D_uv`` arguments can then be arrays.
 
     Returns
     -------
     ndarray
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
+    Notes
+    -----
+    -   When a planckian locus table is used, the normal to the planckian
+        locus is computed from the table derivatives rather than with a
+        finite difference.
+
     References
     ----------
     -   :cite:`Ohno2014a`
@@ -424,8 +970,23 @@ def CCT_to_uv_Ohno2013(
     >>> D_uv = 0.003223690901513
     >>> CCT_to_uv_Ohno2013(CCT, D_uv, cmfs)  # doctest: +ELLIPSIS
     array([ 0.1977999...,  0.3122004...])
+
+    Using a planckian locus table:
+
+    >>> table = PlanckianLocusTable(cmfs)
+    >>> CCT_to_uv_Ohno2013(CCT, D_uv, table=table)  # doctest: +ELLIPSIS
+    array([ 0.1977999...,  0.3122004...])
     """
 
+    if table is not None:
+        u0, v0 = tsplit(table.uv(CCT))
+        du, dv = tsplit(table.duv_dT(CCT))
+
+        u = u0 + D_uv * (dv / np.hypot(du, dv))
+        v = v0 - D_uv * (du / np.hypot(du, dv))
+
+        return tstack((u, v))
+
     cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
 
     shape = cmfs.shape
@@ -482,59 +1043,51 @@ def uv_to_CCT_Robertson1968(uv):
     >>> uv = np.array([0.193741375998230, 0.315221043940594])
     >>> uv_to_CCT_Robertson1968(uv)  # doctest: +ELLIPSIS
     array([  6.5000162...e+03,   8.3333289...e-03])
+    >>> uv = np.array([[0.193741375998230, 0.315221043940594],
+    ...                [0.286295060456356, 0.313966360942357]])
+    >>> uv_to_CCT_Robertson1968(uv)  # doctest: +ELLIPSIS
+    array([[  6.5000162...e+03,   8.3333289...e-03],
+           [  2.3919195...e+03,  -4.2134249...e-02]])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
-
-        du /= length
-        dv /= length
-
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
-
-        dt = -uu * dv + vv * du
-
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    uv = np.asarray(uv)
+    u, v = tsplit(np.reshape(uv, (-1, 2)))
 
-            dt = -dt
+    r_i, u_i, v_i, t_i = np.transpose(ROBERTSON_ISOTEMPERATURE_LINES)
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    length = np.hypot(1, t_i)
+    du_i = 1 / length
+    dv_i = t_i / length
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    # Signed distances to every isotemperature line, the first non-positive
+    # one, or the last one, brackets the chromaticity coordinates.
+    dt_i = (-(u[..., np.newaxis] - u_i) * dv_i +
+            (v[..., np.newaxis] - v_i) * du_i)
+    rows = np.arange(dt_i.shape[0])
+    i = np.argmax(dt_i[..., 1:] <= 0, axis=-1) + 1
+    i = np.where(np.any(dt_i[..., 1:] <= 0, axis=-1), i, 30)
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    dt = -np.minimum(dt_i[rows, i], 0)
+    last_dt = dt_i[rows, i - 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    T = 1.0e6 / (r_i[i - 1] * f + r_i[i] * (1 - f))
 
-            length = np.hypot(du, dv)
+    uu = u - (u_i[i - 1] * f + u_i[i] * (1 - f))
+    vv = v - (v_i[i - 1] * f + v_i[i] * (1 - f))
 
-            du /= length
-            dv /= length
+    du = du_i[i] * (1 - f) + du_i[i - 1] * f
+    dv = dv_i[i] * (1 - f) + dv_i[i - 1] * f
 
-            D_uv = uu * du + vv * dv
+    length = np.hypot(du, dv)
 
-            break
+    du /= length
+    dv /= length
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+    D_uv = uu * du + vv * dv
 
-    return np.array([T, -D_uv])
+    return np.reshape(tstack((T, -D_uv)), uv.shape)
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -6,14 +6,18 @@ Defines unit tests for :mod:`colour.temperature.cct` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 from itertools import permutations
 
 from colour.colorimetry import STANDARD_OBSERVERS_CMFS
 from colour.temperature import (
-    CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968, CCT_to_uv_Krystek1985,
-    uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968, CCT_to_xy_Kang2002,
-    CCT_to_xy_CIE_D, xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999)
+    PlanckianLocusTable, CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968,
+    CCT_to_uv_Krystek1985, uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968,
+    CCT_to_xy_Kang2002, CCT_to_xy_CIE_D, xy_to_CCT_McCamy1992,
+    xy_to_CCT_Hernandez1999)
 from colour.temperature.cct import (planckian_table,
                                     planckian_table_minimal_distance_index)
 from colour.utilities import ignore_numpy_errors
@@ -27,8 +31,9 @@ __status__ = 'Production'
 
 __all__ = [
     'TestPlanckianTable', 'TestPlanckianTableMinimalDistanceIndex',
-    'Testuv_to_CCT_Ohno2013', 'TestCCT_to_uv_Ohno2013',
-    'Testuv_to_CCT_Robertson1968', 'TestCCT_to_uv_Robertson1968',
+    'TestPlanckianLocusTable', 'Testuv_to_CCT_Ohno2013',
+    'TestCCT_to_uv_Ohno2013', 'Testuv_to_CCT_Robertson1968',
+    'TestCCT_to_uv_Robertson1968',
     'TestCCT_to_uv_Krystek1985', 'Testxy_to_CCT_McCamy1992',
     'Testxy_to_CCT_Hernandez1999', 'TestCCT_to_xy_Kang2002',
     'TestCCT_to_xy_CIE_D'
@@ -190,6 +195,128 @@ planckian_table_minimal_distance_index` definition.
                     np.array([0.1978, 0.3122]), cmfs, 1000, 1010, 10)), 9)
 
 
+class TestPlanckianLocusTable(unittest.TestCase):
+    """
+    Defines :class:`colour.temperature.cct.PlanckianLocusTable` class units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'spacing', 'T', 'u', 'v', 'du_dT',
+                               'dv_dT')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PlanckianLocusTable))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__repr__', '__len__', 'uv', 'duv_dT',
+                            'save', 'load')
+
+        for method in required_methods:
+            self.assertIn(method, dir(PlanckianLocusTable))
+
+    def test__init__(self):
+        """
+        Tests :func:`colour.temperature.cct.PlanckianLocusTable.__init__`
+        method.
+        """
+
+        table = PlanckianLocusTable(start=1000, end=10000, samples=64)
+        self.assertEqual(len(table), 64)
+        np.testing.assert_almost_equal(
+            np.log(table.T), np.linspace(np.log(1000), np.log(10000), 64))
+
+        table = PlanckianLocusTable(
+            start=1000, end=10000, samples=64, spacing='Mired')
+        np.testing.assert_almost_equal(
+            1e6 / table.T, np.linspace(1000, 100, 64), decimal=7)
+
+        self.assertRaises(
+            ValueError, lambda: PlanckianLocusTable(spacing='Undefined'))
+
+    def test_uv(self):
+        """
+        Tests :func:`colour.temperature.cct.PlanckianLocusTable.uv` method.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        CCT = np.array([1041.68315360, 2452.15316417, 6507.47380460, 42000])
+        uv = np.array([CCT_to_uv_Ohno2013(x, 0, cmfs) for x in CCT])
+        for spacing in ('Logarithmic', 'Mired'):
+            table = PlanckianLocusTable(cmfs, spacing=spacing)
+            np.testing.assert_almost_equal(table.uv(CCT), uv, decimal=10)
+
+        np.testing.assert_almost_equal(
+            table.uv(np.reshape(CCT, (2, 2))),
+            np.reshape(uv, (2, 2, 2)),
+            decimal=10)
+
+    def test_duv_dT(self):
+        """
+        Tests :func:`colour.temperature.cct.PlanckianLocusTable.duv_dT`
+        method.
+        """
+
+        table = PlanckianLocusTable()
+        CCT = np.array([1041.68315360, 2452.15316417, 6507.47380460, 42000])
+        np.testing.assert_allclose(
+            table.duv_dT(CCT),
+            (table.uv(CCT + 0.001) - table.uv(CCT - 0.001)) / 0.002,
+            rtol=0.000001)
+        np.testing.assert_almost_equal(
+            table.duv_dT(table.T[:8]),
+            np.transpose([table.du_dT[:8], table.dv_dT[:8]]),
+            decimal=12)
+
+    def test_save(self):
+        """
+        Tests :func:`colour.temperature.cct.PlanckianLocusTable.save` and
+        :func:`colour.temperature.cct.PlanckianLocusTable.load` methods.
+        """
+
+        table = PlanckianLocusTable(samples=256, spacing='Mired')
+        path = os.path.join(self._temporary_directory, 'table.npz')
+        table.save(path)
+
+        for mmap in (True, False):
+            table_l = PlanckianLocusTable.load(path, mmap)
+
+            self.assertEqual(table_l.name, table.name)
+            self.assertEqual(table_l.spacing, table.spacing)
+            for attribute in ('T', 'u', 'v', 'du_dT', 'dv_dT'):
+                np.testing.assert_equal(
+                    getattr(table_l, attribute), getattr(table, attribute))
+                self.assertEqual(
+                    isinstance(getattr(table_l, attribute), np.memmap), mmap)
+
+            np.testing.assert_equal(
+                table_l.uv(np.array([2000, 4000])),
+                table.uv(np.array([2000, 4000])))
+            del table_l
+
+
 class Testuv_to_CCT_Ohno2013(unittest.TestCase):
     """
     Defines :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition units
@@ -217,6 +344,35 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+        table = PlanckianLocusTable(cmfs, spacing='Mired')
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(np.array([0.1978, 0.3122]), table=table),
+            np.array([6507.47380460, 0.00322335]),
+            decimal=7)
+
+    def test_n_dimensional_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+        CCT_D_uv = np.array([[6507.47380460, 0.00322335],
+                             [1041.68315360, -0.06737802]])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+        uv = np.tile(uv, (3, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (3, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
 
 class TestCCT_to_uv_Ohno2013(unittest.TestCase):
     """
@@ -245,6 +401,16 @@ class TestCCT_to_uv_Ohno2013(unittest.TestCase):
             np.array([0.29247364, 0.27215157]),
             decimal=7)
 
+        table = PlanckianLocusTable(cmfs)
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(
+                np.array([6507.47380460, 1041.68315360, 2452.15316417]),
+                np.array([0.00322335, -0.06737802, -0.08437064]),
+                table=table),
+            np.array([[0.19779997, 0.31219997], [0.43279885, 0.28830013],
+                      [0.29247364, 0.27215157]]),
+            decimal=7)
+
 
 class Testuv_to_CCT_Robertson1968(unittest.TestCase):
     """
@@ -262,6 +428,27 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
             np.testing.assert_allclose(
                 uv_to_CCT_Robertson1968(value), key, atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968` definition
+        n-dimensional arrays support.
+        """
+
+        uv = np.array([0.193741375998230, 0.315221043940594])
+        CCT_D_uv = np.array([6500.01628793, 0.00833333])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
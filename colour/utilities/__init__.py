@@ -10,8 +10,11 @@ from .common import (handle_numpy_errors, ignore_numpy_errors,
 from .array import (as_numeric, as_namedtuple, closest_indexes, closest,
                     normalise_maximum, interval, is_uniform, in_array, tstack,
                     tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
-                    centroid, linear_conversion, fill_nan, ndarray_write)
-from .data_structures import Lookup, Structure, CaseInsensitiveMapping
+                    centroid, linear_conversion, fill_nan, ndarray_write,
+                    ndarray_digest)
+from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping, MemoryMappedDataset,
+                              write_memory_mapped_dataset, LRUCache)
 from .verbose import (ColourWarning, message_box, warning, filter_warnings,
                       suppress_warnings, numpy_print_options)
 
@@ -25,9 +28,14 @@ __all__ += [
     'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
     'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
     'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write',
+    'ndarray_digest'
+]
+__all__ += [
+    'Lookup', 'Structure', 'CaseInsensitiveMapping',
+    'LazyCaseInsensitiveMapping', 'MemoryMappedDataset',
+    'write_memory_mapped_dataset', 'LRUCache'
 ]
-__all__ += ['Lookup', 'Structure', 'CaseInsensitiveMapping']
 __all__ += [
     'ColourWarning', 'message_box', 'warning', 'filter_warnings',
     'suppress_warnings', 'numpy_print_options'
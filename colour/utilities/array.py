@@ -19,6 +19,7 @@ numpy-fastest-way-of-computing-diagonal-for-each-row-of-a-2d-array/\
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
 from collections import Mapping
 from contextlib import contextmanager
@@ -36,7 +37,8 @@ __all__ = [
     'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
     'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
     'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write',
+    'ndarray_digest'
 ]
 
 
@@ -797,3 +799,41 @@ def ndarray_write(a):
     yield a
 
     a.setflags(write=False)
+
+
+def ndarray_digest(*args):
+    """
+    Returns a digest of the content of given arrays, i.e. their data type,
+    shape and values.
+
+    Two arrays with equal content have the same digest irrespectively of their
+    identity, the digest is thus suitable as a cache key for data computed
+    from arrays that are not hashable.
+
+    Parameters
+    ----------
+    \*args : list, optional
+        Arrays to compute the digest of.
+
+    Returns
+    -------
+    unicode
+        Hexadecimal digest.
+
+    Examples
+    --------
+    >>> a = np.linspace(0, 1, 10)
+    >>> ndarray_digest(a) == ndarray_digest(np.copy(a))
+    True
+    >>> ndarray_digest(a) == ndarray_digest(a * 2)
+    False
+    """
+
+    digest = hashlib.sha1()
+    for a in args:
+        a = np.ascontiguousarray(a)
+        digest.update(str(a.dtype).encode('utf-8'))
+        digest.update(str(a.shape).encode('utf-8'))
+        digest.update(a.view(np.uint8))
+
+    return digest.hexdigest()
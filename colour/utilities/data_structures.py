@@ -11,6 +11,12 @@ Defines various data structures classes:
     retrieve keys by values.
 -   :class:`colour.utilities.CaseInsensitiveMapping`: A case insensitive
     mapping allowing values retrieving from keys while ignoring the key case.
+-   :class:`colour.utilities.LazyCaseInsensitiveMapping`: A case insensitive
+    mapping evaluating its callable values on first retrieval.
+-   :class:`colour.utilities.MemoryMappedDataset`: A read-only mapping of
+    sampled datasets stored in a compact binary format and memory mapped.
+-   :class:`colour.utilities.LRUCache`: A bounded mapping discarding the least
+    recently used items.
 
 References
 ----------
@@ -27,7 +33,12 @@ structures.py#L37
 
 from __future__ import division, unicode_literals
 
-from collections import Mapping, MutableMapping
+import io
+import json
+import numpy as np
+from collections import Mapping, MutableMapping, OrderedDict
+from functools import partial
+from six import text_type
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,7 +47,11 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['Structure', 'Lookup', 'CaseInsensitiveMapping']
+__all__ = [
+    'Structure', 'Lookup', 'CaseInsensitiveMapping',
+    'LazyCaseInsensitiveMapping', 'MemoryMappedDataset',
+    'write_memory_mapped_dataset', 'LRUCache'
+]
 
 
 class Structure(dict):
@@ -454,3 +469,725 @@ class CaseInsensitiveMapping(MutableMapping):
         """
 
         return ((item, value[1]) for (item, value) in self._data.items())
+
+
+class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
+    """
+    Implements a lazy case-insensitive mutable mapping / *dict* object.
+
+    The mapping values that are callables, e.g. :class:`functools.partial`
+    class instances, are evaluated when their item is first retrieved and
+    replaced with their return value.
+
+    Parameters
+    ----------
+    data : dict
+        *dict* of data to store into the mapping at initialisation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Key / Value pairs to store into the mapping at initialisation.
+
+    Methods
+    -------
+    __getitem__
+    update
+    copy
+    lower_items
+
+    Notes
+    -----
+    -   Updating a lazy mapping with another one does not evaluate the values
+        of the latter, the values are evaluated once and shared by both
+        mappings.
+
+    Warning
+    -------
+    Callables cannot be stored as values, they are evaluated on retrieval.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> mapping = LazyCaseInsensitiveMapping({'John': partial(sorted, [3, 1])})
+    >>> callable(mapping.data['john'][1])
+    True
+    >>> mapping['john']
+    [1, 3]
+    >>> mapping.data['john'][1]
+    [1, 3]
+    """
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item, evaluating it if it is a callable.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        name, value = self._data[item.lower()]
+
+        if callable(value):
+            value = value()
+            self._data[item.lower()] = (name, value)
+
+        return value
+
+    def update(self, other=(), **kwargs):
+        """
+        Updates the mapping with given mapping items and keyword arguments.
+
+        The values of a :class:`colour.utilities.LazyCaseInsensitiveMapping`
+        class instance that have not been evaluated yet are stored as
+        callables retrieving them from it.
+
+        Parameters
+        ----------
+        other : dict_like or iterable, optional
+            Mapping or iterable of key / value pairs to update the mapping
+            with.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Key / Value pairs to update the mapping with.
+        """
+
+        if isinstance(other, LazyCaseInsensitiveMapping):
+            for name, value in other.data.values():
+                self[name] = (partial(other.__getitem__, name)
+                              if callable(value) else value)
+
+            other = ()
+
+        super(LazyCaseInsensitiveMapping, self).update(other, **kwargs)
+
+    def copy(self):
+        """
+        Returns a copy of the mapping.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+
+        Notes
+        -----
+        -   The :class:`colour.utilities.LazyCaseInsensitiveMapping` class copy
+            returned is a simple *copy* not a *deepcopy*, the values are
+            evaluated once and shared by both mappings.
+        """
+
+        return LazyCaseInsensitiveMapping(self)
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names, evaluating their values.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in list(self._data))
+
+
+class MemoryMappedDataset(Mapping):
+    """
+    Implements a read-only mapping / *dict* object of sampled datasets stored
+    in a compact columnar binary format and memory mapped on first access.
+
+    The datasets are stored in two files sharing the same path stem: a *.npy*
+    file holding a flat *float64* array of the datasets columns, i.e. the
+    domain followed by the range columns, and a *.json* index file holding
+    the datasets names, offsets and shapes.
+
+    Parameters
+    ----------
+    path : unicode
+        Path stem of the dataset files, i.e. without the *.npy* and *.json*
+        extensions.
+
+    Attributes
+    ----------
+    path
+
+    Methods
+    -------
+    __getitem__
+    __iter__
+    __len__
+    __repr__
+    domain
+    range
+    signal
+
+    Notes
+    -----
+    -   The dataset *.npy* file is memory mapped read-only, its pages are
+        thus only read when accessed and shared across processes.
+    -   Retrieving an item returns a new *dict* mapping the dataset domain
+        values to its range values, or tuples of values for multi-columns
+        datasets, accessing the :meth:`MemoryMappedDataset.domain` and
+        :meth:`MemoryMappedDataset.range` methods instead avoids boxing every
+        value.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'dataset')
+    >>> write_memory_mapped_dataset({'John': {500: 0.5, 510: 0.75}}, path)
+    True
+    >>> dataset = MemoryMappedDataset(path)
+    >>> dataset['John'] == {500: 0.5, 510: 0.75}
+    True
+    >>> dataset.domain('John')
+    array([ 500.,  510.])
+    >>> dataset.range('John')
+    array([ 0.5 ,  0.75])
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._index = None
+        self._array = None
+
+    @property
+    def path(self):
+        """
+        Getter and setter property for the path stem of the dataset files.
+
+        Returns
+        -------
+        unicode
+            Path stem of the dataset files.
+
+        Warning
+        -------
+        :attr:`MemoryMappedDataset.path` is read only.
+        """
+
+        return self._path
+
+    def _load(self):
+        """
+        Reads the dataset index and memory maps the dataset array.
+        """
+
+        if self._index is not None:
+            return
+
+        with io.open(
+                '{0}.json'.format(self._path), encoding='utf-8') as json_file:
+            self._index = OrderedDict(
+                (name, (offset, columns, rows))
+                for name, offset, columns, rows in json.load(json_file))
+
+        self._array = np.asarray(
+            np.load('{0}.npy'.format(self._path), mmap_mode='r'))
+
+    def _columns(self, item):
+        """
+        Returns the columns of given dataset, i.e. a read-only view of the
+        memory mapped dataset array.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+
+        Returns
+        -------
+        ndarray
+            Dataset columns.
+        """
+
+        self._load()
+
+        offset, columns, rows = self._index[item]
+
+        return np.reshape(self._array[offset:offset + columns * rows],
+                          (columns, rows))
+
+    def domain(self, item):
+        """
+        Returns the domain of given dataset.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+
+        Returns
+        -------
+        ndarray
+            Dataset domain, a read-only view of the memory mapped dataset
+            array.
+        """
+
+        return self._columns(item)[0]
+
+    def range(self, item):
+        """
+        Returns the range of given dataset.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+
+        Returns
+        -------
+        ndarray
+            Dataset range, a read-only view of the memory mapped dataset
+            array, 1-dimensional for single column datasets and of shape
+            (domain size, columns count) otherwise.
+        """
+
+        columns = self._columns(item)
+
+        return columns[1] if len(columns) == 2 else np.transpose(columns[1:])
+
+    def signal(self, item, signal_type, **kwargs):
+        """
+        Returns given dataset as a continuous signal of given type.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+        signal_type : type
+            Continuous signal type, e.g.
+            :class:`colour.SpectralPowerDistribution` class, instantiated
+            with the dataset range and domain.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments for the continuous signal type instantiation.
+
+        Returns
+        -------
+        Signal or MultiSignal
+            Continuous signal.
+
+        Examples
+        --------
+        >>> import os
+        >>> import tempfile
+        >>> from colour import SpectralPowerDistribution
+        >>> path = os.path.join(tempfile.mkdtemp(), 'dataset')
+        >>> write_memory_mapped_dataset({'John': {500: 0.5, 510: 0.75}}, path)
+        True
+        >>> dataset = MemoryMappedDataset(path)
+        >>> print(dataset.signal('John', SpectralPowerDistribution))
+        [[  5.00000000e+02   5.00000000e-01]
+         [  5.10000000e+02   7.50000000e-01]]
+        """
+
+        return signal_type(self.range(item), self.domain(item), **kwargs)
+
+    def __getitem__(self, item):
+        """
+        Returns given dataset as a *dict* mapping its domain values to its
+        range values.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+
+        Returns
+        -------
+        dict
+            Dataset.
+        """
+
+        domain, range_ = self.domain(item), self.range(item)
+
+        values = range_.tolist()
+        if range_.ndim == 2:
+            values = [tuple(value) for value in values]
+
+        return dict(zip(domain.tolist(), values))
+
+    def __iter__(self):
+        """
+        Iterates over the datasets names.
+
+        Returns
+        -------
+        generator
+            Datasets names.
+        """
+
+        self._load()
+
+        return iter(self._index)
+
+    def __len__(self):
+        """
+        Returns the datasets count.
+
+        Returns
+        -------
+        int
+            Datasets count.
+        """
+
+        self._load()
+
+        return len(self._index)
+
+    def __repr__(self):
+        """
+        Returns the mapping representation.
+
+        Returns
+        -------
+        unicode
+            Mapping representation.
+        """
+
+        return '{0}({1!r})'.format(self.__class__.__name__, self._path)
+
+
+def write_memory_mapped_dataset(data, path):
+    """
+    Writes given datasets to the files read by the
+    :class:`colour.utilities.MemoryMappedDataset` class.
+
+    Parameters
+    ----------
+    data : dict_like
+        Datasets to write, mapping their names to *dict* mapping their domain
+        values to their range values, or to sequences of range values for
+        multi-columns datasets.
+    path : unicode
+        Path stem of the dataset files, i.e. without the *.npy* and *.json*
+        extensions.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'dataset')
+    >>> write_memory_mapped_dataset({'John': {500: 0.5, 510: 0.75}}, path)
+    True
+    """
+
+    index, arrays, offset = [], [], 0
+    for name, dataset in data.items():
+        domain, range_ = zip(*sorted(dataset.items()))
+        columns = np.vstack([
+            np.asarray(domain, dtype=np.float64),
+            np.transpose(np.asarray(range_, dtype=np.float64))
+        ])
+
+        index.append([name, offset, columns.shape[0], columns.shape[1]])
+        arrays.append(np.ravel(columns))
+        offset += columns.size
+
+    array = np.concatenate(arrays) if arrays else np.zeros(0)
+    np.save('{0}.npy'.format(path), array.astype('<f8'))
+
+    with io.open('{0}.json'.format(path), 'w', encoding='utf-8') as json_file:
+        json_file.write(text_type(json.dumps(index, indent=4)))
+
+    return True
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a bounded mapping / *dict* object discarding the least
+    recently used items once its maximum size is reached.
+
+    The cache keeps track of the hits and misses occurring when retrieving
+    items with the :meth:`colour.utilities.LRUCache.__getitem__` method.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum items count, *None* leads to an unbounded cache.
+
+    Attributes
+    ----------
+    maxsize
+    hits
+    misses
+    hit_rate
+
+    Methods
+    -------
+    __setitem__
+    __getitem__
+    __delitem__
+    __contains__
+    __iter__
+    __len__
+    __repr__
+    clear
+
+    Examples
+    --------
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache['John'] = 'Doe'
+    >>> cache['Jane'] = 'Doe'
+    >>> cache['John']
+    'Doe'
+    >>> cache['Luke'] = 'Skywalker'
+    >>> sorted(cache.keys())
+    ['John', 'Luke']
+    >>> cache.hits, cache.misses
+    (1, 0)
+    >>> cache.hit_rate
+    1.0
+    """
+
+    def __init__(self, maxsize=128):
+        self._data = OrderedDict()
+
+        self._maxsize = None
+        self.maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        """
+        Getter and setter property for the maximum items count.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum items count with.
+
+        Returns
+        -------
+        int
+            Maximum items count.
+        """
+
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        """
+        Setter for the **self.maxsize** property.
+        """
+
+        if value is not None:
+            assert value > 0, (
+                '"{0}" attribute: "{1}" must be strictly positive!'.format(
+                    'maxsize', value))
+
+        self._maxsize = value
+
+        self._evict()
+
+    @property
+    def hits(self):
+        """
+        Getter and setter property for the hits count.
+
+        Returns
+        -------
+        int
+            Hits count.
+
+        Warning
+        -------
+        :attr:`colour.utilities.LRUCache.hits` attribute is read only.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter and setter property for the misses count.
+
+        Returns
+        -------
+        int
+            Misses count.
+
+        Warning
+        -------
+        :attr:`colour.utilities.LRUCache.misses` attribute is read only.
+        """
+
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """
+        Getter and setter property for the hit rate, i.e. the ratio of the
+        hits count to the lookups count.
+
+        Returns
+        -------
+        numeric
+            Hit rate, zero if no lookups occurred.
+
+        Warning
+        -------
+        :attr:`colour.utilities.LRUCache.hit_rate` attribute is read only.
+        """
+
+        lookups = self._hits + self._misses
+
+        return self._hits / lookups if lookups else 0.0
+
+    def _evict(self):
+        """
+        Discards the least recently used items exceeding the maximum items
+        count.
+        """
+
+        if self._maxsize is None:
+            return
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __setitem__(self, item, value):
+        """
+        Sets given item with given value, discarding the least recently used
+        item if the maximum items count is exceeded.
+
+        Parameters
+        ----------
+        item : object
+            Attribute.
+        value : object
+            Value.
+        """
+
+        if item in self._data:
+            del self._data[item]
+
+        self._data[item] = value
+
+        self._evict()
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item and marks it as the most recently
+        used item.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        try:
+            value = self._data.pop(item)
+        except KeyError:
+            self._misses += 1
+            raise
+
+        self._data[item] = value
+        self._hits += 1
+
+        return value
+
+    def __delitem__(self, item):
+        """
+        Deletes the item with given name.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+        """
+
+        del self._data[item]
+
+    def __contains__(self, item):
+        """
+        Returns if the cache contains given item, the hits and misses counts
+        are not modified.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        bool
+            Is item in cache.
+        """
+
+        return item in self._data
+
+    def __iter__(self):
+        """
+        Iterates over the items names in the cache from the least to the most
+        recently used.
+
+        Returns
+        -------
+        generator
+            Item names.
+        """
+
+        return iter(list(self._data.keys()))
+
+    def __len__(self):
+        """
+        Returns the items count.
+
+        Returns
+        -------
+        int
+            Items count.
+        """
+
+        return len(self._data)
+
+    def __repr__(self):
+        """
+        Returns the cache representation.
+
+        Returns
+        -------
+        unicode
+            Cache representation.
+        """
+
+        return '{0}(maxsize={1}, hits={2}, misses={3}, size={4})'.format(
+            self.__class__.__name__, self._maxsize, self._hits, self._misses,
+            len(self._data))
+
+    def clear(self):
+        """
+        Removes all the items from the cache and resets the hits and misses
+        counts.
+        """
+
+        self._data.clear()
+        self._hits = 0
+        self._misses = 0
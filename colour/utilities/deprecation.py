@@ -190,12 +190,25 @@ class FutureAccessRemove(namedtuple('FutureAccessRemove', ('name', 'access'))):
 class ModuleAPI(object):
     """
     Define a class that allows customisation of module attributes access with
-    deprecation management.
+    deprecation management and lazy attributes loading.
 
     Parameters
     ----------
     module : module
         Module to customise attributes access.
+    changes : dict, optional
+        API changes of the module, mapping the changed attributes names to
+        their :class:`colour.utilities.deprecation.Renamed`,
+        :class:`colour.utilities.deprecation.Removed`,
+        :class:`colour.utilities.deprecation.FutureAccessChange` or
+        :class:`colour.utilities.deprecation.FutureAccessRemove` class
+        instances.
+    lazy_attributes : dict, optional
+        Lazy attributes of the module, mapping their names to the modules
+        defining them, the modules are imported on first access of the
+        attributes. An attribute mapped to a sub-module of the module with the
+        same name, e.g. *models* mapped to *colour.models*, resolves to the
+        sub-module itself.
 
     Methods
     -------
@@ -210,13 +223,15 @@ class ModuleAPI(object):
     ... # doctest: +SKIP
     """
 
-    def __init__(self, module, changes=None):
+    def __init__(self, module, changes=None, lazy_attributes=None):
         self._module = module
         self._changes = changes or {}
+        self._lazy_attributes = lazy_attributes or {}
 
     def __getattr__(self, attribute):
         """
-        Returns given attribute value while handling deprecation.
+        Returns given attribute value while handling deprecation and lazy
+        loading.
 
         Parameters
         ----------
@@ -242,21 +257,39 @@ class ModuleAPI(object):
             else:
                 raise AttributeError(str(change))
 
-        return getattr(self._module, attribute)
+        try:
+            return getattr(self._module, attribute)
+        except AttributeError:
+            path = self._lazy_attributes.get(attribute)
+            if path is None:
+                raise
+
+        module = import_module(path)
+        if path == '{0}.{1}'.format(self._module.__name__, attribute):
+            value = module
+        else:
+            value = getattr(module, attribute)
+
+        setattr(self._module, attribute, value)
+
+        return value
 
     def __dir__(self):
         """
-        Returns list of names in the module local scope filtered accordingly to
-        the changes.
+        Returns list of names in the module local scope and of its lazy
+        attributes filtered accordingly to the changes.
 
         Returns
         -------
         list
-            Filtered list of names in the module local scope.
+            Filtered list of names in the module local scope and of its lazy
+            attributes.
         """
 
         attributes = [
-            attribute for attribute in dir(self._module)
+            attribute
+            for attribute in sorted(
+                set(dir(self._module)) | set(self._lazy_attributes))
             if attribute not in self._changes
         ]
 
@@ -14,7 +14,8 @@ from colour.utilities import (as_numeric, as_namedtuple, closest_indexes,
                               closest, normalise_maximum, interval, is_uniform,
                               in_array, tstack, tsplit, row_as_diagonal,
                               dot_vector, dot_matrix, orient, centroid,
-                              linear_conversion, fill_nan, ndarray_write)
+                              linear_conversion, fill_nan, ndarray_write,
+                              ndarray_digest)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -28,7 +29,7 @@ __all__ = [
     'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
     'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
     'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
-    'TestFillNan', 'TestNdarrayWrite'
+    'TestFillNan', 'TestNdarrayWrite', 'TestNdarrayDigest'
 ]
 
 
@@ -683,5 +684,34 @@ class TestNdarrayWrite(unittest.TestCase):
             a += 1
 
 
+class TestNdarrayDigest(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.ndarray_digest` definition unit tests
+    methods.
+    """
+
+    def test_ndarray_digest(self):
+        """
+        Tests :func:`colour.utilities.array.ndarray_digest` definition.
+        """
+
+        a = np.linspace(0, 1, 10)
+
+        self.assertEqual(ndarray_digest(a), ndarray_digest(np.copy(a)))
+
+        self.assertEqual(
+            ndarray_digest(a[::2]), ndarray_digest(np.copy(a[::2])))
+
+        self.assertNotEqual(ndarray_digest(a), ndarray_digest(a * 2))
+
+        self.assertNotEqual(
+            ndarray_digest(a), ndarray_digest(np.reshape(a, (2, 5))))
+
+        self.assertNotEqual(
+            ndarray_digest(a), ndarray_digest(a.astype(np.float32)))
+
+        self.assertNotEqual(ndarray_digest(a, a), ndarray_digest(a))
+
+
 if __name__ == '__main__':
     unittest.main()
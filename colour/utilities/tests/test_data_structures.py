@@ -5,10 +5,19 @@ Defines unit tests for :mod:`colour.utilities.data_structures` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+import os
 import pickle
+import shutil
+import tempfile
 import unittest
+from collections import OrderedDict
+from functools import partial
 
-from colour.utilities import Structure, Lookup, CaseInsensitiveMapping
+from colour.continuous import MultiSignal, Signal
+from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping, MemoryMappedDataset,
+                              write_memory_mapped_dataset, LRUCache)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +26,11 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping']
+__all__ = [
+    'TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping',
+    'TestLazyCaseInsensitiveMapping', 'TestMemoryMappedDataset',
+    'TestWriteMemoryMappedDataset', 'TestLRUCache'
+]
 
 
 class TestStructure(unittest.TestCase):
@@ -274,5 +287,386 @@ CaseInsensitiveMapping.lower_items` method.
             [('jane', 'Doe'), ('john', 'Doe')])
 
 
+class TestLazyCaseInsensitiveMapping(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping` class unit tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__', 'update', 'copy', 'lower_items')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LazyCaseInsensitiveMapping))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.__getitem__` method.
+        """
+
+        evaluations = []
+
+        def value():
+            """
+            Returns a value and records its evaluation.
+            """
+
+            evaluations.append(None)
+
+            return 'Doe'
+
+        mapping = LazyCaseInsensitiveMapping(John=value, Jane='Doe')
+
+        self.assertListEqual(evaluations, [])
+        self.assertEqual(mapping['John'], 'Doe')
+        self.assertEqual(mapping['john'], 'Doe')
+        self.assertEqual(mapping['Jane'], 'Doe')
+        self.assertEqual(len(evaluations), 1)
+        self.assertListEqual(sorted(mapping.keys()), ['Jane', 'John'])
+
+    def test_update(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.update` method.
+        """
+
+        mapping1 = LazyCaseInsensitiveMapping(John=partial(list, 'Doe'))
+        mapping2 = LazyCaseInsensitiveMapping(mapping1, Jane='Doe')
+
+        self.assertTrue(callable(mapping1.data['john'][1]))
+        self.assertIs(mapping2['John'], mapping1['John'])
+        self.assertEqual(mapping2['Jane'], 'Doe')
+
+        mapping3 = CaseInsensitiveMapping(
+            LazyCaseInsensitiveMapping(John=partial(list, 'Doe')))
+        self.assertListEqual(mapping3['John'], ['D', 'o', 'e'])
+
+    def test_copy(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.copy` method.
+        """
+
+        mapping1 = LazyCaseInsensitiveMapping(John=partial(list, 'Doe'))
+        mapping2 = mapping1.copy()
+
+        self.assertIsInstance(mapping2, LazyCaseInsensitiveMapping)
+        self.assertIs(mapping2['John'], mapping1['John'])
+        self.assertEqual(mapping1, mapping2)
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(
+            John=partial(str, 'Doe'), Jane='Doe')
+
+        self.assertListEqual(
+            sorted([item for item in mapping.lower_items()]),
+            [('jane', 'Doe'), ('john', 'Doe')])
+
+
+class TestMemoryMappedDataset(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.MemoryMappedDataset` class
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._path = os.path.join(self._temporary_directory, 'dataset')
+        write_memory_mapped_dataset(
+            OrderedDict([('John', {
+                500: 0.5,
+                520: 1.0,
+                510: 0.75
+            }), ('Jane', {
+                400: (1.0, 2.0, 3.0),
+                410: (4.0, 5.0, 6.0)
+            })]), self._path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('path', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(MemoryMappedDataset))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__', '__iter__', '__len__', '__repr__',
+                            'domain', 'range', 'signal')
+
+        for method in required_methods:
+            self.assertIn(method, dir(MemoryMappedDataset))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.MemoryMappedDataset.\
+__getitem__` method.
+        """
+
+        dataset = MemoryMappedDataset(self._path)
+
+        self.assertDictEqual(dataset['John'], {500: 0.5, 510: 0.75, 520: 1.0})
+        self.assertDictEqual(dataset['Jane'], {
+            400: (1.0, 2.0, 3.0),
+            410: (4.0, 5.0, 6.0)
+        })
+
+        self.assertRaises(KeyError, lambda: dataset['Doe'])
+
+    def test__iter__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.MemoryMappedDataset.\
+__iter__` and :meth:`colour.utilities.data_structures.MemoryMappedDataset.\
+__len__` methods.
+        """
+
+        dataset = MemoryMappedDataset(self._path)
+
+        self.assertListEqual(list(dataset), ['John', 'Jane'])
+        self.assertEqual(len(dataset), 2)
+        self.assertIn('Jane', dataset)
+
+    def test_domain(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.MemoryMappedDataset.\
+domain` method.
+        """
+
+        dataset = MemoryMappedDataset(self._path)
+
+        np.testing.assert_equal(
+            dataset.domain('John'), np.array([500, 510, 520]))
+        np.testing.assert_equal(dataset.domain('Jane'), np.array([400, 410]))
+        self.assertFalse(dataset.domain('John').flags.writeable)
+
+    def test_range(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.MemoryMappedDataset.\
+range` method.
+        """
+
+        dataset = MemoryMappedDataset(self._path)
+
+        np.testing.assert_equal(
+            dataset.range('John'), np.array([0.5, 0.75, 1.0]))
+        np.testing.assert_equal(
+            dataset.range('Jane'), np.array([[1, 2, 3], [4, 5, 6]]))
+        self.assertFalse(dataset.range('Jane').flags.writeable)
+
+    def test_signal(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.MemoryMappedDataset.\
+signal` method.
+        """
+
+        dataset = MemoryMappedDataset(self._path)
+
+        signal = dataset.signal('John', Signal, name='John')
+        self.assertEqual(signal.name, 'John')
+        np.testing.assert_equal(signal.domain, np.array([500, 510, 520]))
+        np.testing.assert_equal(signal.range, np.array([0.5, 0.75, 1.0]))
+
+        signal.range = signal.range * 2
+        np.testing.assert_equal(
+            dataset.range('John'), np.array([0.5, 0.75, 1.0]))
+
+        multi_signal = dataset.signal('Jane', MultiSignal)
+        np.testing.assert_equal(multi_signal.domain, np.array([400, 410]))
+        np.testing.assert_equal(multi_signal.range,
+                                np.array([[1, 2, 3], [4, 5, 6]]))
+
+
+class TestWriteMemoryMappedDataset(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.data_structures.\
+write_memory_mapped_dataset` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_memory_mapped_dataset(self):
+        """
+        Tests :func:`colour.utilities.data_structures.\
+write_memory_mapped_dataset` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'dataset')
+
+        self.assertTrue(
+            write_memory_mapped_dataset({
+                'John': {
+                    500: 0.5,
+                    510: 0.75
+                }
+            }, path))
+
+        array = np.load('{0}.npy'.format(path))
+        self.assertEqual(array.dtype, np.dtype('<f8'))
+        np.testing.assert_equal(array, np.array([500, 510, 0.5, 0.75]))
+
+        self.assertTrue(os.path.exists('{0}.json'.format(path)))
+
+        self.assertTrue(write_memory_mapped_dataset({}, path))
+        self.assertEqual(len(MemoryMappedDataset(path)), 0)
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.LRUCache` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maxsize', 'hits', 'misses', 'hit_rate')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__setitem__', '__getitem__', '__delitem__',
+                            '__contains__', '__iter__', '__len__', '__repr__',
+                            'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_maxsize(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.maxsize`
+        property.
+        """
+
+        cache = LRUCache(maxsize=3)
+        for i in range(5):
+            cache[i] = i
+
+        self.assertListEqual(list(cache), [2, 3, 4])
+
+        cache.maxsize = 1
+        self.assertListEqual(list(cache), [4])
+
+        cache = LRUCache(maxsize=None)
+        for i in range(256):
+            cache[i] = i
+
+        self.assertEqual(len(cache), 256)
+
+        self.assertRaises(AssertionError, LRUCache, 0)
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__getitem__`
+        method.
+        """
+
+        cache = LRUCache(maxsize=2)
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+
+        self.assertEqual(cache['John'], 'Doe')
+        cache['Luke'] = 'Skywalker'
+        self.assertNotIn('Jane', cache)
+        self.assertIn('John', cache)
+
+        self.assertRaises(KeyError, lambda: cache['Jane'])
+        self.assertIsNone(cache.get('Jane'))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_hit_rate(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.LRUCache.hit_rate`
+        property.
+        """
+
+        cache = LRUCache()
+        self.assertEqual(cache.hit_rate, 0)
+
+        cache['John'] = 'Doe'
+        cache.get('John')
+        cache.get('John')
+        cache.get('John')
+        cache.get('Jane')
+        self.assertEqual(cache.hit_rate, 0.75)
+
+    def test__setitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.__setitem__`
+        method.
+        """
+
+        cache = LRUCache(maxsize=2)
+        cache['John'] = 'Doe'
+        cache['Jane'] = 'Doe'
+        cache['John'] = 'Nemo'
+        cache['Luke'] = 'Skywalker'
+
+        self.assertListEqual(list(cache), ['John', 'Luke'])
+        self.assertEqual(cache['John'], 'Nemo')
+
+    def test_clear(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.LRUCache.clear` method.
+        """
+
+        cache = LRUCache()
+        cache['John'] = 'Doe'
+        cache.get('John')
+        cache.get('Jane')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
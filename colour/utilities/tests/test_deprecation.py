@@ -5,9 +5,10 @@ Defines unit tests for :mod:`colour.utilities.deprecation` module.
 
 from __future__ import division, unicode_literals
 
+import types
 import unittest
 
-from colour.utilities.deprecation import get_attribute
+from colour.utilities.deprecation import ModuleAPI, Removed, get_attribute
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -16,7 +17,75 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestGetAttribute']
+__all__ = ['TestModuleAPI', 'TestGetAttribute']
+
+
+class TestModuleAPI(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.deprecation.ModuleAPI` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._module = types.ModuleType(str('colour'))
+        self._module.eager = 'Eager'
+        self._module.removed = 'Removed'
+        self._module_api = ModuleAPI(
+            self._module, {'removed': Removed('colour.removed')}, {
+                'models': 'colour.models',
+                'oetf_sRGB': 'colour.models',
+                'undefined': 'colour.models'
+            })
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getattr__', '__dir__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ModuleAPI))
+
+    def test__getattr__(self):
+        """
+        Tests :func:`colour.utilities.deprecation.ModuleAPI.__getattr__`
+        method.
+        """
+
+        from colour import models
+        from colour.models import oetf_sRGB
+
+        self.assertEqual(self._module_api.eager, 'Eager')
+
+        self.assertNotIn('oetf_sRGB', vars(self._module))
+        self.assertIs(self._module_api.oetf_sRGB, oetf_sRGB)
+        self.assertIs(vars(self._module)['oetf_sRGB'], oetf_sRGB)
+
+        self.assertIs(self._module_api.models, models)
+
+        self.assertRaises(AttributeError, getattr, self._module_api,
+                          'removed')
+        self.assertRaises(AttributeError, getattr, self._module_api,
+                          'undefined')
+        self.assertRaises(AttributeError, getattr, self._module_api,
+                          'unknown')
+
+    def test__dir__(self):
+        """
+        Tests :func:`colour.utilities.deprecation.ModuleAPI.__dir__` method.
+        """
+
+        attributes = dir(self._module_api)
+
+        for attribute in ('eager', 'models', 'oetf_sRGB'):
+            self.assertIn(attribute, attributes)
+
+        self.assertNotIn('removed', attributes)
 
 
 class TestGetAttribute(unittest.TestCase):
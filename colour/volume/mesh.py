@@ -9,7 +9,10 @@ Defines helpers objects related to volume computations.
 from __future__ import division, unicode_literals
 
 import numpy as np
-from scipy.spatial import Delaunay
+from scipy.spatial import ConvexHull, Delaunay
+
+from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
+from colour.utilities import LRUCache, ndarray_digest
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +21,248 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = ['MESH_VOLUME_CHUNK_SIZE', 'MeshVolume', 'is_within_mesh_volume']
+
+MESH_VOLUME_CHUNK_SIZE = 65536
+"""
+Default points count of the chunks the containment queries of
+:class:`colour.volume.MeshVolume` class are answered by.
+
+MESH_VOLUME_CHUNK_SIZE : integer
+"""
+
+_MESH_VOLUMES_CACHE = LRUCache(maxsize=32)
+
+
+class MeshVolume(object):
+    """
+    Defines a mesh volume, i.e. the convex hull of a set of points, answering
+    containment queries.
+
+    The half-space representation of the mesh convex hull is optionally
+    computed at initialisation, the mesh Delaunay triangulation is computed on
+    first use only, e.g. never if the half-space representation answers the
+    containment queries. Both are then reused for every query.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the Delaunay triangulation.
+    half_spaces : bool, optional
+        Whether to compute the half-space representation of the mesh convex
+        hull and use it to answer the containment queries instead of the
+        Delaunay triangulation.
+
+    Attributes
+    ----------
+    mesh
+    triangulation
+    half_spaces
+
+    Methods
+    -------
+    __repr__
+    contains
+
+    Notes
+    -----
+    -   The Delaunay triangulation of a set of points covers its convex hull,
+        both representations thus define the same volume. A point is within
+        the half-space representation if all the convex hull facets
+        hyperplanes equations evaluate to negative values, the containment
+        queries are then a single matrix product whose cost is proportional
+        to the facets count: it is faster than walking the triangulation for
+        convex hulls with few facets, e.g. *RGB* colourspaces volumes, but
+        slower for densely sampled ones, e.g. the visible spectrum volume.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> volume = MeshVolume(mesh, half_spaces=True)
+    >>> a = np.array([[0.0005, 0.0031, 0.0010],
+    ...               [0.3205, 0.4131, 0.5100]])
+    >>> volume.contains(a)
+    array([ True, False], dtype=bool)
+    """
+
+    def __init__(self, mesh, half_spaces=False):
+        mesh = np.asarray(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+
+        self._mesh = mesh
+        self._triangulation = None
+        self._half_spaces = ConvexHull(mesh).equations if half_spaces else None
+
+    @property
+    def mesh(self):
+        """
+        Getter and setter property for the mesh points.
+
+        Returns
+        -------
+        ndarray
+            Mesh points.
+
+        Warning
+        -------
+        :attr:`MeshVolume.mesh` is read only.
+        """
+
+        return self._mesh
+
+    @property
+    def triangulation(self):
+        """
+        Getter and setter property for the mesh Delaunay triangulation.
+
+        Returns
+        -------
+        Delaunay
+            Mesh Delaunay triangulation.
+
+        Warning
+        -------
+        :attr:`MeshVolume.triangulation` is read only.
+
+        Notes
+        -----
+        -   The Delaunay triangulation is computed on first access.
+        """
+
+        if self._triangulation is None:
+            self._triangulation = Delaunay(self._mesh)
+
+        return self._triangulation
+
+    @property
+    def half_spaces(self):
+        """
+        Getter and setter property for the mesh convex hull half-space
+        representation, i.e. the facets hyperplanes equations, the normals
+        pointing outward.
+
+        Returns
+        -------
+        ndarray or None
+            Mesh convex hull half-space representation.
+
+        Warning
+        -------
+        :attr:`MeshVolume.half_spaces` is read only.
+        """
+
+        return self._half_spaces
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the mesh volume.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{0}({1} points, half_spaces={2})'.format(
+            self.__class__.__name__, len(self._mesh),
+            self._half_spaces is not None)
+
+    def contains(self, points, tolerance=None,
+                 chunk_size=MESH_VOLUME_CHUNK_SIZE):
+        """
+        Returns if given points are within the mesh volume.
+
+        Parameters
+        ----------
+        points : array_like
+            Points to check if they are within the mesh volume.
+        tolerance : numeric, optional
+            Tolerance allowed in the inside-triangle check, or in the
+            hyperplanes equations evaluation if using the half-space
+            representation.
+        chunk_size : integer, optional
+            Points count of the chunks the query is answered by, bounding the
+            memory footprint.
+
+        Returns
+        -------
+        bool
+            Is within mesh volume.
+
+        Examples
+        --------
+        >>> mesh = np.array(
+        ...     [[-1.0, -1.0, 1.0],
+        ...       [1.0, -1.0, 1.0],
+        ...       [1.0, -1.0, -1.0],
+        ...       [-1.0, -1.0, -1.0],
+        ...       [0.0, 1.0, 0.0]]
+        ... )
+        >>> MeshVolume(mesh).contains(np.array([0.0005, 0.0031, 0.0010]))
+        array(True, dtype=bool)
+        """
+
+        points = np.asarray(points, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = points.shape[:-1]
+        points = np.reshape(points, (-1, points.shape[-1]))
+        chunk_size = int(chunk_size)
+
+        if self._half_spaces is not None:
+            tolerance = (tolerance
+                         if tolerance is not None else 100 * EPSILON)
+            normals = np.transpose(self._half_spaces[..., :-1])
+            offsets = self._half_spaces[..., -1]
+
+        within = np.empty(points.shape[0], dtype=np.bool_)
+        for i in range(0, points.shape[0], chunk_size):
+            chunk = points[i:i + chunk_size]
+            if self._half_spaces is not None:
+                # Comparisons with *nan* are *False*, *nan* points are thus
+                # outside the volume.
+                within[i:i + chunk_size] = np.all(
+                    np.dot(chunk, normals) + offsets <= tolerance, axis=-1)
+            else:
+                within[i:i + chunk_size] = self.triangulation.find_simplex(
+                    chunk, tol=tolerance) >= 0
+
+        return np.reshape(within, shape)
+
+
+def _mesh_volume(mesh, half_spaces=False):
+    """
+    Returns the :class:`colour.volume.MeshVolume` class instance of given
+    mesh, the instances are cached in the
+    :attr:`colour.volume.mesh._MESH_VOLUMES_CACHE` bounded least recently used
+    cache, keyed by a digest of the mesh points.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the Delaunay triangulation.
+    half_spaces : bool, optional
+        Whether to compute the half-space representation of the mesh convex
+        hull.
+
+    Returns
+    -------
+    MeshVolume
+        Mesh volume.
+    """
+
+    mesh = np.asarray(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+
+    key = (ndarray_digest(mesh), half_spaces)
+    try:
+        return _MESH_VOLUMES_CACHE[key]
+    except KeyError:
+        volume = _MESH_VOLUMES_CACHE[key] = MeshVolume(mesh, half_spaces)
+
+        return volume
 
 
 def is_within_mesh_volume(points, mesh, tolerance=None):
@@ -30,8 +274,9 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     ----------
     points : array_like
         Points to check if they are within ``mesh`` volume.
-    mesh : array_like
-        Points of the volume used to generate the Delaunay triangulation.
+    mesh : array_like or MeshVolume
+        Points of the volume used to generate the Delaunay triangulation or
+        mesh volume.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
 
@@ -40,6 +285,11 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     bool
         Is within mesh volume.
 
+    Notes
+    -----
+    -   The Delaunay triangulations of the meshes are cached, thus checking
+        successive points batches against the same mesh triangulates it once.
+
     Examples
     --------
     >>> mesh = np.array(
@@ -57,9 +307,7 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
-
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    if not isinstance(mesh, MeshVolume):
+        mesh = _mesh_volume(mesh)
 
-    return simplex
+    return mesh.contains(points, tolerance)
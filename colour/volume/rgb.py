@@ -7,6 +7,9 @@ Defines various RGB colourspace volume computation objects:
 
 -   :func:`colour.RGB_colourspace_limits`
 -   :func:`colour.RGB_colourspace_volume_MonteCarlo`
+-   :func:`colour.volume.RGB_colourspace_volume_MonteCarlo_estimates`
+-   :func:`colour.RGB_colourspace_volume_Mesh`
+-   :func:`colour.RGB_colourspaces_intersection_volume_Mesh`
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
@@ -22,7 +25,10 @@ from __future__ import division, unicode_literals
 
 import itertools
 import multiprocessing
+import multiprocessing.pool
 import numpy as np
+from collections import namedtuple
+from scipy.special import ndtri
 
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import ILLUMINANTS
@@ -37,23 +43,66 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
+    'MONTE_CARLO_CHUNK_SIZE', 'MonteCarloVolumeEstimate',
     'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
-    'RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_volume_MonteCarlo_estimates',
+    'RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_volume_Mesh',
+    'RGB_colourspaces_intersection_volume_Mesh',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
 ]
 
 
+MONTE_CARLO_CHUNK_SIZE = 100000
+"""
+Default samples count of the chunks streamed through the *Monte Carlo*
+colourspace volume computation definitions.
+
+MONTE_CARLO_CHUNK_SIZE : integer
+"""
+
+_MESH_INTERSECTION_TOLERANCE = 1e-7
+"""
+Tolerance on the *RGB* values used to decide on which side of an *RGB*
+colourspace volume surface a coincident surface lies.
+
+_MESH_INTERSECTION_TOLERANCE : numeric
+"""
+
+
+class MonteCarloVolumeEstimate(
+        namedtuple('MonteCarloVolumeEstimate',
+                   ('volume', 'standard_error', 'confidence_interval',
+                    'samples'))):
+    """
+    Defines the running estimate of a colourspace volume computed using
+    *Monte Carlo* method.
+
+    Parameters
+    ----------
+    volume : numeric
+        Colourspace volume estimate.
+    standard_error : numeric
+        Colourspace volume estimate standard error.
+    confidence_interval : tuple
+        Colourspace volume estimate confidence interval lower and upper
+        bounds.
+    samples : integer
+        Samples count the estimate is computed with.
+    """
+
+
 def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
     """
     Convenient wrapper to be able to call
     :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`:
-    definition with multiple arguments.
+    definition with multiple arguments and a chunk seed.
 
     Parameters
     ----------
     args : array_like, optional
-        Arguments.
+        Arguments, the seed of the chunk *Mersenne Twister* pseudo-random
+        number generator replaces the pseudo-random number generator.
 
     Returns
     -------
@@ -61,7 +110,13 @@ def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
         Inside *RGB* colourspace volume samples count.
     """
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*args)
+    (colourspace, samples, limits, illuminant_Lab, chromatic_adaptation_method,
+     random_generator, seed, chunk_size) = args
+
+    return sample_RGB_colourspace_volume_MonteCarlo(
+        colourspace, samples, limits, illuminant_Lab,
+        chromatic_adaptation_method, random_generator,
+        np.random.RandomState(np.asarray(seed, np.uint32)), chunk_size)
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -72,11 +127,15 @@ def sample_RGB_colourspace_volume_MonteCarlo(
             'D50'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=MONTE_CARLO_CHUNK_SIZE):
     """
-    Randomly samples the *Lab* colourspace volume and returns the ratio of
+    Randomly samples the *Lab* colourspace volume and returns the count of
     samples within the given *RGB* colourspace volume.
 
+    The samples are streamed in chunks through the colourspace conversions so
+    that the memory footprint is bounded by the chunk size.
+
     Parameters
     ----------
     colourspace : RGB_Colourspace
@@ -98,6 +157,8 @@ def sample_RGB_colourspace_volume_MonteCarlo(
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : integer, optional
+        Samples count of the chunks.
 
     Returns
     -------
@@ -127,16 +188,27 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    Lab = np.asarray(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(
-        Lab_to_XYZ(Lab, illuminant_Lab),
-        illuminant_Lab,
-        colourspace.whitepoint,
-        colourspace.XYZ_to_RGB_matrix,
-        chromatic_adaptation_transform=(chromatic_adaptation_method))
-    RGB_w = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    samples = int(samples)
+    chunk_size = int(chunk_size)
+
+    count = 0
+    for i in range(0, samples, chunk_size):
+        Lab = np.asarray(
+            list(
+                random_generator(
+                    min(chunk_size, samples - i), limits, random_state)))
+        RGB = XYZ_to_RGB(
+            Lab_to_XYZ(Lab, illuminant_Lab),
+            illuminant_Lab,
+            colourspace.whitepoint,
+            colourspace.XYZ_to_RGB_matrix,
+            chromatic_adaptation_transform=(chromatic_adaptation_method))
+        count += int(
+            np.sum(
+                np.logical_and(
+                    np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)))
+
+    return count
 
 
 def RGB_colourspace_limits(
@@ -181,6 +253,149 @@ def RGB_colourspace_limits(
     return np.array(limits)
 
 
+def RGB_colourspace_volume_MonteCarlo_estimates(
+        colourspace,
+        samples=10e6,
+        limits=np.array([[0, 100], [-150, 150], [-150, 150]]),
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        random_generator=random_triplet_generator,
+        random_state=None,
+        processes=None,
+        executor='Process',
+        chunk_size=MONTE_CARLO_CHUNK_SIZE,
+        confidence=0.95,
+        target_standard_error=None):
+    """
+    Returns a generator yielding the running estimates of given *RGB*
+    colourspace volume computation using *Monte Carlo* method.
+
+    The samples are split into fixed size chunks, each chunk being sampled
+    with an independent *Mersenne Twister* pseudo-random number generator
+    seeded from a root entropy and the chunk index: the estimates are
+    reproducible and do not depend on the workers count. Only the counts of
+    samples within the *RGB* colourspace volume are accumulated, in the
+    chunks order, and an estimate is yielded after each chunk.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    samples : numeric, optional
+        Maximum samples count.
+    limits : array_like, optional
+        *Lab* colourspace volume.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    random_generator : generator, optional
+        Random triplet generator providing the random samples within the *Lab*
+        colourspace volume.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator the root entropy is
+        drawn from.
+    processes : integer, optional
+        Workers count, default to :func:`multiprocessing.cpu_count`
+        definition, the chunks are processed in the current process if equal
+        to 1.
+    executor : unicode, optional
+        **{'Process', 'Thread'}**,
+        Workers type, processes or threads.
+    chunk_size : integer, optional
+        Samples count of the chunks.
+    confidence : numeric, optional
+        Confidence level of the estimates confidence interval.
+    target_standard_error : numeric, optional
+        Standard error at which the computation stops early.
+
+    Returns
+    -------
+    generator
+        *RGB* colourspace volume estimates generator.
+
+    Notes
+    -----
+    -   The standard error is computed assuming a binomial distribution of the
+        samples within the *RGB* colourspace volume and the confidence
+        interval using its normal approximation.
+    -   The *RGB* colourspace and the random triplet generator must be
+        picklable when using processes.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> prng = np.random.RandomState(2)
+    >>> estimates = list(RGB_colourspace_volume_MonteCarlo_estimates(
+    ...     sRGB, 10e3, random_state=prng, processes=1, chunk_size=2500))
+    >>> len(estimates)
+    4
+    >>> estimates[-1].volume  # doctest: +ELLIPSIS
+    851...
+    >>> estimates[-1].confidence_interval  # doctest: +ELLIPSIS
+    (799775.4..., 903024.5...)
+    """
+
+    if executor.lower() not in ('process', 'thread'):
+        raise ValueError(
+            '"{0}" executor is invalid, it must be one of '
+            '{{"Process", "Thread"}}!'.format(executor))
+
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
+
+    samples = int(samples)
+    chunk_size = int(chunk_size)
+    entropy = random_state.randint(0, np.iinfo(np.int32).max)
+
+    arguments = [(colourspace, min(chunk_size, samples - i), limits,
+                  illuminant_Lab, chromatic_adaptation_method,
+                  random_generator, (entropy, i // chunk_size), chunk_size)
+                 for i in range(0, samples, chunk_size)]
+
+    workers = processes if processes else multiprocessing.cpu_count()
+    if workers == 1:
+        pool = None
+        counts = (_wrapper_RGB_colourspace_volume_MonteCarlo(argument)
+                  for argument in arguments)
+    else:
+        pool = (multiprocessing.Pool(processes=workers)
+                if executor.lower() == 'process' else
+                multiprocessing.pool.ThreadPool(processes=workers))
+        counts = pool.imap(_wrapper_RGB_colourspace_volume_MonteCarlo,
+                           arguments)
+
+    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
+    z = ndtri(0.5 + confidence / 2)
+
+    try:
+        count = n = 0
+        for argument, chunk_count in zip(arguments, counts):
+            count += chunk_count
+            n += argument[1]
+
+            p = count / n
+            volume = Lab_volume * count / n
+            standard_error = Lab_volume * np.sqrt(p * (1 - p) / n)
+
+            yield MonteCarloVolumeEstimate(
+                volume, standard_error,
+                (volume - z * standard_error, volume + z * standard_error), n)
+
+            # The standard error is null when all the samples are either
+            # within or outside the *RGB* colourspace volume.
+            if (target_standard_error is not None and 0 < count < n and
+                    standard_error <= target_standard_error):
+                break
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
 def RGB_colourspace_volume_MonteCarlo(
         colourspace,
         samples=10e6,
@@ -190,7 +405,10 @@ def RGB_colourspace_volume_MonteCarlo(
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
         random_state=None,
-        processes=None):
+        processes=None,
+        executor='Process',
+        chunk_size=MONTE_CARLO_CHUNK_SIZE,
+        target_standard_error=None):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
@@ -214,11 +432,18 @@ def RGB_colourspace_volume_MonteCarlo(
         Random triplet generator providing the random samples within the *Lab*
         colourspace volume.
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator the root entropy of
+        the chunks pseudo-random number generators is drawn from.
     processes : integer, optional
         Processes count, default to :func:`multiprocessing.cpu_count`
         definition.
+    executor : unicode, optional
+        **{'Process', 'Thread'}**,
+        Workers type, processes or threads.
+    chunk_size : integer, optional
+        Samples count of the chunks.
+    target_standard_error : numeric, optional
+        Standard error at which the computation stops early.
 
     Returns
     -------
@@ -235,6 +460,8 @@ def RGB_colourspace_volume_MonteCarlo(
         pseudo-random numbers across systems and versions? Retrieved January
         20, 2015, from http://stackoverflow.com/questions/8786084/\
 reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
+    -   See :func:`colour.volume.RGB_colourspace_volume_MonteCarlo_estimates`
+        definition for the running estimates and their confidence interval.
 
     Examples
     --------
@@ -244,23 +471,328 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     >>> RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng,
     ...                                   processes=processes)
     ... # doctest: +ELLIPSIS
-    858...
+    838...
     """
 
-    cpu_count = processes if processes else multiprocessing.cpu_count()
-    pool = multiprocessing.Pool(processes=cpu_count)
+    for estimate in RGB_colourspace_volume_MonteCarlo_estimates(
+            colourspace,
+            samples,
+            limits,
+            illuminant_Lab,
+            chromatic_adaptation_method,
+            random_generator,
+            random_state,
+            processes,
+            executor,
+            chunk_size,
+            target_standard_error=target_standard_error):
+        pass
 
-    process_samples = int(np.round(samples / cpu_count))
+    return estimate.volume
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
 
-    results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                       [arguments for _ in range(cpu_count)])
+def _RGB_cube_surface_mesh(resolution):
+    """
+    Tessellates the surface of the unit *RGB* cube into outward oriented
+    triangles.
 
-    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
+    The vertices are spaced uniformly in the cube root of the *RGB* values so
+    that the triangles are evenly distributed once mapped to *CIE L\*a\*b\**
+    colourspace.
+
+    Parameters
+    ----------
+    resolution : integer
+        Subdivisions count of each cube edge.
+
+    Returns
+    -------
+    tuple
+        Mesh vertices and triangles vertices indexes, the cube edges vertices
+        are duplicated.
+    """
+
+    resolution = int(resolution)
+
+    t = np.linspace(0, 1, resolution + 1) ** 3
+    u, v = np.meshgrid(t, t, indexing='ij')
+    indexes = np.reshape(
+        np.arange((resolution + 1) ** 2), (resolution + 1, resolution + 1))
+
+    I_00, I_10 = indexes[:-1, :-1], indexes[1:, :-1]
+    I_11, I_01 = indexes[1:, 1:], indexes[:-1, 1:]
+    triangles = np.reshape(
+        np.concatenate([
+            np.stack([I_00, I_10, I_11], axis=-1),
+            np.stack([I_00, I_11, I_01], axis=-1)
+        ]), (-1, 3))
+
+    vertices, faces = [], []
+    for axis in range(3):
+        i, j = [k for k in range(3) if k != axis]
+        for side in (0, 1):
+            P = np.zeros(u.shape + (3, ))
+            P[..., axis] = side
+            P[..., i] = u
+            P[..., j] = v
+
+            # Triangles of the (i, j) faces are oriented along the positive
+            # axis, they are reversed on the side facing the negative axis.
+            face = triangles + len(vertices) * indexes.size
+            if (side == 1) != ((j - i) % 3 == 1):
+                face = face[:, ::-1]
+
+            vertices.append(np.reshape(P, (-1, 3)))
+            faces.append(face)
+
+    return np.concatenate(vertices), np.concatenate(faces)
+
+
+def _RGB_colourspace_surface_Lab(colourspace, resolution, illuminant_Lab,
+                                 chromatic_adaptation_method):
+    """
+    Returns given *RGB* colourspace volume surface mesh vertices in
+    *CIE L\*a\*b\** colourspace and its outward oriented triangles
+    vertices indexes.
+    """
+
+    vertices, faces = _RGB_cube_surface_mesh(resolution)
+
+    Lab = XYZ_to_Lab(
+        RGB_to_XYZ(
+            vertices,
+            colourspace.whitepoint,
+            illuminant_Lab,
+            colourspace.RGB_to_XYZ_matrix,
+            chromatic_adaptation_transform=chromatic_adaptation_method),
+        illuminant_Lab)
+
+    # Both RGB to CIE XYZ and CIE XYZ to CIE L*a*b* mappings
+    # preserve orientation unless the matrix determinant is negative.
+    if np.linalg.det(colourspace.RGB_to_XYZ_matrix) < 0:
+        faces = faces[:, ::-1]
+
+    return Lab, faces
+
+
+def _triangles_signed_volumes(triangles):
+    """
+    Returns the signed volumes of the tetrahedrons formed by given triangles
+    and the origin.
+    """
+
+    return np.sum(
+        triangles[..., 0, :] * np.cross(triangles[..., 1, :],
+                                        triangles[..., 2, :]),
+        axis=-1) / 6
+
+
+def _clipped_triangles_volume(triangles, margins):
+    """
+    Clips given triangles by the half-spaces where given margins interpolated
+    linearly across them are positive and returns the sum of the signed
+    volumes of the clipped polygons and the origin.
+
+    The clipping is performed with *Sutherland-Hodgman* algorithm on all the
+    triangles at once, the polygons being stored in fixed size arrays
+    alongside their vertices count.
+    """
+
+    n = triangles.shape[0]
+    if n == 0:
+        return 0
+
+    vertices, counts = triangles, np.full(n, 3)
+    i = np.arange(n)[:, np.newaxis]
+    for k in range(margins.shape[-1]):
+        size = vertices.shape[1]
+        j = np.arange(size)
+        valid = j < counts[:, np.newaxis]
+        j_n = (j + 1) % np.maximum(counts[:, np.newaxis], 1)
+
+        vertices_n, margins_n = vertices[i, j_n], margins[i, j_n]
+        m, m_n = margins[..., k], margins_n[..., k]
+
+        keep = np.logical_and(valid, m >= 0)
+        cross = np.logical_and(valid, (m >= 0) != (m_n >= 0))
+        t = (m / np.where(cross, m - m_n, 1))[..., np.newaxis]
+
+        # Each edge contributes its first vertex if inside and its
+        # intersection with the half-space boundary if crossing it.
+        vertices = np.stack(
+            [vertices, vertices + t * (vertices_n - vertices)],
+            axis=2).reshape(n, size * 2, -1)
+        margins = np.stack(
+            [margins, margins + t * (margins_n - margins)],
+            axis=2).reshape(n, size * 2, -1)
+        mask = np.stack([keep, cross], axis=2).reshape(n, size * 2)
+
+        # Compacting the polygons, a convex polygon clipped by a half-space
+        # gains one vertex at most.
+        order = np.argsort(~mask, axis=-1, kind='mergesort')[:, :size + 1]
+        vertices, margins = vertices[i, order], margins[i, order]
+        counts = np.sum(mask, axis=-1)
+
+    volume = 0
+    for j in range(1, vertices.shape[1] - 1):
+        fan = j + 1 < counts
+        volume += np.sum(
+            _triangles_signed_volumes(
+                np.stack([
+                    vertices[fan, 0], vertices[fan, j], vertices[fan, j + 1]
+                ],
+                         axis=-2)))
+
+    return volume
+
+
+def _RGB_colourspace_surface_volume_within(
+        Lab, faces, colourspace, illuminant_Lab, chromatic_adaptation_method,
+        tolerance):
+    """
+    Returns the signed volume enclosed by the parts of given
+    *CIE L\*a\*b\** colourspace surface mesh within given *RGB*
+    colourspace volume, the *RGB* colourspace volume being grown by given
+    tolerance.
+    """
+
+    # The inverse of the *RGB* to *CIE XYZ* matrix is used for consistency
+    # with the surface tessellation.
+    RGB = XYZ_to_RGB(
+        Lab_to_XYZ(Lab, illuminant_Lab),
+        illuminant_Lab,
+        colourspace.whitepoint,
+        np.linalg.inv(colourspace.RGB_to_XYZ_matrix),
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+    margins = (np.concatenate([RGB, 1 - RGB], axis=-1) + tolerance)[faces]
+    Lab = Lab[faces]
+
+    within = np.all(margins >= 0, axis=(-2, -1))
+    outside = np.any(np.all(margins < 0, axis=-2), axis=-1)
+    straddling = ~np.logical_or(within, outside)
+
+    return (np.sum(_triangles_signed_volumes(Lab[within])) +
+            _clipped_triangles_volume(Lab[straddling], margins[straddling]))
+
+
+def RGB_colourspace_volume_Mesh(
+        colourspace,
+        resolution=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Performs given *RGB* colourspace volume computation in
+    *CIE L\*a\*b\** colourspace by tessellating the *RGB* colourspace cube
+    surface and applying the divergence theorem.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    resolution : integer, optional
+        Subdivisions count of each *RGB* colourspace cube edge.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   The *RGB* colourspace cube surface is tessellated with
+        :math:`12 \cdot resolution^2` triangles whose vertices are mapped to
+        *CIE L\*a\*b\** colourspace, the volume is the sum of the signed
+        volumes of the tetrahedrons formed by the triangles and the origin.
+    -   The computation is deterministic, the error decreases quadratically
+        with the resolution: the relative error is about 4e-5 with the
+        default resolution and 2e-6 with a resolution of 256.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_volume_Mesh(sRGB)  # doctest: +ELLIPSIS
+    857161.9...
+    """
+
+    Lab, faces = _RGB_colourspace_surface_Lab(
+        colourspace, resolution, illuminant_Lab, chromatic_adaptation_method)
+
+    return np.abs(np.sum(_triangles_signed_volumes(Lab[faces])))
+
+
+def RGB_colourspaces_intersection_volume_Mesh(
+        colourspace_a,
+        colourspace_b,
+        resolution=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Performs given *RGB* colourspaces volumes intersection volume computation
+    in *CIE L\*a\*b\** colourspace by tessellating the *RGB* colourspaces
+    cubes surfaces and applying the divergence theorem.
+
+    Parameters
+    ----------
+    colourspace_a : RGB_Colourspace
+        First *RGB* colourspace.
+    colourspace_b : RGB_Colourspace
+        Second *RGB* colourspace.
+    resolution : integer, optional
+        Subdivisions count of each *RGB* colourspace cube edge.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    float
+        *RGB* colourspaces volumes intersection volume.
+
+    Notes
+    -----
+    -   The intersection volume boundary is made of the parts of each
+        *RGB* colourspace volume surface within the other *RGB* colourspace
+        volume. The triangles crossing the other *RGB* colourspace volume
+        surface are clipped by linearly interpolating its *RGB* values along
+        their edges.
+    -   Coincident surfaces parts are accounted for once, from
+        ``colourspace_a`` surface.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACES
+    >>> RGB_colourspaces_intersection_volume_Mesh(
+    ...     RGB_COLOURSPACES['DCI-P3'], RGB_COLOURSPACES['Adobe RGB (1998)'])
+    ... # doctest: +ELLIPSIS
+    102...
+    """
 
-    return Lab_volume * np.sum(results) / (process_samples * cpu_count)
+    Lab_a, faces_a = _RGB_colourspace_surface_Lab(
+        colourspace_a, resolution, illuminant_Lab, chromatic_adaptation_method)
+    Lab_b, faces_b = _RGB_colourspace_surface_Lab(
+        colourspace_b, resolution, illuminant_Lab, chromatic_adaptation_method)
+
+    return np.abs(
+        _RGB_colourspace_surface_volume_within(
+            Lab_a, faces_a, colourspace_b, illuminant_Lab,
+            chromatic_adaptation_method, _MESH_INTERSECTION_TOLERANCE) +
+        _RGB_colourspace_surface_volume_within(
+            Lab_b, faces_b, colourspace_a, illuminant_Lab,
+            chromatic_adaptation_method, -_MESH_INTERSECTION_TOLERANCE))
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -8,8 +8,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 from itertools import permutations
+from scipy.spatial import Delaunay
 
-from colour.volume import is_within_mesh_volume
+from colour.volume import MeshVolume, is_within_mesh_volume
+from colour.volume.mesh import _MESH_VOLUMES_CACHE
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +21,100 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = ['TestMeshVolume', 'TestIsWithinMeshVolume']
+
+
+class TestMeshVolume(unittest.TestCase):
+    """
+    Defines :class:`colour.volume.mesh.MeshVolume` class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._mesh = np.array([
+            [-1.0, -1.0, 1.0],
+            [1.0, -1.0, 1.0],
+            [1.0, -1.0, -1.0],
+            [-1.0, -1.0, -1.0],
+            [0.0, 1.0, 0.0],
+        ])
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('mesh', 'triangulation', 'half_spaces')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(MeshVolume))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__repr__', 'contains')
+
+        for method in required_methods:
+            self.assertIn(method, dir(MeshVolume))
+
+    def test__init__(self):
+        """
+        Tests :func:`colour.volume.mesh.MeshVolume.__init__` method.
+        """
+
+        volume = MeshVolume(self._mesh)
+        self.assertIsNone(volume.half_spaces)
+
+        volume = MeshVolume(self._mesh, half_spaces=True)
+        self.assertTupleEqual(volume.half_spaces.shape, (6, 4))
+
+    def test_triangulation(self):
+        """
+        Tests :attr:`colour.volume.mesh.MeshVolume.triangulation` property.
+        """
+
+        # The Delaunay triangulation is computed on first use only.
+        volume = MeshVolume(self._mesh, half_spaces=True)
+        volume.contains(self._mesh)
+        self.assertIsNone(volume._triangulation)
+
+        triangulation = volume.triangulation
+        self.assertIsInstance(triangulation, Delaunay)
+        self.assertIs(volume.triangulation, triangulation)
+
+        volume = MeshVolume(self._mesh)
+        self.assertIsNone(volume._triangulation)
+        volume.contains(self._mesh)
+        self.assertIsInstance(volume._triangulation, Delaunay)
+
+    def test_contains(self):
+        """
+        Tests :func:`colour.volume.mesh.MeshVolume.contains` method.
+        """
+
+        points = np.random.RandomState(4).uniform(-1, 1, (1000, 3))
+
+        triangulation = MeshVolume(self._mesh)
+        half_spaces = MeshVolume(self._mesh, half_spaces=True)
+        within = triangulation.contains(points)
+
+        np.testing.assert_equal(within, half_spaces.contains(points))
+        np.testing.assert_equal(within,
+                                triangulation.contains(points, chunk_size=7))
+        np.testing.assert_equal(within,
+                                half_spaces.contains(points, chunk_size=7))
+
+        np.testing.assert_equal(
+            half_spaces.contains(np.reshape(points, (10, 100, 3))),
+            np.reshape(within, (10, 100)))
+
+        self.assertTrue(half_spaces.contains(self._mesh[0]))
+        self.assertFalse(half_spaces.contains([np.nan, 0, 0]))
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
@@ -62,6 +157,24 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(
                 np.array([0.4325, 0.3788, 0.1034]), self._mesh))
 
+    def test_cache_is_within_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        mesh volumes cache.
+        """
+
+        _MESH_VOLUMES_CACHE.clear()
+
+        is_within_mesh_volume(np.array([0.0005, 0.0031, 0.0010]), self._mesh)
+        is_within_mesh_volume(
+            np.array([0.0005, 0.0031, 0.0010]), np.copy(self._mesh))
+
+        self.assertEqual(len(_MESH_VOLUMES_CACHE), 1)
+
+        self.assertTrue(
+            is_within_mesh_volume(
+                np.array([0.0005, 0.0031, 0.0010]), MeshVolume(self._mesh)))
+
     def test_n_dimensional_is_within_mesh_volume(self):
         """
         Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
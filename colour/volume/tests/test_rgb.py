@@ -24,9 +24,12 @@ import numpy as np
 import unittest
 
 from colour.models import (ACES_2065_1_COLOURSPACE, BT2020_COLOURSPACE,
-                           BT709_COLOURSPACE)
+                           BT709_COLOURSPACE, RGB_COLOURSPACES)
+from colour.volume.rgb import sample_RGB_colourspace_volume_MonteCarlo
 from colour.volume import (
-    RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+    RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo_estimates,
+    RGB_colourspace_volume_MonteCarlo, RGB_colourspace_volume_Mesh,
+    RGB_colourspaces_intersection_volume_Mesh,
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
@@ -40,13 +43,46 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
+    'TestSample_RGB_colourspaceVolumeMonteCarlo', 'TestRGB_colourspaceLimits',
+    'TestRGB_colourspaceVolumeMonteCarloEstimates',
+    'TestRGB_colourspaceVolumeMonteCarlo', 'TestRGB_colourspaceVolumeMesh',
+    'TestRGB_colourspacesIntersectionVolumeMesh',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
     'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
 ]
 
 
+class TestSample_RGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`
+    definition unit tests methods.
+
+    References
+    ----------
+    -   :cite:`Laurent2012a`
+    """
+
+    def test_sample_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+sample_RGB_colourspace_volume_MonteCarlo` definition.
+        """
+
+        self.assertEqual(
+            sample_RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2)), 954)
+
+        self.assertEqual(
+            sample_RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                chunk_size=3000), 954)
+
+
 class TestRGB_colourspaceLimits(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.RGB_colourspace_limits` definition unit
@@ -79,6 +115,72 @@ class TestRGB_colourspaceLimits(unittest.TestCase):
             decimal=7)
 
 
+class TestRGB_colourspaceVolumeMonteCarloEstimates(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimates` definition unit tests methods.
+
+    References
+    ----------
+    -   :cite:`Laurent2012a`
+    """
+
+    def test_RGB_colourspace_volume_MonteCarlo_estimates(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_MonteCarlo_estimates` definition.
+        """
+
+        estimates = list(
+            RGB_colourspace_volume_MonteCarlo_estimates(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=1,
+                chunk_size=2500))
+
+        np.testing.assert_equal(
+            [estimate.samples for estimate in estimates],
+            [2500, 5000, 7500, 10000])
+        np.testing.assert_almost_equal(
+            [estimate.volume for estimate in estimates],
+            [950400.0, 905400.0, 855600.0, 851400.0],
+            decimal=7)
+        np.testing.assert_almost_equal(
+            estimates[-1].standard_error, 26339.54828770, decimal=7)
+        np.testing.assert_almost_equal(
+            estimates[-1].confidence_interval,
+            (799775.43398706, 903024.56601294),
+            decimal=7)
+
+        threaded_estimates = list(
+            RGB_colourspace_volume_MonteCarlo_estimates(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=2,
+                executor='Thread',
+                chunk_size=2500))
+
+        self.assertListEqual(estimates, threaded_estimates)
+
+        estimates = list(
+            RGB_colourspace_volume_MonteCarlo_estimates(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=1,
+                chunk_size=2500,
+                target_standard_error=40000))
+
+        self.assertEqual(len(estimates), 2)
+
+        self.assertRaises(
+            ValueError, lambda: list(
+                RGB_colourspace_volume_MonteCarlo_estimates(
+                    BT709_COLOURSPACE, 10e3, executor='Undefined')))
+
+
 class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
@@ -100,7 +202,90 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
                 BT709_COLOURSPACE,
                 10e3,
                 random_state=np.random.RandomState(2),
-                processes=1), 858600.0)
+                processes=1), 838800.0)
+
+
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            857028.78288572,
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_Mesh(BT2020_COLOURSPACE),
+            1941096.23746068,
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_Mesh(ACES_2065_1_COLOURSPACE),
+            6053879.67514339,
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE, 16),
+            856586.13952822,
+            decimal=5)
+
+
+class TestRGB_colourspacesIntersectionVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspaces_intersection_volume_Mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspaces_intersection_volume_Mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspaces_intersection_volume_Mesh` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspaces_intersection_volume_Mesh(
+                BT709_COLOURSPACE, BT2020_COLOURSPACE),
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspaces_intersection_volume_Mesh(
+                BT2020_COLOURSPACE, BT709_COLOURSPACE),
+            RGB_colourspace_volume_Mesh(BT709_COLOURSPACE),
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspaces_intersection_volume_Mesh(
+                RGB_COLOURSPACES['DCI-P3'],
+                RGB_COLOURSPACES['Adobe RGB (1998)']),
+            1023852.70357340,
+            decimal=5)
+
+    def test_RGB_colourspaces_datasets(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspaces_intersection_volume_Mesh` definition consistency with
+        :func:`colour.volume.rgb.RGB_colourspace_volume_Mesh` definition on
+        the *RGB* colourspaces datasets.
+        """
+
+        for colourspace in RGB_COLOURSPACES.values():
+            volume = RGB_colourspace_volume_Mesh(colourspace, 16)
+
+            self.assertGreater(volume, 0)
+            np.testing.assert_allclose(
+                RGB_colourspaces_intersection_volume_Mesh(
+                    colourspace, colourspace, 16),
+                volume,
+                rtol=1e-7)
 
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):